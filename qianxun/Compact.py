@@ -0,0 +1,140 @@
+import bisect
+import threading
+from array import array
+from collections.abc import Mapping
+from .Shared import LockState
+
+
+class StringTable(LockState):
+    transient = ('lock', 'ids')
+
+    def __init__(self):
+        """字符串表, 相同的字符串只保存一份, 以整数编号引用"""
+
+        self.ids = {'': 0}
+        self.strings = ['']
+        self.lock = threading.Lock()
+
+    def restore(self):
+        super().restore()
+        self.ids = {string: index for index, string in enumerate(self.strings)}
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+    # 字符串编号, 不存在时新增
+    def intern(self, string: str) -> int:
+        index = self.ids.get(string)
+        if index is None:
+            with self.lock:
+                index = self.ids.get(string)
+                if index is None:
+                    index = self.ids[string] = len(self.strings)
+                    self.strings.append(string)
+        return index
+
+    # 字符串编号, 不存在时为 None
+    def find(self, string: str) -> int:
+        return self.ids.get(string)
+
+
+class MemberSet(Mapping):
+    __slots__ = ('table', 'wxids', 'nicks')
+
+    def __init__(self, table: StringTable, pairs=()):
+        """紧凑的群成员集合, 以两个整数数组保存 (群成员 WXID, 群昵称) 的字符串编号, 按 WXID 编号排序
+
+        每个成员只占 8 字节, 字符串由所有群共享的 StringTable 保存, 同一个人在多个群中只存一份 WXID; \r\n
+        读取方式与 dict 相同: members[wxid], wxid in members, members.get(wxid), members.items()
+
+        Args:
+            table (StringTable): 字符串表 \r\n
+            pairs (iterable, optional): [(群成员 WXID, 群昵称), ...] 或 {群成员 WXID: 群昵称}
+        """
+
+        if isinstance(pairs, Mapping):
+            pairs = pairs.items()
+        rows = sorted((table.intern(wxid), table.intern(nick or '')) for wxid, nick in pairs)
+        self.table = table
+        self.wxids = array('I', (row[0] for row in rows))
+        self.nicks = array('I', (row[1] for row in rows))
+
+    def __reduce__(self):
+        return (MemberSet, (self.table, list(self.items())))
+
+    def __len__(self) -> int:
+        return len(self.wxids)
+
+    def __iter__(self):
+        strings = self.table.strings
+        return (strings[index] for index in self.wxids)
+
+    def __getitem__(self, wxid: str) -> str:
+        index = self.table.find(wxid)
+        if index is not None:
+            position = bisect.bisect_left(self.wxids, index)
+            if position < len(self.wxids) and self.wxids[position] == index:
+                return self.table.strings[self.nicks[position]]
+        raise KeyError(wxid)
+
+    def __contains__(self, wxid) -> bool:
+        index = self.table.find(wxid)
+        if index is None:
+            return False
+        position = bisect.bisect_left(self.wxids, index)
+        return position < len(self.wxids) and self.wxids[position] == index
+
+    def items(self):
+        strings = self.table.strings
+        return [(strings[key], strings[value]) for key, value in zip(self.wxids, self.nicks)]
+
+    def __repr__(self) -> str:
+        return f'MemberSet({dict(self.items())!r})'
+
+
+class Record(Mapping):
+    __slots__ = ('schema', 'row')
+
+    # 字段结构缓存, 字段相同的记录共享同一份 {字段名: 位置}
+    schemas = {}
+
+    def __init__(self, data: Mapping):
+        """紧凑的联系人记录, 字段名由相同结构的记录共享, 每条记录只保存一个值元组
+
+        读取方式与 dict 相同, 需要真正的 dict 时使用 dict(record)
+
+        Args:
+            data (Mapping): 联系人, 格式同 getFriendList 的 result 元素
+        """
+
+        keys = tuple(data)
+        schema = Record.schemas.get(keys)
+        if schema is None:
+            schema = Record.schemas.setdefault(keys, {key: index for index, key in enumerate(keys)})
+        self.schema = schema
+        self.row = tuple(data.values())
+
+    def __reduce__(self):
+        return (Record, (dict(self.items()),))
+
+    def __len__(self) -> int:
+        return len(self.row)
+
+    def __iter__(self):
+        return iter(self.schema)
+
+    def __getitem__(self, key: str):
+        return self.row[self.schema[key]]
+
+    def __contains__(self, key) -> bool:
+        return key in self.schema
+
+    def get(self, key: str, default=None):
+        index = self.schema.get(key)
+        return default if index is None else self.row[index]
+
+    def items(self):
+        return list(zip(self.schema, self.row))
+
+    def __repr__(self) -> str:
+        return f'Record({dict(self.items())!r})'
@@ -0,0 +1,427 @@
+import time
+import logging
+import threading
+from collections import OrderedDict
+from .Compact import Record
+from .Event import EVENT_ACCOUNT_CHANGE, EVENT_FRIEND_REQUEST, conversation, notice, payload
+from .Middleware import Middleware
+from .Search import SearchIndex
+from .Shared import ProcessLocal
+
+
+# 未处理的好友请求最多保留的时间(秒)与数量
+PENDING_TTL = 3 * 86400
+PENDING_MAX = 10000
+
+# 联系人类型与对应的列表接口
+KINDS = {
+    'friend': 'iterFriendList',
+    'chatroom': 'iterChatroomList',
+    'subscription': 'iterSubscriptionList',
+}
+
+
+class ContactDirectory(ProcessLocal):
+    persistent = ('robot', 'ttl', 'logger')
+
+    def __init__(self, robot, ttl: float = 300, logger: logging.Logger = None):
+        """本地联系人目录, 一次拉取好友, 群聊, 公众号列表, 按 wxid, 微信号, 备注建立索引
+
+        1.首次访问时同步加载, 之后的查询均为 O(1) 的本地查找, 不再请求千寻接口 \r\n
+        2.超过 ttl 后的访问会在后台刷新, 刷新完成前继续使用旧数据 \r\n
+        3.联系人以 Record 紧凑保存, 字段名由全部联系人共享, 用法同只读 dict
+
+        Args:
+            robot (Robot): 机器人实例 \r\n
+            ttl (float, optional): 缓存有效期(秒), 0 为不自动刷新. 默认 300 \r\n
+            logger (logging.Logger, optional): 日志记录器. 默认 logging.getLogger('qianxun')
+        """
+
+        self.robot = robot
+        self.ttl = ttl
+        self.logger = logger or logging.getLogger('qianxun')
+        self.setup()
+
+    def setup(self):
+        self.setup_indexes()
+        self.refreshing = False
+        self.lock = threading.RLock()
+
+    def setup_indexes(self):
+        self.records = {}
+        self.kinds = {}
+        self.wx_nums = {}
+        self.remarks = {}
+        self.index = SearchIndex()
+        self.pending = OrderedDict()
+        self.loaded_at = 0
+
+    def __len__(self) -> int:
+        self.ensure()
+        return len(self.records)
+
+    def __contains__(self, wxid: str) -> bool:
+        self.ensure()
+        return wxid in self.records
+
+    # 刷新联系人
+    def refresh(self, kinds: list = None, type: str = '1') -> bool:
+        """从千寻接口重新拉取联系人并重建索引
+
+        Args:
+            kinds (list, optional): 要刷新的类型, 可选 'friend', 'chatroom', 'subscription', 不填则全部刷新 \r\n
+            type (str, optional): 1 = 从千寻缓存中获取, 2 = 重新遍历二叉树并刷新缓存. 默认 '1'
+
+        Returns:
+            bool: 全部刷新成功时为 True
+        """
+
+        kinds = kinds or list(KINDS)
+        ok = True
+        fetched = {}
+        for kind in kinds:
+            try:
+                # 逐条解析并立即转为紧凑记录, 不在内存中同时保留完整响应
+                fetched[kind] = [Record(record) for record in getattr(self.robot, KINDS[kind])(type=type)]
+            except Exception as e:
+                self.logger.warning('联系人刷新失败: kind=%s error=%s', kind, e)
+                ok = False
+
+        # 未刷新或刷新失败的类型保留原有联系人
+        entries = []
+        with self.lock:
+            for wxid, record in self.records.items():
+                kind = self.kinds.get(wxid, 'friend')
+                if kind not in fetched:
+                    entries.append((kind, record))
+        entries.extend((kind, record) for kind, result in fetched.items() for record in result)
+        self.replace(entries)
+
+        if ok:
+            self.loaded_at = time.monotonic()
+        return ok
+
+    # 整体替换联系人
+    def replace(self, entries):
+        """在锁外建立新的联系人表与索引, 完成后一次性替换, 替换前的查询继续使用旧数据
+
+        Args:
+            entries (iterable): [(联系人类型, 联系人), ...]
+        """
+
+        records = {}
+        kinds = {}
+        for kind, record in entries:
+            if not isinstance(record, Record):
+                record = Record(record)
+            records[record['wxid']] = record
+            kinds[record['wxid']] = kind
+
+        wx_nums = {}
+        remarks = {}
+        for wxid, record in records.items():
+            if record.get('wxNum'):
+                wx_nums[record['wxNum']] = wxid
+            if record.get('remark'):
+                remarks.setdefault(record['remark'], set()).add(wxid)
+
+        index = SearchIndex()
+        index.rebuild(records)
+        with self.lock:
+            self.records, self.kinds, self.wx_nums, self.remarks, self.index = records, kinds, wx_nums, remarks, index
+
+    # 从快照恢复
+    def restore(self, records, age: float = 0):
+        """从快照恢复联系人, 替换当前缓存
+
+        Args:
+            records (iterable): [(联系人类型, 联系人), ...] \r\n
+            age (float, optional): 快照距今的秒数, 超过 ttl 时下次访问会在后台刷新. 默认 0
+        """
+
+        self.replace(records)
+        # loaded_at 为 0 表示未加载, 因此至少取一个极小的正数
+        self.loaded_at = max(time.monotonic() - age, 1e-9)
+
+    # 确保缓存可用
+    def ensure(self):
+        if not self.loaded_at:
+            with self.lock:
+                if not self.loaded_at:
+                    self.refresh()
+                    # 加载失败时同样按 ttl 重试, 避免每次查询都请求千寻接口
+                    self.loaded_at = self.loaded_at or time.monotonic()
+            return
+
+        if self.ttl and not self.refreshing and time.monotonic() - self.loaded_at > self.ttl:
+            with self.lock:
+                if self.refreshing:
+                    return
+                self.refreshing = True
+            threading.Thread(target=self.background_refresh, name='qianxun-contacts', daemon=True).start()
+
+    def background_refresh(self):
+        try:
+            self.refresh()
+        except Exception:
+            self.logger.exception('联系人后台刷新失败')
+        finally:
+            self.refreshing = False
+
+    # 写入联系人并更新索引
+    def put(self, record: dict, kind: str = 'friend', reindex: bool = True):
+        """写入联系人并更新索引
+
+        Args:
+            record (dict): 联系人, 格式同 getFriendList 的 result 元素 \r\n
+            kind (str, optional): 联系人类型. 默认 'friend' \r\n
+            reindex (bool, optional): 是否更新检索索引, 批量写入时可关闭后统一 rebuild. 默认 True
+        """
+
+        wxid = record['wxid']
+        if not isinstance(record, Record):
+            record = Record(record)
+        with self.lock:
+            if wxid in self.records:
+                self.remove(wxid, reindex)
+            self.records[wxid] = record
+            if reindex:
+                self.index.add(wxid, record)
+            self.kinds[wxid] = kind
+            if record.get('wxNum'):
+                self.wx_nums[record['wxNum']] = wxid
+            if record.get('remark'):
+                self.remarks.setdefault(record['remark'], set()).add(wxid)
+
+    # 删除联系人并更新索引
+    def remove(self, wxid: str, reindex: bool = True) -> dict:
+        with self.lock:
+            record = self.records.pop(wxid, None)
+            if record is None:
+                return None
+            self.kinds.pop(wxid, None)
+            if reindex:
+                self.index.remove(wxid)
+            if record.get('wxNum') and self.wx_nums.get(record['wxNum']) == wxid:
+                del self.wx_nums[record['wxNum']]
+            remark = record.get('remark')
+            if remark and remark in self.remarks:
+                self.remarks[remark].discard(wxid)
+                if not self.remarks[remark]:
+                    del self.remarks[remark]
+            return record
+
+    # 按 wxid 查找
+    def get(self, wxid: str) -> dict:
+        """按 wxid 查找
+
+        Args:
+            wxid (str): 好友, 群聊或公众号 WXID
+
+        Returns:
+            Record: 联系人, 格式同 getFriendList 的 result 元素, 只读, 需要 dict 时使用 dict(record), 不存在时为 None
+        """
+
+        self.ensure()
+        return self.records.get(wxid)
+
+    # 按微信号查找
+    def getByWxNum(self, wx_num: str) -> dict:
+        self.ensure()
+        with self.lock:
+            records, wx_nums = self.records, self.wx_nums
+        wxid = wx_nums.get(wx_num)
+        return records.get(wxid) if wxid else None
+
+    # 按备注查找
+    def getByRemark(self, remark: str) -> list:
+        """按备注查找, 备注可能重复
+
+        Args:
+            remark (str): 备注
+
+        Returns:
+            list: 联系人列表
+        """
+
+        self.ensure()
+        # 备注集合会被 put / remove 原地修改, 在锁内读取
+        with self.lock:
+            return [self.records[wxid] for wxid in self.remarks.get(remark, ())]
+
+    # 显示名称
+    def getName(self, wxid: str, default: str = '') -> str:
+        """显示名称, 有备注时为备注, 否则为昵称
+
+        Args:
+            wxid (str): 好友, 群聊或公众号 WXID \r\n
+            default (str, optional): 不存在时的返回值. 默认 ''
+
+        Returns:
+            str: 显示名称
+        """
+
+        record = self.get(wxid)
+        if record is None:
+            return default
+        return record.get('remark') or record.get('nick') or default
+
+    # 按类型列出联系人
+    def list(self, kind: str = 'friend') -> list:
+        """按类型列出联系人
+
+        Args:
+            kind (str, optional): 'friend', 'chatroom' 或 'subscription'. 默认 'friend'
+
+        Returns:
+            list: 联系人列表
+        """
+
+        self.ensure()
+        # 刷新会整体替换各个表, 只从同一时刻取出的表中读取
+        with self.lock:
+            records, kinds = self.records, self.kinds
+        result = (records.get(wxid) for wxid, k in list(kinds.items()) if k == kind)
+        return [record for record in result if record is not None]
+
+    # 检索联系人
+    def search(self, query: str, limit: int = 20, kind: str = '') -> list:
+        """按昵称, 备注, 简拼, 全拼检索联系人, 优先使用前缀匹配, 没有结果时再使用模糊匹配
+
+        例: robot.contacts.search('zhangs'), robot.contacts.search('zs'), robot.contacts.search('张')
+
+        Args:
+            query (str): 查询词 \r\n
+            limit (int, optional): 最多返回数量. 默认 20 \r\n
+            kind (str, optional): 只返回该类型的联系人, 'friend', 'chatroom' 或 'subscription'. 默认不限制
+
+        Returns:
+            list: 联系人列表
+        """
+
+        self.ensure()
+        with self.lock:
+            records, kinds, index = self.records, self.kinds, self.index
+        result = []
+        for wxid in index.search(query, limit * 4 if kind else limit):
+            record = records.get(wxid)
+            if record is not None and (not kind or kinds.get(wxid) == kind):
+                result.append(record)
+        return result[:limit]
+
+    # 修改联系人字段
+    def patch(self, wxid: str, **fields) -> bool:
+        """修改联系人字段并更新索引, 联系人不在缓存中时忽略
+
+        例: robot.contacts.patch('wxid_xxx', remark='新备注')
+
+        Args:
+            wxid (str): 好友, 群聊或公众号 WXID \r\n
+            **fields: 要修改的字段
+
+        Returns:
+            bool: 联系人存在并已修改时为 True
+        """
+
+        with self.lock:
+            record = self.records.get(wxid)
+            if record is None:
+                return False
+            updated = dict(record)
+            updated.update(fields)
+            self.put(updated, self.kinds[wxid])
+            return True
+
+    # 全部失效
+    def invalidate(self):
+        """清空缓存, 下次访问时重新加载"""
+
+        with self.lock:
+            self.setup_indexes()
+
+    # 按回调事件增量更新
+    def apply(self, event: dict):
+        """按回调事件增量更新缓存, 只修改受影响的联系人
+
+        1.10014 账号变动: 清空缓存 \r\n
+        2.10011 好友请求: 记录请求中的资料, 通过好友验证后直接写入 \r\n
+        3.群聊改名: 修改群聊昵称 \r\n
+        4.机器人被移出群聊: 删除该群聊 \r\n
+        5.新添加好友: 查询对象信息后写入
+
+        Args:
+            event (dict): 原始回调事件
+        """
+
+        if not self.loaded_at:
+            return
+
+        code = event.get('event')
+        if code == EVENT_ACCOUNT_CHANGE:
+            self.invalidate()
+            return
+
+        data = payload(event)
+        if code == EVENT_FRIEND_REQUEST:
+            if data.get('v3'):
+                self.remember(data['v3'], data)
+            return
+
+        result = notice(event)
+        if result is None:
+            return
+
+        kind, value = result
+        wxid = conversation(event)
+        if kind == 'rename':
+            self.patch(wxid, nick=value)
+        elif kind == 'kicked':
+            self.remove(wxid)
+        elif kind == 'friend' and wxid not in self.records:
+            self.add_friend(wxid)
+
+    # 记录好友请求, 超过 PENDING_TTL 或 PENDING_MAX 的旧请求被丢弃
+    def remember(self, v3: str, request: dict):
+        now = time.monotonic()
+        with self.lock:
+            self.pending.pop(v3, None)
+            self.pending[v3] = (now + PENDING_TTL, request)
+            while self.pending:
+                v3, (expire, _) = next(iter(self.pending.items()))
+                if expire > now and len(self.pending) <= PENDING_MAX:
+                    break
+                del self.pending[v3]
+
+    # 通过好友验证后写入
+    def accept(self, v3: str):
+        with self.lock:
+            expire, request = self.pending.pop(v3, (0, None))
+        if not self.loaded_at or not request or expire < time.monotonic():
+            return
+        wxid = request.get('fromWxid') or request.get('wxid')
+        if wxid:
+            self.add_friend(wxid)
+
+    def add_friend(self, wxid: str):
+        # 经对象信息缓存查询, 同一个 wxid 同时只查询一次
+        profile = self.robot.profiles.get(wxid)
+        if profile:
+            self.put(profile, 'friend')
+
+
+class ContactSync(Middleware):
+    def __init__(self, directory: ContactDirectory):
+        """联系人同步中间件, 按回调事件增量更新联系人目录
+
+        Args:
+            directory (ContactDirectory): 联系人目录
+        """
+
+        self.directory = directory
+        self.warned = False
+
+    def before(self, event: dict):
+        if self.directory.detached and not self.warned:
+            self.warned = True
+            self.directory.logger.warning("ContactSync 在回调进程中不会更新主进程的联系人目录, 请使用 callbackEvents(..., mode='thread')")
+        self.directory.apply(event)
@@ -0,0 +1,107 @@
+from collections.abc import Mapping
+from .Compact import MemberSet
+
+
+# 参与比较的字段
+FIELDS = ('nick', 'remark', 'groupNick')
+
+
+# 按 WXID 建立查找表
+def keyed(items, key: str = 'wxid') -> Mapping:
+    """按 WXID 建立查找表
+
+    Args:
+        items (list | dict): 联系人或群成员列表, 格式同 getFriendList / getGroupMemberList 的 result; \r\n
+            或 {wxid: 联系人}, {wxid: 群昵称} (如 robot.members.get 的返回值)
+        key (str, optional): 主键字段. 默认 'wxid'
+
+    Returns:
+        Mapping: {wxid: 联系人或群昵称}
+    """
+
+    if isinstance(items, Mapping):
+        return items
+    return {item[key]: item for item in items}
+
+
+# 取字段值
+def field(value, name: str):
+    if isinstance(value, Mapping):
+        return value.get(name)
+    # {wxid: 群昵称} 形式的群成员
+    return value if name == 'groupNick' else None
+
+
+# 比较两份快照
+def diff(old, new, fields: tuple = FIELDS, key: str = 'wxid') -> dict:
+    """比较两份联系人或群成员快照, 找出新增, 删除与字段变化的条目, O(n)
+
+    例: diff(robot.getGroupMemberList(wxid=group)['result'], robot.getGroupMemberList(wxid=group)['result'])
+
+    Args:
+        old (list | dict): 旧快照, 格式见 keyed \r\n
+        new (list | dict): 新快照, 格式见 keyed \r\n
+        fields (tuple, optional): 参与比较的字段. 默认 ('nick', 'remark', 'groupNick') \r\n
+        key (str, optional): 主键字段. 默认 'wxid'
+
+    Returns:
+        dict: {
+            "added": ["wxid_xxx", ...], # 新增 \r\n
+            "removed": ["wxid_xxx", ...], # 删除 \r\n
+            "changed": {"wxid_xxx": {"nick": ("旧昵称", "新昵称")}, ...} # 字段变化
+        }
+    """
+
+    if isinstance(old, MemberSet) and isinstance(new, MemberSet) and old.table is new.table:
+        return merge(old, new)
+
+    old = keyed(old, key)
+    new = keyed(new, key)
+    added = [wxid for wxid in new if wxid not in old]
+    removed = [wxid for wxid in old if wxid not in new]
+    changed = {}
+    for wxid, value in new.items():
+        before = old.get(wxid)
+        if before is None or before == value:
+            continue
+        delta = {}
+        for name in fields:
+            a, b = field(before, name), field(value, name)
+            if a != b:
+                delta[name] = (a, b)
+        if delta:
+            changed[wxid] = delta
+    return {'added': added, 'removed': removed, 'changed': changed}
+
+
+# 比较两个共享字符串表的群成员集合
+def merge(old: MemberSet, new: MemberSet) -> dict:
+    """两个 MemberSet 均按 WXID 编号排序, 直接归并比较整数数组, 不需要建立查找表
+
+    Args:
+        old (MemberSet): 旧群成员 \r\n
+        new (MemberSet): 新群成员
+
+    Returns:
+        dict: 格式同 diff
+    """
+
+    strings = old.table.strings
+    added, removed, changed = [], [], {}
+    i = j = 0
+    while i < len(old.wxids) and j < len(new.wxids):
+        a, b = old.wxids[i], new.wxids[j]
+        if a == b:
+            if old.nicks[i] != new.nicks[j]:
+                changed[strings[a]] = {'groupNick': (strings[old.nicks[i]], strings[new.nicks[j]])}
+            i += 1
+            j += 1
+        elif a < b:
+            removed.append(strings[a])
+            i += 1
+        else:
+            added.append(strings[b])
+            j += 1
+    removed.extend(strings[index] for index in old.wxids[i:])
+    added.extend(strings[index] for index in new.wxids[j:])
+    return {'added': added, 'removed': removed, 'changed': changed}
@@ -1,3350 +1,1906 @@
-表情_微笑 = '[微笑]'
-表情_撇嘴 = '[撇嘴]'
-表情_色 = '[色]'
-表情_发呆 = '[发呆]'
-表情_得意 = '[得意]'
-表情_流泪 = '[流泪]'
-表情_闭嘴 = '[闭嘴]'
-表情_害羞 = '[害羞]'
-表情_睡 = '[睡]'
-表情_大哭 = '[大哭]'
-表情_尴尬 = '[尴尬]'
-表情_发怒 = '[发怒]'
-表情_调皮 = '[调皮]'
-表情_呲牙 = '[呲牙]'
-表情_惊讶 = '[惊讶]'
-表情_难过 = '[难过]'
-表情_囧 = '[囧]'
-表情_抓狂 = '[抓狂]'
-表情_吐 = '[吐]'
-表情_偷笑 = '[偷笑]'
-表情_愉快 = '[愉快]'
-表情_白眼 = '[白眼]'
-表情_傲慢 = '[傲慢]'
-表情_困 = '[困]'
-表情_惊恐 = '[惊恐]'
-表情_流汗 = '[流汗]'
-表情_憨笑 = '[憨笑]'
-表情_悠闲 = '[悠闲]'
-表情_奋斗 = '[奋斗]'
-表情_咒骂 = '[咒骂]'
-表情_疑问 = '[疑问]'
-表情_嘘 = '[嘘]'
-表情_晕 = '[晕]'
-表情_衰 = '[衰]'
-表情_骷髅 = '[骷髅]'
-表情_敲打 = '[敲打]'
-表情_再见 = '[再见]'
-表情_擦汗 = '[擦汗]'
-表情_抠鼻 = '[抠鼻]'
-表情_鼓掌 = '[鼓掌]'
-表情_坏笑 = '[坏笑]'
-表情_左哼哼 = '[左哼哼]'
-表情_右哼哼 = '[右哼哼]'
-表情_哈欠 = '[哈欠]'
-表情_鄙视 = '[鄙视]'
-表情_委屈 = '[委屈]'
-表情_快哭了 = '[快哭了]'
-表情_阴险 = '[阴险]'
-表情_亲亲 = '[亲亲]'
-表情_可怜 = '[可怜]'
-表情_菜刀 = '[菜刀]'
-表情_西瓜 = '[西瓜]'
-表情_啤酒 = '[啤酒]'
-表情_咖啡 = '[咖啡]'
-表情_猪头 = '[猪头]'
-表情_玫瑰 = '[玫瑰]'
-表情_凋谢 = '[凋谢]'
-表情_嘴唇 = '[嘴唇]'
-表情_爱心 = '[爱心]'
-表情_心碎 = '[心碎]'
-表情_蛋糕 = '[蛋糕]'
-表情_炸弹 = '[炸弹]'
-表情_便便 = '[便便]'
-表情_月亮 = '[月亮]'
-表情_太阳 = '[太阳]'
-表情_拥抱 = '[拥抱]'
-表情_强 = '[强]'
-表情_弱 = '[弱]'
-表情_握手 = '[握手]'
-表情_胜利 = '[胜利]'
-表情_抱拳 = '[抱拳]'
-表情_勾引 = '[勾引]'
-表情_拳头 = '[拳头]'
-表情_ok = '[OK]'
-表情_跳跳 = '[跳跳]'
-表情_发抖 = '[发抖]'
-表情_怄火 = '[怄火]'
-表情_转圈 = '[转圈]'
-表情_哈嘿 = '[哈嘿]'
-表情_捂脸 = '[捂脸]'
-表情_奸笑 = '[奸笑]'
-表情_机智 = '[机智]'
-表情_皱眉 = '[皱眉]'
-表情_耶 = '[耶]'
-表情_红包 = '[红包]'
-表情_發 = '[發]'
-表情_福 = '[福]'
+# 表情常量, 用法: Emoji.小丑脸, Emoji.表情_捂脸
+#
+# 常量在首次访问时才从下方的表中查出并缓存为模块属性, 导入本模块几乎没有开销;
+# 常量名与取值的完整列表见同目录下的 Emoji.pyi
 
-咧嘴笑 = '[emoji=D83D][emoji=DE00]'  # 咧嘴笑
-"""😀"""
-大眼睛咧嘴笑脸 = '[emoji=D83D][emoji=DE03]'  # 大眼睛咧嘴笑脸
-"""😃"""
-咧嘴笑脸 = '[emoji=D83D][emoji=DE04]'  # 咧嘴笑脸
-"""😄"""
-笑容可掬的脸 = '[emoji=D83D][emoji=DE01]'  # 笑容可掬的脸
-"""😁"""
-咧嘴眯眼的脸 = '[emoji=D83D][emoji=DE06]'  # 咧嘴眯眼的脸
-"""😆"""
-满脸汗水的笑容 = '[emoji=D83D][emoji=DE05]'  # 满脸汗水的笑容
-"""😅"""
-在地板上滚来滚去大笑 = '[emoji=D83E][emoji=DD23]'  # 在地板上滚来滚去大笑
-"""🤣"""
-喜极而泣 = '[emoji=D83D][emoji=DE02]'  # 喜极而泣
-"""😂"""
-略带微笑的脸 = '[emoji=D83D][emoji=DE42]'  # 略带微笑的脸
-"""🙂"""
-倒立的脸 = '[emoji=D83D][emoji=DE43]'  # 倒立的脸
-"""🙃"""
-眨眼脸 = '[emoji=D83D][emoji=DE09]'  # 眨眼脸
-"""😉"""
-笑脸与微笑的眼睛 = '[emoji=D83D][emoji=DE0A]'  # 笑脸与微笑的眼睛
-"""😊"""
-带光环的笑脸 = '[emoji=D83D][emoji=DE07]'  # 带光环的笑脸
-"""😇"""
-满心笑容 = '[emoji=D83E][emoji=DD70]'  # 满心笑容
-"""🥰"""
-带着心眼的笑脸 = '[emoji=D83D][emoji=DE0D]'  # 带着心眼的笑脸
-"""😍"""
-星击 = '[emoji=D83E][emoji=DD29]'  # 星击
-"""🤩"""
-吹着吻的脸 = '[emoji=D83D][emoji=DE18]'  # 吹着吻的脸
-"""😘"""
-吻脸 = '[emoji=D83D][emoji=DE17]'  # 吻脸
-"""😗"""
-笑脸 = '[emoji=263A]'  # 笑脸
-"""☺"""
-闭着眼睛亲吻脸 = '[emoji=D83D][emoji=DE1A]'  # 闭着眼睛亲吻脸
-"""😚"""
-用微笑的眼睛亲吻脸 = '[emoji=D83D][emoji=DE19]'  # 用微笑的眼睛亲吻脸
-"""😙"""
-脸上的美味食物 = '[emoji=D83D][emoji=DE0B]'  # 脸上的美味食物
-"""😋"""
-有舌头的脸 = '[emoji=D83D][emoji=DE1B]'  # 有舌头的脸
-"""😛"""
-舌头眨眼脸 = '[emoji=D83D][emoji=DE1C]'  # 舌头眨眼脸
-"""😜"""
-滑稽面孔 = '[emoji=D83E][emoji=DD2A]'  # 滑稽面孔
-"""🤪"""
-用舌头眯着脸 = '[emoji=D83D][emoji=DE1D]'  # 用舌头眯着脸
-"""😝"""
-钱嘴脸 = '[emoji=D83E][emoji=DD11]'  # 钱嘴脸
-"""🤑"""
-拥抱面容 = '[emoji=D83E][emoji=DD17]'  # 拥抱面容
-"""🤗"""
-手捂嘴的脸 = '[emoji=D83E][emoji=DD2D]'  # 手捂嘴的脸
-"""🤭"""
-洗脸 = '[emoji=D83E][emoji=DD2B]'  # 洗脸
-"""🤫"""
-思考的脸 = '[emoji=D83E][emoji=DD14]'  # 思考的脸
-"""🤔"""
-拉链口面 = '[emoji=D83E][emoji=DD10]'  # 拉链口面
-"""🤐"""
-扬起眉毛的脸 = '[emoji=D83E][emoji=DD28]'  # 扬起眉毛的脸
-"""🤨"""
-中性面 = '[emoji=D83D][emoji=DE10]'  # 中性面
-"""😐"""
-无表情的脸 = '[emoji=D83D][emoji=DE11]'  # 无表情的脸
-"""😑"""
-没有嘴的脸 = '[emoji=D83D][emoji=DE36]'  # 没有嘴的脸
-"""😶"""
-傻笑脸 = '[emoji=D83D][emoji=DE0F]'  # 傻笑脸
-"""😏"""
-没用的脸 = '[emoji=D83D][emoji=DE12]'  # 没用的脸
-"""😒"""
-眼睛滚动的脸 = '[emoji=D83D][emoji=DE44]'  # 眼睛滚动的脸
-"""🙄"""
-歪扭 = '[emoji=D83D][emoji=DE2C]'  # 歪扭
-"""😬"""
-说谎脸 = '[emoji=D83E][emoji=DD25]'  # 说谎脸
-"""🤥"""
-卸脸 = '[emoji=D83D][emoji=DE0C]'  # 卸脸
-"""😌"""
-忧郁的面容 = '[emoji=D83D][emoji=DE14]'  # 忧郁的面容
-"""😔"""
-瞌睡脸 = '[emoji=D83D][emoji=DE2A]'  # 瞌睡脸
-"""😪"""
-流口水的脸 = '[emoji=D83E][emoji=DD24]'  # 流口水的脸
-"""🤤"""
-睡脸 = '[emoji=D83D][emoji=DE34]'  # 睡脸
-"""😴"""
-带口罩的脸 = '[emoji=D83D][emoji=DE37]'  # 带口罩的脸
-"""😷"""
-带温度计的脸 = '[emoji=D83E][emoji=DD12]'  # 带温度计的脸
-"""🤒"""
-戴头巾的脸 = '[emoji=D83E][emoji=DD15]'  # 戴头巾的脸
-"""🤕"""
-恶心脸 = '[emoji=D83E][emoji=DD22]'  # 恶心脸
-"""🤢"""
-面吐 = '[emoji=D83E][emoji=DD2E]'  # 面吐
-"""🤮"""
-打喷嚏脸 = '[emoji=D83E][emoji=DD27]'  # 打喷嚏脸
-"""🤧"""
-热面 = '[emoji=D83E][emoji=DD75]'  # 热面
-"""🥵"""
-冷面 = '[emoji=D83E][emoji=DD76]'  # 冷面
-"""🥶"""
-哇哇的脸 = '[emoji=D83E][emoji=DD74]'  # 哇哇的脸
-"""🥴"""
-头晕脸 = '[emoji=D83D][emoji=DE35]'  # 头晕脸
-"""😵"""
-爆炸头 = '[emoji=D83E][emoji=DD2F]'  # 爆炸头
-"""🤯"""
-牛仔帽面 = '[emoji=D83E][emoji=DD20]'  # 牛仔帽面
-"""🤠"""
-派对脸 = '[emoji=D83E][emoji=DD73]'  # 派对脸
-"""🥳"""
-带太阳镜的笑脸 = '[emoji=D83D][emoji=DE0E]'  # 带太阳镜的笑脸
-"""😎"""
-书呆子脸 = '[emoji=D83E][emoji=DD13]'  # 书呆子脸
-"""🤓"""
-戴单片眼镜的脸 = '[emoji=D83E][emoji=DDD0]'  # 戴单片眼镜的脸
-"""🧐"""
-困惑的脸 = '[emoji=D83D][emoji=DE15]'  # 困惑的脸
-"""😕"""
-忧愁面容 = '[emoji=D83D][emoji=DE1F]'  # 忧愁面容
-"""😟"""
-微皱的脸 = '[emoji=D83D][emoji=DE41]'  # 微皱的脸
-"""🙁"""
-皱眉 = '[emoji=2639]'  # 皱眉
-"""☹"""
-张开嘴的脸 = '[emoji=D83D][emoji=DE2E]'  # 张开嘴的脸
-"""😮"""
-哑巴脸 = '[emoji=D83D][emoji=DE2F]'  # 哑巴脸
-"""😯"""
-惊愕的脸 = '[emoji=D83D][emoji=DE32]'  # 惊愕的脸
-"""😲"""
-脸红 = '[emoji=D83D][emoji=DE33]'  # 脸红
-"""😳"""
-恳求面容 = '[emoji=D83E][emoji=DD7A]'  # 恳求面容
-"""🥺"""
-张嘴皱眉头 = '[emoji=D83D][emoji=DE26]'  # 张嘴皱眉头
-"""😦"""
-痛苦的面容 = '[emoji=D83D][emoji=DE27]'  # 痛苦的面容
-"""😧"""
-可怕的面容 = '[emoji=D83D][emoji=DE28]'  # 可怕的面容
-"""😨"""
-焦头烂额 = '[emoji=D83D][emoji=DE30]'  # 焦头烂额
-"""😰"""
-悲伤但如释重负的脸 = '[emoji=D83D][emoji=DE25]'  # 悲伤但如释重负的脸
-"""😥"""
-哭脸 = '[emoji=D83D][emoji=DE22]'  # 哭脸
-"""😢"""
-大声哭泣的脸 = '[emoji=D83D][emoji=DE2D]'  # 大声哭泣的脸
-"""😭"""
-恐惧中尖叫的脸 = '[emoji=D83D][emoji=DE31]'  # 恐惧中尖叫的脸
-"""😱"""
-脸色茫然 = '[emoji=D83D][emoji=DE16]'  # 脸色茫然
-"""😖"""
-坚持不懈的脸 = '[emoji=D83D][emoji=DE23]'  # 坚持不懈的脸
-"""😣"""
-失望的脸 = '[emoji=D83D][emoji=DE1E]'  # 失望的脸
-"""😞"""
-汗流满面 = '[emoji=D83D][emoji=DE13]'  # 汗流满面
-"""😓"""
-疲乏的脸 = '[emoji=D83D][emoji=DE29]'  # 疲乏的脸
-"""😩"""
-疲惫的面容 = '[emoji=D83D][emoji=DE2B]'  # 疲惫的面容
-"""😫"""
-打呵欠的脸 = '[emoji=D83E][emoji=DD71]'  # 打呵欠的脸
-"""🥱"""
-鼻子冒出蒸汽的脸 = '[emoji=D83D][emoji=DE24]'  # 鼻子冒出蒸汽的脸
-"""😤"""
-撅嘴脸 = '[emoji=D83D][emoji=DE21]'  # 撅嘴脸
-"""😡"""
-生气的脸 = '[emoji=D83D][emoji=DE20]'  # 生气的脸
-"""😠"""
-口上有符号的脸 = '[emoji=D83E][emoji=DD2C]'  # 口上有符号的脸
-"""🤬"""
-有角的笑脸 = '[emoji=D83D][emoji=DE08]'  # 有角的笑脸
-"""😈"""
-有角的愤怒的脸 = '[emoji=D83D][emoji=DC7F]'  # 有角的愤怒的脸
-"""👿"""
-颅骨 = '[emoji=D83D][emoji=DC80]'  # 颅骨
-"""💀"""
-头骨和交叉骨 = '[emoji=2620]'  # 头骨和交叉骨
-"""☠"""
-一堆屎 = '[emoji=D83D][emoji=DCA9]'  # 一堆屎
-"""💩"""
-小丑脸 = '[emoji=D83E][emoji=DD21]'  # 小丑脸
-"""🤡"""
-食人魔 = '[emoji=D83D][emoji=DC79]'  # 食人魔
-"""👹"""
-妖精 = '[emoji=D83D][emoji=DC7A]'  # 妖精
-"""👺"""
-鬼 = '[emoji=D83D][emoji=DC7B]'  # 鬼
-"""👻"""
-外星人 = '[emoji=D83D][emoji=DC7D]'  # 外星人
-"""👽"""
-外来怪物 = '[emoji=D83D][emoji=DC7E]'  # 外来怪物
-"""👾"""
-机器人 = '[emoji=D83E][emoji=DD16]'  # 机器人
-"""🤖"""
-咧嘴笑的猫 = '[emoji=D83D][emoji=DE3A]'  # 咧嘴笑的猫
-"""😺"""
-笑眯眯的猫 = '[emoji=D83D][emoji=DE38]'  # 笑眯眯的猫
-"""😸"""
-喜极而泣的猫 = '[emoji=D83D][emoji=DE39]'  # 喜极而泣的猫
-"""😹"""
-心眼含笑的猫 = '[emoji=D83D][emoji=DE3B]'  # 心眼含笑的猫
-"""😻"""
-苦笑的猫 = '[emoji=D83D][emoji=DE3C]'  # 苦笑的猫
-"""😼"""
-接吻猫 = '[emoji=D83D][emoji=DE3D]'  # 接吻猫
-"""😽"""
-疲倦的猫 = '[emoji=D83D][emoji=DE40]'  # 疲倦的猫
-"""🙀"""
-哭泣的猫 = '[emoji=D83D][emoji=DE3F]'  # 哭泣的猫
-"""😿"""
-撅嘴猫 = '[emoji=D83D][emoji=DE3E]'  # 撅嘴猫
-"""😾"""
-看不到邪恶的猴子 = '[emoji=D83D][emoji=DE48]'  # 看不到邪恶的猴子
-"""🙈"""
-听不到邪恶的猴子 = '[emoji=D83D][emoji=DE49]'  # 听不到邪恶的猴子
-"""🙉"""
-不要说邪恶的猴子 = '[emoji=D83D][emoji=DE4A]'  # 不要说邪恶的猴子
-"""🙊"""
-吻痕 = '[emoji=D83D][emoji=DC8B]'  # 吻痕
-"""💋"""
-情书 = '[emoji=D83D][emoji=DC8C]'  # 情书
-"""💌"""
-带箭头的心 = '[emoji=D83D][emoji=DC98]'  # 带箭头的心
-"""💘"""
-带丝带的心 = '[emoji=D83D][emoji=DC9D]'  # 带丝带的心
-"""💝"""
-闪闪发光的心 = '[emoji=D83D][emoji=DC96]'  # 闪闪发光的心
-"""💖"""
-成长的心 = '[emoji=D83D][emoji=DC97]'  # 成长的心
-"""💗"""
-跳动的心脏 = '[emoji=D83D][emoji=DC93]'  # 跳动的心脏
-"""💓"""
-旋转心脏 = '[emoji=D83D][emoji=DC9E]'  # 旋转心脏
-"""💞"""
-两颗心 = '[emoji=D83D][emoji=DC95]'  # 两颗心
-"""💕"""
-心脏装饰 = '[emoji=D83D][emoji=DC9F]'  # 心脏装饰
-"""💟"""
-心形感叹号 = '[emoji=2763]'  # 心形感叹号
-"""❣"""
-破碎的心 = '[emoji=D83D][emoji=DC94]'  # 破碎的心
-"""💔"""
-红心 = '[emoji=2764]'  # 红心
-"""❤"""
-橙心 = '[emoji=D83E][emoji=DDE1]'  # 橙心
-"""🧡"""
-黄心 = '[emoji=D83D][emoji=DC9B]'  # 黄心
-"""💛"""
-青心树 = '[emoji=D83D][emoji=DC9A]'  # 青心树
-"""💚"""
-蓝心 = '[emoji=D83D][emoji=DC99]'  # 蓝心
-"""💙"""
-紫心 = '[emoji=D83D][emoji=DC9C]'  # 紫心
-"""💜"""
-黑心 = '[emoji=D83D][emoji=DDA4]'  # 黑心
-"""🖤"""
-白心 = '[emoji=D83E][emoji=DD0D]'  # 白心
-"""🤍"""
-褐色心脏 = '[emoji=D83E][emoji=DD0E]'  # 褐色心脏
-"""🤎"""
-百分 = '[emoji=D83D][emoji=DCAF]'  # 百分
-"""💯"""
-愤怒符号 = '[emoji=D83D][emoji=DCA2]'  # 愤怒符号
-"""💢"""
-碰撞 = '[emoji=D83D][emoji=DCA5]'  # 碰撞
-"""💥"""
-头晕 = '[emoji=D83D][emoji=DCAB]'  # 头晕
-"""💫"""
-汗液滴 = '[emoji=D83D][emoji=DCA6]'  # 汗液滴
-"""💦"""
-飞奔而去 = '[emoji=D83D][emoji=DCA8]'  # 飞奔而去
-"""💨"""
-孔 = '[emoji=D83D][emoji=DD73]'  # 孔
-"""🕳"""
-炸弹 = '[emoji=D83D][emoji=DCA3]'  # 炸弹
-"""💣"""
-语音气球 = '[emoji=D83D][emoji=DCAC]'  # 语音气球
-"""💬"""
-言语中的眼睛 = '[emoji=D83D][emoji=DC41][emoji=FE0F][emoji=200D][emoji=D83D][emoji=DDE8][emoji=FE0F]'  # 言语中的眼睛
-"""👁️‍🗨️"""
-左语音气泡 = '[emoji=D83D][emoji=DDE8]'  # 左语音气泡
-"""🗨"""
-右愤怒气泡 = '[emoji=D83D][emoji=DDEF]'  # 右愤怒气泡
-"""🗯"""
-思维气球 = '[emoji=D83D][emoji=DCAD]'  # 思维气球
-"""💭"""
-ZZZ = '[emoji=D83D][emoji=DCA4]'  # ZZZ
-"""💤"""
-挥手 = '[emoji=D83D][emoji=DC4B]'  # 挥手
-"""👋"""
-抬起手背 = '[emoji=D83E][emoji=DD1A]'  # 抬起手背
-"""🤚"""
-手指张开的手 = '[emoji=D83D][emoji=DD90]'  # 手指张开的手
-"""🖐"""
-抬高手 = '[emoji=270B]'  # 抬高手
-"""✋"""
-火神礼炮 = '[emoji=D83D][emoji=DD96]'  # 火神礼炮
-"""🖖"""
-好手 = '[emoji=D83D][emoji=DC4C]'  # 好手
-"""👌"""
-捏手 = '[emoji=D83E][emoji=DD0F]'  # 捏手
-"""🤏"""
-胜利之手 = '[emoji=270C]'  # 胜利之手
-"""✌"""
-交叉手指 = '[emoji=D83E][emoji=DD1E]'  # 交叉手指
-"""🤞"""
-爱你的手势 = '[emoji=D83E][emoji=DD1F]'  # 爱你的手势
-"""🤟"""
-喇叭的标志 = '[emoji=D83E][emoji=DD18]'  # 喇叭的标志
-"""🤘"""
-叫我手 = '[emoji=D83E][emoji=DD19]'  # 叫我手
-"""🤙"""
-反向索引指向左 = '[emoji=D83D][emoji=DC48]'  # 反向索引指向左
-"""👈"""
-反手指数指向右 = '[emoji=D83D][emoji=DC49]'  # 反手指数指向右
-"""👉"""
-反手指数指向上 = '[emoji=D83D][emoji=DC46]'  # 反手指数指向上
-"""👆"""
-中指 = '[emoji=D83D][emoji=DD95]'  # 中指
-"""🖕"""
-反手指数向下 = '[emoji=D83D][emoji=DC47]'  # 反手指数向下
-"""👇"""
-索引指向上 = '[emoji=261D]'  # 索引指向上
-"""☝"""
-竖起大拇指 = '[emoji=D83D][emoji=DC4D]'  # 竖起大拇指
-"""👍"""
-拇指向下 = '[emoji=D83D][emoji=DC4E]'  # 拇指向下
-"""👎"""
-凸起拳 = '[emoji=270A]'  # 凸起拳
-"""✊"""
-迎面拳头 = '[emoji=D83D][emoji=DC4A]'  # 迎面拳头
-"""👊"""
-左拳 = '[emoji=D83E][emoji=DD1B]'  # 左拳
-"""🤛"""
-右拳 = '[emoji=D83E][emoji=DD1C]'  # 右拳
-"""🤜"""
-拍手 = '[emoji=D83D][emoji=DC4F]'  # 拍手
-"""👏"""
-举手 = '[emoji=D83D][emoji=DE4C]'  # 举手
-"""🙌"""
-张开双手 = '[emoji=D83D][emoji=DC50]'  # 张开双手
-"""👐"""
-手掌向上 = '[emoji=D83E][emoji=DD32]'  # 手掌向上
-"""🤲"""
-握手 = '[emoji=D83E][emoji=DD1D]'  # 握手
-"""🤝"""
-折叠手 = '[emoji=D83D][emoji=DE4F]'  # 折叠手
-"""🙏"""
-书写手 = '[emoji=270D]'  # 书写手
-"""✍"""
-指甲油 = '[emoji=D83D][emoji=DC85]'  # 指甲油
-"""💅"""
-自拍 = '[emoji=D83E][emoji=DD33]'  # 自拍
-"""🤳"""
-屈曲二头肌 = '[emoji=D83D][emoji=DCAA]'  # 屈曲二头肌
-"""💪"""
-机械臂 = '[emoji=D83E][emoji=DDBE]'  # 机械臂
-"""🦾"""
-机械腿 = '[emoji=D83E][emoji=DDBF]'  # 机械腿
-"""🦿"""
-腿 = '[emoji=D83E][emoji=DDB5]'  # 腿
-"""🦵"""
-脚 = '[emoji=D83E][emoji=DDB6]'  # 脚
-"""🦶"""
-耳朵 = '[emoji=D83D][emoji=DC42]'  # 耳朵
-"""👂"""
-带助听器的耳 = '[emoji=D83E][emoji=DDBB]'  # 带助听器的耳
-"""🦻"""
-鼻子 = '[emoji=D83D][emoji=DC43]'  # 鼻子
-"""👃"""
-脑 = '[emoji=D83E][emoji=DDE0]'  # 脑
-"""🧠"""
-牙齿 = '[emoji=D83E][emoji=DDB7]'  # 牙齿
-"""🦷"""
-骨 = '[emoji=D83E][emoji=DDB4]'  # 骨
-"""🦴"""
-很多眼睛 = '[emoji=D83D][emoji=DC40]'  # 很多眼睛
-"""👀"""
-眼睛 = '[emoji=D83D][emoji=DC41]'  # 眼睛
-"""👁"""
-舌头 = '[emoji=D83D][emoji=DC45]'  # 舌头
-"""👅"""
-口 = '[emoji=D83D][emoji=DC44]'  # 口
-"""👄"""
-宝贝 = '[emoji=D83D][emoji=DC76]'  # 宝贝
-"""👶"""
-小孩 = '[emoji=D83E][emoji=DDD2]'  # 小孩
-"""🧒"""
-男孩 = '[emoji=D83D][emoji=DC66]'  # 男孩
-"""👦"""
-女孩 = '[emoji=D83D][emoji=DC67]'  # 女孩
-"""👧"""
-人 = '[emoji=D83E][emoji=DDD1]'  # 人
-"""🧑"""
-男人 = '[emoji=D83D][emoji=DC68]'  # 男人
-"""👨"""
-胡子 = '[emoji=D83E][emoji=DDD4]'  # 胡子
-"""🧔"""
-女人 = '[emoji=D83D][emoji=DC69]'  # 女人
-"""👩"""
-老年人 = '[emoji=D83E][emoji=DDD3]'  # 老年人
-"""🧓"""
-老人 = '[emoji=D83D][emoji=DC74]'  # 老人
-"""👴"""
-老妇人 = '[emoji=D83D][emoji=DC75]'  # 老妇人
-"""👵"""
-皱眉头 = '[emoji=D83D][emoji=DE4D]'  # 皱眉头
-"""🙍"""
-男人皱眉 = '[emoji=D83D][emoji=DE4D][emoji=200D][emoji=2642][emoji=FE0F]'  # 男人皱眉
-"""🙍‍♂️"""
-女人皱眉 = '[emoji=D83D][emoji=DE4D][emoji=200D][emoji=2640][emoji=FE0F]'  # 女人皱眉
-"""🙍‍♀️"""
-人撅嘴 = '[emoji=D83D][emoji=DE4E]'  # 人撅嘴
-"""🙎"""
-男人撅嘴 = '[emoji=D83D][emoji=DE4E][emoji=200D][emoji=2642][emoji=FE0F]'  # 男人撅嘴
-"""🙎‍♂️"""
-女人撅嘴 = '[emoji=D83D][emoji=DE4E][emoji=200D][emoji=2640][emoji=FE0F]'  # 女人撅嘴
-"""🙎‍♀️"""
-打手势的人不 = '[emoji=D83D][emoji=DE45]'  # 打手势的人不
-"""🙅"""
-男人示意不 = '[emoji=D83D][emoji=DE45][emoji=200D][emoji=2642][emoji=FE0F]'  # 男人示意不
-"""🙅‍♂️"""
-女人示意不 = '[emoji=D83D][emoji=DE45][emoji=200D][emoji=2640][emoji=FE0F]'  # 女人示意不
-"""🙅‍♀️"""
-手势正常的人 = '[emoji=D83D][emoji=DE46]'  # 手势正常的人
-"""🙆"""
-男人示意好了 = '[emoji=D83D][emoji=DE46][emoji=200D][emoji=2642][emoji=FE0F]'  # 男人示意好了
-"""🙆‍♂️"""
-女人做手势好吗 = '[emoji=D83D][emoji=DE46][emoji=200D][emoji=2640][emoji=FE0F]'  # 女人做手势好吗
-"""🙆‍♀️"""
-倾卸手 = '[emoji=D83D][emoji=DC81]'  # 倾卸手
-"""💁"""
-人倾翻手 = '[emoji=D83D][emoji=DC81][emoji=200D][emoji=2642][emoji=FE0F]'  # 人倾翻手
-"""💁‍♂️"""
-女人倾翻的手 = '[emoji=D83D][emoji=DC81][emoji=200D][emoji=2640][emoji=FE0F]'  # 女人倾翻的手
-"""💁‍♀️"""
-举起手的人 = '[emoji=D83D][emoji=DE4B]'  # 举起手的人
-"""🙋"""
-举起手来 = '[emoji=D83D][emoji=DE4B][emoji=200D][emoji=2642][emoji=FE0F]'  # 举起手来
-"""🙋‍♂️"""
-女人举起手来 = '[emoji=D83D][emoji=DE4B][emoji=200D][emoji=2640][emoji=FE0F]'  # 女人举起手来
-"""🙋‍♀️"""
-聋人 = '[emoji=D83E][emoji=DDCF]'  # 聋人
-"""🧏"""
-聋男人 = '[emoji=D83E][emoji=DDCF][emoji=200D][emoji=2642][emoji=FE0F]'  # 聋男人
-"""🧏‍♂️"""
-聋女 = '[emoji=D83E][emoji=DDCF][emoji=200D][emoji=2640][emoji=FE0F]'  # 聋女
-"""🧏‍♀️"""
-鞠躬 = '[emoji=D83D][emoji=DE47]'  # 鞠躬
-"""🙇"""
-男人鞠躬 = '[emoji=D83D][emoji=DE47][emoji=200D][emoji=2642][emoji=FE0F]'  # 男人鞠躬
-"""🙇‍♂️"""
-女子鞠躬 = '[emoji=D83D][emoji=DE47][emoji=200D][emoji=2640][emoji=FE0F]'  # 女子鞠躬
-"""🙇‍♀️"""
-面部护理 = '[emoji=D83E][emoji=DD26]'  # 面部护理
-"""🤦"""
-人脸识别 = '[emoji=D83E][emoji=DD26][emoji=200D][emoji=2642][emoji=FE0F]'  # 人脸识别
-"""🤦‍♂️"""
-女性面部按摩 = '[emoji=D83E][emoji=DD26][emoji=200D][emoji=2640][emoji=FE0F]'  # 女性面部按摩
-"""🤦‍♀️"""
-人耸肩 = '[emoji=D83E][emoji=DD37]'  # 人耸肩
-"""🤷"""
-男人耸肩 = '[emoji=D83E][emoji=DD37][emoji=200D][emoji=2642][emoji=FE0F]'  # 男人耸肩
-"""🤷‍♂️"""
-女耸肩 = '[emoji=D83E][emoji=DD37][emoji=200D][emoji=2640][emoji=FE0F]'  # 女耸肩
-"""🤷‍♀️"""
-男子卫生工作者 = '[emoji=D83D][emoji=DC68][emoji=200D][emoji=2695][emoji=FE0F]'  # 男子卫生工作者
-"""👨‍⚕️"""
-女保健员 = '[emoji=D83D][emoji=DC69][emoji=200D][emoji=2695][emoji=FE0F]'  # 女保健员
-"""👩‍⚕️"""
-男学生 = '[emoji=D83D][emoji=DC68][emoji=200D][emoji=D83C][emoji=DF93]'  # 男学生
-"""👨‍🎓"""
-女学生 = '[emoji=D83D][emoji=DC69][emoji=200D][emoji=D83C][emoji=DF93]'  # 女学生
-"""👩‍🎓"""
-男教师 = '[emoji=D83D][emoji=DC68][emoji=200D][emoji=D83C][emoji=DFEB]'  # 男教师
-"""👨‍🏫"""
-女教师 = '[emoji=D83D][emoji=DC69][emoji=200D][emoji=D83C][emoji=DFEB]'  # 女教师
-"""👩‍🏫"""
-男子裁判员 = '[emoji=D83D][emoji=DC68][emoji=200D][emoji=2696][emoji=FE0F]'  # 男子裁判员
-"""👨‍⚖️"""
-女法官 = '[emoji=D83D][emoji=DC69][emoji=200D][emoji=2696][emoji=FE0F]'  # 女法官
-"""👩‍⚖️"""
-男子农民 = '[emoji=D83D][emoji=DC68][emoji=200D][emoji=D83C][emoji=DF3E]'  # 男子农民
-"""👨‍🌾"""
-女农民 = '[emoji=D83D][emoji=DC69][emoji=200D][emoji=D83C][emoji=DF3E]'  # 女农民
-"""👩‍🌾"""
-男子厨师 = '[emoji=D83D][emoji=DC68][emoji=200D][emoji=D83C][emoji=DF73]'  # 男子厨师
-"""👨‍🍳"""
-女厨师 = '[emoji=D83D][emoji=DC69][emoji=200D][emoji=D83C][emoji=DF73]'  # 女厨师
-"""👩‍🍳"""
-男子机械师 = '[emoji=D83D][emoji=DC68][emoji=200D][emoji=D83D][emoji=DD27]'  # 男子机械师
-"""👨‍🔧"""
-女机修工 = '[emoji=D83D][emoji=DC69][emoji=200D][emoji=D83D][emoji=DD27]'  # 女机修工
-"""👩‍🔧"""
-工厂工人 = '[emoji=D83D][emoji=DC68][emoji=200D][emoji=D83C][emoji=DFED]'  # 工厂工人
-"""👨‍🏭"""
-女工厂工人 = '[emoji=D83D][emoji=DC69][emoji=200D][emoji=D83C][emoji=DFED]'  # 女工厂工人
-"""👩‍🏭"""
-办公室文员 = '[emoji=D83D][emoji=DC68][emoji=200D][emoji=D83D][emoji=DCBC]'  # 办公室文员
-"""👨‍💼"""
-女上班族 = '[emoji=D83D][emoji=DC69][emoji=200D][emoji=D83D][emoji=DCBC]'  # 女上班族
-"""👩‍💼"""
-人类科学家 = '[emoji=D83D][emoji=DC68][emoji=200D][emoji=D83D][emoji=DD2C]'  # 人类科学家
-"""👨‍🔬"""
-女科学家 = '[emoji=D83D][emoji=DC69][emoji=200D][emoji=D83D][emoji=DD2C]'  # 女科学家
-"""👩‍🔬"""
-人工技术专家 = '[emoji=D83D][emoji=DC68][emoji=200D][emoji=D83D][emoji=DCBB]'  # 人工技术专家
-"""👨‍💻"""
-女技师 = '[emoji=D83D][emoji=DC69][emoji=200D][emoji=D83D][emoji=DCBB]'  # 女技师
-"""👩‍💻"""
-男歌手 = '[emoji=D83D][emoji=DC68][emoji=200D][emoji=D83C][emoji=DFA4]'  # 男歌手
-"""👨‍🎤"""
-女歌手 = '[emoji=D83D][emoji=DC69][emoji=200D][emoji=D83C][emoji=DFA4]'  # 女歌手
-"""👩‍🎤"""
-男性艺术家 = '[emoji=D83D][emoji=DC68][emoji=200D][emoji=D83C][emoji=DFA8]'  # 男性艺术家
-"""👨‍🎨"""
-女艺术家 = '[emoji=D83D][emoji=DC69][emoji=200D][emoji=D83C][emoji=DFA8]'  # 女艺术家
-"""👩‍🎨"""
-男飞行员 = '[emoji=D83D][emoji=DC68][emoji=200D][emoji=2708][emoji=FE0F]'  # 男飞行员
-"""👨‍✈️"""
-女飞行员 = '[emoji=D83D][emoji=DC69][emoji=200D][emoji=2708][emoji=FE0F]'  # 女飞行员
-"""👩‍✈️"""
-人航天员 = '[emoji=D83D][emoji=DC68][emoji=200D][emoji=D83D][emoji=DE80]'  # 人航天员
-"""👨‍🚀"""
-女宇航员 = '[emoji=D83D][emoji=DC69][emoji=200D][emoji=D83D][emoji=DE80]'  # 女宇航员
-"""👩‍🚀"""
-男子消防队员 = '[emoji=D83D][emoji=DC68][emoji=200D][emoji=D83D][emoji=DE92]'  # 男子消防队员
-"""👨‍🚒"""
-女消防员 = '[emoji=D83D][emoji=DC69][emoji=200D][emoji=D83D][emoji=DE92]'  # 女消防员
-"""👩‍🚒"""
-警官 = '[emoji=D83D][emoji=DC6E]'  # 警官
-"""👮"""
-男警官 = '[emoji=D83D][emoji=DC6E][emoji=200D][emoji=2642][emoji=FE0F]'  # 男警官
-"""👮‍♂️"""
-女警官 = '[emoji=D83D][emoji=DC6E][emoji=200D][emoji=2640][emoji=FE0F]'  # 女警官
-"""👮‍♀️"""
-侦探 = '[emoji=D83D][emoji=DD75]'  # 侦探
-"""🕵"""
-男侦探 = '[emoji=D83D][emoji=DD75][emoji=FE0F][emoji=200D][emoji=2642][emoji=FE0F]'  # 男侦探
-"""🕵️‍♂️"""
-女侦探 = '[emoji=D83D][emoji=DD75][emoji=FE0F][emoji=200D][emoji=2640][emoji=FE0F]'  # 女侦探
-"""🕵️‍♀️"""
-警卫 = '[emoji=D83D][emoji=DC82]'  # 警卫
-"""💂"""
-男子守卫 = '[emoji=D83D][emoji=DC82][emoji=200D][emoji=2642][emoji=FE0F]'  # 男子守卫
-"""💂‍♂️"""
-女警卫 = '[emoji=D83D][emoji=DC82][emoji=200D][emoji=2640][emoji=FE0F]'  # 女警卫
-"""💂‍♀️"""
-建筑工人 = '[emoji=D83D][emoji=DC77]'  # 建筑工人
-"""👷"""
-施工员 = '[emoji=D83D][emoji=DC77][emoji=200D][emoji=2642][emoji=FE0F]'  # 施工员
-"""👷‍♂️"""
-女建筑工人 = '[emoji=D83D][emoji=DC77][emoji=200D][emoji=2640][emoji=FE0F]'  # 女建筑工人
-"""👷‍♀️"""
-王子 = '[emoji=D83E][emoji=DD34]'  # 王子
-"""🤴"""
-公主 = '[emoji=D83D][emoji=DC78]'  # 公主
-"""👸"""
-戴头巾的人 = '[emoji=D83D][emoji=DC73]'  # 戴头巾的人
-"""👳"""
-戴头巾的男人 = '[emoji=D83D][emoji=DC73][emoji=200D][emoji=2642][emoji=FE0F]'  # 戴头巾的男人
-"""👳‍♂️"""
-女人戴着头巾 = '[emoji=D83D][emoji=DC73][emoji=200D][emoji=2640][emoji=FE0F]'  # 女人戴着头巾
-"""👳‍♀️"""
-戴中国帽子的男人 = '[emoji=D83D][emoji=DC72]'  # 戴中国帽子的男人
-"""👲"""
-头巾的女人 = '[emoji=D83E][emoji=DDD5]'  # 头巾的女人
-"""🧕"""
-礼服男 = '[emoji=D83E][emoji=DD35]'  # 礼服男
-"""🤵"""
-戴面纱的新娘 = '[emoji=D83D][emoji=DC70]'  # 戴面纱的新娘
-"""👰"""
-孕妇 = '[emoji=D83E][emoji=DD30]'  # 孕妇
-"""🤰"""
-母乳喂养 = '[emoji=D83E][emoji=DD31]'  # 母乳喂养
-"""🤱"""
-宝贝天使 = '[emoji=D83D][emoji=DC7C]'  # 宝贝天使
-"""👼"""
-圣诞老人 = '[emoji=D83C][emoji=DF85]'  # 圣诞老人
-"""🎅"""
-克劳斯夫人 = '[emoji=D83E][emoji=DD36]'  # 克劳斯夫人
-"""🤶"""
-超级英雄 = '[emoji=D83E][emoji=DDB8]'  # 超级英雄
-"""🦸"""
-超人英雄 = '[emoji=D83E][emoji=DDB8][emoji=200D][emoji=2642][emoji=FE0F]'  # 超人英雄
-"""🦸‍♂️"""
-女超级英雄 = '[emoji=D83E][emoji=DDB8][emoji=200D][emoji=2640][emoji=FE0F]'  # 女超级英雄
-"""🦸‍♀️"""
-超级恶棍 = '[emoji=D83E][emoji=DDB9]'  # 超级恶棍
-"""🦹"""
-人类超级恶棍 = '[emoji=D83E][emoji=DDB9][emoji=200D][emoji=2642][emoji=FE0F]'  # 人类超级恶棍
-"""🦹‍♂️"""
-女超人 = '[emoji=D83E][emoji=DDB9][emoji=200D][emoji=2640][emoji=FE0F]'  # 女超人
-"""🦹‍♀️"""
-魔术师 = '[emoji=D83E][emoji=DDD9]'  # 魔术师
-"""🧙"""
-男子法师 = '[emoji=D83E][emoji=DDD9][emoji=200D][emoji=2642][emoji=FE0F]'  # 男子法师
-"""🧙‍♂️"""
-女法师 = '[emoji=D83E][emoji=DDD9][emoji=200D][emoji=2640][emoji=FE0F]'  # 女法师
-"""🧙‍♀️"""
-仙女 = '[emoji=D83E][emoji=DDDA]'  # 仙女
-"""🧚"""
-男人仙女 = '[emoji=D83E][emoji=DDDA][emoji=200D][emoji=2642][emoji=FE0F]'  # 男人仙女
-"""🧚‍♂️"""
-女仙女 = '[emoji=D83E][emoji=DDDA][emoji=200D][emoji=2640][emoji=FE0F]'  # 女仙女
-"""🧚‍♀️"""
-吸血鬼 = '[emoji=D83E][emoji=DDDB]'  # 吸血鬼
-"""🧛"""
-人吸血鬼 = '[emoji=D83E][emoji=DDDB][emoji=200D][emoji=2642][emoji=FE0F]'  # 人吸血鬼
-"""🧛‍♂️"""
-女吸血鬼 = '[emoji=D83E][emoji=DDDB][emoji=200D][emoji=2640][emoji=FE0F]'  # 女吸血鬼
-"""🧛‍♀️"""
-merperson = '[emoji=D83E][emoji=DDDC]'  # merperson
-"""🧜"""
-人鱼 = '[emoji=D83E][emoji=DDDC][emoji=200D][emoji=2642][emoji=FE0F]'  # 人鱼
-"""🧜‍♂️"""
-美人鱼 = '[emoji=D83E][emoji=DDDC][emoji=200D][emoji=2640][emoji=FE0F]'  # 美人鱼
-"""🧜‍♀️"""
-精灵 = '[emoji=D83E][emoji=DDDD]'  # 精灵
-"""🧝"""
-人精灵 = '[emoji=D83E][emoji=DDDD][emoji=200D][emoji=2642][emoji=FE0F]'  # 人精灵
-"""🧝‍♂️"""
-女妖 = '[emoji=D83E][emoji=DDDD][emoji=200D][emoji=2640][emoji=FE0F]'  # 女妖
-"""🧝‍♀️"""
-妖怪 = '[emoji=D83E][emoji=DDDE]'  # 妖怪
-"""🧞"""
-人妖怪 = '[emoji=D83E][emoji=DDDE][emoji=200D][emoji=2642][emoji=FE0F]'  # 人妖怪
-"""🧞‍♂️"""
-女妖怪 = '[emoji=D83E][emoji=DDDE][emoji=200D][emoji=2640][emoji=FE0F]'  # 女妖怪
-"""🧞‍♀️"""
-僵尸 = '[emoji=D83E][emoji=DDDF]'  # 僵尸
-"""🧟"""
-男人僵尸 = '[emoji=D83E][emoji=DDDF][emoji=200D][emoji=2642][emoji=FE0F]'  # 男人僵尸
-"""🧟‍♂️"""
-女人僵尸 = '[emoji=D83E][emoji=DDDF][emoji=200D][emoji=2640][emoji=FE0F]'  # 女人僵尸
-"""🧟‍♀️"""
-按摩的人 = '[emoji=D83D][emoji=DC86]'  # 按摩的人
-"""💆"""
-男人在按摩 = '[emoji=D83D][emoji=DC86][emoji=200D][emoji=2642][emoji=FE0F]'  # 男人在按摩
-"""💆‍♂️"""
-按摩的女人 = '[emoji=D83D][emoji=DC86][emoji=200D][emoji=2640][emoji=FE0F]'  # 按摩的女人
-"""💆‍♀️"""
-理发师 = '[emoji=D83D][emoji=DC87]'  # 理发师
-"""💇"""
-男人理发 = '[emoji=D83D][emoji=DC87][emoji=200D][emoji=2642][emoji=FE0F]'  # 男人理发
-"""💇‍♂️"""
-理发的女人 = '[emoji=D83D][emoji=DC87][emoji=200D][emoji=2640][emoji=FE0F]'  # 理发的女人
-"""💇‍♀️"""
-走路的人 = '[emoji=D83D][emoji=DEB6]'  # 走路的人
-"""🚶"""
-男人走路 = '[emoji=D83D][emoji=DEB6][emoji=200D][emoji=2642][emoji=FE0F]'  # 男人走路
-"""🚶‍♂️"""
-女人走路 = '[emoji=D83D][emoji=DEB6][emoji=200D][emoji=2640][emoji=FE0F]'  # 女人走路
-"""🚶‍♀️"""
-站人 = '[emoji=D83E][emoji=DDCD]'  # 站人
-"""🧍"""
-男子站立 = '[emoji=D83E][emoji=DDCD][emoji=200D][emoji=2642][emoji=FE0F]'  # 男子站立
-"""🧍‍♂️"""
-站着的女人 = '[emoji=D83E][emoji=DDCD][emoji=200D][emoji=2640][emoji=FE0F]'  # 站着的女人
-"""🧍‍♀️"""
-跪人 = '[emoji=D83E][emoji=DDCE]'  # 跪人
-"""🧎"""
-跪跪 = '[emoji=D83E][emoji=DDCE][emoji=200D][emoji=2642][emoji=FE0F]'  # 跪跪
-"""🧎‍♂️"""
-跪着的女人 = '[emoji=D83E][emoji=DDCE][emoji=200D][emoji=2640][emoji=FE0F]'  # 跪着的女人
-"""🧎‍♀️"""
-有探测杖的人 = '[emoji=D83D][emoji=DC68][emoji=200D][emoji=D83E][emoji=DDAF]'  # 有探测杖的人
-"""👨‍🦯"""
-有探测杖的女人 = '[emoji=D83D][emoji=DC69][emoji=200D][emoji=D83E][emoji=DDAF]'  # 有探测杖的女人
-"""👩‍🦯"""
-坐机动轮椅的人 = '[emoji=D83D][emoji=DC68][emoji=200D][emoji=D83E][emoji=DDBC]'  # 坐机动轮椅的人
-"""👨‍🦼"""
-坐机动轮椅的女人 = '[emoji=D83D][emoji=DC69][emoji=200D][emoji=D83E][emoji=DDBC]'  # 坐机动轮椅的女人
-"""👩‍🦼"""
-坐手动轮椅的人 = '[emoji=D83D][emoji=DC68][emoji=200D][emoji=D83E][emoji=DDBD]'  # 坐手动轮椅的人
-"""👨‍🦽"""
-坐手动轮椅的女人 = '[emoji=D83D][emoji=DC69][emoji=200D][emoji=D83E][emoji=DDBD]'  # 坐手动轮椅的女人
-"""👩‍🦽"""
-人跑 = '[emoji=D83C][emoji=DFC3]'  # 人跑
-"""🏃"""
-男子跑步 = '[emoji=D83C][emoji=DFC3][emoji=200D][emoji=2642][emoji=FE0F]'  # 男子跑步
-"""🏃‍♂️"""
-女子跑步 = '[emoji=D83C][emoji=DFC3][emoji=200D][emoji=2640][emoji=FE0F]'  # 女子跑步
-"""🏃‍♀️"""
-女子舞蹈 = '[emoji=D83D][emoji=DC83]'  # 女子舞蹈
-"""💃"""
-男人跳舞 = '[emoji=D83D][emoji=DD7A]'  # 男人跳舞
-"""🕺"""
-穿西装的人在空中飘浮 = '[emoji=D83D][emoji=DD74]'  # 穿西装的人在空中飘浮
-"""🕴"""
-有兔子耳朵的人 = '[emoji=D83D][emoji=DC6F]'  # 有兔子耳朵的人
-"""👯"""
-有兔子耳朵的男人 = '[emoji=D83D][emoji=DC6F][emoji=200D][emoji=2642][emoji=FE0F]'  # 有兔子耳朵的男人
-"""👯‍♂️"""
-有兔子耳朵的女人 = '[emoji=D83D][emoji=DC6F][emoji=200D][emoji=2640][emoji=FE0F]'  # 有兔子耳朵的女人
-"""👯‍♀️"""
-在潮湿的房间里的人 = '[emoji=D83E][emoji=DDD6]'  # 在潮湿的房间里的人
-"""🧖"""
-在潮湿的房间里的男人 = '[emoji=D83E][emoji=DDD6][emoji=200D][emoji=2642][emoji=FE0F]'  # 在潮湿的房间里的男人
-"""🧖‍♂️"""
-蒸汽房的女人 = '[emoji=D83E][emoji=DDD6][emoji=200D][emoji=2640][emoji=FE0F]'  # 蒸汽房的女人
-"""🧖‍♀️"""
-攀登者 = '[emoji=D83E][emoji=DDD7]'  # 攀登者
-"""🧗"""
-爬人 = '[emoji=D83E][emoji=DDD7][emoji=200D][emoji=2642][emoji=FE0F]'  # 爬人
-"""🧗‍♂️"""
-女子攀岩 = '[emoji=D83E][emoji=DDD7][emoji=200D][emoji=2640][emoji=FE0F]'  # 女子攀岩
-"""🧗‍♀️"""
-击剑运动员 = '[emoji=D83E][emoji=DD3A]'  # 击剑运动员
-"""🤺"""
-赛马 = '[emoji=D83C][emoji=DFC7]'  # 赛马
-"""🏇"""
-滑雪者 = '[emoji=26F7]'  # 滑雪者
-"""⛷"""
-滑雪板 = '[emoji=D83C][emoji=DFC2]'  # 滑雪板
-"""🏂"""
-个人打高尔夫球 = '[emoji=D83C][emoji=DFCC]'  # 个人打高尔夫球
-"""🏌"""
-男子高尔夫球 = '[emoji=D83C][emoji=DFCC][emoji=FE0F][emoji=200D][emoji=2642][emoji=FE0F]'  # 男子高尔夫球
-"""🏌️‍♂️"""
-女子高尔夫球 = '[emoji=D83C][emoji=DFCC][emoji=FE0F][emoji=200D][emoji=2640][emoji=FE0F]'  # 女子高尔夫球
-"""🏌️‍♀️"""
-人冲浪 = '[emoji=D83C][emoji=DFC4]'  # 人冲浪
-"""🏄"""
-男子冲浪 = '[emoji=D83C][emoji=DFC4][emoji=200D][emoji=2642][emoji=FE0F]'  # 男子冲浪
-"""🏄‍♂️"""
-女人冲浪 = '[emoji=D83C][emoji=DFC4][emoji=200D][emoji=2640][emoji=FE0F]'  # 女人冲浪
-"""🏄‍♀️"""
-划船人 = '[emoji=D83D][emoji=DEA3]'  # 划船人
-"""🚣"""
-人划艇 = '[emoji=D83D][emoji=DEA3][emoji=200D][emoji=2642][emoji=FE0F]'  # 人划艇
-"""🚣‍♂️"""
-女子划艇 = '[emoji=D83D][emoji=DEA3][emoji=200D][emoji=2640][emoji=FE0F]'  # 女子划艇
-"""🚣‍♀️"""
-人游泳 = '[emoji=D83C][emoji=DFCA]'  # 人游泳
-"""🏊"""
-男子游泳 = '[emoji=D83C][emoji=DFCA][emoji=200D][emoji=2642][emoji=FE0F]'  # 男子游泳
-"""🏊‍♂️"""
-女子游泳 = '[emoji=D83C][emoji=DFCA][emoji=200D][emoji=2640][emoji=FE0F]'  # 女子游泳
-"""🏊‍♀️"""
-弹跳球的人 = '[emoji=26F9]'  # 弹跳球的人
-"""⛹"""
-男子跳球 = '[emoji=26F9][emoji=FE0F][emoji=200D][emoji=2642][emoji=FE0F]'  # 男子跳球
-"""⛹️‍♂️"""
-女子跳球 = '[emoji=26F9][emoji=FE0F][emoji=200D][emoji=2640][emoji=FE0F]'  # 女子跳球
-"""⛹️‍♀️"""
-举重人员 = '[emoji=D83C][emoji=DFCB]'  # 举重人员
-"""🏋"""
-人力举重 = '[emoji=D83C][emoji=DFCB][emoji=FE0F][emoji=200D][emoji=2642][emoji=FE0F]'  # 人力举重
-"""🏋️‍♂️"""
-女子举重 = '[emoji=D83C][emoji=DFCB][emoji=FE0F][emoji=200D][emoji=2640][emoji=FE0F]'  # 女子举重
-"""🏋️‍♀️"""
-骑自行车的人 = '[emoji=D83D][emoji=DEB4]'  # 骑自行车的人
-"""🚴"""
-骑自行车的男人 = '[emoji=D83D][emoji=DEB4][emoji=200D][emoji=2642][emoji=FE0F]'  # 骑自行车的男人
-"""🚴‍♂️"""
-女子自行车 = '[emoji=D83D][emoji=DEB4][emoji=200D][emoji=2640][emoji=FE0F]'  # 女子自行车
-"""🚴‍♀️"""
-山地自行车 = '[emoji=D83D][emoji=DEB5]'  # 山地自行车
-"""🚵"""
-曼山自行车 = '[emoji=D83D][emoji=DEB5][emoji=200D][emoji=2642][emoji=FE0F]'  # 曼山自行车
-"""🚵‍♂️"""
-女子山地自行车 = '[emoji=D83D][emoji=DEB5][emoji=200D][emoji=2640][emoji=FE0F]'  # 女子山地自行车
-"""🚵‍♀️"""
-人推车 = '[emoji=D83E][emoji=DD38]'  # 人推车
-"""🤸"""
-手推车 = '[emoji=D83E][emoji=DD38][emoji=200D][emoji=2642][emoji=FE0F]'  # 手推车
-"""🤸‍♂️"""
-妇女手推车 = '[emoji=D83E][emoji=DD38][emoji=200D][emoji=2640][emoji=FE0F]'  # 妇女手推车
-"""🤸‍♀️"""
-人们摔跤 = '[emoji=D83E][emoji=DD3C]'  # 人们摔跤
-"""🤼"""
-男子摔跤 = '[emoji=D83E][emoji=DD3C][emoji=200D][emoji=2642][emoji=FE0F]'  # 男子摔跤
-"""🤼‍♂️"""
-女子摔跤 = '[emoji=D83E][emoji=DD3C][emoji=200D][emoji=2640][emoji=FE0F]'  # 女子摔跤
-"""🤼‍♀️"""
-水球运动员 = '[emoji=D83E][emoji=DD3D]'  # 水球运动员
-"""🤽"""
-男子水球 = '[emoji=D83E][emoji=DD3D][emoji=200D][emoji=2642][emoji=FE0F]'  # 男子水球
-"""🤽‍♂️"""
-玩水球的女人 = '[emoji=D83E][emoji=DD3D][emoji=200D][emoji=2640][emoji=FE0F]'  # 玩水球的女人
-"""🤽‍♀️"""
-打手球的人 = '[emoji=D83E][emoji=DD3E]'  # 打手球的人
-"""🤾"""
-男子玩手球 = '[emoji=D83E][emoji=DD3E][emoji=200D][emoji=2642][emoji=FE0F]'  # 男子玩手球
-"""🤾‍♂️"""
-打手球的女人 = '[emoji=D83E][emoji=DD3E][emoji=200D][emoji=2640][emoji=FE0F]'  # 打手球的女人
-"""🤾‍♀️"""
-人物杂耍 = '[emoji=D83E][emoji=DD39]'  # 人物杂耍
-"""🤹"""
-男人杂耍 = '[emoji=D83E][emoji=DD39][emoji=200D][emoji=2642][emoji=FE0F]'  # 男人杂耍
-"""🤹‍♂️"""
-女人杂耍 = '[emoji=D83E][emoji=DD39][emoji=200D][emoji=2640][emoji=FE0F]'  # 女人杂耍
-"""🤹‍♀️"""
-莲花位 = '[emoji=D83E][emoji=DDD8]'  # 莲花位
-"""🧘"""
-莲花位男子 = '[emoji=D83E][emoji=DDD8][emoji=200D][emoji=2642][emoji=FE0F]'  # 莲花位男子
-"""🧘‍♂️"""
-莲花位女子 = '[emoji=D83E][emoji=DDD8][emoji=200D][emoji=2640][emoji=FE0F]'  # 莲花位女子
-"""🧘‍♀️"""
-洗澡的人 = '[emoji=D83D][emoji=DEC0]'  # 洗澡的人
-"""🛀"""
-躺在床上的人 = '[emoji=D83D][emoji=DECC]'  # 躺在床上的人
-"""🛌"""
-女人牵着手 = '[emoji=D83D][emoji=DC6D]'  # 女人牵着手
-"""👭"""
-女人和男人牵着手 = '[emoji=D83D][emoji=DC6B]'  # 女人和男人牵着手
-"""👫"""
-手牵着手的男人 = '[emoji=D83D][emoji=DC6C]'  # 手牵着手的男人
-"""👬"""
-吻 = '[emoji=D83D][emoji=DC8F]'  # 吻
-"""💏"""
-有爱心的情侣 = '[emoji=D83D][emoji=DC91]'  # 有爱心的情侣
-"""💑"""
-家庭 = '[emoji=D83D][emoji=DC6A]'  # 家庭
-"""👪"""
-说话的头 = '[emoji=D83D][emoji=DDE3]'  # 说话的头
-"""🗣"""
-半身像 = '[emoji=D83D][emoji=DC64]'  # 半身像
-"""👤"""
-多个半身像 = '[emoji=D83D][emoji=DC65]'  # 多个半身像
-"""👥"""
-足迹 = '[emoji=D83D][emoji=DC63]'  # 足迹
-"""👣"""
-红发 = '[emoji=D83E][emoji=DDB0]'  # 红发
-"""🦰"""
-卷发 = '[emoji=D83E][emoji=DDB1]'  # 卷发
-"""🦱"""
-白发 = '[emoji=D83E][emoji=DDB3]'  # 白发
-"""🦳"""
-秃顶 = '[emoji=D83E][emoji=DDB2]'  # 秃顶
-"""🦲"""
-猴脸 = '[emoji=D83D][emoji=DC35]'  # 猴脸
-"""🐵"""
-猴子 = '[emoji=D83D][emoji=DC12]'  # 猴子
-"""🐒"""
-大猩猩 = '[emoji=D83E][emoji=DD8D]'  # 大猩猩
-"""🦍"""
-狗脸 = '[emoji=D83D][emoji=DC36]'  # 狗脸
-"""🐶"""
-狗 = '[emoji=D83D][emoji=DC15]'  # 狗
-"""🐕"""
-导盲犬 = '[emoji=D83E][emoji=DDAE]'  # 导盲犬
-"""🦮"""
-服务犬 = '[emoji=D83D][emoji=DC15][emoji=200D][emoji=D83E][emoji=DDBA]'  # 服务犬
-"""🐕‍🦺"""
-贵宾犬 = '[emoji=D83D][emoji=DC29]'  # 贵宾犬
-"""🐩"""
-狼 = '[emoji=D83D][emoji=DC3A]'  # 狼
-"""🐺"""
-狐狸 = '[emoji=D83E][emoji=DD8A]'  # 狐狸
-"""🦊"""
-浣熊 = '[emoji=D83E][emoji=DD9D]'  # 浣熊
-"""🦝"""
-猫脸 = '[emoji=D83D][emoji=DC31]'  # 猫脸
-"""🐱"""
-猫 = '[emoji=D83D][emoji=DC08]'  # 猫
-"""🐈"""
-狮子 = '[emoji=D83E][emoji=DD81]'  # 狮子
-"""🦁"""
-虎面 = '[emoji=D83D][emoji=DC2F]'  # 虎面
-"""🐯"""
-老虎 = '[emoji=D83D][emoji=DC05]'  # 老虎
-"""🐅"""
-豹 = '[emoji=D83D][emoji=DC06]'  # 豹
-"""🐆"""
-马面 = '[emoji=D83D][emoji=DC34]'  # 马面
-"""🐴"""
-马 = '[emoji=D83D][emoji=DC0E]'  # 马
-"""🐎"""
-独角兽 = '[emoji=D83E][emoji=DD84]'  # 独角兽
-"""🦄"""
-斑马 = '[emoji=D83E][emoji=DD93]'  # 斑马
-"""🦓"""
-鹿 = '[emoji=D83E][emoji=DD8C]'  # 鹿
-"""🦌"""
-牛脸 = '[emoji=D83D][emoji=DC2E]'  # 牛脸
-"""🐮"""
-公牛 = '[emoji=D83D][emoji=DC02]'  # 公牛
-"""🐂"""
-水牛 = '[emoji=D83D][emoji=DC03]'  # 水牛
-"""🐃"""
-奶牛 = '[emoji=D83D][emoji=DC04]'  # 奶牛
-"""🐄"""
-猪脸 = '[emoji=D83D][emoji=DC37]'  # 猪脸
-"""🐷"""
-猪 = '[emoji=D83D][emoji=DC16]'  # 猪
-"""🐖"""
-野猪 = '[emoji=D83D][emoji=DC17]'  # 野猪
-"""🐗"""
-猪鼻 = '[emoji=D83D][emoji=DC3D]'  # 猪鼻
-"""🐽"""
-猛撞 = '[emoji=D83D][emoji=DC0F]'  # 猛撞
-"""🐏"""
-母羊 = '[emoji=D83D][emoji=DC11]'  # 母羊
-"""🐑"""
-山羊 = '[emoji=D83D][emoji=DC10]'  # 山羊
-"""🐐"""
-骆驼 = '[emoji=D83D][emoji=DC2A]'  # 骆驼
-"""🐪"""
-双驼峰骆驼 = '[emoji=D83D][emoji=DC2B]'  # 双驼峰骆驼
-"""🐫"""
-美洲驼 = '[emoji=D83E][emoji=DD99]'  # 美洲驼
-"""🦙"""
-长颈鹿 = '[emoji=D83E][emoji=DD92]'  # 长颈鹿
-"""🦒"""
-大象 = '[emoji=D83D][emoji=DC18]'  # 大象
-"""🐘"""
-犀牛 = '[emoji=D83E][emoji=DD8F]'  # 犀牛
-"""🦏"""
-河马 = '[emoji=D83E][emoji=DD9B]'  # 河马
-"""🦛"""
-鼠标面 = '[emoji=D83D][emoji=DC2D]'  # 鼠标面
-"""🐭"""
-鼠标 = '[emoji=D83D][emoji=DC01]'  # 鼠标
-"""🐁"""
-老鼠 = '[emoji=D83D][emoji=DC00]'  # 老鼠
-"""🐀"""
-仓鼠 = '[emoji=D83D][emoji=DC39]'  # 仓鼠
-"""🐹"""
-兔脸 = '[emoji=D83D][emoji=DC30]'  # 兔脸
-"""🐰"""
-兔子 = '[emoji=D83D][emoji=DC07]'  # 兔子
-"""🐇"""
-花栗鼠 = '[emoji=D83D][emoji=DC3F]'  # 花栗鼠
-"""🐿"""
-刺猬 = '[emoji=D83E][emoji=DD94]'  # 刺猬
-"""🦔"""
-蝙蝠 = '[emoji=D83E][emoji=DD87]'  # 蝙蝠
-"""🦇"""
-熊 = '[emoji=D83D][emoji=DC3B]'  # 熊
-"""🐻"""
-考拉 = '[emoji=D83D][emoji=DC28]'  # 考拉
-"""🐨"""
-熊猫 = '[emoji=D83D][emoji=DC3C]'  # 熊猫
-"""🐼"""
-树獭 = '[emoji=D83E][emoji=DDA5]'  # 树獭
-"""🦥"""
-水獭 = '[emoji=D83E][emoji=DDA6]'  # 水獭
-"""🦦"""
-猩猩 = '[emoji=D83E][emoji=DDA7]'  # 猩猩
-"""🦧"""
-臭鼬 = '[emoji=D83E][emoji=DDA8]'  # 臭鼬
-"""🦨"""
-袋鼠 = '[emoji=D83E][emoji=DD98]'  # 袋鼠
-"""🦘"""
-獾 = '[emoji=D83E][emoji=DDA1]'  # 獾
-"""🦡"""
-爪印 = '[emoji=D83D][emoji=DC3E]'  # 爪印
-"""🐾"""
-火鸡 = '[emoji=D83E][emoji=DD83]'  # 火鸡
-"""🦃"""
-鸡 = '[emoji=D83D][emoji=DC14]'  # 鸡
-"""🐔"""
-公鸡 = '[emoji=D83D][emoji=DC13]'  # 公鸡
-"""🐓"""
-孵蛋雏鸡 = '[emoji=D83D][emoji=DC23]'  # 孵蛋雏鸡
-"""🐣"""
-小鸡 = '[emoji=D83D][emoji=DC24]'  # 小鸡
-"""🐤"""
-正面小雏鸡 = '[emoji=D83D][emoji=DC25]'  # 正面小雏鸡
-"""🐥"""
-鸟 = '[emoji=D83D][emoji=DC26]'  # 鸟
-"""🐦"""
-企鹅 = '[emoji=D83D][emoji=DC27]'  # 企鹅
-"""🐧"""
-鸽子 = '[emoji=D83D][emoji=DD4A]'  # 鸽子
-"""🕊"""
-鹰 = '[emoji=D83E][emoji=DD85]'  # 鹰
-"""🦅"""
-鸭子 = '[emoji=D83E][emoji=DD86]'  # 鸭子
-"""🦆"""
-天鹅 = '[emoji=D83E][emoji=DDA2]'  # 天鹅
-"""🦢"""
-猫头鹰 = '[emoji=D83E][emoji=DD89]'  # 猫头鹰
-"""🦉"""
-火烈鸟 = '[emoji=D83E][emoji=DDA9]'  # 火烈鸟
-"""🦩"""
-孔雀 = '[emoji=D83E][emoji=DD9A]'  # 孔雀
-"""🦚"""
-鹦鹉 = '[emoji=D83E][emoji=DD9C]'  # 鹦鹉
-"""🦜"""
-青蛙 = '[emoji=D83D][emoji=DC38]'  # 青蛙
-"""🐸"""
-鳄鱼 = '[emoji=D83D][emoji=DC0A]'  # 鳄鱼
-"""🐊"""
-乌龟 = '[emoji=D83D][emoji=DC22]'  # 乌龟
-"""🐢"""
-蜥蜴 = '[emoji=D83E][emoji=DD8E]'  # 蜥蜴
-"""🦎"""
-蛇 = '[emoji=D83D][emoji=DC0D]'  # 蛇
-"""🐍"""
-龙脸 = '[emoji=D83D][emoji=DC32]'  # 龙脸
-"""🐲"""
-龙 = '[emoji=D83D][emoji=DC09]'  # 龙
-"""🐉"""
-蜥脚类 = '[emoji=D83E][emoji=DD95]'  # 蜥脚类
-"""🦕"""
-喷鲸 = '[emoji=D83D][emoji=DC33]'  # 喷鲸
-"""🐳"""
-鲸鱼 = '[emoji=D83D][emoji=DC0B]'  # 鲸鱼
-"""🐋"""
-海豚 = '[emoji=D83D][emoji=DC2C]'  # 海豚
-"""🐬"""
-鱼 = '[emoji=D83D][emoji=DC1F]'  # 鱼
-"""🐟"""
-热带鱼 = '[emoji=D83D][emoji=DC20]'  # 热带鱼
-"""🐠"""
-河豚 = '[emoji=D83D][emoji=DC21]'  # 河豚
-"""🐡"""
-鲨鱼 = '[emoji=D83E][emoji=DD88]'  # 鲨鱼
-"""🦈"""
-章鱼 = '[emoji=D83D][emoji=DC19]'  # 章鱼
-"""🐙"""
-螺旋壳 = '[emoji=D83D][emoji=DC1A]'  # 螺旋壳
-"""🐚"""
-蜗牛 = '[emoji=D83D][emoji=DC0C]'  # 蜗牛
-"""🐌"""
-蝴蝶 = '[emoji=D83E][emoji=DD8B]'  # 蝴蝶
-"""🦋"""
-缺陷 = '[emoji=D83D][emoji=DC1B]'  # 缺陷
-"""🐛"""
-蚂蚁 = '[emoji=D83D][emoji=DC1C]'  # 蚂蚁
-"""🐜"""
-蜜蜂 = '[emoji=D83D][emoji=DC1D]'  # 蜜蜂
-"""🐝"""
-瓢虫 = '[emoji=D83D][emoji=DC1E]'  # 瓢虫
-"""🐞"""
-板球 = '[emoji=D83E][emoji=DD97]'  # 板球
-"""🦗"""
-蜘蛛 = '[emoji=D83D][emoji=DD77]'  # 蜘蛛
-"""🕷"""
-蜘蛛网 = '[emoji=D83D][emoji=DD78]'  # 蜘蛛网
-"""🕸"""
-蝎子 = '[emoji=D83E][emoji=DD82]'  # 蝎子
-"""🦂"""
-蚊子 = '[emoji=D83E][emoji=DD9F]'  # 蚊子
-"""🦟"""
-微生物 = '[emoji=D83E][emoji=DDA0]'  # 微生物
-"""🦠"""
-花束 = '[emoji=D83D][emoji=DC90]'  # 花束
-"""💐"""
-樱花 = '[emoji=D83C][emoji=DF38]'  # 樱花
-"""🌸"""
-白花 = '[emoji=D83D][emoji=DCAE]'  # 白花
-"""💮"""
-玫瑰花结 = '[emoji=D83C][emoji=DFF5]'  # 玫瑰花结
-"""🏵"""
-玫瑰 = '[emoji=D83C][emoji=DF39]'  # 玫瑰
-"""🌹"""
-枯萎花 = '[emoji=D83E][emoji=DD40]'  # 枯萎花
-"""🥀"""
-木槿 = '[emoji=D83C][emoji=DF3A]'  # 木槿
-"""🌺"""
-向日葵 = '[emoji=D83C][emoji=DF3B]'  # 向日葵
-"""🌻"""
-开花 = '[emoji=D83C][emoji=DF3C]'  # 开花
-"""🌼"""
-郁金香 = '[emoji=D83C][emoji=DF37]'  # 郁金香
-"""🌷"""
-秧苗 = '[emoji=D83C][emoji=DF31]'  # 秧苗
-"""🌱"""
-常绿乔木 = '[emoji=D83C][emoji=DF32]'  # 常绿乔木
-"""🌲"""
-落叶树 = '[emoji=D83C][emoji=DF33]'  # 落叶树
-"""🌳"""
-棕榈树 = '[emoji=D83C][emoji=DF34]'  # 棕榈树
-"""🌴"""
-仙人掌 = '[emoji=D83C][emoji=DF35]'  # 仙人掌
-"""🌵"""
-水稻捆 = '[emoji=D83C][emoji=DF3E]'  # 水稻捆
-"""🌾"""
-草本植物 = '[emoji=D83C][emoji=DF3F]'  # 草本植物
-"""🌿"""
-三叶草 = '[emoji=2618]'  # 三叶草
-"""☘"""
-四叶草 = '[emoji=D83C][emoji=DF40]'  # 四叶草
-"""🍀"""
-枫叶 = '[emoji=D83C][emoji=DF41]'  # 枫叶
-"""🍁"""
-落叶 = '[emoji=D83C][emoji=DF42]'  # 落叶
-"""🍂"""
-树叶在风中飘动 = '[emoji=D83C][emoji=DF43]'  # 树叶在风中飘动
-"""🍃"""
-葡萄 = '[emoji=D83C][emoji=DF47]'  # 葡萄
-"""🍇"""
-甜瓜 = '[emoji=D83C][emoji=DF48]'  # 甜瓜
-"""🍈"""
-西瓜 = '[emoji=D83C][emoji=DF49]'  # 西瓜
-"""🍉"""
-Tangerine夜店 = '[emoji=D83C][emoji=DF4A]'  # Tangerine夜店
-"""🍊"""
-柠檬 = '[emoji=D83C][emoji=DF4B]'  # 柠檬
-"""🍋"""
-香蕉 = '[emoji=D83C][emoji=DF4C]'  # 香蕉
-"""🍌"""
-菠萝 = '[emoji=D83C][emoji=DF4D]'  # 菠萝
-"""🍍"""
-芒果 = '[emoji=D83E][emoji=DD6D]'  # 芒果
-"""🥭"""
-红苹果 = '[emoji=D83C][emoji=DF4E]'  # 红苹果
-"""🍎"""
-青苹果 = '[emoji=D83C][emoji=DF4F]'  # 青苹果
-"""🍏"""
-梨 = '[emoji=D83C][emoji=DF50]'  # 梨
-"""🍐"""
-桃 = '[emoji=D83C][emoji=DF51]'  # 桃
-"""🍑"""
-樱桃 = '[emoji=D83C][emoji=DF52]'  # 樱桃
-"""🍒"""
-草莓 = '[emoji=D83C][emoji=DF53]'  # 草莓
-"""🍓"""
-猕猴桃 = '[emoji=D83E][emoji=DD5D]'  # 猕猴桃
-"""🥝"""
-番茄 = '[emoji=D83C][emoji=DF45]'  # 番茄
-"""🍅"""
-椰子 = '[emoji=D83E][emoji=DD65]'  # 椰子
-"""🥥"""
-鳄梨 = '[emoji=D83E][emoji=DD51]'  # 鳄梨
-"""🥑"""
-茄子 = '[emoji=D83C][emoji=DF46]'  # 茄子
-"""🍆"""
-马铃薯 = '[emoji=D83E][emoji=DD54]'  # 马铃薯
-"""🥔"""
-胡萝卜 = '[emoji=D83E][emoji=DD55]'  # 胡萝卜
-"""🥕"""
-玉米穗 = '[emoji=D83C][emoji=DF3D]'  # 玉米穗
-"""🌽"""
-辣椒 = '[emoji=D83C][emoji=DF36]'  # 辣椒
-"""🌶"""
-黄瓜 = '[emoji=D83E][emoji=DD52]'  # 黄瓜
-"""🥒"""
-叶绿 = '[emoji=D83E][emoji=DD6C]'  # 叶绿
-"""🥬"""
-西兰花 = '[emoji=D83E][emoji=DD66]'  # 西兰花
-"""🥦"""
-大蒜 = '[emoji=D83E][emoji=DDC4]'  # 大蒜
-"""🧄"""
-洋葱 = '[emoji=D83E][emoji=DDC5]'  # 洋葱
-"""🧅"""
-蘑菇 = '[emoji=D83C][emoji=DF44]'  # 蘑菇
-"""🍄"""
-花生 = '[emoji=D83E][emoji=DD5C]'  # 花生
-"""🥜"""
-板栗 = '[emoji=D83C][emoji=DF30]'  # 板栗
-"""🌰"""
-面包 = '[emoji=D83C][emoji=DF5E]'  # 面包
-"""🍞"""
-羊角面包 = '[emoji=D83E][emoji=DD50]'  # 羊角面包
-"""🥐"""
-面包面包 = '[emoji=D83E][emoji=DD56]'  # 面包面包
-"""🥖"""
-椒盐脆饼 = '[emoji=D83E][emoji=DD68]'  # 椒盐脆饼
-"""🥨"""
-百吉饼 = '[emoji=D83E][emoji=DD6F]'  # 百吉饼
-"""🥯"""
-烙饼 = '[emoji=D83E][emoji=DD5E]'  # 烙饼
-"""🥞"""
-华夫饼干 = '[emoji=D83E][emoji=DDC7]'  # 华夫饼干
-"""🧇"""
-奶酪楔 = '[emoji=D83E][emoji=DDC0]'  # 奶酪楔
-"""🧀"""
-骨上肉 = '[emoji=D83C][emoji=DF56]'  # 骨上肉
-"""🍖"""
-鸡腿 = '[emoji=D83C][emoji=DF57]'  # 鸡腿
-"""🍗"""
-肉切肉 = '[emoji=D83E][emoji=DD69]'  # 肉切肉
-"""🥩"""
-熏肉 = '[emoji=D83E][emoji=DD53]'  # 熏肉
-"""🥓"""
-汉堡包 = '[emoji=D83C][emoji=DF54]'  # 汉堡包
-"""🍔"""
-炸薯条 = '[emoji=D83C][emoji=DF5F]'  # 炸薯条
-"""🍟"""
-披萨 = '[emoji=D83C][emoji=DF55]'  # 披萨
-"""🍕"""
-热狗 = '[emoji=D83C][emoji=DF2D]'  # 热狗
-"""🌭"""
-三明治 = '[emoji=D83E][emoji=DD6A]'  # 三明治
-"""🥪"""
-墨西哥玉米薄饼卷 = '[emoji=D83C][emoji=DF2E]'  # 墨西哥玉米薄饼卷
-"""🌮"""
-墨西哥煎饼 = '[emoji=D83C][emoji=DF2F]'  # 墨西哥煎饼
-"""🌯"""
-夹心面包 = '[emoji=D83E][emoji=DD59]'  # 夹心面包
-"""🥙"""
-法拉菲尔 = '[emoji=D83E][emoji=DDC6]'  # 法拉菲尔
-"""🧆"""
-鸡蛋 = '[emoji=D83E][emoji=DD5A]'  # 鸡蛋
-"""🥚"""
-烹饪 = '[emoji=D83C][emoji=DF73]'  # 烹饪
-"""🍳"""
-浅盘食物 = '[emoji=D83E][emoji=DD58]'  # 浅盘食物
-"""🥘"""
-一罐食物 = '[emoji=D83C][emoji=DF72]'  # 一罐食物
-"""🍲"""
-汤匙碗 = '[emoji=D83E][emoji=DD63]'  # 汤匙碗
-"""🥣"""
-绿色沙拉 = '[emoji=D83E][emoji=DD57]'  # 绿色沙拉
-"""🥗"""
-爆米花 = '[emoji=D83C][emoji=DF7F]'  # 爆米花
-"""🍿"""
-黄油 = '[emoji=D83E][emoji=DDC8]'  # 黄油
-"""🧈"""
-盐 = '[emoji=D83E][emoji=DDC2]'  # 盐
-"""🧂"""
-罐头食品 = '[emoji=D83E][emoji=DD6B]'  # 罐头食品
-"""🥫"""
-便当盒 = '[emoji=D83C][emoji=DF71]'  # 便当盒
-"""🍱"""
-碾米机 = '[emoji=D83C][emoji=DF58]'  # 碾米机
-"""🍘"""
-米球 = '[emoji=D83C][emoji=DF59]'  # 米球
-"""🍙"""
-米饭 = '[emoji=D83C][emoji=DF5A]'  # 米饭
-"""🍚"""
-咖喱饭 = '[emoji=D83C][emoji=DF5B]'  # 咖喱饭
-"""🍛"""
-蒸碗 = '[emoji=D83C][emoji=DF5C]'  # 蒸碗
-"""🍜"""
-意大利面条 = '[emoji=D83C][emoji=DF5D]'  # 意大利面条
-"""🍝"""
-烤红薯 = '[emoji=D83C][emoji=DF60]'  # 烤红薯
-"""🍠"""
-奥登 = '[emoji=D83C][emoji=DF62]'  # 奥登
-"""🍢"""
-寿司 = '[emoji=D83C][emoji=DF63]'  # 寿司
-"""🍣"""
-炸虾仁 = '[emoji=D83C][emoji=DF64]'  # 炸虾仁
-"""🍤"""
-漩涡鱼糕 = '[emoji=D83C][emoji=DF65]'  # 漩涡鱼糕
-"""🍥"""
-月饼 = '[emoji=D83E][emoji=DD6E]'  # 月饼
-"""🥮"""
-丹戈 = '[emoji=D83C][emoji=DF61]'  # 丹戈
-"""🍡"""
-饺子 = '[emoji=D83E][emoji=DD5F]'  # 饺子
-"""🥟"""
-幸运饼干 = '[emoji=D83E][emoji=DD60]'  # 幸运饼干
-"""🥠"""
-取出盒 = '[emoji=D83E][emoji=DD61]'  # 取出盒
-"""🥡"""
-蟹 = '[emoji=D83E][emoji=DD80]'  # 蟹
-"""🦀"""
-龙虾 = '[emoji=D83E][emoji=DD9E]'  # 龙虾
-"""🦞"""
-虾 = '[emoji=D83E][emoji=DD90]'  # 虾
-"""🦐"""
-鱿鱼 = '[emoji=D83E][emoji=DD91]'  # 鱿鱼
-"""🦑"""
-牡蛎 = '[emoji=D83E][emoji=DDAA]'  # 牡蛎
-"""🦪"""
-软冰淇淋 = '[emoji=D83C][emoji=DF66]'  # 软冰淇淋
-"""🍦"""
-刨冰 = '[emoji=D83C][emoji=DF67]'  # 刨冰
-"""🍧"""
-冰淇淋 = '[emoji=D83C][emoji=DF68]'  # 冰淇淋
-"""🍨"""
-油炸圈饼 = '[emoji=D83C][emoji=DF69]'  # 油炸圈饼
-"""🍩"""
-曲奇饼干 = '[emoji=D83C][emoji=DF6A]'  # 曲奇饼干
-"""🍪"""
-生日蛋糕 = '[emoji=D83C][emoji=DF82]'  # 生日蛋糕
-"""🎂"""
-酥饼 = '[emoji=D83C][emoji=DF70]'  # 酥饼
-"""🍰"""
-纸杯蛋糕 = '[emoji=D83E][emoji=DDC1]'  # 纸杯蛋糕
-"""🧁"""
-馅饼 = '[emoji=D83E][emoji=DD67]'  # 馅饼
-"""🥧"""
-巧克力棒 = '[emoji=D83C][emoji=DF6B]'  # 巧克力棒
-"""🍫"""
-糖果 = '[emoji=D83C][emoji=DF6C]'  # 糖果
-"""🍬"""
-棒棒糖 = '[emoji=D83C][emoji=DF6D]'  # 棒棒糖
-"""🍭"""
-奶油冻 = '[emoji=D83C][emoji=DF6E]'  # 奶油冻
-"""🍮"""
-蜜罐 = '[emoji=D83C][emoji=DF6F]'  # 蜜罐
-"""🍯"""
-奶瓶 = '[emoji=D83C][emoji=DF7C]'  # 奶瓶
-"""🍼"""
-一杯牛奶 = '[emoji=D83E][emoji=DD5B]'  # 一杯牛奶
-"""🥛"""
-热饮 = '[emoji=2615]'  # 热饮
-"""☕"""
-无柄茶杯 = '[emoji=D83C][emoji=DF75]'  # 无柄茶杯
-"""🍵"""
-目的 = '[emoji=D83C][emoji=DF76]'  # 目的
-"""🍶"""
-带弹出软木塞的瓶子 = '[emoji=D83C][emoji=DF7E]'  # 带弹出软木塞的瓶子
-"""🍾"""
-酒杯 = '[emoji=D83C][emoji=DF77]'  # 酒杯
-"""🍷"""
-鸡尾酒杯 = '[emoji=D83C][emoji=DF78]'  # 鸡尾酒杯
-"""🍸"""
-热带饮料 = '[emoji=D83C][emoji=DF79]'  # 热带饮料
-"""🍹"""
-啤酒杯 = '[emoji=D83C][emoji=DF7A]'  # 啤酒杯
-"""🍺"""
-叮当作响的啤酒杯 = '[emoji=D83C][emoji=DF7B]'  # 叮当作响的啤酒杯
-"""🍻"""
-碰杯 = '[emoji=D83E][emoji=DD42]'  # 碰杯
-"""🥂"""
-平底杯 = '[emoji=D83E][emoji=DD43]'  # 平底杯
-"""🥃"""
-吸管杯 = '[emoji=D83E][emoji=DD64]'  # 吸管杯
-"""🥤"""
-饮料盒 = '[emoji=D83E][emoji=DDC3]'  # 饮料盒
-"""🧃"""
-伙伴 = '[emoji=D83E][emoji=DDC9]'  # 伙伴
-"""🧉"""
-冰块 = '[emoji=D83E][emoji=DDCA]'  # 冰块
-"""🧊"""
-筷子 = '[emoji=D83E][emoji=DD62]'  # 筷子
-"""🥢"""
-带盘叉刀 = '[emoji=D83C][emoji=DF7D]'  # 带盘叉刀
-"""🍽"""
-刀叉 = '[emoji=D83C][emoji=DF74]'  # 刀叉
-"""🍴"""
-勺子 = '[emoji=D83E][emoji=DD44]'  # 勺子
-"""🥄"""
-厨刀 = '[emoji=D83D][emoji=DD2A]'  # 厨刀
-"""🔪"""
-菊花 = '[emoji=D83C][emoji=DFFA]'  # 菊花
-"""🏺"""
-环球展示美洲 = '[emoji=D83C][emoji=DF0E]'  # 环球展示美洲
-"""🌎"""
-经络地球仪 = '[emoji=D83C][emoji=DF10]'  # 经络地球仪
-"""🌐"""
-世界地图 = '[emoji=D83D][emoji=DDFA]'  # 世界地图
-"""🗺"""
-日本地图 = '[emoji=D83D][emoji=DDFE]'  # 日本地图
-"""🗾"""
-罗盘 = '[emoji=D83E][emoji=DDED]'  # 罗盘
-"""🧭"""
-雪山 = '[emoji=D83C][emoji=DFD4]'  # 雪山
-"""🏔"""
-山 = '[emoji=26F0]'  # 山
-"""⛰"""
-火山 = '[emoji=D83C][emoji=DF0B]'  # 火山
-"""🌋"""
-富士山 = '[emoji=D83D][emoji=DDFB]'  # 富士山
-"""🗻"""
-露营 = '[emoji=D83C][emoji=DFD5]'  # 露营
-"""🏕"""
-带伞的海滩 = '[emoji=D83C][emoji=DFD6]'  # 带伞的海滩
-"""🏖"""
-沙漠 = '[emoji=D83C][emoji=DFDC]'  # 沙漠
-"""🏜"""
-荒岛 = '[emoji=D83C][emoji=DFDD]'  # 荒岛
-"""🏝"""
-国家公园 = '[emoji=D83C][emoji=DFDE]'  # 国家公园
-"""🏞"""
-体育场 = '[emoji=D83C][emoji=DFDF]'  # 体育场
-"""🏟"""
-古典建筑 = '[emoji=D83C][emoji=DFDB]'  # 古典建筑
-"""🏛"""
-建筑施工 = '[emoji=D83C][emoji=DFD7]'  # 建筑施工
-"""🏗"""
-砖 = '[emoji=D83E][emoji=DDF1]'  # 砖
-"""🧱"""
-房屋 = '[emoji=D83C][emoji=DFD8]'  # 房屋
-"""🏘"""
-废弃房屋 = '[emoji=D83C][emoji=DFDA]'  # 废弃房屋
-"""🏚"""
-房子 = '[emoji=D83C][emoji=DFE0]'  # 房子
-"""🏠"""
-带花园的房子 = '[emoji=D83C][emoji=DFE1]'  # 带花园的房子
-"""🏡"""
-办公楼 = '[emoji=D83C][emoji=DFE2]'  # 办公楼
-"""🏢"""
-日本邮局 = '[emoji=D83C][emoji=DFE3]'  # 日本邮局
-"""🏣"""
-邮局 = '[emoji=D83C][emoji=DFE4]'  # 邮局
-"""🏤"""
-医院 = '[emoji=D83C][emoji=DFE5]'  # 医院
-"""🏥"""
-银行 = '[emoji=D83C][emoji=DFE6]'  # 银行
-"""🏦"""
-酒店 = '[emoji=D83C][emoji=DFE8]'  # 酒店
-"""🏨"""
-爱酒店 = '[emoji=D83C][emoji=DFE9]'  # 爱酒店
-"""🏩"""
-便利店 = '[emoji=D83C][emoji=DFEA]'  # 便利店
-"""🏪"""
-学校 = '[emoji=D83C][emoji=DFEB]'  # 学校
-"""🏫"""
-百货公司 = '[emoji=D83C][emoji=DFEC]'  # 百货公司
-"""🏬"""
-工厂 = '[emoji=D83C][emoji=DFED]'  # 工厂
-"""🏭"""
-日本城堡 = '[emoji=D83C][emoji=DFEF]'  # 日本城堡
-"""🏯"""
-城堡 = '[emoji=D83C][emoji=DFF0]'  # 城堡
-"""🏰"""
-婚礼 = '[emoji=D83D][emoji=DC92]'  # 婚礼
-"""💒"""
-东京塔 = '[emoji=D83D][emoji=DDFC]'  # 东京塔
-"""🗼"""
-自由女神像 = '[emoji=D83D][emoji=DDFD]'  # 自由女神像
-"""🗽"""
-教堂 = '[emoji=26EA]'  # 教堂
-"""⛪"""
-清真寺 = '[emoji=D83D][emoji=DD4C]'  # 清真寺
-"""🕌"""
-印度教寺庙 = '[emoji=D83D][emoji=DED5]'  # 印度教寺庙
-"""🛕"""
-犹太会堂 = '[emoji=D83D][emoji=DD4D]'  # 犹太会堂
-"""🕍"""
-神社 = '[emoji=26E9]'  # 神社
-"""⛩"""
-卡巴 = '[emoji=D83D][emoji=DD4B]'  # 卡巴
-"""🕋"""
-喷泉 = '[emoji=26F2]'  # 喷泉
-"""⛲"""
-帐篷 = '[emoji=26FA]'  # 帐篷
-"""⛺"""
-多雾的 = '[emoji=D83C][emoji=DF01]'  # 多雾的
-"""🌁"""
-星星之夜 = '[emoji=D83C][emoji=DF03]'  # 星星之夜
-"""🌃"""
-城市风貌 = '[emoji=D83C][emoji=DFD9]'  # 城市风貌
-"""🏙"""
-山上日出 = '[emoji=D83C][emoji=DF04]'  # 山上日出
-"""🌄"""
-日出 = '[emoji=D83C][emoji=DF05]'  # 日出
-"""🌅"""
-黄昏时的城市景色 = '[emoji=D83C][emoji=DF06]'  # 黄昏时的城市景色
-"""🌆"""
-日落 = '[emoji=D83C][emoji=DF07]'  # 日落
-"""🌇"""
-夜桥 = '[emoji=D83C][emoji=DF09]'  # 夜桥
-"""🌉"""
-温泉 = '[emoji=2668]'  # 温泉
-"""♨"""
-银河系 = '[emoji=D83C][emoji=DF0C]'  # 银河系
-"""🌌"""
-旋转木马 = '[emoji=D83C][emoji=DFA0]'  # 旋转木马
-"""🎠"""
-费里斯轮 = '[emoji=D83C][emoji=DFA1]'  # 费里斯轮
-"""🎡"""
-过山车 = '[emoji=D83C][emoji=DFA2]'  # 过山车
-"""🎢"""
-理发竿 = '[emoji=D83D][emoji=DC88]'  # 理发竿
-"""💈"""
-马戏团帐篷 = '[emoji=D83C][emoji=DFAA]'  # 马戏团帐篷
-"""🎪"""
-机车 = '[emoji=D83D][emoji=DE82]'  # 机车
-"""🚂"""
-铁道车辆 = '[emoji=D83D][emoji=DE83]'  # 铁道车辆
-"""🚃"""
-高速列车 = '[emoji=D83D][emoji=DE84]'  # 高速列车
-"""🚄"""
-子弹头列车 = '[emoji=D83D][emoji=DE85]'  # 子弹头列车
-"""🚅"""
-火车 = '[emoji=D83D][emoji=DE86]'  # 火车
-"""🚆"""
-地铁 = '[emoji=D83D][emoji=DE87]'  # 地铁
-"""🚇"""
-轻轨 = '[emoji=D83D][emoji=DE88]'  # 轻轨
-"""🚈"""
-站 = '[emoji=D83D][emoji=DE89]'  # 站
-"""🚉"""
-电车 = '[emoji=D83D][emoji=DE8A]'  # 电车
-"""🚊"""
-单轨铁路 = '[emoji=D83D][emoji=DE9D]'  # 单轨铁路
-"""🚝"""
-山区铁路 = '[emoji=D83D][emoji=DE9E]'  # 山区铁路
-"""🚞"""
-电车车 = '[emoji=D83D][emoji=DE8B]'  # 电车车
-"""🚋"""
-公共汽车 = '[emoji=D83D][emoji=DE8C]'  # 公共汽车
-"""🚌"""
-迎面驶来的公共汽车 = '[emoji=D83D][emoji=DE8D]'  # 迎面驶来的公共汽车
-"""🚍"""
-无轨电车 = '[emoji=D83D][emoji=DE8E]'  # 无轨电车
-"""🚎"""
-微型客车 = '[emoji=D83D][emoji=DE90]'  # 微型客车
-"""🚐"""
-救护车 = '[emoji=D83D][emoji=DE91]'  # 救护车
-"""🚑"""
-消防车 = '[emoji=D83D][emoji=DE92]'  # 消防车
-"""🚒"""
-警车 = '[emoji=D83D][emoji=DE93]'  # 警车
-"""🚓"""
-迎面而来的警车 = '[emoji=D83D][emoji=DE94]'  # 迎面而来的警车
-"""🚔"""
-出租车 = '[emoji=D83D][emoji=DE95]'  # 出租车
-"""🚕"""
-迎面来的出租车 = '[emoji=D83D][emoji=DE96]'  # 迎面来的出租车
-"""🚖"""
-汽车 = '[emoji=D83D][emoji=DE97]'  # 汽车
-"""🚗"""
-迎面而来的汽车 = '[emoji=D83D][emoji=DE98]'  # 迎面而来的汽车
-"""🚘"""
-运动型多用途车 = '[emoji=D83D][emoji=DE99]'  # 运动型多用途车
-"""🚙"""
-送货车 = '[emoji=D83D][emoji=DE9A]'  # 送货车
-"""🚚"""
-铰接式货车 = '[emoji=D83D][emoji=DE9B]'  # 铰接式货车
-"""🚛"""
-拖拉机 = '[emoji=D83D][emoji=DE9C]'  # 拖拉机
-"""🚜"""
-赛车 = '[emoji=D83C][emoji=DFCE]'  # 赛车
-"""🏎"""
-摩托车 = '[emoji=D83C][emoji=DFCD]'  # 摩托车
-"""🏍"""
-电动滑板车 = '[emoji=D83D][emoji=DEF5]'  # 电动滑板车
-"""🛵"""
-手动轮椅 = '[emoji=D83E][emoji=DDBD]'  # 手动轮椅
-"""🦽"""
-机动轮椅 = '[emoji=D83E][emoji=DDBC]'  # 机动轮椅
-"""🦼"""
-自动人力车 = '[emoji=D83D][emoji=DEFA]'  # 自动人力车
-"""🛺"""
-自行车 = '[emoji=D83D][emoji=DEB2]'  # 自行车
-"""🚲"""
-踢踏板车 = '[emoji=D83D][emoji=DEF4]'  # 踢踏板车
-"""🛴"""
-滑板 = '[emoji=D83D][emoji=DEF9]'  # 滑板
-"""🛹"""
-公交站 = '[emoji=D83D][emoji=DE8F]'  # 公交站
-"""🚏"""
-高速公路 = '[emoji=D83D][emoji=DEE3]'  # 高速公路
-"""🛣"""
-铁路轨道 = '[emoji=D83D][emoji=DEE4]'  # 铁路轨道
-"""🛤"""
-油桶 = '[emoji=D83D][emoji=DEE2]'  # 油桶
-"""🛢"""
-燃油泵 = '[emoji=26FD]'  # 燃油泵
-"""⛽"""
-警车灯 = '[emoji=D83D][emoji=DEA8]'  # 警车灯
-"""🚨"""
-水平交通灯 = '[emoji=D83D][emoji=DEA5]'  # 水平交通灯
-"""🚥"""
-垂直交通灯 = '[emoji=D83D][emoji=DEA6]'  # 垂直交通灯
-"""🚦"""
-停车标志 = '[emoji=D83D][emoji=DED1]'  # 停车标志
-"""🛑"""
-建设 = '[emoji=D83D][emoji=DEA7]'  # 建设
-"""🚧"""
-锚 = '[emoji=2693]'  # 锚
-"""⚓"""
-帆船 = '[emoji=26F5]'  # 帆船
-"""⛵"""
-独木舟 = '[emoji=D83D][emoji=DEF6]'  # 独木舟
-"""🛶"""
-快艇 = '[emoji=D83D][emoji=DEA4]'  # 快艇
-"""🚤"""
-客船 = '[emoji=D83D][emoji=DEF3]'  # 客船
-"""🛳"""
-渡船 = '[emoji=26F4]'  # 渡船
-"""⛴"""
-摩托艇 = '[emoji=D83D][emoji=DEE5]'  # 摩托艇
-"""🛥"""
-船 = '[emoji=D83D][emoji=DEA2]'  # 船
-"""🚢"""
-飞机 = '[emoji=2708]'  # 飞机
-"""✈"""
-小型飞机 = '[emoji=D83D][emoji=DEE9]'  # 小型飞机
-"""🛩"""
-飞机起飞 = '[emoji=D83D][emoji=DEEB]'  # 飞机起飞
-"""🛫"""
-飞机抵达 = '[emoji=D83D][emoji=DEEC]'  # 飞机抵达
-"""🛬"""
-降落伞 = '[emoji=D83E][emoji=DE82]'  # 降落伞
-"""🪂"""
-座位 = '[emoji=D83D][emoji=DCBA]'  # 座位
-"""💺"""
-直升机 = '[emoji=D83D][emoji=DE81]'  # 直升机
-"""🚁"""
-悬空铁路 = '[emoji=D83D][emoji=DE9F]'  # 悬空铁路
-"""🚟"""
-山地索道 = '[emoji=D83D][emoji=DEA0]'  # 山地索道
-"""🚠"""
-架空索道 = '[emoji=D83D][emoji=DEA1]'  # 架空索道
-"""🚡"""
-卫星 = '[emoji=D83D][emoji=DEF0]'  # 卫星
-"""🛰"""
-火箭 = '[emoji=D83D][emoji=DE80]'  # 火箭
-"""🚀"""
-飞碟 = '[emoji=D83D][emoji=DEF8]'  # 飞碟
-"""🛸"""
-贝尔钟 = '[emoji=D83D][emoji=DECE]'  # 贝尔钟
-"""🛎"""
-行李 = '[emoji=D83E][emoji=DDF3]'  # 行李
-"""🧳"""
-沙漏完成 = '[emoji=231B]'  # 沙漏完成
-"""⌛"""
-沙漏未完成 = '[emoji=23F3]'  # 沙漏未完成
-"""⏳"""
-看 = '[emoji=231A]'  # 看
-"""⌚"""
-闹钟 = '[emoji=23F0]'  # 闹钟
-"""⏰"""
-秒表 = '[emoji=23F1]'  # 秒表
-"""⏱"""
-定时器时钟 = '[emoji=23F2]'  # 定时器时钟
-"""⏲"""
-壁炉架时钟 = '[emoji=D83D][emoji=DD70]'  # 壁炉架时钟
-"""🕰"""
-十二点 = '[emoji=D83D][emoji=DD5B]'  # 十二点
-"""🕛"""
-十二点三十 = '[emoji=D83D][emoji=DD67]'  # 十二点三十
-"""🕧"""
-一点 = '[emoji=D83D][emoji=DD50]'  # 一点
-"""🕐"""
-一点三十 = '[emoji=D83D][emoji=DD5C]'  # 一点三十
-"""🕜"""
-二点 = '[emoji=D83D][emoji=DD51]'  # 二点
-"""🕑"""
-二点三十 = '[emoji=D83D][emoji=DD5D]'  # 二点三十
-"""🕝"""
-三点 = '[emoji=D83D][emoji=DD52]'  # 三点
-"""🕒"""
-三点三十 = '[emoji=D83D][emoji=DD5E]'  # 三点三十
-"""🕞"""
-四点 = '[emoji=D83D][emoji=DD53]'  # 四点
-"""🕓"""
-四点三十 = '[emoji=D83D][emoji=DD5F]'  # 四点三十
-"""🕟"""
-五点 = '[emoji=D83D][emoji=DD54]'  # 五点
-"""🕔"""
-五点三十 = '[emoji=D83D][emoji=DD60]'  # 五点三十
-"""🕠"""
-六点 = '[emoji=D83D][emoji=DD55]'  # 六点
-"""🕕"""
-六点三十 = '[emoji=D83D][emoji=DD61]'  # 六点三十
-"""🕡"""
-七点 = '[emoji=D83D][emoji=DD56]'  # 七点
-"""🕖"""
-七点三十 = '[emoji=D83D][emoji=DD62]'  # 七点三十
-"""🕢"""
-八点 = '[emoji=D83D][emoji=DD57]'  # 八点
-"""🕗"""
-八点三十 = '[emoji=D83D][emoji=DD63]'  # 八点三十
-"""🕣"""
-九点 = '[emoji=D83D][emoji=DD58]'  # 九点
-"""🕘"""
-九点三十 = '[emoji=D83D][emoji=DD64]'  # 九点三十
-"""🕤"""
-十点 = '[emoji=D83D][emoji=DD59]'  # 十点
-"""🕙"""
-十点三十 = '[emoji=D83D][emoji=DD65]'  # 十点三十
-"""🕥"""
-十一点 = '[emoji=D83D][emoji=DD5A]'  # 十一点
-"""🕚"""
-十一点三十 = '[emoji=D83D][emoji=DD66]'  # 十一点三十
-"""🕦"""
-新月 = '[emoji=D83C][emoji=DF11]'  # 新月
-"""🌑"""
-娥眉月 = '[emoji=D83C][emoji=DF12]'  # 娥眉月
-"""🌒"""
-第一季月球 = '[emoji=D83C][emoji=DF13]'  # 第一季月球
-"""🌓"""
-上蜡的凸月 = '[emoji=D83C][emoji=DF14]'  # 上蜡的凸月
-"""🌔"""
-满月 = '[emoji=D83C][emoji=DF15]'  # 满月
-"""🌕"""
-月亮渐渐消失 = '[emoji=D83C][emoji=DF16]'  # 月亮渐渐消失
-"""🌖"""
-最后四分之一的月亮 = '[emoji=D83C][emoji=DF17]'  # 最后四分之一的月亮
-"""🌗"""
-月牙渐渐消失 = '[emoji=D83C][emoji=DF18]'  # 月牙渐渐消失
-"""🌘"""
-新的月 = '[emoji=D83C][emoji=DF19]'  # 新的月
-"""🌙"""
-新月面 = '[emoji=D83C][emoji=DF1A]'  # 新月面
-"""🌚"""
-第一季月面 = '[emoji=D83C][emoji=DF1B]'  # 第一季月面
-"""🌛"""
-最后四分之一的月面 = '[emoji=D83C][emoji=DF1C]'  # 最后四分之一的月面
-"""🌜"""
-温度计 = '[emoji=D83C][emoji=DF21]'  # 温度计
-"""🌡"""
-太阳 = '[emoji=2600]'  # 太阳
-"""☀"""
-满月脸 = '[emoji=D83C][emoji=DF1D]'  # 满月脸
-"""🌝"""
-有脸的太阳 = '[emoji=D83C][emoji=DF1E]'  # 有脸的太阳
-"""🌞"""
-环状行星 = '[emoji=D83E][emoji=DE90]'  # 环状行星
-"""🪐"""
-明星 = '[emoji=2B50]'  # 明星
-"""⭐"""
-发光星 = '[emoji=D83C][emoji=DF1F]'  # 发光星
-"""🌟"""
-流星 = '[emoji=D83C][emoji=DF20]'  # 流星
-"""🌠"""
-云 = '[emoji=2601]'  # 云
-"""☁"""
-云后太阳 = '[emoji=26C5]'  # 云后太阳
-"""⛅"""
-闪电雨云 = '[emoji=26C8]'  # 闪电雨云
-"""⛈"""
-小云后的太阳 = '[emoji=D83C][emoji=DF24]'  # 小云后的太阳
-"""🌤"""
-大云后的太阳 = '[emoji=D83C][emoji=DF25]'  # 大云后的太阳
-"""🌥"""
-雨云背后的太阳 = '[emoji=D83C][emoji=DF26]'  # 雨云背后的太阳
-"""🌦"""
-雨云 = '[emoji=D83C][emoji=DF27]'  # 雨云
-"""🌧"""
-雪与云 = '[emoji=D83C][emoji=DF28]'  # 雪与云
-"""🌨"""
-闪电云 = '[emoji=D83C][emoji=DF29]'  # 闪电云
-"""🌩"""
-龙卷风 = '[emoji=D83C][emoji=DF2A]'  # 龙卷风
-"""🌪"""
-雾 = '[emoji=D83C][emoji=DF2B]'  # 雾
-"""🌫"""
-风面 = '[emoji=D83C][emoji=DF2C]'  # 风面
-"""🌬"""
-旋风 = '[emoji=D83C][emoji=DF00]'  # 旋风
-"""🌀"""
-彩虹 = '[emoji=D83C][emoji=DF08]'  # 彩虹
-"""🌈"""
-闭伞 = '[emoji=D83C][emoji=DF02]'  # 闭伞
-"""🌂"""
-雨伞 = '[emoji=2602]'  # 雨伞
-"""☂"""
-雨滴伞 = '[emoji=2614]'  # 雨滴伞
-"""☔"""
-地上的雨伞 = '[emoji=26F1]'  # 地上的雨伞
-"""⛱"""
-高电压 = '[emoji=26A1]'  # 高电压
-"""⚡"""
-雪花 = '[emoji=2744]'  # 雪花
-"""❄"""
-雪人 = '[emoji=2603]'  # 雪人
-"""☃"""
-没有雪的雪人 = '[emoji=26C4]'  # 没有雪的雪人
-"""⛄"""
-彗星 = '[emoji=2604]'  # 彗星
-"""☄"""
-火 = '[emoji=D83D][emoji=DD25]'  # 火
-"""🔥"""
-液滴 = '[emoji=D83D][emoji=DCA7]'  # 液滴
-"""💧"""
-水波 = '[emoji=D83C][emoji=DF0A]'  # 水波
-"""🌊"""
-南瓜灯 = '[emoji=D83C][emoji=DF83]'  # 南瓜灯
-"""🎃"""
-圣诞树 = '[emoji=D83C][emoji=DF84]'  # 圣诞树
-"""🎄"""
-烟花 = '[emoji=D83C][emoji=DF86]'  # 烟花
-"""🎆"""
-火花机 = '[emoji=D83C][emoji=DF87]'  # 火花机
-"""🎇"""
-爆竹 = '[emoji=D83E][emoji=DDE8]'  # 爆竹
-"""🧨"""
-火花 = '[emoji=2728]'  # 火花
-"""✨"""
-气球 = '[emoji=D83C][emoji=DF88]'  # 气球
-"""🎈"""
-波普派对 = '[emoji=D83C][emoji=DF89]'  # 波普派对
-"""🎉"""
-纸屑球 = '[emoji=D83C][emoji=DF8A]'  # 纸屑球
-"""🎊"""
-七夕树 = '[emoji=D83C][emoji=DF8B]'  # 七夕树
-"""🎋"""
-松木装饰 = '[emoji=D83C][emoji=DF8D]'  # 松木装饰
-"""🎍"""
-日本娃娃 = '[emoji=D83C][emoji=DF8E]'  # 日本娃娃
-"""🎎"""
-鲤鱼流光 = '[emoji=D83C][emoji=DF8F]'  # 鲤鱼流光
-"""🎏"""
-风铃 = '[emoji=D83C][emoji=DF90]'  # 风铃
-"""🎐"""
-赏月仪式 = '[emoji=D83C][emoji=DF91]'  # 赏月仪式
-"""🎑"""
-红包 = '[emoji=D83E][emoji=DDE7]'  # 红包
-"""🧧"""
-丝带 = '[emoji=D83C][emoji=DF80]'  # 丝带
-"""🎀"""
-包装礼物 = '[emoji=D83C][emoji=DF81]'  # 包装礼物
-"""🎁"""
-提醒带 = '[emoji=D83C][emoji=DF97]'  # 提醒带
-"""🎗"""
-入场券 = '[emoji=D83C][emoji=DF9F]'  # 入场券
-"""🎟"""
-票 = '[emoji=D83C][emoji=DFAB]'  # 票
-"""🎫"""
-军事奖章 = '[emoji=D83C][emoji=DF96]'  # 军事奖章
-"""🎖"""
-奖杯 = '[emoji=D83C][emoji=DFC6]'  # 奖杯
-"""🏆"""
-运动奖章 = '[emoji=D83C][emoji=DFC5]'  # 运动奖章
-"""🏅"""
-第一位奖章 = '[emoji=D83E][emoji=DD47]'  # 第一位奖章
-"""🥇"""
-第二位奖章 = '[emoji=D83E][emoji=DD48]'  # 第二位奖章
-"""🥈"""
-第三位奖章 = '[emoji=D83E][emoji=DD49]'  # 第三位奖章
-"""🥉"""
-足球 = '[emoji=26BD]'  # 足球
-"""⚽"""
-棒球运动 = '[emoji=26BE]'  # 棒球运动
-"""⚾"""
-垒球 = '[emoji=D83E][emoji=DD4E]'  # 垒球
-"""🥎"""
-篮球 = '[emoji=D83C][emoji=DFC0]'  # 篮球
-"""🏀"""
-排球 = '[emoji=D83C][emoji=DFD0]'  # 排球
-"""🏐"""
-美式足球 = '[emoji=D83C][emoji=DFC8]'  # 美式足球
-"""🏈"""
-橄榄球 = '[emoji=D83C][emoji=DFC9]'  # 橄榄球
-"""🏉"""
-网球 = '[emoji=D83C][emoji=DFBE]'  # 网球
-"""🎾"""
-飞盘 = '[emoji=D83E][emoji=DD4F]'  # 飞盘
-"""🥏"""
-保龄球运动 = '[emoji=D83C][emoji=DFB3]'  # 保龄球运动
-"""🎳"""
-板球比赛 = '[emoji=D83C][emoji=DFCF]'  # 板球比赛
-"""🏏"""
-曲棍球 = '[emoji=D83C][emoji=DFD1]'  # 曲棍球
-"""🏑"""
-冰上曲棍球 = '[emoji=D83C][emoji=DFD2]'  # 冰上曲棍球
-"""🏒"""
-长曲棍球 = '[emoji=D83E][emoji=DD4D]'  # 长曲棍球
-"""🥍"""
-乒乓球 = '[emoji=D83C][emoji=DFD3]'  # 乒乓球
-"""🏓"""
-羽毛球 = '[emoji=D83C][emoji=DFF8]'  # 羽毛球
-"""🏸"""
-拳击手套 = '[emoji=D83E][emoji=DD4A]'  # 拳击手套
-"""🥊"""
-武术制服 = '[emoji=D83E][emoji=DD4B]'  # 武术制服
-"""🥋"""
-球门网 = '[emoji=D83E][emoji=DD45]'  # 球门网
-"""🥅"""
-孔旗 = '[emoji=26F3]'  # 孔旗
-"""⛳"""
-溜冰鞋 = '[emoji=26F8]'  # 溜冰鞋
-"""⛸"""
-钓鱼竿 = '[emoji=D83C][emoji=DFA3]'  # 钓鱼竿
-"""🎣"""
-潜水面罩 = '[emoji=D83E][emoji=DD3F]'  # 潜水面罩
-"""🤿"""
-跑步衫 = '[emoji=D83C][emoji=DFBD]'  # 跑步衫
-"""🎽"""
-雪板 = '[emoji=D83C][emoji=DFBF]'  # 雪板
-"""🎿"""
-雪橇 = '[emoji=D83D][emoji=DEF7]'  # 雪橇
-"""🛷"""
-冰壶石 = '[emoji=D83E][emoji=DD4C]'  # 冰壶石
-"""🥌"""
-直接命中 = '[emoji=D83C][emoji=DFAF]'  # 直接命中
-"""🎯"""
-溜溜球 = '[emoji=D83E][emoji=DE80]'  # 溜溜球
-"""🪀"""
-风筝 = '[emoji=D83E][emoji=DE81]'  # 风筝
-"""🪁"""
-台球8号 = '[emoji=D83C][emoji=DFB1]'  # 8球
-"""🎱"""
-水晶球 = '[emoji=D83D][emoji=DD2E]'  # 水晶球
-"""🔮"""
-纳扎尔护身符 = '[emoji=D83E][emoji=DDFF]'  # 纳扎尔护身符
-"""🧿"""
-视频游戏 = '[emoji=D83C][emoji=DFAE]'  # 视频游戏
-"""🎮"""
-操纵杆 = '[emoji=D83D][emoji=DD79]'  # 操纵杆
-"""🕹"""
-老虎机 = '[emoji=D83C][emoji=DFB0]'  # 老虎机
-"""🎰"""
-游戏骰子 = '[emoji=D83C][emoji=DFB2]'  # 游戏骰子
-"""🎲"""
-拼图片 = '[emoji=D83E][emoji=DDE9]'  # 拼图片
-"""🧩"""
-泰迪熊 = '[emoji=D83E][emoji=DDF8]'  # 泰迪熊
-"""🧸"""
-锹服 = '[emoji=2660]'  # 锹服
-"""♠"""
-心服 = '[emoji=2665]'  # 心服
-"""♥"""
-钻石套装 = '[emoji=2666]'  # 钻石套装
-"""♦"""
-俱乐部套装 = '[emoji=2663]'  # 俱乐部套装
-"""♣"""
-棋子 = '[emoji=265F]'  # 棋子
-"""♟"""
-小丑 = '[emoji=D83C][emoji=DCCF]'  # 小丑
-"""🃏"""
-麻将红龙 = '[emoji=D83C][emoji=DC04]'  # 麻将红龙
-"""🀄"""
-花牌 = '[emoji=D83C][emoji=DFB4]'  # 花牌
-"""🎴"""
-表演艺术 = '[emoji=D83C][emoji=DFAD]'  # 表演艺术
-"""🎭"""
-框架图片 = '[emoji=D83D][emoji=DDBC]'  # 框架图片
-"""🖼"""
-艺术家调色板 = '[emoji=D83C][emoji=DFA8]'  # 艺术家调色板
-"""🎨"""
-线 = '[emoji=D83E][emoji=DDF5]'  # 线
-"""🧵"""
-纱线 = '[emoji=D83E][emoji=DDF6]'  # 纱线
-"""🧶"""
-玻璃杯 = '[emoji=D83D][emoji=DC53]'  # 玻璃杯
-"""👓"""
-太阳镜 = '[emoji=D83D][emoji=DD76]'  # 太阳镜
-"""🕶"""
-护目镜 = '[emoji=D83E][emoji=DD7D]'  # 护目镜
-"""🥽"""
-实验衣 = '[emoji=D83E][emoji=DD7C]'  # 实验衣
-"""🥼"""
-安全背心 = '[emoji=D83E][emoji=DDBA]'  # 安全背心
-"""🦺"""
-领带 = '[emoji=D83D][emoji=DC54]'  # 领带
-"""👔"""
-T恤衫 = '[emoji=D83D][emoji=DC55]'  # T恤衫
-"""👕"""
-牛仔裤 = '[emoji=D83D][emoji=DC56]'  # 牛仔裤
-"""👖"""
-围巾 = '[emoji=D83E][emoji=DDE3]'  # 围巾
-"""🧣"""
-手套 = '[emoji=D83E][emoji=DDE4]'  # 手套
-"""🧤"""
-外套 = '[emoji=D83E][emoji=DDE5]'  # 外套
-"""🧥"""
-袜子 = '[emoji=D83E][emoji=DDE6]'  # 袜子
-"""🧦"""
-连衣裙 = '[emoji=D83D][emoji=DC57]'  # 连衣裙
-"""👗"""
-和服 = '[emoji=D83D][emoji=DC58]'  # 和服
-"""👘"""
-纱丽 = '[emoji=D83E][emoji=DD7B]'  # 纱丽
-"""🥻"""
-连体式泳衣 = '[emoji=D83E][emoji=DE71]'  # 连体式泳衣
-"""🩱"""
-概要 = '[emoji=D83E][emoji=DE72]'  # 概要
-"""🩲"""
-短裤 = '[emoji=D83E][emoji=DE73]'  # 短裤
-"""🩳"""
-比基尼 = '[emoji=D83D][emoji=DC59]'  # 比基尼
-"""👙"""
-女人的衣服 = '[emoji=D83D][emoji=DC5A]'  # 女人的衣服
-"""👚"""
-钱包 = '[emoji=D83D][emoji=DC5B]'  # 钱包
-"""👛"""
-手提包 = '[emoji=D83D][emoji=DC5C]'  # 手提包
-"""👜"""
-离合器袋 = '[emoji=D83D][emoji=DC5D]'  # 离合器袋
-"""👝"""
-购物袋 = '[emoji=D83D][emoji=DECD]'  # 购物袋
-"""🛍"""
-背包 = '[emoji=D83C][emoji=DF92]'  # 背包
-"""🎒"""
-男鞋 = '[emoji=D83D][emoji=DC5E]'  # 男鞋
-"""👞"""
-跑鞋 = '[emoji=D83D][emoji=DC5F]'  # 跑鞋
-"""👟"""
-徒步旅行靴 = '[emoji=D83E][emoji=DD7E]'  # 徒步旅行靴
-"""🥾"""
-扁形鞋 = '[emoji=D83E][emoji=DD7F]'  # 扁形鞋
-"""🥿"""
-高跟鞋 = '[emoji=D83D][emoji=DC60]'  # 高跟鞋
-"""👠"""
-女式凉鞋 = '[emoji=D83D][emoji=DC61]'  # 女式凉鞋
-"""👡"""
-芭蕾舞鞋 = '[emoji=D83E][emoji=DE70]'  # 芭蕾舞鞋
-"""🩰"""
-女靴 = '[emoji=D83D][emoji=DC62]'  # 女靴
-"""👢"""
-王冠 = '[emoji=D83D][emoji=DC51]'  # 王冠
-"""👑"""
-女人的帽子 = '[emoji=D83D][emoji=DC52]'  # 女人的帽子
-"""👒"""
-顶帽 = '[emoji=D83C][emoji=DFA9]'  # 顶帽
-"""🎩"""
-毕业帽 = '[emoji=D83C][emoji=DF93]'  # 毕业帽
-"""🎓"""
-瓶盖 = '[emoji=D83E][emoji=DDE2]'  # 瓶盖
-"""🧢"""
-救援人员头盔 = '[emoji=26D1]'  # 救援人员头盔
-"""⛑"""
-念珠 = '[emoji=D83D][emoji=DCFF]'  # 念珠
-"""📿"""
-唇膏 = '[emoji=D83D][emoji=DC84]'  # 唇膏
-"""💄"""
-戒指 = '[emoji=D83D][emoji=DC8D]'  # 戒指
-"""💍"""
-宝石 = '[emoji=D83D][emoji=DC8E]'  # 宝石
-"""💎"""
-静音扬声器 = '[emoji=D83D][emoji=DD07]'  # 静音扬声器
-"""🔇"""
-扬声器音量低 = '[emoji=D83D][emoji=DD08]'  # 扬声器音量低
-"""🔈"""
-扬声器中等音量 = '[emoji=D83D][emoji=DD09]'  # 扬声器中等音量
-"""🔉"""
-扬声器音量大 = '[emoji=D83D][emoji=DD0A]'  # 扬声器音量大
-"""🔊"""
-扬声器 = '[emoji=D83D][emoji=DCE2]'  # 扬声器
-"""📢"""
-扩音器 = '[emoji=D83D][emoji=DCE3]'  # 扩音器
-"""📣"""
-邮政号角 = '[emoji=D83D][emoji=DCEF]'  # 邮政号角
-"""📯"""
-钟 = '[emoji=D83D][emoji=DD14]'  # 钟
-"""🔔"""
-带斜纹的钟 = '[emoji=D83D][emoji=DD15]'  # 带斜纹的钟
-"""🔕"""
-乐谱 = '[emoji=D83C][emoji=DFBC]'  # 乐谱
-"""🎼"""
-音符 = '[emoji=D83C][emoji=DFB5]'  # 音符
-"""🎵"""
-多音符 = '[emoji=D83C][emoji=DFB6]'  # 多音符
-"""🎶"""
-录音室麦克风 = '[emoji=D83C][emoji=DF99]'  # 录音室麦克风
-"""🎙"""
-水平滑块 = '[emoji=D83C][emoji=DF9A]'  # 水平滑块
-"""🎚"""
-控制旋钮 = '[emoji=D83C][emoji=DF9B]'  # 控制旋钮
-"""🎛"""
-麦克风 = '[emoji=D83C][emoji=DFA4]'  # 麦克风
-"""🎤"""
-头戴式耳机 = '[emoji=D83C][emoji=DFA7]'  # 头戴式耳机
-"""🎧"""
-收音机 = '[emoji=D83D][emoji=DCFB]'  # 收音机
-"""📻"""
-萨克斯 = '[emoji=D83C][emoji=DFB7]'  # 萨克斯
-"""🎷"""
-吉他 = '[emoji=D83C][emoji=DFB8]'  # 吉他
-"""🎸"""
-音乐键盘 = '[emoji=D83C][emoji=DFB9]'  # 音乐键盘
-"""🎹"""
-小号 = '[emoji=D83C][emoji=DFBA]'  # 小号
-"""🎺"""
-小提琴 = '[emoji=D83C][emoji=DFBB]'  # 小提琴
-"""🎻"""
-班卓琴 = '[emoji=D83E][emoji=DE95]'  # 班卓琴
-"""🪕"""
-鼓 = '[emoji=D83E][emoji=DD41]'  # 鼓
-"""🥁"""
-移动电话 = '[emoji=D83D][emoji=DCF1]'  # 移动电话
-"""📱"""
-带箭头的手机 = '[emoji=D83D][emoji=DCF2]'  # 带箭头的手机
-"""📲"""
-电话 = '[emoji=260E]'  # 电话
-"""☎"""
-电话接收机 = '[emoji=D83D][emoji=DCDE]'  # 电话接收机
-"""📞"""
-寻呼机 = '[emoji=D83D][emoji=DCDF]'  # 寻呼机
-"""📟"""
-传真机 = '[emoji=D83D][emoji=DCE0]'  # 传真机
-"""📠"""
-电池 = '[emoji=D83D][emoji=DD0B]'  # 电池
-"""🔋"""
-电插头 = '[emoji=D83D][emoji=DD0C]'  # 电插头
-"""🔌"""
-膝上型计算机 = '[emoji=D83D][emoji=DCBB]'  # 膝上型计算机
-"""💻"""
-台式计算机 = '[emoji=D83D][emoji=DDA5]'  # 台式计算机
-"""🖥"""
-打印机 = '[emoji=D83D][emoji=DDA8]'  # 打印机
-"""🖨"""
-键盘 = '[emoji=2328]'  # 键盘
-"""⌨"""
-电脑鼠标 = '[emoji=D83D][emoji=DDB1]'  # 电脑鼠标
-"""🖱"""
-轨迹球 = '[emoji=D83D][emoji=DDB2]'  # 轨迹球
-"""🖲"""
-计算机磁盘 = '[emoji=D83D][emoji=DCBD]'  # 计算机磁盘
-"""💽"""
-软盘 = '[emoji=D83D][emoji=DCBE]'  # 软盘
-"""💾"""
-光盘 = '[emoji=D83D][emoji=DCBF]'  # 光盘
-"""💿"""
-DVD = '[emoji=D83D][emoji=DCC0]'  # DVD
-"""📀"""
-算盘 = '[emoji=D83E][emoji=DDEE]'  # 算盘
-"""🧮"""
-电影摄影机 = '[emoji=D83C][emoji=DFA5]'  # 电影摄影机
-"""🎥"""
-胶片架 = '[emoji=D83C][emoji=DF9E]'  # 胶片架
-"""🎞"""
-电影放映机 = '[emoji=D83D][emoji=DCFD]'  # 电影放映机
-"""📽"""
-拍板 = '[emoji=D83C][emoji=DFAC]'  # 拍板
-"""🎬"""
-电视 = '[emoji=D83D][emoji=DCFA]'  # 电视
-"""📺"""
-照相机 = '[emoji=D83D][emoji=DCF7]'  # 照相机
-"""📷"""
-带闪光灯的照相机 = '[emoji=D83D][emoji=DCF8]'  # 带闪光灯的照相机
-"""📸"""
-摄像机 = '[emoji=D83D][emoji=DCF9]'  # 摄像机
-"""📹"""
-盒式录像带 = '[emoji=D83D][emoji=DCFC]'  # 盒式录像带
-"""📼"""
-放大镜向左倾斜 = '[emoji=D83D][emoji=DD0D]'  # 放大镜向左倾斜
-"""🔍"""
-放大镜向右倾斜 = '[emoji=D83D][emoji=DD0E]'  # 放大镜向右倾斜
-"""🔎"""
-蜡烛 = '[emoji=D83D][emoji=DD6F]'  # 蜡烛
-"""🕯"""
-灯泡 = '[emoji=D83D][emoji=DCA1]'  # 灯泡
-"""💡"""
-手电筒 = '[emoji=D83D][emoji=DD26]'  # 手电筒
-"""🔦"""
-红纸灯笼 = '[emoji=D83C][emoji=DFEE]'  # 红纸灯笼
-"""🏮"""
-迪亚灯 = '[emoji=D83E][emoji=DE94]'  # 迪亚灯
-"""🪔"""
-带装饰盖的笔记本 = '[emoji=D83D][emoji=DCD4]'  # 带装饰盖的笔记本
-"""📔"""
-闭书 = '[emoji=D83D][emoji=DCD5]'  # 闭书
-"""📕"""
-开卷 = '[emoji=D83D][emoji=DCD6]'  # 开卷
-"""📖"""
-绿皮书 = '[emoji=D83D][emoji=DCD7]'  # 绿皮书
-"""📗"""
-蓝皮书 = '[emoji=D83D][emoji=DCD8]'  # 蓝皮书
-"""📘"""
-橙皮书 = '[emoji=D83D][emoji=DCD9]'  # 橙皮书
-"""📙"""
-书 = '[emoji=D83D][emoji=DCDA]'  # 书
-"""📚"""
-笔记本 = '[emoji=D83D][emoji=DCD3]'  # 笔记本
-"""📓"""
-分类帐 = '[emoji=D83D][emoji=DCD2]'  # 分类帐
-"""📒"""
-卷曲页 = '[emoji=D83D][emoji=DCC3]'  # 卷曲页
-"""📃"""
-纸卷 = '[emoji=D83D][emoji=DCDC]'  # 纸卷
-"""📜"""
-页面向上 = '[emoji=D83D][emoji=DCC4]'  # 页面向上
-"""📄"""
-报纸 = '[emoji=D83D][emoji=DCF0]'  # 报纸
-"""📰"""
-卷起来的报纸 = '[emoji=D83D][emoji=DDDE]'  # 卷起来的报纸
-"""🗞"""
-书签标签 = '[emoji=D83D][emoji=DCD1]'  # 书签标签
-"""📑"""
-书签 = '[emoji=D83D][emoji=DD16]'  # 书签
-"""🔖"""
-标签 = '[emoji=D83C][emoji=DFF7]'  # 标签
-"""🏷"""
-钱袋 = '[emoji=D83D][emoji=DCB0]'  # 钱袋
-"""💰"""
-日元纸币 = '[emoji=D83D][emoji=DCB4]'  # 日元纸币
-"""💴"""
-美元纸币 = '[emoji=D83D][emoji=DCB5]'  # 美元纸币
-"""💵"""
-欧元纸币 = '[emoji=D83D][emoji=DCB6]'  # 欧元纸币
-"""💶"""
-英镑纸币 = '[emoji=D83D][emoji=DCB7]'  # 英镑纸币
-"""💷"""
-有翅膀的钱 = '[emoji=D83D][emoji=DCB8]'  # 有翅膀的钱
-"""💸"""
-信用卡 = '[emoji=D83D][emoji=DCB3]'  # 信用卡
-"""💳"""
-收据 = '[emoji=D83E][emoji=DDFE]'  # 收据
-"""🧾"""
-图表随日元增长 = '[emoji=D83D][emoji=DCB9]'  # 图表随日元增长
-"""💹"""
-货币兑换 = '[emoji=D83D][emoji=DCB1]'  # 货币兑换
-"""💱"""
-重美元符号 = '[emoji=D83D][emoji=DCB2]'  # 重美元符号
-"""💲"""
-信封 = '[emoji=2709]'  # 信封
-"""✉"""
-电子邮件 = '[emoji=D83D][emoji=DCE7]'  # 电子邮件
-"""📧"""
-传入信封 = '[emoji=D83D][emoji=DCE8]'  # 传入信封
-"""📨"""
-带箭头的信封 = '[emoji=D83D][emoji=DCE9]'  # 带箭头的信封
-"""📩"""
-发件箱托盘 = '[emoji=D83D][emoji=DCE4]'  # 发件箱托盘
-"""📤"""
-收件箱托盘 = '[emoji=D83D][emoji=DCE5]'  # 收件箱托盘
-"""📥"""
-包裹 = '[emoji=D83D][emoji=DCE6]'  # 包裹
-"""📦"""
-带升起标志的已关闭邮箱 = '[emoji=D83D][emoji=DCEB]'  # 带升起标志的已关闭邮箱
-"""📫"""
-标志降低的已关闭邮箱 = '[emoji=D83D][emoji=DCEA]'  # 标志降低的已关闭邮箱
-"""📪"""
-打开带有升起标志的邮箱 = '[emoji=D83D][emoji=DCEC]'  # 打开带有升起标志的邮箱
-"""📬"""
-打开标志降低的邮箱 = '[emoji=D83D][emoji=DCED]'  # 打开标志降低的邮箱
-"""📭"""
-邮筒 = '[emoji=D83D][emoji=DCEE]'  # 邮筒
-"""📮"""
-带选票的投票箱 = '[emoji=D83D][emoji=DDF3]'  # 带选票的投票箱
-"""🗳"""
-铅笔 = '[emoji=270F]'  # 铅笔
-"""✏"""
-黑笔尖 = '[emoji=2712]'  # 黑笔尖
-"""✒"""
-钢笔 = '[emoji=D83D][emoji=DD8B]'  # 钢笔
-"""🖋"""
-笔 = '[emoji=D83D][emoji=DD8A]'  # 笔
-"""🖊"""
-画笔 = '[emoji=D83D][emoji=DD8C]'  # 画笔
-"""🖌"""
-蜡笔 = '[emoji=D83D][emoji=DD8D]'  # 蜡笔
-"""🖍"""
-备忘录 = '[emoji=D83D][emoji=DCDD]'  # 备忘录
-"""📝"""
-公文包 = '[emoji=D83D][emoji=DCBC]'  # 公文包
-"""💼"""
-文件文件夹 = '[emoji=D83D][emoji=DCC1]'  # 文件文件夹
-"""📁"""
-打开文件文件夹 = '[emoji=D83D][emoji=DCC2]'  # 打开文件文件夹
-"""📂"""
-卡片索引分隔符 = '[emoji=D83D][emoji=DDC2]'  # 卡片索引分隔符
-"""🗂"""
-日历 = '[emoji=D83D][emoji=DCC5]'  # 日历
-"""📅"""
-撕下日历 = '[emoji=D83D][emoji=DCC6]'  # 撕下日历
-"""📆"""
-螺旋记事本 = '[emoji=D83D][emoji=DDD2]'  # 螺旋记事本
-"""🗒"""
-螺旋历 = '[emoji=D83D][emoji=DDD3]'  # 螺旋历
-"""🗓"""
-卡片索引 = '[emoji=D83D][emoji=DCC7]'  # 卡片索引
-"""📇"""
-图表增加 = '[emoji=D83D][emoji=DCC8]'  # 图表增加
-"""📈"""
-图表递减 = '[emoji=D83D][emoji=DCC9]'  # 图表递减
-"""📉"""
-条形图 = '[emoji=D83D][emoji=DCCA]'  # 条形图
-"""📊"""
-剪贴板 = '[emoji=D83D][emoji=DCCB]'  # 剪贴板
-"""📋"""
-图钉 = '[emoji=D83D][emoji=DCCC]'  # 图钉
-"""📌"""
-圆推销 = '[emoji=D83D][emoji=DCCD]'  # 圆推销
-"""📍"""
-回形针 = '[emoji=D83D][emoji=DCCE]'  # 回形针
-"""📎"""
-链接回形针 = '[emoji=D83D][emoji=DD87]'  # 链接回形针
-"""🖇"""
-直尺 = '[emoji=D83D][emoji=DCCF]'  # 直尺
-"""📏"""
-三角尺 = '[emoji=D83D][emoji=DCD0]'  # 三角尺
-"""📐"""
-剪刀 = '[emoji=2702]'  # 剪刀
-"""✂"""
-卡片盒 = '[emoji=D83D][emoji=DDC3]'  # 卡片盒
-"""🗃"""
-文件柜 = '[emoji=D83D][emoji=DDC4]'  # 文件柜
-"""🗄"""
-废纸篓 = '[emoji=D83D][emoji=DDD1]'  # 废纸篓
-"""🗑"""
-锁定的 = '[emoji=D83D][emoji=DD12]'  # 锁定的
-"""🔒"""
-解锁 = '[emoji=D83D][emoji=DD13]'  # 解锁
-"""🔓"""
-用钢笔锁着 = '[emoji=D83D][emoji=DD0F]'  # 用钢笔锁着
-"""🔏"""
-钥匙锁住 = '[emoji=D83D][emoji=DD10]'  # 钥匙锁住
-"""🔐"""
-钥匙 = '[emoji=D83D][emoji=DD11]'  # 钥匙
-"""🔑"""
-旧钥匙 = '[emoji=D83D][emoji=DDDD]'  # 旧钥匙
-"""🗝"""
-铁锤 = '[emoji=D83D][emoji=DD28]'  # 铁锤
-"""🔨"""
-斧子 = '[emoji=D83E][emoji=DE93]'  # 斧子
-"""🪓"""
-挑选 = '[emoji=26CF]'  # 挑选
-"""⛏"""
-锤与挑 = '[emoji=2692]'  # 锤与挑
-"""⚒"""
-锤子和扳手 = '[emoji=D83D][emoji=DEE0]'  # 锤子和扳手
-"""🛠"""
-匕首 = '[emoji=D83D][emoji=DDE1]'  # 匕首
-"""🗡"""
-十字剑 = '[emoji=2694]'  # 十字剑
-"""⚔"""
-手枪 = '[emoji=D83D][emoji=DD2B]'  # 手枪
-"""🔫"""
-弓箭 = '[emoji=D83C][emoji=DFF9]'  # 弓箭
-"""🏹"""
-盾 = '[emoji=D83D][emoji=DEE1]'  # 盾
-"""🛡"""
-扳手 = '[emoji=D83D][emoji=DD27]'  # 扳手
-"""🔧"""
-螺母螺栓 = '[emoji=D83D][emoji=DD29]'  # 螺母螺栓
-"""🔩"""
-齿轮 = '[emoji=2699]'  # 齿轮
-"""⚙"""
-夹紧 = '[emoji=D83D][emoji=DDDC]'  # 夹紧
-"""🗜"""
-平衡秤 = '[emoji=2696]'  # 平衡秤
-"""⚖"""
-探杖 = '[emoji=D83E][emoji=DDAF]'  # 探杖
-"""🦯"""
-链接 = '[emoji=D83D][emoji=DD17]'  # 链接
-"""🔗"""
-链 = '[emoji=26D3]'  # 链
-"""⛓"""
-工具箱 = '[emoji=D83E][emoji=DDF0]'  # 工具箱
-"""🧰"""
-磁铁 = '[emoji=D83E][emoji=DDF2]'  # 磁铁
-"""🧲"""
-蒸馏器 = '[emoji=2697]'  # 蒸馏器
-"""⚗"""
-试管 = '[emoji=D83E][emoji=DDEA]'  # 试管
-"""🧪"""
-培养皿 = '[emoji=D83E][emoji=DDEB]'  # 培养皿
-"""🧫"""
-DNA = '[emoji=D83E][emoji=DDEC]'  # DNA
-"""🧬"""
-显微镜 = '[emoji=D83D][emoji=DD2C]'  # 显微镜
-"""🔬"""
-望远镜 = '[emoji=D83D][emoji=DD2D]'  # 望远镜
-"""🔭"""
-卫星天线 = '[emoji=D83D][emoji=DCE1]'  # 卫星天线
-"""📡"""
-注射器 = '[emoji=D83D][emoji=DC89]'  # 注射器
-"""💉"""
-血滴 = '[emoji=D83E][emoji=DE78]'  # 血滴
-"""🩸"""
-药丸 = '[emoji=D83D][emoji=DC8A]'  # 药丸
-"""💊"""
-胶带 = '[emoji=D83E][emoji=DE79]'  # 胶带
-"""🩹"""
-听诊器 = '[emoji=D83E][emoji=DE7A]'  # 听诊器
-"""🩺"""
-门 = '[emoji=D83D][emoji=DEAA]'  # 门
-"""🚪"""
-床 = '[emoji=D83D][emoji=DECF]'  # 床
-"""🛏"""
-沙发灯 = '[emoji=D83D][emoji=DECB]'  # 沙发灯
-"""🛋"""
-椅子 = '[emoji=D83E][emoji=DE91]'  # 椅子
-"""🪑"""
-厕所 = '[emoji=D83D][emoji=DEBD]'  # 厕所
-"""🚽"""
-淋浴 = '[emoji=D83D][emoji=DEBF]'  # 淋浴
-"""🚿"""
-浴缸 = '[emoji=D83D][emoji=DEC1]'  # 浴缸
-"""🛁"""
-剃刀 = '[emoji=D83E][emoji=DE92]'  # 剃刀
-"""🪒"""
-洗液瓶 = '[emoji=D83E][emoji=DDF4]'  # 洗液瓶
-"""🧴"""
-安全销 = '[emoji=D83E][emoji=DDF7]'  # 安全销
-"""🧷"""
-扫帚 = '[emoji=D83E][emoji=DDF9]'  # 扫帚
-"""🧹"""
-篮子 = '[emoji=D83E][emoji=DDFA]'  # 篮子
-"""🧺"""
-卷筒纸 = '[emoji=D83E][emoji=DDFB]'  # 卷筒纸
-"""🧻"""
-肥皂 = '[emoji=D83E][emoji=DDFC]'  # 肥皂
-"""🧼"""
-海绵 = '[emoji=D83E][emoji=DDFD]'  # 海绵
-"""🧽"""
-灭火器 = '[emoji=D83E][emoji=DDEF]'  # 灭火器
-"""🧯"""
-购物车 = '[emoji=D83D][emoji=DED2]'  # 购物车
-"""🛒"""
-香烟 = '[emoji=D83D][emoji=DEAC]'  # 香烟
-"""🚬"""
-棺材 = '[emoji=26B0]'  # 棺材
-"""⚰"""
-丧葬瓮 = '[emoji=26B1]'  # 丧葬瓮
-"""⚱"""
-莫艾 = '[emoji=D83D][emoji=DDFF]'  # 莫艾
-"""🗿"""
-自动取款机标志 = '[emoji=D83C][emoji=DFE7]'  # 自动取款机标志
-"""🏧"""
-垃圾箱标志 = '[emoji=D83D][emoji=DEAE]'  # 垃圾箱标志
-"""🚮"""
-饮用水 = '[emoji=D83D][emoji=DEB0]'  # 饮用水
-"""🚰"""
-轮椅标志 = '[emoji=267F]'  # 轮椅标志
-"""♿"""
-男厕所 = '[emoji=D83D][emoji=DEB9]'  # 男厕所
-"""🚹"""
-女厕所 = '[emoji=D83D][emoji=DEBA]'  # 女厕所
-"""🚺"""
-卫生间 = '[emoji=D83D][emoji=DEBB]'  # 卫生间
-"""🚻"""
-婴儿符号 = '[emoji=D83D][emoji=DEBC]'  # 婴儿符号
-"""🚼"""
-抽水马桶 = '[emoji=D83D][emoji=DEBE]'  # 抽水马桶
-"""🚾"""
-护照管理 = '[emoji=D83D][emoji=DEC2]'  # 护照管理
-"""🛂"""
-海关 = '[emoji=D83D][emoji=DEC3]'  # 海关
-"""🛃"""
-行李认领 = '[emoji=D83D][emoji=DEC4]'  # 行李认领
-"""🛄"""
-行李寄存 = '[emoji=D83D][emoji=DEC5]'  # 行李寄存
-"""🛅"""
-警告 = '[emoji=26A0]'  # 警告
-"""⚠"""
-儿童穿越 = '[emoji=D83D][emoji=DEB8]'  # 儿童穿越
-"""🚸"""
-禁止进入 = '[emoji=26D4]'  # 禁止进入
-"""⛔"""
-禁止 = '[emoji=D83D][emoji=DEAB]'  # 禁止
-"""🚫"""
-禁止骑自行车 = '[emoji=D83D][emoji=DEB3]'  # 禁止骑自行车
-"""🚳"""
-禁止吸烟 = '[emoji=D83D][emoji=DEAD]'  # 禁止吸烟
-"""🚭"""
-禁止乱丢垃圾 = '[emoji=D83D][emoji=DEAF]'  # 禁止乱丢垃圾
-"""🚯"""
-非饮用水 = '[emoji=D83D][emoji=DEB1]'  # 非饮用水
-"""🚱"""
-没有行人 = '[emoji=D83D][emoji=DEB7]'  # 没有行人
-"""🚷"""
-没有手机 = '[emoji=D83D][emoji=DCF5]'  # 没有手机
-"""📵"""
-十八岁以下没有人 = '[emoji=D83D][emoji=DD1E]'  # 十八岁以下没有人
-"""🔞"""
-放射性的 = '[emoji=2622]'  # 放射性的
-"""☢"""
-生物危害 = '[emoji=2623]'  # 生物危害
-"""☣"""
-向上箭头 = '[emoji=2B06]'  # 向上箭头
-"""⬆"""
-右上箭头 = '[emoji=2197]'  # 右上箭头
-"""↗"""
-右箭头 = '[emoji=27A1]'  # 右箭头
-"""➡"""
-右下箭头 = '[emoji=2198]'  # 右下箭头
-"""↘"""
-向下箭头 = '[emoji=2B07]'  # 向下箭头
-"""⬇"""
-左下箭头 = '[emoji=2199]'  # 左下箭头
-"""↙"""
-左箭头 = '[emoji=2B05]'  # 左箭头
-"""⬅"""
-左上箭头 = '[emoji=2196]'  # 左上箭头
-"""↖"""
-上下箭头 = '[emoji=2195]'  # 上下箭头
-"""↕"""
-左右箭头 = '[emoji=2194]'  # 左右箭头
-"""↔"""
-右箭头向左弯曲 = '[emoji=21A9]'  # 右箭头向左弯曲
-"""↩"""
-左箭头向右弯曲 = '[emoji=21AA]'  # 左箭头向右弯曲
-"""↪"""
-右箭头向上弯曲 = '[emoji=2934]'  # 右箭头向上弯曲
-"""⤴"""
-右箭头向下弯曲 = '[emoji=2935]'  # 右箭头向下弯曲
-"""⤵"""
-顺时针垂直箭头 = '[emoji=D83D][emoji=DD03]'  # 顺时针垂直箭头
-"""🔃"""
-逆时针箭头按钮 = '[emoji=D83D][emoji=DD04]'  # 逆时针箭头按钮
-"""🔄"""
-后箭头 = '[emoji=D83D][emoji=DD19]'  # 后箭头
-"""🔙"""
-结束箭头 = '[emoji=D83D][emoji=DD1A]'  # 结束箭头
-"""🔚"""
-快箭 = '[emoji=D83D][emoji=DD1C]'  # 快箭
-"""🔜"""
-上箭头 = '[emoji=D83D][emoji=DD1D]'  # 上箭头
-"""🔝"""
-礼拜场所 = '[emoji=D83D][emoji=DED0]'  # 礼拜场所
-"""🛐"""
-原子符号 = '[emoji=269B]'  # 原子符号
-"""⚛"""
-奥姆 = '[emoji=D83D][emoji=DD49]'  # 奥姆
-"""🕉"""
-戴维之星 = '[emoji=2721]'  # 戴维之星
-"""✡"""
-法轮 = '[emoji=2638]'  # 法轮
-"""☸"""
-阴阳 = '[emoji=262F]'  # 阴阳
-"""☯"""
-拉丁十字勋章 = '[emoji=271D]'  # 拉丁十字勋章
-"""✝"""
-正统十字架 = '[emoji=2626]'  # 正统十字架
-"""☦"""
-星与新月 = '[emoji=262A]'  # 星与新月
-"""☪"""
-和平象征 = '[emoji=262E]'  # 和平象征
-"""☮"""
-米诺拉 = '[emoji=D83D][emoji=DD4E]'  # 米诺拉
-"""🕎"""
-星点六角星 = '[emoji=D83D][emoji=DD2F]'  # 星点六角星
-"""🔯"""
-白羊座 = '[emoji=2648]'  # 白羊座
-"""♈"""
-金牛座 = '[emoji=2649]'  # 金牛座
-"""♉"""
-双子星座 = '[emoji=264A]'  # 双子星座
-"""♊"""
-癌症 = '[emoji=264B]'  # 癌症
-"""♋"""
-狮子座 = '[emoji=264C]'  # 狮子座
-"""♌"""
-处女座 = '[emoji=264D]'  # 处女座
-"""♍"""
-天秤座 = '[emoji=264E]'  # 天秤座
-"""♎"""
-天蝎座 = '[emoji=264F]'  # 天蝎座
-"""♏"""
-射手座 = '[emoji=2650]'  # 射手座
-"""♐"""
-摩羯座 = '[emoji=2651]'  # 摩羯座
-"""♑"""
-宝瓶座 = '[emoji=2652]'  # 宝瓶座
-"""♒"""
-双鱼座 = '[emoji=2653]'  # 双鱼座
-"""♓"""
-蛇夫座 = '[emoji=26CE]'  # 蛇夫座
-"""⛎"""
-随机播放曲目按钮 = '[emoji=D83D][emoji=DD00]'  # 随机播放曲目按钮
-"""🔀"""
-重复按钮 = '[emoji=D83D][emoji=DD01]'  # 重复按钮
-"""🔁"""
-重复单个按钮 = '[emoji=D83D][emoji=DD02]'  # 重复单个按钮
-"""🔂"""
-播放按钮 = '[emoji=25B6]'  # 播放按钮
-"""▶"""
-快进按钮 = '[emoji=23E9]'  # 快进按钮
-"""⏩"""
-下一曲目按钮 = '[emoji=23ED]'  # 下一曲目按钮
-"""⏭"""
-播放或暂停按钮 = '[emoji=23EF]'  # 播放或暂停按钮
-"""⏯"""
-反向按钮 = '[emoji=25C0]'  # 反向按钮
-"""◀"""
-快速后退按钮 = '[emoji=23EA]'  # 快速后退按钮
-"""⏪"""
-最后一个曲目按钮 = '[emoji=23EE]'  # 最后一个曲目按钮
-"""⏮"""
-向上按钮 = '[emoji=D83D][emoji=DD3C]'  # 向上按钮
-"""🔼"""
-快速按钮 = '[emoji=23EB]'  # 快速按钮
-"""⏫"""
-向下按钮 = '[emoji=D83D][emoji=DD3D]'  # 向下按钮
-"""🔽"""
-快速向下按钮 = '[emoji=23EC]'  # 快速向下按钮
-"""⏬"""
-暂停按钮 = '[emoji=23F8]'  # 暂停按钮
-"""⏸"""
-停止按钮 = '[emoji=23F9]'  # 停止按钮
-"""⏹"""
-记录按钮 = '[emoji=23FA]'  # 记录按钮
-"""⏺"""
-弹出按钮 = '[emoji=23CF]'  # 弹出按钮
-"""⏏"""
-电影院 = '[emoji=D83C][emoji=DFA6]'  # 电影院
-"""🎦"""
-暗淡按钮 = '[emoji=D83D][emoji=DD05]'  # 暗淡按钮
-"""🔅"""
-亮钮 = '[emoji=D83D][emoji=DD06]'  # 亮钮
-"""🔆"""
-天线杆 = '[emoji=D83D][emoji=DCF6]'  # 天线杆
-"""📶"""
-振动模式 = '[emoji=D83D][emoji=DCF3]'  # 振动模式
-"""📳"""
-手机关闭 = '[emoji=D83D][emoji=DCF4]'  # 手机关闭
-"""📴"""
-女性征 = '[emoji=2640]'  # 女性征
-"""♀"""
-男性征 = '[emoji=2642]'  # 男性征
-"""♂"""
-医学符号 = '[emoji=2695]'  # 医学符号
-"""⚕"""
-无穷 = '[emoji=267E]'  # 无穷
-"""♾"""
-回收符号 = '[emoji=267B]'  # 回收符号
-"""♻"""
-鸢尾花 = '[emoji=269C]'  # 鸢尾花
-"""⚜"""
-三叉戟徽章 = '[emoji=D83D][emoji=DD31]'  # 三叉戟徽章
-"""🔱"""
-姓名徽章 = '[emoji=D83D][emoji=DCDB]'  # 姓名徽章
-"""📛"""
-日语初学者符号 = '[emoji=D83D][emoji=DD30]'  # 日语初学者符号
-"""🔰"""
-空心红色圆圈 = '[emoji=2B55]'  # 空心红色圆圈
-"""⭕"""
-复选标记按钮 = '[emoji=2705]'  # 复选标记按钮
-"""✅"""
-带复选框的复选框 = '[emoji=2611]'  # 带复选框的复选框
-"""☑"""
-复选标记 = '[emoji=2714]'  # 复选标记
-"""✔"""
-乘号 = '[emoji=2716]'  # 乘号
-"""✖"""
-十字标记 = '[emoji=274C]'  # 十字标记
-"""❌"""
-十字标记按钮 = '[emoji=274E]'  # 十字标记按钮
-"""❎"""
-加号 = '[emoji=2795]'  # 加号
-"""➕"""
-负号 = '[emoji=2796]'  # 负号
-"""➖"""
-除法标志 = '[emoji=2797]'  # 除法标志
-"""➗"""
-卷曲环 = '[emoji=27B0]'  # 卷曲环
-"""➰"""
-双卷曲环 = '[emoji=27BF]'  # 双卷曲环
-"""➿"""
-零件替换标记 = '[emoji=303D]'  # 零件替换标记
-"""〽"""
-八辐星号 = '[emoji=2733]'  # 八辐星号
-"""✳"""
-八角星 = '[emoji=2734]'  # 八角星
-"""✴"""
-闪耀 = '[emoji=2747]'  # 闪耀
-"""❇"""
-双感叹号 = '[emoji=203C]'  # 双感叹号
-"""‼"""
-感叹号问号 = '[emoji=2049]'  # 感叹号问号
-"""⁉"""
-问号 = '[emoji=2753]'  # 问号
-"""❓"""
-白色问号 = '[emoji=2754]'  # 白色问号
-"""❔"""
-白色感叹号 = '[emoji=2755]'  # 白色感叹号
-"""❕"""
-感叹号 = '[emoji=2757]'  # 感叹号
-"""❗"""
-波浪冲刺 = '[emoji=3030]'  # 波浪冲刺
-"""〰"""
-版权 = '[emoji=00A9]'  # 版权
-"""©"""
-注册的 = '[emoji=00AE]'  # 注册的
-"""®"""
-商标 = '[emoji=2122]'  # 商标
-"""™"""
-输入拉丁文大写 = '[emoji=D83D][emoji=DD20]'  # 输入拉丁文大写
-"""🔠"""
-输入拉丁文小写 = '[emoji=D83D][emoji=DD21]'  # 输入拉丁文小写
-"""🔡"""
-输入数 = '[emoji=D83D][emoji=DD22]'  # 输入数
-"""🔢"""
-输入符号 = '[emoji=D83D][emoji=DD23]'  # 输入符号
-"""🔣"""
-输入拉丁字母 = '[emoji=D83D][emoji=DD24]'  # 输入拉丁字母
-"""🔤"""
-CL按钮 = '[emoji=D83C][emoji=DD91]'  # CL按钮
-"""🆑"""
-酷按钮 = '[emoji=D83C][emoji=DD92]'  # 酷按钮
-"""🆒"""
-免费按钮 = '[emoji=D83C][emoji=DD93]'  # 免费按钮
-"""🆓"""
-信息 = '[emoji=2139]'  # 信息
-"""ℹ"""
-标识按钮 = '[emoji=D83C][emoji=DD94]'  # 标识按钮
-"""🆔"""
-圆圈M = '[emoji=24C2]'  # 圆圈M
-"""Ⓜ"""
-新按钮 = '[emoji=D83C][emoji=DD95]'  # 新按钮
-"""🆕"""
-NG按钮 = '[emoji=D83C][emoji=DD96]'  # NG按钮
-"""🆖"""
-确定按钮 = '[emoji=D83C][emoji=DD97]'  # 确定按钮
-"""🆗"""
-P按钮 = '[emoji=D83C][emoji=DD7F]'  # P按钮
-"""🅿"""
-SOS按钮 = '[emoji=D83C][emoji=DD98]'  # SOS按钮
-"""🆘"""
-VS按钮 = '[emoji=D83C][emoji=DD9A]'  # VS按钮
-"""🆚"""
-红圈 = '[emoji=D83D][emoji=DD34]'  # 红圈
-"""🔴"""
-橙色圈 = '[emoji=D83D][emoji=DFE0]'  # 橙色圈
-"""🟠"""
-黄圈 = '[emoji=D83D][emoji=DFE1]'  # 黄圈
-"""🟡"""
-绿圈 = '[emoji=D83D][emoji=DFE2]'  # 绿圈
-"""🟢"""
-蓝圆 = '[emoji=D83D][emoji=DD35]'  # 蓝圆
-"""🔵"""
-紫色圈 = '[emoji=D83D][emoji=DFE3]'  # 紫色圈
-"""🟣"""
-白圈 = '[emoji=26AA]'  # 白圈
-"""⚪"""
-棕圆 = '[emoji=D83D][emoji=DFE4]'  # 棕圆
-"""🟤"""
-红场 = '[emoji=D83D][emoji=DFE5]'  # 红场
-"""🟥"""
-橙色广场 = '[emoji=D83D][emoji=DFE7]'  # 橙色广场
-"""🟧"""
-黄色广场 = '[emoji=D83D][emoji=DFE8]'  # 黄色广场
-"""🟨"""
-绿色广场 = '[emoji=D83D][emoji=DFE9]'  # 绿色广场
-"""🟩"""
-蓝方 = '[emoji=D83D][emoji=DFE6]'  # 蓝方
-"""🟦"""
-紫方 = '[emoji=D83D][emoji=DFEA]'  # 紫方
-"""🟪"""
-黑圈 = '[emoji=26AB]'  # 黑圈
-"""⚫"""
-白色大方形 = '[emoji=2B1C]'  # 白色大方形
-"""⬜"""
-褐色广场 = '[emoji=D83D][emoji=DFEB]'  # 褐色广场
-"""🟫"""
-黑色大方形 = '[emoji=2B1B]'  # 黑色大方形
-"""⬛"""
-黑色中方形 = '[emoji=25FC]'  # 黑色中方形
-"""◼"""
-白色中方形 = '[emoji=25FB]'  # 白色中方形
-"""◻"""
-白色中小型方形 = '[emoji=25FD]'  # 白色中小型方形
-"""◽"""
-黑色中小型方形 = '[emoji=25FE]'  # 黑色中小型方形
-"""◾"""
-白色小正方形 = '[emoji=25AB]'  # 白色小正方形
-"""▫"""
-黑色小正方形 = '[emoji=25AA]'  # 黑色小正方形
-"""▪"""
-大橙色菱形 = '[emoji=D83D][emoji=DD36]'  # 大橙色菱形
-"""🔶"""
-大蓝钻石 = '[emoji=D83D][emoji=DD37]'  # 大蓝钻石
-"""🔷"""
-小橙色菱形 = '[emoji=D83D][emoji=DD38]'  # 小橙色菱形
-"""🔸"""
-蓝色小钻石 = '[emoji=D83D][emoji=DD39]'  # 蓝色小钻石
-"""🔹"""
-红色三角形尖朝上 = '[emoji=D83D][emoji=DD3A]'  # 红色三角形尖朝上
-"""🔺"""
-红色三角形向下 = '[emoji=D83D][emoji=DD3B]'  # 红色三角形向下
-"""🔻"""
-带点的菱形 = '[emoji=D83D][emoji=DCA0]'  # 带点的菱形
-"""💠"""
-单选按钮 = '[emoji=D83D][emoji=DD18]'  # 单选按钮
-"""🔘"""
-黑色方形按钮 = '[emoji=D83D][emoji=DD32]'  # 黑色方形按钮
-"""🔲"""
-白色方形按钮 = '[emoji=D83D][emoji=DD33]'  # 白色方形按钮
-"""🔳"""
-黑白方格旗 = '[emoji=D83C][emoji=DFC1]'  # 黑白方格旗
-"""🏁"""
-三角旗 = '[emoji=D83D][emoji=DEA9]'  # 三角旗
-"""🚩"""
-十字旗 = '[emoji=D83C][emoji=DF8C]'  # 十字旗
-"""🎌"""
-黑旗 = '[emoji=D83C][emoji=DFF4]'  # 黑旗
-"""🏴"""
-白旗 = '[emoji=D83C][emoji=DFF3]'  # 白旗
-"""🏳"""
-彩虹旗 = '[emoji=D83C][emoji=DFF3][emoji=FE0F][emoji=200D][emoji=D83C][emoji=DF08]'  # 彩虹旗
-"""🏳️‍🌈"""
-海盗旗 = '[emoji=D83C][emoji=DFF4][emoji=200D][emoji=2620][emoji=FE0F]'  # 海盗旗
-"""🏴‍☠️"""
-阿森松岛国旗 = '[emoji=D83C][emoji=DDE6][emoji=D83C][emoji=DDE8]'  # 阿森松岛国旗
-"""🇦🇨"""
-安道尔国旗 = '[emoji=D83C][emoji=DDE6][emoji=D83C][emoji=DDE9]'  # 安道尔国旗
-"""🇦🇩"""
-阿拉伯联合酋长国国旗 = '[emoji=D83C][emoji=DDE6][emoji=D83C][emoji=DDEA]'  # 阿拉伯联合酋长国国旗
-"""🇦🇪"""
-阿富汗国旗 = '[emoji=D83C][emoji=DDE6][emoji=D83C][emoji=DDEB]'  # 阿富汗国旗
-"""🇦🇫"""
-安提瓜和巴布达国旗 = '[emoji=D83C][emoji=DDE6][emoji=D83C][emoji=DDEC]'  # 安提瓜和巴布达国旗
-"""🇦🇬"""
-安圭拉国旗 = '[emoji=D83C][emoji=DDE6][emoji=D83C][emoji=DDEE]'  # 安圭拉国旗
-"""🇦🇮"""
-阿尔巴尼亚国旗 = '[emoji=D83C][emoji=DDE6][emoji=D83C][emoji=DDF1]'  # 阿尔巴尼亚国旗
-"""🇦🇱"""
-亚美尼亚国旗 = '[emoji=D83C][emoji=DDE6][emoji=D83C][emoji=DDF2]'  # 亚美尼亚国旗
-"""🇦🇲"""
-安哥拉国旗 = '[emoji=D83C][emoji=DDE6][emoji=D83C][emoji=DDF4]'  # 安哥拉国旗
-"""🇦🇴"""
-南极洲国旗 = '[emoji=D83C][emoji=DDE6][emoji=D83C][emoji=DDF6]'  # 南极洲国旗
-"""🇦🇶"""
-阿根廷国旗 = '[emoji=D83C][emoji=DDE6][emoji=D83C][emoji=DDF7]'  # 阿根廷国旗
-"""🇦🇷"""
-美属萨摩亚国旗 = '[emoji=D83C][emoji=DDE6][emoji=D83C][emoji=DDF8]'  # 美属萨摩亚国旗
-"""🇦🇸"""
-奥地利国旗 = '[emoji=D83C][emoji=DDE6][emoji=D83C][emoji=DDF9]'  # 奥地利国旗
-"""🇦🇹"""
-澳大利亚国旗 = '[emoji=D83C][emoji=DDE6][emoji=D83C][emoji=DDFA]'  # 澳大利亚国旗
-"""🇦🇺"""
-Aruba国旗 = '[emoji=D83C][emoji=DDE6][emoji=D83C][emoji=DDFC]'  # Aruba国旗
-"""🇦🇼"""
-陆地岛屿国旗 = '[emoji=D83C][emoji=DDE6][emoji=D83C][emoji=DDFD]'  # 陆地岛屿国旗
-"""🇦🇽"""
-阿塞拜疆国旗 = '[emoji=D83C][emoji=DDE6][emoji=D83C][emoji=DDFF]'  # 阿塞拜疆国旗
-"""🇦🇿"""
-波斯尼亚和黑塞哥维那国旗 = '[emoji=D83C][emoji=DDE7][emoji=D83C][emoji=DDE6]'  # 波斯尼亚和黑塞哥维那国旗
-"""🇧🇦"""
-巴巴多斯国旗 = '[emoji=D83C][emoji=DDE7][emoji=D83C][emoji=DDE7]'  # 巴巴多斯国旗
-"""🇧🇧"""
-孟加拉国国旗 = '[emoji=D83C][emoji=DDE7][emoji=D83C][emoji=DDE9]'  # 孟加拉国国旗
-"""🇧🇩"""
-比利时国旗 = '[emoji=D83C][emoji=DDE7][emoji=D83C][emoji=DDEA]'  # 比利时国旗
-"""🇧🇪"""
-布基纳法索国旗 = '[emoji=D83C][emoji=DDE7][emoji=D83C][emoji=DDEB]'  # 布基纳法索国旗
-"""🇧🇫"""
-保加利亚国旗 = '[emoji=D83C][emoji=DDE7][emoji=D83C][emoji=DDEC]'  # 保加利亚国旗
-"""🇧🇬"""
-巴林国旗 = '[emoji=D83C][emoji=DDE7][emoji=D83C][emoji=DDED]'  # 巴林国旗
-"""🇧🇭"""
-布隆迪国旗 = '[emoji=D83C][emoji=DDE7][emoji=D83C][emoji=DDEE]'  # 布隆迪国旗
-"""🇧🇮"""
-贝宁国旗 = '[emoji=D83C][emoji=DDE7][emoji=D83C][emoji=DDEF]'  # 贝宁国旗
-"""🇧🇯"""
-圣巴特莱米国旗 = '[emoji=D83C][emoji=DDE7][emoji=D83C][emoji=DDF1]'  # 圣巴特莱米国旗
-"""🇧🇱"""
-百慕大群岛国旗 = '[emoji=D83C][emoji=DDE7][emoji=D83C][emoji=DDF2]'  # 百慕大群岛国旗
-"""🇧🇲"""
-文莱国旗 = '[emoji=D83C][emoji=DDE7][emoji=D83C][emoji=DDF3]'  # 文莱国旗
-"""🇧🇳"""
-玻利维亚国旗 = '[emoji=D83C][emoji=DDE7][emoji=D83C][emoji=DDF4]'  # 玻利维亚国旗
-"""🇧🇴"""
-加勒比海荷兰国旗 = '[emoji=D83C][emoji=DDE7][emoji=D83C][emoji=DDF6]'  # 加勒比海荷兰国旗
-"""🇧🇶"""
-巴西国旗 = '[emoji=D83C][emoji=DDE7][emoji=D83C][emoji=DDF7]'  # 巴西国旗
-"""🇧🇷"""
-巴哈马国旗 = '[emoji=D83C][emoji=DDE7][emoji=D83C][emoji=DDF8]'  # 巴哈马国旗
-"""🇧🇸"""
-不丹国旗 = '[emoji=D83C][emoji=DDE7][emoji=D83C][emoji=DDF9]'  # 不丹国旗
-"""🇧🇹"""
-布韦岛国旗 = '[emoji=D83C][emoji=DDE7][emoji=D83C][emoji=DDFB]'  # 布韦岛国旗
-"""🇧🇻"""
-博茨瓦纳国旗 = '[emoji=D83C][emoji=DDE7][emoji=D83C][emoji=DDFC]'  # 博茨瓦纳国旗
-"""🇧🇼"""
-白俄罗斯国旗 = '[emoji=D83C][emoji=DDE7][emoji=D83C][emoji=DDFE]'  # 白俄罗斯国旗
-"""🇧🇾"""
-伯利兹国旗 = '[emoji=D83C][emoji=DDE7][emoji=D83C][emoji=DDFF]'  # 伯利兹国旗
-"""🇧🇿"""
-加拿大国旗 = '[emoji=D83C][emoji=DDE8][emoji=D83C][emoji=DDE6]'  # 加拿大国旗
-"""🇨🇦"""
-中非共和国国旗 = '[emoji=D83C][emoji=DDE8][emoji=D83C][emoji=DDEB]'  # 中非共和国国旗
-"""🇨🇫"""
-瑞士国旗 = '[emoji=D83C][emoji=DDE8][emoji=D83C][emoji=DDED]'  # 瑞士国旗
-"""🇨🇭"""
-科特迪瓦国旗 = '[emoji=D83C][emoji=DDE8][emoji=D83C][emoji=DDEE]'  # 科特迪瓦国旗
-"""🇨🇮"""
-库克群岛国旗 = '[emoji=D83C][emoji=DDE8][emoji=D83C][emoji=DDF0]'  # 库克群岛国旗
-"""🇨🇰"""
-智利国旗 = '[emoji=D83C][emoji=DDE8][emoji=D83C][emoji=DDF1]'  # 智利国旗
-"""🇨🇱"""
-喀麦隆国旗 = '[emoji=D83C][emoji=DDE8][emoji=D83C][emoji=DDF2]'  # 喀麦隆国旗
-"""🇨🇲"""
-中国国旗 = '[emoji=D83C][emoji=DDE8][emoji=D83C][emoji=DDF3]'  # 中国国旗
-"""🇨🇳"""
-哥伦比亚国旗 = '[emoji=D83C][emoji=DDE8][emoji=D83C][emoji=DDF4]'  # 哥伦比亚国旗
-"""🇨🇴"""
-克利珀顿岛国旗 = '[emoji=D83C][emoji=DDE8][emoji=D83C][emoji=DDF5]'  # 克利珀顿岛国旗
-"""🇨🇵"""
-哥斯达黎加国旗 = '[emoji=D83C][emoji=DDE8][emoji=D83C][emoji=DDF7]'  # 哥斯达黎加国旗
-"""🇨🇷"""
-古巴国旗 = '[emoji=D83C][emoji=DDE8][emoji=D83C][emoji=DDFA]'  # 古巴国旗
-"""🇨🇺"""
-佛得角国旗 = '[emoji=D83C][emoji=DDE8][emoji=D83C][emoji=DDFB]'  # 佛得角国旗
-"""🇨🇻"""
-库劳国旗 = '[emoji=D83C][emoji=DDE8][emoji=D83C][emoji=DDFC]'  # 库劳国旗
-"""🇨🇼"""
-圣诞岛国旗 = '[emoji=D83C][emoji=DDE8][emoji=D83C][emoji=DDFD]'  # 圣诞岛国旗
-"""🇨🇽"""
-塞浦路斯国旗 = '[emoji=D83C][emoji=DDE8][emoji=D83C][emoji=DDFE]'  # 塞浦路斯国旗
-"""🇨🇾"""
-捷克国旗 = '[emoji=D83C][emoji=DDE8][emoji=D83C][emoji=DDFF]'  # 捷克国旗
-"""🇨🇿"""
-德国国旗 = '[emoji=D83C][emoji=DDE9][emoji=D83C][emoji=DDEA]'  # 德国国旗
-"""🇩🇪"""
-吉布提国旗 = '[emoji=D83C][emoji=DDE9][emoji=D83C][emoji=DDEF]'  # 吉布提国旗
-"""🇩🇯"""
-丹麦国旗 = '[emoji=D83C][emoji=DDE9][emoji=D83C][emoji=DDF0]'  # 丹麦国旗
-"""🇩🇰"""
-多米尼加国旗 = '[emoji=D83C][emoji=DDE9][emoji=D83C][emoji=DDF2]'  # 多米尼加国旗
-"""🇩🇲"""
-多米尼加共和国国旗 = '[emoji=D83C][emoji=DDE9][emoji=D83C][emoji=DDF4]'  # 多米尼加共和国国旗
-"""🇩🇴"""
-阿尔及利亚国旗 = '[emoji=D83C][emoji=DDE9][emoji=D83C][emoji=DDFF]'  # 阿尔及利亚国旗
-"""🇩🇿"""
-休达和梅利利亚国旗 = '[emoji=D83C][emoji=DDEA][emoji=D83C][emoji=DDE6]'  # 休达和梅利利亚国旗
-"""🇪🇦"""
-厄瓜多尔国旗 = '[emoji=D83C][emoji=DDEA][emoji=D83C][emoji=DDE8]'  # 厄瓜多尔国旗
-"""🇪🇨"""
-爱沙尼亚国旗 = '[emoji=D83C][emoji=DDEA][emoji=D83C][emoji=DDEA]'  # 爱沙尼亚国旗
-"""🇪🇪"""
-埃及国旗 = '[emoji=D83C][emoji=DDEA][emoji=D83C][emoji=DDEC]'  # 埃及国旗
-"""🇪🇬"""
-西撒哈拉国旗 = '[emoji=D83C][emoji=DDEA][emoji=D83C][emoji=DDED]'  # 西撒哈拉国旗
-"""🇪🇭"""
-Eritrea国旗 = '[emoji=D83C][emoji=DDEA][emoji=D83C][emoji=DDF7]'  # Eritrea国旗
-"""🇪🇷"""
-西班牙国旗 = '[emoji=D83C][emoji=DDEA][emoji=D83C][emoji=DDF8]'  # 西班牙国旗
-"""🇪🇸"""
-埃塞俄比亚国旗 = '[emoji=D83C][emoji=DDEA][emoji=D83C][emoji=DDF9]'  # 埃塞俄比亚国旗
-"""🇪🇹"""
-欧盟国旗 = '[emoji=D83C][emoji=DDEA][emoji=D83C][emoji=DDFA]'  # 欧盟国旗
-"""🇪🇺"""
-芬兰国旗 = '[emoji=D83C][emoji=DDEB][emoji=D83C][emoji=DDEE]'  # 芬兰国旗
-"""🇫🇮"""
-斐济国旗 = '[emoji=D83C][emoji=DDEB][emoji=D83C][emoji=DDEF]'  # 斐济国旗
-"""🇫🇯"""
-福克兰群岛国旗 = '[emoji=D83C][emoji=DDEB][emoji=D83C][emoji=DDF0]'  # 福克兰群岛国旗
-"""🇫🇰"""
-密克罗尼西亚国旗 = '[emoji=D83C][emoji=DDEB][emoji=D83C][emoji=DDF2]'  # 密克罗尼西亚国旗
-"""🇫🇲"""
-法罗群岛国旗 = '[emoji=D83C][emoji=DDEB][emoji=D83C][emoji=DDF4]'  # 法罗群岛国旗
-"""🇫🇴"""
-法国国旗 = '[emoji=D83C][emoji=DDEB][emoji=D83C][emoji=DDF7]'  # 法国国旗
-"""🇫🇷"""
-Gabon国旗 = '[emoji=D83C][emoji=DDEC][emoji=D83C][emoji=DDE6]'  # Gabon国旗
-"""🇬🇦"""
-格林纳达国旗 = '[emoji=D83C][emoji=DDEC][emoji=D83C][emoji=DDE9]'  # 格林纳达国旗
-"""🇬🇩"""
-格鲁吉亚国旗 = '[emoji=D83C][emoji=DDEC][emoji=D83C][emoji=DDEA]'  # 格鲁吉亚国旗
-"""🇬🇪"""
-法属圭亚那国旗 = '[emoji=D83C][emoji=DDEC][emoji=D83C][emoji=DDEB]'  # 法属圭亚那国旗
-"""🇬🇫"""
-英属格恩西国旗 = '[emoji=D83C][emoji=DDEC][emoji=D83C][emoji=DDEC]'  # 英属格恩西国旗
-"""🇬🇬"""
-加纳国旗 = '[emoji=D83C][emoji=DDEC][emoji=D83C][emoji=DDED]'  # 加纳国旗
-"""🇬🇭"""
-直布罗陀国旗 = '[emoji=D83C][emoji=DDEC][emoji=D83C][emoji=DDEE]'  # 直布罗陀国旗
-"""🇬🇮"""
-格陵兰岛国旗 = '[emoji=D83C][emoji=DDEC][emoji=D83C][emoji=DDF1]'  # 格陵兰岛国旗
-"""🇬🇱"""
-冈比亚国旗 = '[emoji=D83C][emoji=DDEC][emoji=D83C][emoji=DDF2]'  # 冈比亚国旗
-"""🇬🇲"""
-几内亚国旗 = '[emoji=D83C][emoji=DDEC][emoji=D83C][emoji=DDF3]'  # 几内亚国旗
-"""🇬🇳"""
-瓜德罗普国旗 = '[emoji=D83C][emoji=DDEC][emoji=D83C][emoji=DDF5]'  # 瓜德罗普国旗
-"""🇬🇵"""
-赤道几内亚国旗 = '[emoji=D83C][emoji=DDEC][emoji=D83C][emoji=DDF6]'  # 赤道几内亚国旗
-"""🇬🇶"""
-希腊国旗 = '[emoji=D83C][emoji=DDEC][emoji=D83C][emoji=DDF7]'  # 希腊国旗
-"""🇬🇷"""
-南乔治亚和南桑威奇群岛国旗 = '[emoji=D83C][emoji=DDEC][emoji=D83C][emoji=DDF8]'  # 南乔治亚和南桑威奇群岛国旗
-"""🇬🇸"""
-瓜地马拉国旗 = '[emoji=D83C][emoji=DDEC][emoji=D83C][emoji=DDF9]'  # 瓜地马拉国旗
-"""🇬🇹"""
-关岛国旗 = '[emoji=D83C][emoji=DDEC][emoji=D83C][emoji=DDFA]'  # 关岛国旗
-"""🇬🇺"""
-几内亚比绍国旗 = '[emoji=D83C][emoji=DDEC][emoji=D83C][emoji=DDFC]'  # 几内亚比绍国旗
-"""🇬🇼"""
-圭亚那国旗 = '[emoji=D83C][emoji=DDEC][emoji=D83C][emoji=DDFE]'  # 圭亚那国旗
-"""🇬🇾"""
-香港特区 = '[emoji=D83C][emoji=DDED][emoji=D83C][emoji=DDF0]'  # 香港特区
-"""🇭🇰"""
-赫德和麦克唐纳群岛国旗 = '[emoji=D83C][emoji=DDED][emoji=D83C][emoji=DDF2]'  # 赫德和麦克唐纳群岛国旗
-"""🇭🇲"""
-洪都拉斯国旗 = '[emoji=D83C][emoji=DDED][emoji=D83C][emoji=DDF3]'  # 洪都拉斯国旗
-"""🇭🇳"""
-克罗地亚国旗 = '[emoji=D83C][emoji=DDED][emoji=D83C][emoji=DDF7]'  # 克罗地亚国旗
-"""🇭🇷"""
-海地国旗 = '[emoji=D83C][emoji=DDED][emoji=D83C][emoji=DDF9]'  # 海地国旗
-"""🇭🇹"""
-匈牙利国旗 = '[emoji=D83C][emoji=DDED][emoji=D83C][emoji=DDFA]'  # 匈牙利国旗
-"""🇭🇺"""
-加那利群岛国旗 = '[emoji=D83C][emoji=DDEE][emoji=D83C][emoji=DDE8]'  # 加那利群岛国旗
-"""🇮🇨"""
-印度尼西亚国旗 = '[emoji=D83C][emoji=DDEE][emoji=D83C][emoji=DDE9]'  # 印度尼西亚国旗
-"""🇮🇩"""
-爱尔兰国旗 = '[emoji=D83C][emoji=DDEE][emoji=D83C][emoji=DDEA]'  # 爱尔兰国旗
-"""🇮🇪"""
-以色列国旗 = '[emoji=D83C][emoji=DDEE][emoji=D83C][emoji=DDF1]'  # 以色列国旗
-"""🇮🇱"""
-马恩岛国旗 = '[emoji=D83C][emoji=DDEE][emoji=D83C][emoji=DDF2]'  # 马恩岛国旗
-"""🇮🇲"""
-印度国旗 = '[emoji=D83C][emoji=DDEE][emoji=D83C][emoji=DDF3]'  # 印度国旗
-"""🇮🇳"""
-英属印度洋领土国旗 = '[emoji=D83C][emoji=DDEE][emoji=D83C][emoji=DDF4]'  # 英属印度洋领土国旗
-"""🇮🇴"""
-伊拉克国旗 = '[emoji=D83C][emoji=DDEE][emoji=D83C][emoji=DDF6]'  # 伊拉克国旗
-"""🇮🇶"""
-伊朗国旗 = '[emoji=D83C][emoji=DDEE][emoji=D83C][emoji=DDF7]'  # 伊朗国旗
-"""🇮🇷"""
-冰岛国旗 = '[emoji=D83C][emoji=DDEE][emoji=D83C][emoji=DDF8]'  # 冰岛国旗
-"""🇮🇸"""
-意大利国旗 = '[emoji=D83C][emoji=DDEE][emoji=D83C][emoji=DDF9]'  # 意大利国旗
-"""🇮🇹"""
-Jersey国旗 = '[emoji=D83C][emoji=DDEF][emoji=D83C][emoji=DDEA]'  # Jersey国旗
-"""🇯🇪"""
-牙买加国旗 = '[emoji=D83C][emoji=DDEF][emoji=D83C][emoji=DDF2]'  # 牙买加国旗
-"""🇯🇲"""
-约旦国旗 = '[emoji=D83C][emoji=DDEF][emoji=D83C][emoji=DDF4]'  # 约旦国旗
-"""🇯🇴"""
-日本国旗 = '[emoji=D83C][emoji=DDEF][emoji=D83C][emoji=DDF5]'  # 日本国旗
-"""🇯🇵"""
-肯尼亚国旗 = '[emoji=D83C][emoji=DDF0][emoji=D83C][emoji=DDEA]'  # 肯尼亚国旗
-"""🇰🇪"""
-吉尔吉斯斯坦国旗 = '[emoji=D83C][emoji=DDF0][emoji=D83C][emoji=DDEC]'  # 吉尔吉斯斯坦国旗
-"""🇰🇬"""
-柬埔寨国旗 = '[emoji=D83C][emoji=DDF0][emoji=D83C][emoji=DDED]'  # 柬埔寨国旗
-"""🇰🇭"""
-基里巴斯国旗 = '[emoji=D83C][emoji=DDF0][emoji=D83C][emoji=DDEE]'  # 基里巴斯国旗
-"""🇰🇮"""
-科摩罗伊斯兰国旗 = '[emoji=D83C][emoji=DDF0][emoji=D83C][emoji=DDF2]'  # 科摩罗伊斯兰国旗
-"""🇰🇲"""
-圣基茨和尼维斯国旗 = '[emoji=D83C][emoji=DDF0][emoji=D83C][emoji=DDF3]'  # 圣基茨和尼维斯国旗
-"""🇰🇳"""
-朝鲜国旗 = '[emoji=D83C][emoji=DDF0][emoji=D83C][emoji=DDF5]'  # 朝鲜国旗
-"""🇰🇵"""
-韩国国旗 = '[emoji=D83C][emoji=DDF0][emoji=D83C][emoji=DDF7]'  # 韩国国旗
-"""🇰🇷"""
-科威特国旗 = '[emoji=D83C][emoji=DDF0][emoji=D83C][emoji=DDFC]'  # 科威特国旗
-"""🇰🇼"""
-开曼群岛国旗 = '[emoji=D83C][emoji=DDF0][emoji=D83C][emoji=DDFE]'  # 开曼群岛国旗
-"""🇰🇾"""
-哈萨克斯坦国旗 = '[emoji=D83C][emoji=DDF0][emoji=D83C][emoji=DDFF]'  # 哈萨克斯坦国旗
-"""🇰🇿"""
-Laos国旗 = '[emoji=D83C][emoji=DDF1][emoji=D83C][emoji=DDE6]'  # Laos国旗
-"""🇱🇦"""
-黎巴嫩国旗 = '[emoji=D83C][emoji=DDF1][emoji=D83C][emoji=DDE7]'  # 黎巴嫩国旗
-"""🇱🇧"""
-圣卢西亚国旗 = '[emoji=D83C][emoji=DDF1][emoji=D83C][emoji=DDE8]'  # 圣卢西亚国旗
-"""🇱🇨"""
-列支敦士登国旗 = '[emoji=D83C][emoji=DDF1][emoji=D83C][emoji=DDEE]'  # 列支敦士登国旗
-"""🇱🇮"""
-斯里兰卡国旗 = '[emoji=D83C][emoji=DDF1][emoji=D83C][emoji=DDF0]'  # 斯里兰卡国旗
-"""🇱🇰"""
-利比里亚国旗 = '[emoji=D83C][emoji=DDF1][emoji=D83C][emoji=DDF7]'  # 利比里亚国旗
-"""🇱🇷"""
-莱索托国旗 = '[emoji=D83C][emoji=DDF1][emoji=D83C][emoji=DDF8]'  # 莱索托国旗
-"""🇱🇸"""
-立陶宛国旗 = '[emoji=D83C][emoji=DDF1][emoji=D83C][emoji=DDF9]'  # 立陶宛国旗
-"""🇱🇹"""
-卢森堡国旗 = '[emoji=D83C][emoji=DDF1][emoji=D83C][emoji=DDFA]'  # 卢森堡国旗
-"""🇱🇺"""
-拉脱维亚国旗 = '[emoji=D83C][emoji=DDF1][emoji=D83C][emoji=DDFB]'  # 拉脱维亚国旗
-"""🇱🇻"""
-利比亚国旗 = '[emoji=D83C][emoji=DDF1][emoji=D83C][emoji=DDFE]'  # 利比亚国旗
-"""🇱🇾"""
-摩洛哥国旗 = '[emoji=D83C][emoji=DDF2][emoji=D83C][emoji=DDE6]'  # 摩洛哥国旗
-"""🇲🇦"""
-摩纳哥国旗 = '[emoji=D83C][emoji=DDF2][emoji=D83C][emoji=DDE8]'  # 摩纳哥国旗
-"""🇲🇨"""
-摩尔多瓦国旗 = '[emoji=D83C][emoji=DDF2][emoji=D83C][emoji=DDE9]'  # 摩尔多瓦国旗
-"""🇲🇩"""
-黑山国旗 = '[emoji=D83C][emoji=DDF2][emoji=D83C][emoji=DDEA]'  # 黑山国旗
-"""🇲🇪"""
-圣马丁国旗 = '[emoji=D83C][emoji=DDF2][emoji=D83C][emoji=DDEB]'  # 圣马丁国旗
-"""🇲🇫"""
-马达加斯加国旗 = '[emoji=D83C][emoji=DDF2][emoji=D83C][emoji=DDEC]'  # 马达加斯加国旗
-"""🇲🇬"""
-马绍尔群岛国旗 = '[emoji=D83C][emoji=DDF2][emoji=D83C][emoji=DDED]'  # 马绍尔群岛国旗
-"""🇲🇭"""
-马其顿国旗 = '[emoji=D83C][emoji=DDF2][emoji=D83C][emoji=DDF0]'  # 马其顿国旗
-"""🇲🇰"""
-马里国旗 = '[emoji=D83C][emoji=DDF2][emoji=D83C][emoji=DDF1]'  # 马里国旗
-"""🇲🇱"""
-蒙古国旗 = '[emoji=D83C][emoji=DDF2][emoji=D83C][emoji=DDF3]'  # 蒙古国旗
-"""🇲🇳"""
-中国澳门特别行政区 = '[emoji=D83C][emoji=DDF2][emoji=D83C][emoji=DDF4]'  # 中国澳门特别行政区
-"""🇲🇴"""
-北马里亚纳群岛国旗 = '[emoji=D83C][emoji=DDF2][emoji=D83C][emoji=DDF5]'  # 北马里亚纳群岛国旗
-"""🇲🇵"""
-马提尼克国旗 = '[emoji=D83C][emoji=DDF2][emoji=D83C][emoji=DDF6]'  # 马提尼克国旗
-"""🇲🇶"""
-毛里塔尼亚国旗 = '[emoji=D83C][emoji=DDF2][emoji=D83C][emoji=DDF7]'  # 毛里塔尼亚国旗
-"""🇲🇷"""
-蒙特塞拉特国旗 = '[emoji=D83C][emoji=DDF2][emoji=D83C][emoji=DDF8]'  # 蒙特塞拉特国旗
-"""🇲🇸"""
-马耳他国旗 = '[emoji=D83C][emoji=DDF2][emoji=D83C][emoji=DDF9]'  # 马耳他国旗
-"""🇲🇹"""
-毛里求斯国旗 = '[emoji=D83C][emoji=DDF2][emoji=D83C][emoji=DDFA]'  # 毛里求斯国旗
-"""🇲🇺"""
-马尔代夫国旗 = '[emoji=D83C][emoji=DDF2][emoji=D83C][emoji=DDFB]'  # 马尔代夫国旗
-"""🇲🇻"""
-马拉维国旗 = '[emoji=D83C][emoji=DDF2][emoji=D83C][emoji=DDFC]'  # 马拉维国旗
-"""🇲🇼"""
-墨西哥国旗 = '[emoji=D83C][emoji=DDF2][emoji=D83C][emoji=DDFD]'  # 墨西哥国旗
-"""🇲🇽"""
-马来西亚国旗 = '[emoji=D83C][emoji=DDF2][emoji=D83C][emoji=DDFE]'  # 马来西亚国旗
-"""🇲🇾"""
-莫桑比克国旗 = '[emoji=D83C][emoji=DDF2][emoji=D83C][emoji=DDFF]'  # 莫桑比克国旗
-"""🇲🇿"""
-纳米比亚国旗 = '[emoji=D83C][emoji=DDF3][emoji=D83C][emoji=DDE6]'  # 纳米比亚国旗
-"""🇳🇦"""
-新喀里多尼亚国旗 = '[emoji=D83C][emoji=DDF3][emoji=D83C][emoji=DDE8]'  # 新喀里多尼亚国旗
-"""🇳🇨"""
-尼日尔国旗 = '[emoji=D83C][emoji=DDF3][emoji=D83C][emoji=DDEA]'  # 尼日尔国旗
-"""🇳🇪"""
-诺福克岛国旗 = '[emoji=D83C][emoji=DDF3][emoji=D83C][emoji=DDEB]'  # 诺福克岛国旗
-"""🇳🇫"""
-尼日利亚国旗 = '[emoji=D83C][emoji=DDF3][emoji=D83C][emoji=DDEC]'  # 尼日利亚国旗
-"""🇳🇬"""
-尼加拉瓜国旗 = '[emoji=D83C][emoji=DDF3][emoji=D83C][emoji=DDEE]'  # 尼加拉瓜国旗
-"""🇳🇮"""
-荷兰国旗 = '[emoji=D83C][emoji=DDF3][emoji=D83C][emoji=DDF1]'  # 荷兰国旗
-"""🇳🇱"""
-挪威国旗 = '[emoji=D83C][emoji=DDF3][emoji=D83C][emoji=DDF4]'  # 挪威国旗
-"""🇳🇴"""
-尼泊尔国旗 = '[emoji=D83C][emoji=DDF3][emoji=D83C][emoji=DDF5]'  # 尼泊尔国旗
-"""🇳🇵"""
-瑙鲁国旗 = '[emoji=D83C][emoji=DDF3][emoji=D83C][emoji=DDF7]'  # 瑙鲁国旗
-"""🇳🇷"""
-纽埃国旗 = '[emoji=D83C][emoji=DDF3][emoji=D83C][emoji=DDFA]'  # 纽埃国旗
-"""🇳🇺"""
-新西兰国旗 = '[emoji=D83C][emoji=DDF3][emoji=D83C][emoji=DDFF]'  # 新西兰国旗
-"""🇳🇿"""
-阿曼国旗 = '[emoji=D83C][emoji=DDF4][emoji=D83C][emoji=DDF2]'  # 阿曼国旗
-"""🇴🇲"""
-巴拿马国旗 = '[emoji=D83C][emoji=DDF5][emoji=D83C][emoji=DDE6]'  # 巴拿马国旗
-"""🇵🇦"""
-秘鲁国旗 = '[emoji=D83C][emoji=DDF5][emoji=D83C][emoji=DDEA]'  # 秘鲁国旗
-"""🇵🇪"""
-法属波利尼西亚国旗 = '[emoji=D83C][emoji=DDF5][emoji=D83C][emoji=DDEB]'  # 法属波利尼西亚国旗
-"""🇵🇫"""
-巴布亚新几内亚国旗 = '[emoji=D83C][emoji=DDF5][emoji=D83C][emoji=DDEC]'  # 巴布亚新几内亚国旗
-"""🇵🇬"""
-菲律宾国旗 = '[emoji=D83C][emoji=DDF5][emoji=D83C][emoji=DDED]'  # 菲律宾国旗
-"""🇵🇭"""
-巴基斯坦国旗 = '[emoji=D83C][emoji=DDF5][emoji=D83C][emoji=DDF0]'  # 巴基斯坦国旗
-"""🇵🇰"""
-波兰国旗 = '[emoji=D83C][emoji=DDF5][emoji=D83C][emoji=DDF1]'  # 波兰国旗
-"""🇵🇱"""
-圣皮埃尔和密克隆国旗 = '[emoji=D83C][emoji=DDF5][emoji=D83C][emoji=DDF2]'  # 圣皮埃尔和密克隆国旗
-"""🇵🇲"""
-皮特凯恩群岛国旗 = '[emoji=D83C][emoji=DDF5][emoji=D83C][emoji=DDF3]'  # 皮特凯恩群岛国旗
-"""🇵🇳"""
-波多黎各国旗 = '[emoji=D83C][emoji=DDF5][emoji=D83C][emoji=DDF7]'  # 波多黎各国旗
-"""🇵🇷"""
-巴勒斯坦领土国旗 = '[emoji=D83C][emoji=DDF5][emoji=D83C][emoji=DDF8]'  # 巴勒斯坦领土国旗
-"""🇵🇸"""
-葡萄牙国旗 = '[emoji=D83C][emoji=DDF5][emoji=D83C][emoji=DDF9]'  # 葡萄牙国旗
-"""🇵🇹"""
-帕劳国旗 = '[emoji=D83C][emoji=DDF5][emoji=D83C][emoji=DDFC]'  # 帕劳国旗
-"""🇵🇼"""
-巴拉圭国旗 = '[emoji=D83C][emoji=DDF5][emoji=D83C][emoji=DDFE]'  # 巴拉圭国旗
-"""🇵🇾"""
-卡塔尔国旗 = '[emoji=D83C][emoji=DDF6][emoji=D83C][emoji=DDE6]'  # 卡塔尔国旗
-"""🇶🇦"""
-留尼旺岛国旗 = '[emoji=D83C][emoji=DDF7][emoji=D83C][emoji=DDEA]'  # 留尼旺岛国旗
-"""🇷🇪"""
-罗马尼亚国旗 = '[emoji=D83C][emoji=DDF7][emoji=D83C][emoji=DDF4]'  # 罗马尼亚国旗
-"""🇷🇴"""
-塞尔维亚国旗 = '[emoji=D83C][emoji=DDF7][emoji=D83C][emoji=DDF8]'  # 塞尔维亚国旗
-"""🇷🇸"""
-俄罗斯国旗 = '[emoji=D83C][emoji=DDF7][emoji=D83C][emoji=DDFA]'  # 俄罗斯国旗
-"""🇷🇺"""
-卢旺达国旗 = '[emoji=D83C][emoji=DDF7][emoji=D83C][emoji=DDFC]'  # 卢旺达国旗
-"""🇷🇼"""
-沙特阿拉伯国旗 = '[emoji=D83C][emoji=DDF8][emoji=D83C][emoji=DDE6]'  # 沙特阿拉伯国旗
-"""🇸🇦"""
-所罗门群岛国旗 = '[emoji=D83C][emoji=DDF8][emoji=D83C][emoji=DDE7]'  # 所罗门群岛国旗
-"""🇸🇧"""
-塞舌尔国旗 = '[emoji=D83C][emoji=DDF8][emoji=D83C][emoji=DDE8]'  # 塞舌尔国旗
-"""🇸🇨"""
-苏丹国旗 = '[emoji=D83C][emoji=DDF8][emoji=D83C][emoji=DDE9]'  # 苏丹国旗
-"""🇸🇩"""
-瑞典国旗 = '[emoji=D83C][emoji=DDF8][emoji=D83C][emoji=DDEA]'  # 瑞典国旗
-"""🇸🇪"""
-新加坡国旗 = '[emoji=D83C][emoji=DDF8][emoji=D83C][emoji=DDEC]'  # 新加坡国旗
-"""🇸🇬"""
-圣赫勒拿国旗 = '[emoji=D83C][emoji=DDF8][emoji=D83C][emoji=DDED]'  # 圣赫勒拿国旗
-"""🇸🇭"""
-斯洛文尼亚国旗 = '[emoji=D83C][emoji=DDF8][emoji=D83C][emoji=DDEE]'  # 斯洛文尼亚国旗
-"""🇸🇮"""
-斯瓦尔巴和扬马延国旗 = '[emoji=D83C][emoji=DDF8][emoji=D83C][emoji=DDEF]'  # 斯瓦尔巴和扬马延国旗
-"""🇸🇯"""
-斯洛伐克国旗 = '[emoji=D83C][emoji=DDF8][emoji=D83C][emoji=DDF0]'  # 斯洛伐克国旗
-"""🇸🇰"""
-塞拉利昂国旗 = '[emoji=D83C][emoji=DDF8][emoji=D83C][emoji=DDF1]'  # 塞拉利昂国旗
-"""🇸🇱"""
-圣马力诺国旗 = '[emoji=D83C][emoji=DDF8][emoji=D83C][emoji=DDF2]'  # 圣马力诺国旗
-"""🇸🇲"""
-塞内加尔国旗 = '[emoji=D83C][emoji=DDF8][emoji=D83C][emoji=DDF3]'  # 塞内加尔国旗
-"""🇸🇳"""
-索马里国旗 = '[emoji=D83C][emoji=DDF8][emoji=D83C][emoji=DDF4]'  # 索马里国旗
-"""🇸🇴"""
-苏里南国旗 = '[emoji=D83C][emoji=DDF8][emoji=D83C][emoji=DDF7]'  # 苏里南国旗
-"""🇸🇷"""
-南苏丹国旗 = '[emoji=D83C][emoji=DDF8][emoji=D83C][emoji=DDF8]'  # 南苏丹国旗
-"""🇸🇸"""
-圣多美和普林西比国旗 = '[emoji=D83C][emoji=DDF8][emoji=D83C][emoji=DDF9]'  # 圣多美和普林西比国旗
-"""🇸🇹"""
-萨尔瓦多国旗 = '[emoji=D83C][emoji=DDF8][emoji=D83C][emoji=DDFB]'  # 萨尔瓦多国旗
-"""🇸🇻"""
-荷属圣马丁国旗 = '[emoji=D83C][emoji=DDF8][emoji=D83C][emoji=DDFD]'  # 荷属圣马丁国旗
-"""🇸🇽"""
-叙利亚国旗 = '[emoji=D83C][emoji=DDF8][emoji=D83C][emoji=DDFE]'  # 叙利亚国旗
-"""🇸🇾"""
-埃斯瓦蒂尼国旗 = '[emoji=D83C][emoji=DDF8][emoji=D83C][emoji=DDFF]'  # 埃斯瓦蒂尼国旗
-"""🇸🇿"""
-特里斯坦达库尼亚国旗 = '[emoji=D83C][emoji=DDF9][emoji=D83C][emoji=DDE6]'  # 特里斯坦达库尼亚国旗
-"""🇹🇦"""
-特克斯和凯科斯群岛国旗 = '[emoji=D83C][emoji=DDF9][emoji=D83C][emoji=DDE8]'  # 特克斯和凯科斯群岛国旗
-"""🇹🇨"""
-乍得国旗 = '[emoji=D83C][emoji=DDF9][emoji=D83C][emoji=DDE9]'  # 乍得国旗
-"""🇹🇩"""
-法国南部领土国旗 = '[emoji=D83C][emoji=DDF9][emoji=D83C][emoji=DDEB]'  # 法国南部领土国旗
-"""🇹🇫"""
-多哥国旗 = '[emoji=D83C][emoji=DDF9][emoji=D83C][emoji=DDEC]'  # 多哥国旗
-"""🇹🇬"""
-泰国国旗 = '[emoji=D83C][emoji=DDF9][emoji=D83C][emoji=DDED]'  # 泰国国旗
-"""🇹🇭"""
-塔吉克斯坦国旗 = '[emoji=D83C][emoji=DDF9][emoji=D83C][emoji=DDEF]'  # 塔吉克斯坦国旗
-"""🇹🇯"""
-托克劳国旗 = '[emoji=D83C][emoji=DDF9][emoji=D83C][emoji=DDF0]'  # 托克劳国旗
-"""🇹🇰"""
-东帝汶国旗 = '[emoji=D83C][emoji=DDF9][emoji=D83C][emoji=DDF1]'  # 东帝汶国旗
-"""🇹🇱"""
-土库曼斯坦国旗 = '[emoji=D83C][emoji=DDF9][emoji=D83C][emoji=DDF2]'  # 土库曼斯坦国旗
-"""🇹🇲"""
-突尼斯国旗 = '[emoji=D83C][emoji=DDF9][emoji=D83C][emoji=DDF3]'  # 突尼斯国旗
-"""🇹🇳"""
-汤加国旗 = '[emoji=D83C][emoji=DDF9][emoji=D83C][emoji=DDF4]'  # 汤加国旗
-"""🇹🇴"""
-土耳其国旗 = '[emoji=D83C][emoji=DDF9][emoji=D83C][emoji=DDF7]'  # 土耳其国旗
-"""🇹🇷"""
-特立尼达和多巴哥国旗 = '[emoji=D83C][emoji=DDF9][emoji=D83C][emoji=DDF9]'  # 特立尼达和多巴哥国旗
-"""🇹🇹"""
-图瓦卢国旗 = '[emoji=D83C][emoji=DDF9][emoji=D83C][emoji=DDFB]'  # 图瓦卢国旗
-"""🇹🇻"""
-台湾 = '[emoji=D83C][emoji=DDF9][emoji=D83C][emoji=DDFC]'  # 台湾
-"""🇹🇼"""
-坦桑尼亚国旗 = '[emoji=D83C][emoji=DDF9][emoji=D83C][emoji=DDFF]'  # 坦桑尼亚国旗
-"""🇹🇿"""
-乌克兰国旗 = '[emoji=D83C][emoji=DDFA][emoji=D83C][emoji=DDE6]'  # 乌克兰国旗
-"""🇺🇦"""
-乌干达国旗 = '[emoji=D83C][emoji=DDFA][emoji=D83C][emoji=DDEC]'  # 乌干达国旗
-"""🇺🇬"""
-美国边远岛屿国旗 = '[emoji=D83C][emoji=DDFA][emoji=D83C][emoji=DDF2]'  # 美国边远岛屿国旗
-"""🇺🇲"""
-联合国国旗 = '[emoji=D83C][emoji=DDFA][emoji=D83C][emoji=DDF3]'  # 联合国国旗
-"""🇺🇳"""
-美国国旗 = '[emoji=D83C][emoji=DDFA][emoji=D83C][emoji=DDF8]'  # 美国国旗
-"""🇺🇸"""
-乌拉圭国旗 = '[emoji=D83C][emoji=DDFA][emoji=D83C][emoji=DDFE]'  # 乌拉圭国旗
-"""🇺🇾"""
-乌兹别克斯坦国旗 = '[emoji=D83C][emoji=DDFA][emoji=D83C][emoji=DDFF]'  # 乌兹别克斯坦国旗
-"""🇺🇿"""
-梵蒂冈城国旗 = '[emoji=D83C][emoji=DDFB][emoji=D83C][emoji=DDE6]'  # 梵蒂冈城国旗
-"""🇻🇦"""
-圣文森特格林纳丁斯国旗 = '[emoji=D83C][emoji=DDFB][emoji=D83C][emoji=DDE8]'  # 圣文森特格林纳丁斯国旗
-"""🇻🇨"""
-委内瑞拉国旗 = '[emoji=D83C][emoji=DDFB][emoji=D83C][emoji=DDEA]'  # 委内瑞拉国旗
-"""🇻🇪"""
-英属维尔京群岛国旗 = '[emoji=D83C][emoji=DDFB][emoji=D83C][emoji=DDEC]'  # 英属维尔京群岛国旗
-"""🇻🇬"""
-美属维尔京群岛国旗 = '[emoji=D83C][emoji=DDFB][emoji=D83C][emoji=DDEE]'  # 美属维尔京群岛国旗
-"""🇻🇮"""
-越南国旗 = '[emoji=D83C][emoji=DDFB][emoji=D83C][emoji=DDF3]'  # 越南国旗
-"""🇻🇳"""
-瓦努阿图国旗 = '[emoji=D83C][emoji=DDFB][emoji=D83C][emoji=DDFA]'  # 瓦努阿图国旗
-"""🇻🇺"""
-瓦利斯和富图纳国旗 = '[emoji=D83C][emoji=DDFC][emoji=D83C][emoji=DDEB]'  # 瓦利斯和富图纳国旗
-"""🇼🇫"""
-萨摩亚国旗 = '[emoji=D83C][emoji=DDFC][emoji=D83C][emoji=DDF8]'  # 萨摩亚国旗
-"""🇼🇸"""
-科索沃国旗 = '[emoji=D83C][emoji=DDFD][emoji=D83C][emoji=DDF0]'  # 科索沃国旗
-"""🇽🇰"""
-也门国旗 = '[emoji=D83C][emoji=DDFE][emoji=D83C][emoji=DDEA]'  # 也门国旗
-"""🇾🇪"""
-马约特国旗 = '[emoji=D83C][emoji=DDFE][emoji=D83C][emoji=DDF9]'  # 马约特国旗
-"""🇾🇹"""
-南非国旗 = '[emoji=D83C][emoji=DDFF][emoji=D83C][emoji=DDE6]'  # 南非国旗
-"""🇿🇦"""
-赞比亚国旗 = '[emoji=D83C][emoji=DDFF][emoji=D83C][emoji=DDF2]'  # 赞比亚国旗
-"""🇿🇲"""
-津巴布韦国旗 = '[emoji=D83C][emoji=DDFF][emoji=D83C][emoji=DDFC]'  # 津巴布韦国旗
-"""🇿🇼"""
-英国国旗 = '[emoji=D83C][emoji=DFF4][emoji=DB40][emoji=DC67][emoji=DB40][emoji=DC62][emoji=DB40][emoji=DC65][emoji=DB40][emoji=DC6E][emoji=DB40][emoji=DC67][emoji=DB40][emoji=DC7F]'  # 英国国旗
-"""🏴󠁧󠁢󠁥󠁮󠁧󠁿"""
-苏格兰国旗 = '[emoji=D83C][emoji=DFF4][emoji=DB40][emoji=DC67][emoji=DB40][emoji=DC62][emoji=DB40][emoji=DC73][emoji=DB40][emoji=DC63][emoji=DB40][emoji=DC74][emoji=DB40][emoji=DC7F]'  # 苏格兰国旗
-"""🏴󠁧󠁢󠁳󠁣󠁴󠁿"""
-威尔士国旗 = '[emoji=D83C][emoji=DFF4][emoji=DB40][emoji=DC67][emoji=DB40][emoji=DC62][emoji=DB40][emoji=DC77][emoji=DB40][emoji=DC6C][emoji=DB40][emoji=DC73][emoji=DB40][emoji=DC7F]'  # 威尔士国旗
-"""🏴󠁧󠁢󠁷󠁬󠁳󠁿"""
+# 表情表, 每行为 常量名 与 取值, 以制表符分隔; 微信表情的取值为文本代码, Emoji 的取值为 Unicode 字符
+TABLE = '''
+表情_微笑	[微笑]
+表情_撇嘴	[撇嘴]
+表情_色	[色]
+表情_发呆	[发呆]
+表情_得意	[得意]
+表情_流泪	[流泪]
+表情_闭嘴	[闭嘴]
+表情_害羞	[害羞]
+表情_睡	[睡]
+表情_大哭	[大哭]
+表情_尴尬	[尴尬]
+表情_发怒	[发怒]
+表情_调皮	[调皮]
+表情_呲牙	[呲牙]
+表情_惊讶	[惊讶]
+表情_难过	[难过]
+表情_囧	[囧]
+表情_抓狂	[抓狂]
+表情_吐	[吐]
+表情_偷笑	[偷笑]
+表情_愉快	[愉快]
+表情_白眼	[白眼]
+表情_傲慢	[傲慢]
+表情_困	[困]
+表情_惊恐	[惊恐]
+表情_流汗	[流汗]
+表情_憨笑	[憨笑]
+表情_悠闲	[悠闲]
+表情_奋斗	[奋斗]
+表情_咒骂	[咒骂]
+表情_疑问	[疑问]
+表情_嘘	[嘘]
+表情_晕	[晕]
+表情_衰	[衰]
+表情_骷髅	[骷髅]
+表情_敲打	[敲打]
+表情_再见	[再见]
+表情_擦汗	[擦汗]
+表情_抠鼻	[抠鼻]
+表情_鼓掌	[鼓掌]
+表情_坏笑	[坏笑]
+表情_左哼哼	[左哼哼]
+表情_右哼哼	[右哼哼]
+表情_哈欠	[哈欠]
+表情_鄙视	[鄙视]
+表情_委屈	[委屈]
+表情_快哭了	[快哭了]
+表情_阴险	[阴险]
+表情_亲亲	[亲亲]
+表情_可怜	[可怜]
+表情_菜刀	[菜刀]
+表情_西瓜	[西瓜]
+表情_啤酒	[啤酒]
+表情_咖啡	[咖啡]
+表情_猪头	[猪头]
+表情_玫瑰	[玫瑰]
+表情_凋谢	[凋谢]
+表情_嘴唇	[嘴唇]
+表情_爱心	[爱心]
+表情_心碎	[心碎]
+表情_蛋糕	[蛋糕]
+表情_炸弹	[炸弹]
+表情_便便	[便便]
+表情_月亮	[月亮]
+表情_太阳	[太阳]
+表情_拥抱	[拥抱]
+表情_强	[强]
+表情_弱	[弱]
+表情_握手	[握手]
+表情_胜利	[胜利]
+表情_抱拳	[抱拳]
+表情_勾引	[勾引]
+表情_拳头	[拳头]
+表情_ok	[OK]
+表情_跳跳	[跳跳]
+表情_发抖	[发抖]
+表情_怄火	[怄火]
+表情_转圈	[转圈]
+表情_哈嘿	[哈嘿]
+表情_捂脸	[捂脸]
+表情_奸笑	[奸笑]
+表情_机智	[机智]
+表情_皱眉	[皱眉]
+表情_耶	[耶]
+表情_红包	[红包]
+表情_發	[發]
+表情_福	[福]
+咧嘴笑	😀
+大眼睛咧嘴笑脸	😃
+咧嘴笑脸	😄
+笑容可掬的脸	😁
+咧嘴眯眼的脸	😆
+满脸汗水的笑容	😅
+在地板上滚来滚去大笑	🤣
+喜极而泣	😂
+略带微笑的脸	🙂
+倒立的脸	🙃
+眨眼脸	😉
+笑脸与微笑的眼睛	😊
+带光环的笑脸	😇
+满心笑容	🥰
+带着心眼的笑脸	😍
+星击	🤩
+吹着吻的脸	😘
+吻脸	😗
+笑脸	☺
+闭着眼睛亲吻脸	😚
+用微笑的眼睛亲吻脸	😙
+脸上的美味食物	😋
+有舌头的脸	😛
+舌头眨眼脸	😜
+滑稽面孔	🤪
+用舌头眯着脸	😝
+钱嘴脸	🤑
+拥抱面容	🤗
+手捂嘴的脸	🤭
+洗脸	🤫
+思考的脸	🤔
+拉链口面	🤐
+扬起眉毛的脸	🤨
+中性面	😐
+无表情的脸	😑
+没有嘴的脸	😶
+傻笑脸	😏
+没用的脸	😒
+眼睛滚动的脸	🙄
+歪扭	😬
+说谎脸	🤥
+卸脸	😌
+忧郁的面容	😔
+瞌睡脸	😪
+流口水的脸	🤤
+睡脸	😴
+带口罩的脸	😷
+带温度计的脸	🤒
+戴头巾的脸	🤕
+恶心脸	🤢
+面吐	🤮
+打喷嚏脸	🤧
+热面	🥵
+冷面	🥶
+哇哇的脸	🥴
+头晕脸	😵
+爆炸头	🤯
+牛仔帽面	🤠
+派对脸	🥳
+带太阳镜的笑脸	😎
+书呆子脸	🤓
+戴单片眼镜的脸	🧐
+困惑的脸	😕
+忧愁面容	😟
+微皱的脸	🙁
+皱眉	☹
+张开嘴的脸	😮
+哑巴脸	😯
+惊愕的脸	😲
+脸红	😳
+恳求面容	🥺
+张嘴皱眉头	😦
+痛苦的面容	😧
+可怕的面容	😨
+焦头烂额	😰
+悲伤但如释重负的脸	😥
+哭脸	😢
+大声哭泣的脸	😭
+恐惧中尖叫的脸	😱
+脸色茫然	😖
+坚持不懈的脸	😣
+失望的脸	😞
+汗流满面	😓
+疲乏的脸	😩
+疲惫的面容	😫
+打呵欠的脸	🥱
+鼻子冒出蒸汽的脸	😤
+撅嘴脸	😡
+生气的脸	😠
+口上有符号的脸	🤬
+有角的笑脸	😈
+有角的愤怒的脸	👿
+颅骨	💀
+头骨和交叉骨	☠
+一堆屎	💩
+小丑脸	🤡
+食人魔	👹
+妖精	👺
+鬼	👻
+外星人	👽
+外来怪物	👾
+机器人	🤖
+咧嘴笑的猫	😺
+笑眯眯的猫	😸
+喜极而泣的猫	😹
+心眼含笑的猫	😻
+苦笑的猫	😼
+接吻猫	😽
+疲倦的猫	🙀
+哭泣的猫	😿
+撅嘴猫	😾
+看不到邪恶的猴子	🙈
+听不到邪恶的猴子	🙉
+不要说邪恶的猴子	🙊
+吻痕	💋
+情书	💌
+带箭头的心	💘
+带丝带的心	💝
+闪闪发光的心	💖
+成长的心	💗
+跳动的心脏	💓
+旋转心脏	💞
+两颗心	💕
+心脏装饰	💟
+心形感叹号	❣
+破碎的心	💔
+红心	❤
+橙心	🧡
+黄心	💛
+青心树	💚
+蓝心	💙
+紫心	💜
+黑心	🖤
+白心	🤍
+褐色心脏	🤎
+百分	💯
+愤怒符号	💢
+碰撞	💥
+头晕	💫
+汗液滴	💦
+飞奔而去	💨
+孔	🕳
+炸弹	💣
+语音气球	💬
+言语中的眼睛	👁️‍🗨️
+左语音气泡	🗨
+右愤怒气泡	🗯
+思维气球	💭
+ZZZ	💤
+挥手	👋
+抬起手背	🤚
+手指张开的手	🖐
+抬高手	✋
+火神礼炮	🖖
+好手	👌
+捏手	🤏
+胜利之手	✌
+交叉手指	🤞
+爱你的手势	🤟
+喇叭的标志	🤘
+叫我手	🤙
+反向索引指向左	👈
+反手指数指向右	👉
+反手指数指向上	👆
+中指	🖕
+反手指数向下	👇
+索引指向上	☝
+竖起大拇指	👍
+拇指向下	👎
+凸起拳	✊
+迎面拳头	👊
+左拳	🤛
+右拳	🤜
+拍手	👏
+举手	🙌
+张开双手	👐
+手掌向上	🤲
+握手	🤝
+折叠手	🙏
+书写手	✍
+指甲油	💅
+自拍	🤳
+屈曲二头肌	💪
+机械臂	🦾
+机械腿	🦿
+腿	🦵
+脚	🦶
+耳朵	👂
+带助听器的耳	🦻
+鼻子	👃
+脑	🧠
+牙齿	🦷
+骨	🦴
+很多眼睛	👀
+眼睛	👁
+舌头	👅
+口	👄
+宝贝	👶
+小孩	🧒
+男孩	👦
+女孩	👧
+人	🧑
+男人	👨
+胡子	🧔
+女人	👩
+老年人	🧓
+老人	👴
+老妇人	👵
+皱眉头	🙍
+男人皱眉	🙍‍♂️
+女人皱眉	🙍‍♀️
+人撅嘴	🙎
+男人撅嘴	🙎‍♂️
+女人撅嘴	🙎‍♀️
+打手势的人不	🙅
+男人示意不	🙅‍♂️
+女人示意不	🙅‍♀️
+手势正常的人	🙆
+男人示意好了	🙆‍♂️
+女人做手势好吗	🙆‍♀️
+倾卸手	💁
+人倾翻手	💁‍♂️
+女人倾翻的手	💁‍♀️
+举起手的人	🙋
+举起手来	🙋‍♂️
+女人举起手来	🙋‍♀️
+聋人	🧏
+聋男人	🧏‍♂️
+聋女	🧏‍♀️
+鞠躬	🙇
+男人鞠躬	🙇‍♂️
+女子鞠躬	🙇‍♀️
+面部护理	🤦
+人脸识别	🤦‍♂️
+女性面部按摩	🤦‍♀️
+人耸肩	🤷
+男人耸肩	🤷‍♂️
+女耸肩	🤷‍♀️
+男子卫生工作者	👨‍⚕️
+女保健员	👩‍⚕️
+男学生	👨‍🎓
+女学生	👩‍🎓
+男教师	👨‍🏫
+女教师	👩‍🏫
+男子裁判员	👨‍⚖️
+女法官	👩‍⚖️
+男子农民	👨‍🌾
+女农民	👩‍🌾
+男子厨师	👨‍🍳
+女厨师	👩‍🍳
+男子机械师	👨‍🔧
+女机修工	👩‍🔧
+工厂工人	👨‍🏭
+女工厂工人	👩‍🏭
+办公室文员	👨‍💼
+女上班族	👩‍💼
+人类科学家	👨‍🔬
+女科学家	👩‍🔬
+人工技术专家	👨‍💻
+女技师	👩‍💻
+男歌手	👨‍🎤
+女歌手	👩‍🎤
+男性艺术家	👨‍🎨
+女艺术家	👩‍🎨
+男飞行员	👨‍✈️
+女飞行员	👩‍✈️
+人航天员	👨‍🚀
+女宇航员	👩‍🚀
+男子消防队员	👨‍🚒
+女消防员	👩‍🚒
+警官	👮
+男警官	👮‍♂️
+女警官	👮‍♀️
+侦探	🕵
+男侦探	🕵️‍♂️
+女侦探	🕵️‍♀️
+警卫	💂
+男子守卫	💂‍♂️
+女警卫	💂‍♀️
+建筑工人	👷
+施工员	👷‍♂️
+女建筑工人	👷‍♀️
+王子	🤴
+公主	👸
+戴头巾的人	👳
+戴头巾的男人	👳‍♂️
+女人戴着头巾	👳‍♀️
+戴中国帽子的男人	👲
+头巾的女人	🧕
+礼服男	🤵
+戴面纱的新娘	👰
+孕妇	🤰
+母乳喂养	🤱
+宝贝天使	👼
+圣诞老人	🎅
+克劳斯夫人	🤶
+超级英雄	🦸
+超人英雄	🦸‍♂️
+女超级英雄	🦸‍♀️
+超级恶棍	🦹
+人类超级恶棍	🦹‍♂️
+女超人	🦹‍♀️
+魔术师	🧙
+男子法师	🧙‍♂️
+女法师	🧙‍♀️
+仙女	🧚
+男人仙女	🧚‍♂️
+女仙女	🧚‍♀️
+吸血鬼	🧛
+人吸血鬼	🧛‍♂️
+女吸血鬼	🧛‍♀️
+merperson	🧜
+人鱼	🧜‍♂️
+美人鱼	🧜‍♀️
+精灵	🧝
+人精灵	🧝‍♂️
+女妖	🧝‍♀️
+妖怪	🧞
+人妖怪	🧞‍♂️
+女妖怪	🧞‍♀️
+僵尸	🧟
+男人僵尸	🧟‍♂️
+女人僵尸	🧟‍♀️
+按摩的人	💆
+男人在按摩	💆‍♂️
+按摩的女人	💆‍♀️
+理发师	💇
+男人理发	💇‍♂️
+理发的女人	💇‍♀️
+走路的人	🚶
+男人走路	🚶‍♂️
+女人走路	🚶‍♀️
+站人	🧍
+男子站立	🧍‍♂️
+站着的女人	🧍‍♀️
+跪人	🧎
+跪跪	🧎‍♂️
+跪着的女人	🧎‍♀️
+有探测杖的人	👨‍🦯
+有探测杖的女人	👩‍🦯
+坐机动轮椅的人	👨‍🦼
+坐机动轮椅的女人	👩‍🦼
+坐手动轮椅的人	👨‍🦽
+坐手动轮椅的女人	👩‍🦽
+人跑	🏃
+男子跑步	🏃‍♂️
+女子跑步	🏃‍♀️
+女子舞蹈	💃
+男人跳舞	🕺
+穿西装的人在空中飘浮	🕴
+有兔子耳朵的人	👯
+有兔子耳朵的男人	👯‍♂️
+有兔子耳朵的女人	👯‍♀️
+在潮湿的房间里的人	🧖
+在潮湿的房间里的男人	🧖‍♂️
+蒸汽房的女人	🧖‍♀️
+攀登者	🧗
+爬人	🧗‍♂️
+女子攀岩	🧗‍♀️
+击剑运动员	🤺
+赛马	🏇
+滑雪者	⛷
+滑雪板	🏂
+个人打高尔夫球	🏌
+男子高尔夫球	🏌️‍♂️
+女子高尔夫球	🏌️‍♀️
+人冲浪	🏄
+男子冲浪	🏄‍♂️
+女人冲浪	🏄‍♀️
+划船人	🚣
+人划艇	🚣‍♂️
+女子划艇	🚣‍♀️
+人游泳	🏊
+男子游泳	🏊‍♂️
+女子游泳	🏊‍♀️
+弹跳球的人	⛹
+男子跳球	⛹️‍♂️
+女子跳球	⛹️‍♀️
+举重人员	🏋
+人力举重	🏋️‍♂️
+女子举重	🏋️‍♀️
+骑自行车的人	🚴
+骑自行车的男人	🚴‍♂️
+女子自行车	🚴‍♀️
+山地自行车	🚵
+曼山自行车	🚵‍♂️
+女子山地自行车	🚵‍♀️
+人推车	🤸
+手推车	🤸‍♂️
+妇女手推车	🤸‍♀️
+人们摔跤	🤼
+男子摔跤	🤼‍♂️
+女子摔跤	🤼‍♀️
+水球运动员	🤽
+男子水球	🤽‍♂️
+玩水球的女人	🤽‍♀️
+打手球的人	🤾
+男子玩手球	🤾‍♂️
+打手球的女人	🤾‍♀️
+人物杂耍	🤹
+男人杂耍	🤹‍♂️
+女人杂耍	🤹‍♀️
+莲花位	🧘
+莲花位男子	🧘‍♂️
+莲花位女子	🧘‍♀️
+洗澡的人	🛀
+躺在床上的人	🛌
+女人牵着手	👭
+女人和男人牵着手	👫
+手牵着手的男人	👬
+吻	💏
+有爱心的情侣	💑
+家庭	👪
+说话的头	🗣
+半身像	👤
+多个半身像	👥
+足迹	👣
+红发	🦰
+卷发	🦱
+白发	🦳
+秃顶	🦲
+猴脸	🐵
+猴子	🐒
+大猩猩	🦍
+狗脸	🐶
+狗	🐕
+导盲犬	🦮
+服务犬	🐕‍🦺
+贵宾犬	🐩
+狼	🐺
+狐狸	🦊
+浣熊	🦝
+猫脸	🐱
+猫	🐈
+狮子	🦁
+虎面	🐯
+老虎	🐅
+豹	🐆
+马面	🐴
+马	🐎
+独角兽	🦄
+斑马	🦓
+鹿	🦌
+牛脸	🐮
+公牛	🐂
+水牛	🐃
+奶牛	🐄
+猪脸	🐷
+猪	🐖
+野猪	🐗
+猪鼻	🐽
+猛撞	🐏
+母羊	🐑
+山羊	🐐
+骆驼	🐪
+双驼峰骆驼	🐫
+美洲驼	🦙
+长颈鹿	🦒
+大象	🐘
+犀牛	🦏
+河马	🦛
+鼠标面	🐭
+鼠标	🐁
+老鼠	🐀
+仓鼠	🐹
+兔脸	🐰
+兔子	🐇
+花栗鼠	🐿
+刺猬	🦔
+蝙蝠	🦇
+熊	🐻
+考拉	🐨
+熊猫	🐼
+树獭	🦥
+水獭	🦦
+猩猩	🦧
+臭鼬	🦨
+袋鼠	🦘
+獾	🦡
+爪印	🐾
+火鸡	🦃
+鸡	🐔
+公鸡	🐓
+孵蛋雏鸡	🐣
+小鸡	🐤
+正面小雏鸡	🐥
+鸟	🐦
+企鹅	🐧
+鸽子	🕊
+鹰	🦅
+鸭子	🦆
+天鹅	🦢
+猫头鹰	🦉
+火烈鸟	🦩
+孔雀	🦚
+鹦鹉	🦜
+青蛙	🐸
+鳄鱼	🐊
+乌龟	🐢
+蜥蜴	🦎
+蛇	🐍
+龙脸	🐲
+龙	🐉
+蜥脚类	🦕
+喷鲸	🐳
+鲸鱼	🐋
+海豚	🐬
+鱼	🐟
+热带鱼	🐠
+河豚	🐡
+鲨鱼	🦈
+章鱼	🐙
+螺旋壳	🐚
+蜗牛	🐌
+蝴蝶	🦋
+缺陷	🐛
+蚂蚁	🐜
+蜜蜂	🐝
+瓢虫	🐞
+板球	🦗
+蜘蛛	🕷
+蜘蛛网	🕸
+蝎子	🦂
+蚊子	🦟
+微生物	🦠
+花束	💐
+樱花	🌸
+白花	💮
+玫瑰花结	🏵
+玫瑰	🌹
+枯萎花	🥀
+木槿	🌺
+向日葵	🌻
+开花	🌼
+郁金香	🌷
+秧苗	🌱
+常绿乔木	🌲
+落叶树	🌳
+棕榈树	🌴
+仙人掌	🌵
+水稻捆	🌾
+草本植物	🌿
+三叶草	☘
+四叶草	🍀
+枫叶	🍁
+落叶	🍂
+树叶在风中飘动	🍃
+葡萄	🍇
+甜瓜	🍈
+西瓜	🍉
+Tangerine夜店	🍊
+柠檬	🍋
+香蕉	🍌
+菠萝	🍍
+芒果	🥭
+红苹果	🍎
+青苹果	🍏
+梨	🍐
+桃	🍑
+樱桃	🍒
+草莓	🍓
+猕猴桃	🥝
+番茄	🍅
+椰子	🥥
+鳄梨	🥑
+茄子	🍆
+马铃薯	🥔
+胡萝卜	🥕
+玉米穗	🌽
+辣椒	🌶
+黄瓜	🥒
+叶绿	🥬
+西兰花	🥦
+大蒜	🧄
+洋葱	🧅
+蘑菇	🍄
+花生	🥜
+板栗	🌰
+面包	🍞
+羊角面包	🥐
+面包面包	🥖
+椒盐脆饼	🥨
+百吉饼	🥯
+烙饼	🥞
+华夫饼干	🧇
+奶酪楔	🧀
+骨上肉	🍖
+鸡腿	🍗
+肉切肉	🥩
+熏肉	🥓
+汉堡包	🍔
+炸薯条	🍟
+披萨	🍕
+热狗	🌭
+三明治	🥪
+墨西哥玉米薄饼卷	🌮
+墨西哥煎饼	🌯
+夹心面包	🥙
+法拉菲尔	🧆
+鸡蛋	🥚
+烹饪	🍳
+浅盘食物	🥘
+一罐食物	🍲
+汤匙碗	🥣
+绿色沙拉	🥗
+爆米花	🍿
+黄油	🧈
+盐	🧂
+罐头食品	🥫
+便当盒	🍱
+碾米机	🍘
+米球	🍙
+米饭	🍚
+咖喱饭	🍛
+蒸碗	🍜
+意大利面条	🍝
+烤红薯	🍠
+奥登	🍢
+寿司	🍣
+炸虾仁	🍤
+漩涡鱼糕	🍥
+月饼	🥮
+丹戈	🍡
+饺子	🥟
+幸运饼干	🥠
+取出盒	🥡
+蟹	🦀
+龙虾	🦞
+虾	🦐
+鱿鱼	🦑
+牡蛎	🦪
+软冰淇淋	🍦
+刨冰	🍧
+冰淇淋	🍨
+油炸圈饼	🍩
+曲奇饼干	🍪
+生日蛋糕	🎂
+酥饼	🍰
+纸杯蛋糕	🧁
+馅饼	🥧
+巧克力棒	🍫
+糖果	🍬
+棒棒糖	🍭
+奶油冻	🍮
+蜜罐	🍯
+奶瓶	🍼
+一杯牛奶	🥛
+热饮	☕
+无柄茶杯	🍵
+目的	🍶
+带弹出软木塞的瓶子	🍾
+酒杯	🍷
+鸡尾酒杯	🍸
+热带饮料	🍹
+啤酒杯	🍺
+叮当作响的啤酒杯	🍻
+碰杯	🥂
+平底杯	🥃
+吸管杯	🥤
+饮料盒	🧃
+伙伴	🧉
+冰块	🧊
+筷子	🥢
+带盘叉刀	🍽
+刀叉	🍴
+勺子	🥄
+厨刀	🔪
+菊花	🏺
+环球展示美洲	🌎
+经络地球仪	🌐
+世界地图	🗺
+日本地图	🗾
+罗盘	🧭
+雪山	🏔
+山	⛰
+火山	🌋
+富士山	🗻
+露营	🏕
+带伞的海滩	🏖
+沙漠	🏜
+荒岛	🏝
+国家公园	🏞
+体育场	🏟
+古典建筑	🏛
+建筑施工	🏗
+砖	🧱
+房屋	🏘
+废弃房屋	🏚
+房子	🏠
+带花园的房子	🏡
+办公楼	🏢
+日本邮局	🏣
+邮局	🏤
+医院	🏥
+银行	🏦
+酒店	🏨
+爱酒店	🏩
+便利店	🏪
+学校	🏫
+百货公司	🏬
+工厂	🏭
+日本城堡	🏯
+城堡	🏰
+婚礼	💒
+东京塔	🗼
+自由女神像	🗽
+教堂	⛪
+清真寺	🕌
+印度教寺庙	🛕
+犹太会堂	🕍
+神社	⛩
+卡巴	🕋
+喷泉	⛲
+帐篷	⛺
+多雾的	🌁
+星星之夜	🌃
+城市风貌	🏙
+山上日出	🌄
+日出	🌅
+黄昏时的城市景色	🌆
+日落	🌇
+夜桥	🌉
+温泉	♨
+银河系	🌌
+旋转木马	🎠
+费里斯轮	🎡
+过山车	🎢
+理发竿	💈
+马戏团帐篷	🎪
+机车	🚂
+铁道车辆	🚃
+高速列车	🚄
+子弹头列车	🚅
+火车	🚆
+地铁	🚇
+轻轨	🚈
+站	🚉
+电车	🚊
+单轨铁路	🚝
+山区铁路	🚞
+电车车	🚋
+公共汽车	🚌
+迎面驶来的公共汽车	🚍
+无轨电车	🚎
+微型客车	🚐
+救护车	🚑
+消防车	🚒
+警车	🚓
+迎面而来的警车	🚔
+出租车	🚕
+迎面来的出租车	🚖
+汽车	🚗
+迎面而来的汽车	🚘
+运动型多用途车	🚙
+送货车	🚚
+铰接式货车	🚛
+拖拉机	🚜
+赛车	🏎
+摩托车	🏍
+电动滑板车	🛵
+手动轮椅	🦽
+机动轮椅	🦼
+自动人力车	🛺
+自行车	🚲
+踢踏板车	🛴
+滑板	🛹
+公交站	🚏
+高速公路	🛣
+铁路轨道	🛤
+油桶	🛢
+燃油泵	⛽
+警车灯	🚨
+水平交通灯	🚥
+垂直交通灯	🚦
+停车标志	🛑
+建设	🚧
+锚	⚓
+帆船	⛵
+独木舟	🛶
+快艇	🚤
+客船	🛳
+渡船	⛴
+摩托艇	🛥
+船	🚢
+飞机	✈
+小型飞机	🛩
+飞机起飞	🛫
+飞机抵达	🛬
+降落伞	🪂
+座位	💺
+直升机	🚁
+悬空铁路	🚟
+山地索道	🚠
+架空索道	🚡
+卫星	🛰
+火箭	🚀
+飞碟	🛸
+贝尔钟	🛎
+行李	🧳
+沙漏完成	⌛
+沙漏未完成	⏳
+看	⌚
+闹钟	⏰
+秒表	⏱
+定时器时钟	⏲
+壁炉架时钟	🕰
+十二点	🕛
+十二点三十	🕧
+一点	🕐
+一点三十	🕜
+二点	🕑
+二点三十	🕝
+三点	🕒
+三点三十	🕞
+四点	🕓
+四点三十	🕟
+五点	🕔
+五点三十	🕠
+六点	🕕
+六点三十	🕡
+七点	🕖
+七点三十	🕢
+八点	🕗
+八点三十	🕣
+九点	🕘
+九点三十	🕤
+十点	🕙
+十点三十	🕥
+十一点	🕚
+十一点三十	🕦
+新月	🌑
+娥眉月	🌒
+第一季月球	🌓
+上蜡的凸月	🌔
+满月	🌕
+月亮渐渐消失	🌖
+最后四分之一的月亮	🌗
+月牙渐渐消失	🌘
+新的月	🌙
+新月面	🌚
+第一季月面	🌛
+最后四分之一的月面	🌜
+温度计	🌡
+太阳	☀
+满月脸	🌝
+有脸的太阳	🌞
+环状行星	🪐
+明星	⭐
+发光星	🌟
+流星	🌠
+云	☁
+云后太阳	⛅
+闪电雨云	⛈
+小云后的太阳	🌤
+大云后的太阳	🌥
+雨云背后的太阳	🌦
+雨云	🌧
+雪与云	🌨
+闪电云	🌩
+龙卷风	🌪
+雾	🌫
+风面	🌬
+旋风	🌀
+彩虹	🌈
+闭伞	🌂
+雨伞	☂
+雨滴伞	☔
+地上的雨伞	⛱
+高电压	⚡
+雪花	❄
+雪人	☃
+没有雪的雪人	⛄
+彗星	☄
+火	🔥
+液滴	💧
+水波	🌊
+南瓜灯	🎃
+圣诞树	🎄
+烟花	🎆
+火花机	🎇
+爆竹	🧨
+火花	✨
+气球	🎈
+波普派对	🎉
+纸屑球	🎊
+七夕树	🎋
+松木装饰	🎍
+日本娃娃	🎎
+鲤鱼流光	🎏
+风铃	🎐
+赏月仪式	🎑
+红包	🧧
+丝带	🎀
+包装礼物	🎁
+提醒带	🎗
+入场券	🎟
+票	🎫
+军事奖章	🎖
+奖杯	🏆
+运动奖章	🏅
+第一位奖章	🥇
+第二位奖章	🥈
+第三位奖章	🥉
+足球	⚽
+棒球运动	⚾
+垒球	🥎
+篮球	🏀
+排球	🏐
+美式足球	🏈
+橄榄球	🏉
+网球	🎾
+飞盘	🥏
+保龄球运动	🎳
+板球比赛	🏏
+曲棍球	🏑
+冰上曲棍球	🏒
+长曲棍球	🥍
+乒乓球	🏓
+羽毛球	🏸
+拳击手套	🥊
+武术制服	🥋
+球门网	🥅
+孔旗	⛳
+溜冰鞋	⛸
+钓鱼竿	🎣
+潜水面罩	🤿
+跑步衫	🎽
+雪板	🎿
+雪橇	🛷
+冰壶石	🥌
+直接命中	🎯
+溜溜球	🪀
+风筝	🪁
+台球8号	🎱
+水晶球	🔮
+纳扎尔护身符	🧿
+视频游戏	🎮
+操纵杆	🕹
+老虎机	🎰
+游戏骰子	🎲
+拼图片	🧩
+泰迪熊	🧸
+锹服	♠
+心服	♥
+钻石套装	♦
+俱乐部套装	♣
+棋子	♟
+小丑	🃏
+麻将红龙	🀄
+花牌	🎴
+表演艺术	🎭
+框架图片	🖼
+艺术家调色板	🎨
+线	🧵
+纱线	🧶
+玻璃杯	👓
+太阳镜	🕶
+护目镜	🥽
+实验衣	🥼
+安全背心	🦺
+领带	👔
+T恤衫	👕
+牛仔裤	👖
+围巾	🧣
+手套	🧤
+外套	🧥
+袜子	🧦
+连衣裙	👗
+和服	👘
+纱丽	🥻
+连体式泳衣	🩱
+概要	🩲
+短裤	🩳
+比基尼	👙
+女人的衣服	👚
+钱包	👛
+手提包	👜
+离合器袋	👝
+购物袋	🛍
+背包	🎒
+男鞋	👞
+跑鞋	👟
+徒步旅行靴	🥾
+扁形鞋	🥿
+高跟鞋	👠
+女式凉鞋	👡
+芭蕾舞鞋	🩰
+女靴	👢
+王冠	👑
+女人的帽子	👒
+顶帽	🎩
+毕业帽	🎓
+瓶盖	🧢
+救援人员头盔	⛑
+念珠	📿
+唇膏	💄
+戒指	💍
+宝石	💎
+静音扬声器	🔇
+扬声器音量低	🔈
+扬声器中等音量	🔉
+扬声器音量大	🔊
+扬声器	📢
+扩音器	📣
+邮政号角	📯
+钟	🔔
+带斜纹的钟	🔕
+乐谱	🎼
+音符	🎵
+多音符	🎶
+录音室麦克风	🎙
+水平滑块	🎚
+控制旋钮	🎛
+麦克风	🎤
+头戴式耳机	🎧
+收音机	📻
+萨克斯	🎷
+吉他	🎸
+音乐键盘	🎹
+小号	🎺
+小提琴	🎻
+班卓琴	🪕
+鼓	🥁
+移动电话	📱
+带箭头的手机	📲
+电话	☎
+电话接收机	📞
+寻呼机	📟
+传真机	📠
+电池	🔋
+电插头	🔌
+膝上型计算机	💻
+台式计算机	🖥
+打印机	🖨
+键盘	⌨
+电脑鼠标	🖱
+轨迹球	🖲
+计算机磁盘	💽
+软盘	💾
+光盘	💿
+DVD	📀
+算盘	🧮
+电影摄影机	🎥
+胶片架	🎞
+电影放映机	📽
+拍板	🎬
+电视	📺
+照相机	📷
+带闪光灯的照相机	📸
+摄像机	📹
+盒式录像带	📼
+放大镜向左倾斜	🔍
+放大镜向右倾斜	🔎
+蜡烛	🕯
+灯泡	💡
+手电筒	🔦
+红纸灯笼	🏮
+迪亚灯	🪔
+带装饰盖的笔记本	📔
+闭书	📕
+开卷	📖
+绿皮书	📗
+蓝皮书	📘
+橙皮书	📙
+书	📚
+笔记本	📓
+分类帐	📒
+卷曲页	📃
+纸卷	📜
+页面向上	📄
+报纸	📰
+卷起来的报纸	🗞
+书签标签	📑
+书签	🔖
+标签	🏷
+钱袋	💰
+日元纸币	💴
+美元纸币	💵
+欧元纸币	💶
+英镑纸币	💷
+有翅膀的钱	💸
+信用卡	💳
+收据	🧾
+图表随日元增长	💹
+货币兑换	💱
+重美元符号	💲
+信封	✉
+电子邮件	📧
+传入信封	📨
+带箭头的信封	📩
+发件箱托盘	📤
+收件箱托盘	📥
+包裹	📦
+带升起标志的已关闭邮箱	📫
+标志降低的已关闭邮箱	📪
+打开带有升起标志的邮箱	📬
+打开标志降低的邮箱	📭
+邮筒	📮
+带选票的投票箱	🗳
+铅笔	✏
+黑笔尖	✒
+钢笔	🖋
+笔	🖊
+画笔	🖌
+蜡笔	🖍
+备忘录	📝
+公文包	💼
+文件文件夹	📁
+打开文件文件夹	📂
+卡片索引分隔符	🗂
+日历	📅
+撕下日历	📆
+螺旋记事本	🗒
+螺旋历	🗓
+卡片索引	📇
+图表增加	📈
+图表递减	📉
+条形图	📊
+剪贴板	📋
+图钉	📌
+圆推销	📍
+回形针	📎
+链接回形针	🖇
+直尺	📏
+三角尺	📐
+剪刀	✂
+卡片盒	🗃
+文件柜	🗄
+废纸篓	🗑
+锁定的	🔒
+解锁	🔓
+用钢笔锁着	🔏
+钥匙锁住	🔐
+钥匙	🔑
+旧钥匙	🗝
+铁锤	🔨
+斧子	🪓
+挑选	⛏
+锤与挑	⚒
+锤子和扳手	🛠
+匕首	🗡
+十字剑	⚔
+手枪	🔫
+弓箭	🏹
+盾	🛡
+扳手	🔧
+螺母螺栓	🔩
+齿轮	⚙
+夹紧	🗜
+平衡秤	⚖
+探杖	🦯
+链接	🔗
+链	⛓
+工具箱	🧰
+磁铁	🧲
+蒸馏器	⚗
+试管	🧪
+培养皿	🧫
+DNA	🧬
+显微镜	🔬
+望远镜	🔭
+卫星天线	📡
+注射器	💉
+血滴	🩸
+药丸	💊
+胶带	🩹
+听诊器	🩺
+门	🚪
+床	🛏
+沙发灯	🛋
+椅子	🪑
+厕所	🚽
+淋浴	🚿
+浴缸	🛁
+剃刀	🪒
+洗液瓶	🧴
+安全销	🧷
+扫帚	🧹
+篮子	🧺
+卷筒纸	🧻
+肥皂	🧼
+海绵	🧽
+灭火器	🧯
+购物车	🛒
+香烟	🚬
+棺材	⚰
+丧葬瓮	⚱
+莫艾	🗿
+自动取款机标志	🏧
+垃圾箱标志	🚮
+饮用水	🚰
+轮椅标志	♿
+男厕所	🚹
+女厕所	🚺
+卫生间	🚻
+婴儿符号	🚼
+抽水马桶	🚾
+护照管理	🛂
+海关	🛃
+行李认领	🛄
+行李寄存	🛅
+警告	⚠
+儿童穿越	🚸
+禁止进入	⛔
+禁止	🚫
+禁止骑自行车	🚳
+禁止吸烟	🚭
+禁止乱丢垃圾	🚯
+非饮用水	🚱
+没有行人	🚷
+没有手机	📵
+十八岁以下没有人	🔞
+放射性的	☢
+生物危害	☣
+向上箭头	⬆
+右上箭头	↗
+右箭头	➡
+右下箭头	↘
+向下箭头	⬇
+左下箭头	↙
+左箭头	⬅
+左上箭头	↖
+上下箭头	↕
+左右箭头	↔
+右箭头向左弯曲	↩
+左箭头向右弯曲	↪
+右箭头向上弯曲	⤴
+右箭头向下弯曲	⤵
+顺时针垂直箭头	🔃
+逆时针箭头按钮	🔄
+后箭头	🔙
+结束箭头	🔚
+快箭	🔜
+上箭头	🔝
+礼拜场所	🛐
+原子符号	⚛
+奥姆	🕉
+戴维之星	✡
+法轮	☸
+阴阳	☯
+拉丁十字勋章	✝
+正统十字架	☦
+星与新月	☪
+和平象征	☮
+米诺拉	🕎
+星点六角星	🔯
+白羊座	♈
+金牛座	♉
+双子星座	♊
+癌症	♋
+狮子座	♌
+处女座	♍
+天秤座	♎
+天蝎座	♏
+射手座	♐
+摩羯座	♑
+宝瓶座	♒
+双鱼座	♓
+蛇夫座	⛎
+随机播放曲目按钮	🔀
+重复按钮	🔁
+重复单个按钮	🔂
+播放按钮	▶
+快进按钮	⏩
+下一曲目按钮	⏭
+播放或暂停按钮	⏯
+反向按钮	◀
+快速后退按钮	⏪
+最后一个曲目按钮	⏮
+向上按钮	🔼
+快速按钮	⏫
+向下按钮	🔽
+快速向下按钮	⏬
+暂停按钮	⏸
+停止按钮	⏹
+记录按钮	⏺
+弹出按钮	⏏
+电影院	🎦
+暗淡按钮	🔅
+亮钮	🔆
+天线杆	📶
+振动模式	📳
+手机关闭	📴
+女性征	♀
+男性征	♂
+医学符号	⚕
+无穷	♾
+回收符号	♻
+鸢尾花	⚜
+三叉戟徽章	🔱
+姓名徽章	📛
+日语初学者符号	🔰
+空心红色圆圈	⭕
+复选标记按钮	✅
+带复选框的复选框	☑
+复选标记	✔
+乘号	✖
+十字标记	❌
+十字标记按钮	❎
+加号	➕
+负号	➖
+除法标志	➗
+卷曲环	➰
+双卷曲环	➿
+零件替换标记	〽
+八辐星号	✳
+八角星	✴
+闪耀	❇
+双感叹号	‼
+感叹号问号	⁉
+问号	❓
+白色问号	❔
+白色感叹号	❕
+感叹号	❗
+波浪冲刺	〰
+版权	©
+注册的	®
+商标	™
+输入拉丁文大写	🔠
+输入拉丁文小写	🔡
+输入数	🔢
+输入符号	🔣
+输入拉丁字母	🔤
+CL按钮	🆑
+酷按钮	🆒
+免费按钮	🆓
+信息	ℹ
+标识按钮	🆔
+圆圈M	Ⓜ
+新按钮	🆕
+NG按钮	🆖
+确定按钮	🆗
+P按钮	🅿
+SOS按钮	🆘
+VS按钮	🆚
+红圈	🔴
+橙色圈	🟠
+黄圈	🟡
+绿圈	🟢
+蓝圆	🔵
+紫色圈	🟣
+白圈	⚪
+棕圆	🟤
+红场	🟥
+橙色广场	🟧
+黄色广场	🟨
+绿色广场	🟩
+蓝方	🟦
+紫方	🟪
+黑圈	⚫
+白色大方形	⬜
+褐色广场	🟫
+黑色大方形	⬛
+黑色中方形	◼
+白色中方形	◻
+白色中小型方形	◽
+黑色中小型方形	◾
+白色小正方形	▫
+黑色小正方形	▪
+大橙色菱形	🔶
+大蓝钻石	🔷
+小橙色菱形	🔸
+蓝色小钻石	🔹
+红色三角形尖朝上	🔺
+红色三角形向下	🔻
+带点的菱形	💠
+单选按钮	🔘
+黑色方形按钮	🔲
+白色方形按钮	🔳
+黑白方格旗	🏁
+三角旗	🚩
+十字旗	🎌
+黑旗	🏴
+白旗	🏳
+彩虹旗	🏳️‍🌈
+海盗旗	🏴‍☠️
+阿森松岛国旗	🇦🇨
+安道尔国旗	🇦🇩
+阿拉伯联合酋长国国旗	🇦🇪
+阿富汗国旗	🇦🇫
+安提瓜和巴布达国旗	🇦🇬
+安圭拉国旗	🇦🇮
+阿尔巴尼亚国旗	🇦🇱
+亚美尼亚国旗	🇦🇲
+安哥拉国旗	🇦🇴
+南极洲国旗	🇦🇶
+阿根廷国旗	🇦🇷
+美属萨摩亚国旗	🇦🇸
+奥地利国旗	🇦🇹
+澳大利亚国旗	🇦🇺
+Aruba国旗	🇦🇼
+陆地岛屿国旗	🇦🇽
+阿塞拜疆国旗	🇦🇿
+波斯尼亚和黑塞哥维那国旗	🇧🇦
+巴巴多斯国旗	🇧🇧
+孟加拉国国旗	🇧🇩
+比利时国旗	🇧🇪
+布基纳法索国旗	🇧🇫
+保加利亚国旗	🇧🇬
+巴林国旗	🇧🇭
+布隆迪国旗	🇧🇮
+贝宁国旗	🇧🇯
+圣巴特莱米国旗	🇧🇱
+百慕大群岛国旗	🇧🇲
+文莱国旗	🇧🇳
+玻利维亚国旗	🇧🇴
+加勒比海荷兰国旗	🇧🇶
+巴西国旗	🇧🇷
+巴哈马国旗	🇧🇸
+不丹国旗	🇧🇹
+布韦岛国旗	🇧🇻
+博茨瓦纳国旗	🇧🇼
+白俄罗斯国旗	🇧🇾
+伯利兹国旗	🇧🇿
+加拿大国旗	🇨🇦
+中非共和国国旗	🇨🇫
+瑞士国旗	🇨🇭
+科特迪瓦国旗	🇨🇮
+库克群岛国旗	🇨🇰
+智利国旗	🇨🇱
+喀麦隆国旗	🇨🇲
+中国国旗	🇨🇳
+哥伦比亚国旗	🇨🇴
+克利珀顿岛国旗	🇨🇵
+哥斯达黎加国旗	🇨🇷
+古巴国旗	🇨🇺
+佛得角国旗	🇨🇻
+库劳国旗	🇨🇼
+圣诞岛国旗	🇨🇽
+塞浦路斯国旗	🇨🇾
+捷克国旗	🇨🇿
+德国国旗	🇩🇪
+吉布提国旗	🇩🇯
+丹麦国旗	🇩🇰
+多米尼加国旗	🇩🇲
+多米尼加共和国国旗	🇩🇴
+阿尔及利亚国旗	🇩🇿
+休达和梅利利亚国旗	🇪🇦
+厄瓜多尔国旗	🇪🇨
+爱沙尼亚国旗	🇪🇪
+埃及国旗	🇪🇬
+西撒哈拉国旗	🇪🇭
+Eritrea国旗	🇪🇷
+西班牙国旗	🇪🇸
+埃塞俄比亚国旗	🇪🇹
+欧盟国旗	🇪🇺
+芬兰国旗	🇫🇮
+斐济国旗	🇫🇯
+福克兰群岛国旗	🇫🇰
+密克罗尼西亚国旗	🇫🇲
+法罗群岛国旗	🇫🇴
+法国国旗	🇫🇷
+Gabon国旗	🇬🇦
+格林纳达国旗	🇬🇩
+格鲁吉亚国旗	🇬🇪
+法属圭亚那国旗	🇬🇫
+英属格恩西国旗	🇬🇬
+加纳国旗	🇬🇭
+直布罗陀国旗	🇬🇮
+格陵兰岛国旗	🇬🇱
+冈比亚国旗	🇬🇲
+几内亚国旗	🇬🇳
+瓜德罗普国旗	🇬🇵
+赤道几内亚国旗	🇬🇶
+希腊国旗	🇬🇷
+南乔治亚和南桑威奇群岛国旗	🇬🇸
+瓜地马拉国旗	🇬🇹
+关岛国旗	🇬🇺
+几内亚比绍国旗	🇬🇼
+圭亚那国旗	🇬🇾
+香港特区	🇭🇰
+赫德和麦克唐纳群岛国旗	🇭🇲
+洪都拉斯国旗	🇭🇳
+克罗地亚国旗	🇭🇷
+海地国旗	🇭🇹
+匈牙利国旗	🇭🇺
+加那利群岛国旗	🇮🇨
+印度尼西亚国旗	🇮🇩
+爱尔兰国旗	🇮🇪
+以色列国旗	🇮🇱
+马恩岛国旗	🇮🇲
+印度国旗	🇮🇳
+英属印度洋领土国旗	🇮🇴
+伊拉克国旗	🇮🇶
+伊朗国旗	🇮🇷
+冰岛国旗	🇮🇸
+意大利国旗	🇮🇹
+Jersey国旗	🇯🇪
+牙买加国旗	🇯🇲
+约旦国旗	🇯🇴
+日本国旗	🇯🇵
+肯尼亚国旗	🇰🇪
+吉尔吉斯斯坦国旗	🇰🇬
+柬埔寨国旗	🇰🇭
+基里巴斯国旗	🇰🇮
+科摩罗伊斯兰国旗	🇰🇲
+圣基茨和尼维斯国旗	🇰🇳
+朝鲜国旗	🇰🇵
+韩国国旗	🇰🇷
+科威特国旗	🇰🇼
+开曼群岛国旗	🇰🇾
+哈萨克斯坦国旗	🇰🇿
+Laos国旗	🇱🇦
+黎巴嫩国旗	🇱🇧
+圣卢西亚国旗	🇱🇨
+列支敦士登国旗	🇱🇮
+斯里兰卡国旗	🇱🇰
+利比里亚国旗	🇱🇷
+莱索托国旗	🇱🇸
+立陶宛国旗	🇱🇹
+卢森堡国旗	🇱🇺
+拉脱维亚国旗	🇱🇻
+利比亚国旗	🇱🇾
+摩洛哥国旗	🇲🇦
+摩纳哥国旗	🇲🇨
+摩尔多瓦国旗	🇲🇩
+黑山国旗	🇲🇪
+圣马丁国旗	🇲🇫
+马达加斯加国旗	🇲🇬
+马绍尔群岛国旗	🇲🇭
+马其顿国旗	🇲🇰
+马里国旗	🇲🇱
+蒙古国旗	🇲🇳
+中国澳门特别行政区	🇲🇴
+北马里亚纳群岛国旗	🇲🇵
+马提尼克国旗	🇲🇶
+毛里塔尼亚国旗	🇲🇷
+蒙特塞拉特国旗	🇲🇸
+马耳他国旗	🇲🇹
+毛里求斯国旗	🇲🇺
+马尔代夫国旗	🇲🇻
+马拉维国旗	🇲🇼
+墨西哥国旗	🇲🇽
+马来西亚国旗	🇲🇾
+莫桑比克国旗	🇲🇿
+纳米比亚国旗	🇳🇦
+新喀里多尼亚国旗	🇳🇨
+尼日尔国旗	🇳🇪
+诺福克岛国旗	🇳🇫
+尼日利亚国旗	🇳🇬
+尼加拉瓜国旗	🇳🇮
+荷兰国旗	🇳🇱
+挪威国旗	🇳🇴
+尼泊尔国旗	🇳🇵
+瑙鲁国旗	🇳🇷
+纽埃国旗	🇳🇺
+新西兰国旗	🇳🇿
+阿曼国旗	🇴🇲
+巴拿马国旗	🇵🇦
+秘鲁国旗	🇵🇪
+法属波利尼西亚国旗	🇵🇫
+巴布亚新几内亚国旗	🇵🇬
+菲律宾国旗	🇵🇭
+巴基斯坦国旗	🇵🇰
+波兰国旗	🇵🇱
+圣皮埃尔和密克隆国旗	🇵🇲
+皮特凯恩群岛国旗	🇵🇳
+波多黎各国旗	🇵🇷
+巴勒斯坦领土国旗	🇵🇸
+葡萄牙国旗	🇵🇹
+帕劳国旗	🇵🇼
+巴拉圭国旗	🇵🇾
+卡塔尔国旗	🇶🇦
+留尼旺岛国旗	🇷🇪
+罗马尼亚国旗	🇷🇴
+塞尔维亚国旗	🇷🇸
+俄罗斯国旗	🇷🇺
+卢旺达国旗	🇷🇼
+沙特阿拉伯国旗	🇸🇦
+所罗门群岛国旗	🇸🇧
+塞舌尔国旗	🇸🇨
+苏丹国旗	🇸🇩
+瑞典国旗	🇸🇪
+新加坡国旗	🇸🇬
+圣赫勒拿国旗	🇸🇭
+斯洛文尼亚国旗	🇸🇮
+斯瓦尔巴和扬马延国旗	🇸🇯
+斯洛伐克国旗	🇸🇰
+塞拉利昂国旗	🇸🇱
+圣马力诺国旗	🇸🇲
+塞内加尔国旗	🇸🇳
+索马里国旗	🇸🇴
+苏里南国旗	🇸🇷
+南苏丹国旗	🇸🇸
+圣多美和普林西比国旗	🇸🇹
+萨尔瓦多国旗	🇸🇻
+荷属圣马丁国旗	🇸🇽
+叙利亚国旗	🇸🇾
+埃斯瓦蒂尼国旗	🇸🇿
+特里斯坦达库尼亚国旗	🇹🇦
+特克斯和凯科斯群岛国旗	🇹🇨
+乍得国旗	🇹🇩
+法国南部领土国旗	🇹🇫
+多哥国旗	🇹🇬
+泰国国旗	🇹🇭
+塔吉克斯坦国旗	🇹🇯
+托克劳国旗	🇹🇰
+东帝汶国旗	🇹🇱
+土库曼斯坦国旗	🇹🇲
+突尼斯国旗	🇹🇳
+汤加国旗	🇹🇴
+土耳其国旗	🇹🇷
+特立尼达和多巴哥国旗	🇹🇹
+图瓦卢国旗	🇹🇻
+台湾	🇹🇼
+坦桑尼亚国旗	🇹🇿
+乌克兰国旗	🇺🇦
+乌干达国旗	🇺🇬
+美国边远岛屿国旗	🇺🇲
+联合国国旗	🇺🇳
+美国国旗	🇺🇸
+乌拉圭国旗	🇺🇾
+乌兹别克斯坦国旗	🇺🇿
+梵蒂冈城国旗	🇻🇦
+圣文森特格林纳丁斯国旗	🇻🇨
+委内瑞拉国旗	🇻🇪
+英属维尔京群岛国旗	🇻🇬
+美属维尔京群岛国旗	🇻🇮
+越南国旗	🇻🇳
+瓦努阿图国旗	🇻🇺
+瓦利斯和富图纳国旗	🇼🇫
+萨摩亚国旗	🇼🇸
+科索沃国旗	🇽🇰
+也门国旗	🇾🇪
+马约特国旗	🇾🇹
+南非国旗	🇿🇦
+赞比亚国旗	🇿🇲
+津巴布韦国旗	🇿🇼
+英国国旗	🏴󠁧󠁢󠁥󠁮󠁧󠁿
+苏格兰国旗	🏴󠁧󠁢󠁳󠁣󠁴󠁿
+威尔士国旗	🏴󠁧󠁢󠁷󠁬󠁳󠁿
+'''
+
+
+# 按常量名查表
+def lookup(name: str) -> str:
+    start = TABLE.find('\n' + name + '\t')
+    if start < 0:
+        return None
+    start += len(name) + 2
+    value = TABLE[start:TABLE.index('\n', start)]
+    if name.startswith('表情_'):
+        return value
+    # 用到时才导入编解码模块, 保持本模块导入开销最小
+    from .TextCode import encode
+    return encode(value)
+
+
+# 全部常量名
+def names() -> list:
+    return [line.split('\t', 1)[0] for line in TABLE.strip('\n').split('\n')]
+
+
+# 全部常量名与表中的取值
+def entries() -> list:
+    return [tuple(line.split('\t', 1)) for line in TABLE.strip('\n').split('\n')]
+
+
+class EmojiIndex:
+    def __init__(self):
+        """表情索引, 由表情表一次建立, 可按常量名, Unicode 字符, 文本代码查找对应的常量
+
+        1.精确查找: get('小丑脸'), get('🤡'), get('[emoji=D83E][emoji=DD21]'), get('[捂脸]'), O(1) \r\n
+        2.前缀查找: prefix('笑脸'), prefix('👨'), 二分查找 \r\n
+        3.识别消息中的全部表情: scan('你好😁[捂脸]')
+
+        一般通过 Emoji.index() 获取共享的实例
+        """
+
+        import re
+        from .TextCode import ENCODE_PATTERN, decode, encode
+
+        self.decode = decode
+        # 可能是表情的片段: 连续的 Emoji 字符, 或 [捂脸] 形式的微信表情代码
+        self.pattern = re.compile(ENCODE_PATTERN.pattern + r'|\[[^\[\]]{1,8}\]')
+        self.glyphs = {}
+        self.codes = {}
+        self.keys = {}
+        self.tokens = {}
+        for name, value in entries():
+            if name.startswith('表情_'):
+                code = value
+                self.tokens[value] = name
+            else:
+                code = encode(value)
+                self.glyphs[name] = value
+                self.keys.setdefault(value, name)
+                # 常见的输入会省略变体选择符 U+FE0F
+                self.keys.setdefault(value.replace('\ufe0f', ''), name)
+                self.tokens.setdefault(value, name)
+                self.tokens.setdefault(value.replace('\ufe0f', ''), name)
+            self.codes[name] = code
+            self.keys[name] = name
+            self.keys.setdefault(code, name)
+        self.sorted_keys = sorted(self.keys)
+        self.longest = max(map(len, self.glyphs.values()))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    # 精确查找
+    def get(self, key: str) -> str:
+        """精确查找
+
+        Args:
+            key (str): 常量名, Unicode 字符, Emoji 文本代码或微信表情代码
+
+        Returns:
+            str: 常量名, 如 '小丑脸', '表情_捂脸', 不存在时为 None
+        """
+
+        name = self.keys.get(key)
+        if name is None and '\ufe0f' in key:
+            name = self.keys.get(key.replace('\ufe0f', ''))
+        return name
+
+    # 前缀查找
+    def prefix(self, query: str, limit: int = 20) -> list:
+        """前缀查找, 按常量名, Unicode 字符与文本代码的前缀匹配
+
+        Args:
+            query (str): 查询词 \r\n
+            limit (int, optional): 最多返回数量. 默认 20
+
+        Returns:
+            list: 常量名列表
+        """
+
+        import bisect
+
+        result = []
+        keys = self.sorted_keys
+        index = bisect.bisect_left(keys, query)
+        while index < len(keys) and len(result) < limit and keys[index].startswith(query):
+            name = self.keys[keys[index]]
+            if name not in result:
+                result.append(name)
+            index += 1
+        return result
+
+    # 识别表情
+    def scan(self, text: str) -> list:
+        """识别文本中的全部表情, 文本中的 Emoji 可以是 Unicode 字符或文本代码, 优先匹配最长的表情
+
+        Args:
+            text (str): 消息内容, 昵称等
+
+        Returns:
+            list: 按出现顺序排列的常量名列表
+        """
+
+        result = []
+        tokens = self.tokens
+        for run in self.pattern.findall(self.decode(text)):
+            if run[0] == '[':
+                if run in tokens:
+                    result.append(tokens[run])
+                continue
+            # 连续的 Emoji 字符按最长匹配逐个切分
+            i = 0
+            while i < len(run):
+                for j in range(min(len(run), i + self.longest), i, -1):
+                    name = tokens.get(run[i:j])
+                    if name is not None:
+                        result.append(name)
+                        i = j
+                        break
+                else:
+                    i += 1
+        return result
+
+    # Unicode 字符
+    def glyph(self, name: str) -> str:
+        return self.glyphs.get(name)
+
+    # 文本代码
+    def code(self, name: str) -> str:
+        return self.codes.get(name)
+
+
+shared = None
+
+
+# 共享的表情索引
+def index() -> EmojiIndex:
+    """共享的表情索引, 首次调用时建立
+
+    例: Emoji.index().get('😁')
+
+    Returns:
+        EmojiIndex: 表情索引
+    """
+
+    global shared
+    if shared is None:
+        shared = EmojiIndex()
+    return shared
+
+
+def __getattr__(name: str) -> str:
+    # from qianxun.Emoji import * 导出全部常量, 与按名称访问一样在首次使用时才查表
+    if name == '__all__':
+        return names()
+    value = lookup(name)
+    if value is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(names()))
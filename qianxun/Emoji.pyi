@@ -0,0 +1,3367 @@
+# 由 Emoji.py 的 TABLE 生成, 供编辑器补全与悬停预览
+
+TABLE: str
+
+def lookup(name: str) -> str: ...
+def names() -> list: ...
+def entries() -> list: ...
+
+class EmojiIndex:
+    def __len__(self) -> int: ...
+    def get(self, key: str) -> str: ...
+    def prefix(self, query: str, limit: int = ...) -> list: ...
+    def scan(self, text: str) -> list: ...
+    def glyph(self, name: str) -> str: ...
+    def code(self, name: str) -> str: ...
+
+def index() -> EmojiIndex: ...
+
+表情_微笑: str  # [微笑]
+表情_撇嘴: str  # [撇嘴]
+表情_色: str  # [色]
+表情_发呆: str  # [发呆]
+表情_得意: str  # [得意]
+表情_流泪: str  # [流泪]
+表情_闭嘴: str  # [闭嘴]
+表情_害羞: str  # [害羞]
+表情_睡: str  # [睡]
+表情_大哭: str  # [大哭]
+表情_尴尬: str  # [尴尬]
+表情_发怒: str  # [发怒]
+表情_调皮: str  # [调皮]
+表情_呲牙: str  # [呲牙]
+表情_惊讶: str  # [惊讶]
+表情_难过: str  # [难过]
+表情_囧: str  # [囧]
+表情_抓狂: str  # [抓狂]
+表情_吐: str  # [吐]
+表情_偷笑: str  # [偷笑]
+表情_愉快: str  # [愉快]
+表情_白眼: str  # [白眼]
+表情_傲慢: str  # [傲慢]
+表情_困: str  # [困]
+表情_惊恐: str  # [惊恐]
+表情_流汗: str  # [流汗]
+表情_憨笑: str  # [憨笑]
+表情_悠闲: str  # [悠闲]
+表情_奋斗: str  # [奋斗]
+表情_咒骂: str  # [咒骂]
+表情_疑问: str  # [疑问]
+表情_嘘: str  # [嘘]
+表情_晕: str  # [晕]
+表情_衰: str  # [衰]
+表情_骷髅: str  # [骷髅]
+表情_敲打: str  # [敲打]
+表情_再见: str  # [再见]
+表情_擦汗: str  # [擦汗]
+表情_抠鼻: str  # [抠鼻]
+表情_鼓掌: str  # [鼓掌]
+表情_坏笑: str  # [坏笑]
+表情_左哼哼: str  # [左哼哼]
+表情_右哼哼: str  # [右哼哼]
+表情_哈欠: str  # [哈欠]
+表情_鄙视: str  # [鄙视]
+表情_委屈: str  # [委屈]
+表情_快哭了: str  # [快哭了]
+表情_阴险: str  # [阴险]
+表情_亲亲: str  # [亲亲]
+表情_可怜: str  # [可怜]
+表情_菜刀: str  # [菜刀]
+表情_西瓜: str  # [西瓜]
+表情_啤酒: str  # [啤酒]
+表情_咖啡: str  # [咖啡]
+表情_猪头: str  # [猪头]
+表情_玫瑰: str  # [玫瑰]
+表情_凋谢: str  # [凋谢]
+表情_嘴唇: str  # [嘴唇]
+表情_爱心: str  # [爱心]
+表情_心碎: str  # [心碎]
+表情_蛋糕: str  # [蛋糕]
+表情_炸弹: str  # [炸弹]
+表情_便便: str  # [便便]
+表情_月亮: str  # [月亮]
+表情_太阳: str  # [太阳]
+表情_拥抱: str  # [拥抱]
+表情_强: str  # [强]
+表情_弱: str  # [弱]
+表情_握手: str  # [握手]
+表情_胜利: str  # [胜利]
+表情_抱拳: str  # [抱拳]
+表情_勾引: str  # [勾引]
+表情_拳头: str  # [拳头]
+表情_ok: str  # [OK]
+表情_跳跳: str  # [跳跳]
+表情_发抖: str  # [发抖]
+表情_怄火: str  # [怄火]
+表情_转圈: str  # [转圈]
+表情_哈嘿: str  # [哈嘿]
+表情_捂脸: str  # [捂脸]
+表情_奸笑: str  # [奸笑]
+表情_机智: str  # [机智]
+表情_皱眉: str  # [皱眉]
+表情_耶: str  # [耶]
+表情_红包: str  # [红包]
+表情_發: str  # [發]
+表情_福: str  # [福]
+咧嘴笑: str  # 咧嘴笑
+"""😀"""
+大眼睛咧嘴笑脸: str  # 大眼睛咧嘴笑脸
+"""😃"""
+咧嘴笑脸: str  # 咧嘴笑脸
+"""😄"""
+笑容可掬的脸: str  # 笑容可掬的脸
+"""😁"""
+咧嘴眯眼的脸: str  # 咧嘴眯眼的脸
+"""😆"""
+满脸汗水的笑容: str  # 满脸汗水的笑容
+"""😅"""
+在地板上滚来滚去大笑: str  # 在地板上滚来滚去大笑
+"""🤣"""
+喜极而泣: str  # 喜极而泣
+"""😂"""
+略带微笑的脸: str  # 略带微笑的脸
+"""🙂"""
+倒立的脸: str  # 倒立的脸
+"""🙃"""
+眨眼脸: str  # 眨眼脸
+"""😉"""
+笑脸与微笑的眼睛: str  # 笑脸与微笑的眼睛
+"""😊"""
+带光环的笑脸: str  # 带光环的笑脸
+"""😇"""
+满心笑容: str  # 满心笑容
+"""🥰"""
+带着心眼的笑脸: str  # 带着心眼的笑脸
+"""😍"""
+星击: str  # 星击
+"""🤩"""
+吹着吻的脸: str  # 吹着吻的脸
+"""😘"""
+吻脸: str  # 吻脸
+"""😗"""
+笑脸: str  # 笑脸
+"""☺"""
+闭着眼睛亲吻脸: str  # 闭着眼睛亲吻脸
+"""😚"""
+用微笑的眼睛亲吻脸: str  # 用微笑的眼睛亲吻脸
+"""😙"""
+脸上的美味食物: str  # 脸上的美味食物
+"""😋"""
+有舌头的脸: str  # 有舌头的脸
+"""😛"""
+舌头眨眼脸: str  # 舌头眨眼脸
+"""😜"""
+滑稽面孔: str  # 滑稽面孔
+"""🤪"""
+用舌头眯着脸: str  # 用舌头眯着脸
+"""😝"""
+钱嘴脸: str  # 钱嘴脸
+"""🤑"""
+拥抱面容: str  # 拥抱面容
+"""🤗"""
+手捂嘴的脸: str  # 手捂嘴的脸
+"""🤭"""
+洗脸: str  # 洗脸
+"""🤫"""
+思考的脸: str  # 思考的脸
+"""🤔"""
+拉链口面: str  # 拉链口面
+"""🤐"""
+扬起眉毛的脸: str  # 扬起眉毛的脸
+"""🤨"""
+中性面: str  # 中性面
+"""😐"""
+无表情的脸: str  # 无表情的脸
+"""😑"""
+没有嘴的脸: str  # 没有嘴的脸
+"""😶"""
+傻笑脸: str  # 傻笑脸
+"""😏"""
+没用的脸: str  # 没用的脸
+"""😒"""
+眼睛滚动的脸: str  # 眼睛滚动的脸
+"""🙄"""
+歪扭: str  # 歪扭
+"""😬"""
+说谎脸: str  # 说谎脸
+"""🤥"""
+卸脸: str  # 卸脸
+"""😌"""
+忧郁的面容: str  # 忧郁的面容
+"""😔"""
+瞌睡脸: str  # 瞌睡脸
+"""😪"""
+流口水的脸: str  # 流口水的脸
+"""🤤"""
+睡脸: str  # 睡脸
+"""😴"""
+带口罩的脸: str  # 带口罩的脸
+"""😷"""
+带温度计的脸: str  # 带温度计的脸
+"""🤒"""
+戴头巾的脸: str  # 戴头巾的脸
+"""🤕"""
+恶心脸: str  # 恶心脸
+"""🤢"""
+面吐: str  # 面吐
+"""🤮"""
+打喷嚏脸: str  # 打喷嚏脸
+"""🤧"""
+热面: str  # 热面
+"""🥵"""
+冷面: str  # 冷面
+"""🥶"""
+哇哇的脸: str  # 哇哇的脸
+"""🥴"""
+头晕脸: str  # 头晕脸
+"""😵"""
+爆炸头: str  # 爆炸头
+"""🤯"""
+牛仔帽面: str  # 牛仔帽面
+"""🤠"""
+派对脸: str  # 派对脸
+"""🥳"""
+带太阳镜的笑脸: str  # 带太阳镜的笑脸
+"""😎"""
+书呆子脸: str  # 书呆子脸
+"""🤓"""
+戴单片眼镜的脸: str  # 戴单片眼镜的脸
+"""🧐"""
+困惑的脸: str  # 困惑的脸
+"""😕"""
+忧愁面容: str  # 忧愁面容
+"""😟"""
+微皱的脸: str  # 微皱的脸
+"""🙁"""
+皱眉: str  # 皱眉
+"""☹"""
+张开嘴的脸: str  # 张开嘴的脸
+"""😮"""
+哑巴脸: str  # 哑巴脸
+"""😯"""
+惊愕的脸: str  # 惊愕的脸
+"""😲"""
+脸红: str  # 脸红
+"""😳"""
+恳求面容: str  # 恳求面容
+"""🥺"""
+张嘴皱眉头: str  # 张嘴皱眉头
+"""😦"""
+痛苦的面容: str  # 痛苦的面容
+"""😧"""
+可怕的面容: str  # 可怕的面容
+"""😨"""
+焦头烂额: str  # 焦头烂额
+"""😰"""
+悲伤但如释重负的脸: str  # 悲伤但如释重负的脸
+"""😥"""
+哭脸: str  # 哭脸
+"""😢"""
+大声哭泣的脸: str  # 大声哭泣的脸
+"""😭"""
+恐惧中尖叫的脸: str  # 恐惧中尖叫的脸
+"""😱"""
+脸色茫然: str  # 脸色茫然
+"""😖"""
+坚持不懈的脸: str  # 坚持不懈的脸
+"""😣"""
+失望的脸: str  # 失望的脸
+"""😞"""
+汗流满面: str  # 汗流满面
+"""😓"""
+疲乏的脸: str  # 疲乏的脸
+"""😩"""
+疲惫的面容: str  # 疲惫的面容
+"""😫"""
+打呵欠的脸: str  # 打呵欠的脸
+"""🥱"""
+鼻子冒出蒸汽的脸: str  # 鼻子冒出蒸汽的脸
+"""😤"""
+撅嘴脸: str  # 撅嘴脸
+"""😡"""
+生气的脸: str  # 生气的脸
+"""😠"""
+口上有符号的脸: str  # 口上有符号的脸
+"""🤬"""
+有角的笑脸: str  # 有角的笑脸
+"""😈"""
+有角的愤怒的脸: str  # 有角的愤怒的脸
+"""👿"""
+颅骨: str  # 颅骨
+"""💀"""
+头骨和交叉骨: str  # 头骨和交叉骨
+"""☠"""
+一堆屎: str  # 一堆屎
+"""💩"""
+小丑脸: str  # 小丑脸
+"""🤡"""
+食人魔: str  # 食人魔
+"""👹"""
+妖精: str  # 妖精
+"""👺"""
+鬼: str  # 鬼
+"""👻"""
+外星人: str  # 外星人
+"""👽"""
+外来怪物: str  # 外来怪物
+"""👾"""
+机器人: str  # 机器人
+"""🤖"""
+咧嘴笑的猫: str  # 咧嘴笑的猫
+"""😺"""
+笑眯眯的猫: str  # 笑眯眯的猫
+"""😸"""
+喜极而泣的猫: str  # 喜极而泣的猫
+"""😹"""
+心眼含笑的猫: str  # 心眼含笑的猫
+"""😻"""
+苦笑的猫: str  # 苦笑的猫
+"""😼"""
+接吻猫: str  # 接吻猫
+"""😽"""
+疲倦的猫: str  # 疲倦的猫
+"""🙀"""
+哭泣的猫: str  # 哭泣的猫
+"""😿"""
+撅嘴猫: str  # 撅嘴猫
+"""😾"""
+看不到邪恶的猴子: str  # 看不到邪恶的猴子
+"""🙈"""
+听不到邪恶的猴子: str  # 听不到邪恶的猴子
+"""🙉"""
+不要说邪恶的猴子: str  # 不要说邪恶的猴子
+"""🙊"""
+吻痕: str  # 吻痕
+"""💋"""
+情书: str  # 情书
+"""💌"""
+带箭头的心: str  # 带箭头的心
+"""💘"""
+带丝带的心: str  # 带丝带的心
+"""💝"""
+闪闪发光的心: str  # 闪闪发光的心
+"""💖"""
+成长的心: str  # 成长的心
+"""💗"""
+跳动的心脏: str  # 跳动的心脏
+"""💓"""
+旋转心脏: str  # 旋转心脏
+"""💞"""
+两颗心: str  # 两颗心
+"""💕"""
+心脏装饰: str  # 心脏装饰
+"""💟"""
+心形感叹号: str  # 心形感叹号
+"""❣"""
+破碎的心: str  # 破碎的心
+"""💔"""
+红心: str  # 红心
+"""❤"""
+橙心: str  # 橙心
+"""🧡"""
+黄心: str  # 黄心
+"""💛"""
+青心树: str  # 青心树
+"""💚"""
+蓝心: str  # 蓝心
+"""💙"""
+紫心: str  # 紫心
+"""💜"""
+黑心: str  # 黑心
+"""🖤"""
+白心: str  # 白心
+"""🤍"""
+褐色心脏: str  # 褐色心脏
+"""🤎"""
+百分: str  # 百分
+"""💯"""
+愤怒符号: str  # 愤怒符号
+"""💢"""
+碰撞: str  # 碰撞
+"""💥"""
+头晕: str  # 头晕
+"""💫"""
+汗液滴: str  # 汗液滴
+"""💦"""
+飞奔而去: str  # 飞奔而去
+"""💨"""
+孔: str  # 孔
+"""🕳"""
+炸弹: str  # 炸弹
+"""💣"""
+语音气球: str  # 语音气球
+"""💬"""
+言语中的眼睛: str  # 言语中的眼睛
+"""👁️‍🗨️"""
+左语音气泡: str  # 左语音气泡
+"""🗨"""
+右愤怒气泡: str  # 右愤怒气泡
+"""🗯"""
+思维气球: str  # 思维气球
+"""💭"""
+ZZZ: str  # ZZZ
+"""💤"""
+挥手: str  # 挥手
+"""👋"""
+抬起手背: str  # 抬起手背
+"""🤚"""
+手指张开的手: str  # 手指张开的手
+"""🖐"""
+抬高手: str  # 抬高手
+"""✋"""
+火神礼炮: str  # 火神礼炮
+"""🖖"""
+好手: str  # 好手
+"""👌"""
+捏手: str  # 捏手
+"""🤏"""
+胜利之手: str  # 胜利之手
+"""✌"""
+交叉手指: str  # 交叉手指
+"""🤞"""
+爱你的手势: str  # 爱你的手势
+"""🤟"""
+喇叭的标志: str  # 喇叭的标志
+"""🤘"""
+叫我手: str  # 叫我手
+"""🤙"""
+反向索引指向左: str  # 反向索引指向左
+"""👈"""
+反手指数指向右: str  # 反手指数指向右
+"""👉"""
+反手指数指向上: str  # 反手指数指向上
+"""👆"""
+中指: str  # 中指
+"""🖕"""
+反手指数向下: str  # 反手指数向下
+"""👇"""
+索引指向上: str  # 索引指向上
+"""☝"""
+竖起大拇指: str  # 竖起大拇指
+"""👍"""
+拇指向下: str  # 拇指向下
+"""👎"""
+凸起拳: str  # 凸起拳
+"""✊"""
+迎面拳头: str  # 迎面拳头
+"""👊"""
+左拳: str  # 左拳
+"""🤛"""
+右拳: str  # 右拳
+"""🤜"""
+拍手: str  # 拍手
+"""👏"""
+举手: str  # 举手
+"""🙌"""
+张开双手: str  # 张开双手
+"""👐"""
+手掌向上: str  # 手掌向上
+"""🤲"""
+握手: str  # 握手
+"""🤝"""
+折叠手: str  # 折叠手
+"""🙏"""
+书写手: str  # 书写手
+"""✍"""
+指甲油: str  # 指甲油
+"""💅"""
+自拍: str  # 自拍
+"""🤳"""
+屈曲二头肌: str  # 屈曲二头肌
+"""💪"""
+机械臂: str  # 机械臂
+"""🦾"""
+机械腿: str  # 机械腿
+"""🦿"""
+腿: str  # 腿
+"""🦵"""
+脚: str  # 脚
+"""🦶"""
+耳朵: str  # 耳朵
+"""👂"""
+带助听器的耳: str  # 带助听器的耳
+"""🦻"""
+鼻子: str  # 鼻子
+"""👃"""
+脑: str  # 脑
+"""🧠"""
+牙齿: str  # 牙齿
+"""🦷"""
+骨: str  # 骨
+"""🦴"""
+很多眼睛: str  # 很多眼睛
+"""👀"""
+眼睛: str  # 眼睛
+"""👁"""
+舌头: str  # 舌头
+"""👅"""
+口: str  # 口
+"""👄"""
+宝贝: str  # 宝贝
+"""👶"""
+小孩: str  # 小孩
+"""🧒"""
+男孩: str  # 男孩
+"""👦"""
+女孩: str  # 女孩
+"""👧"""
+人: str  # 人
+"""🧑"""
+男人: str  # 男人
+"""👨"""
+胡子: str  # 胡子
+"""🧔"""
+女人: str  # 女人
+"""👩"""
+老年人: str  # 老年人
+"""🧓"""
+老人: str  # 老人
+"""👴"""
+老妇人: str  # 老妇人
+"""👵"""
+皱眉头: str  # 皱眉头
+"""🙍"""
+男人皱眉: str  # 男人皱眉
+"""🙍‍♂️"""
+女人皱眉: str  # 女人皱眉
+"""🙍‍♀️"""
+人撅嘴: str  # 人撅嘴
+"""🙎"""
+男人撅嘴: str  # 男人撅嘴
+"""🙎‍♂️"""
+女人撅嘴: str  # 女人撅嘴
+"""🙎‍♀️"""
+打手势的人不: str  # 打手势的人不
+"""🙅"""
+男人示意不: str  # 男人示意不
+"""🙅‍♂️"""
+女人示意不: str  # 女人示意不
+"""🙅‍♀️"""
+手势正常的人: str  # 手势正常的人
+"""🙆"""
+男人示意好了: str  # 男人示意好了
+"""🙆‍♂️"""
+女人做手势好吗: str  # 女人做手势好吗
+"""🙆‍♀️"""
+倾卸手: str  # 倾卸手
+"""💁"""
+人倾翻手: str  # 人倾翻手
+"""💁‍♂️"""
+女人倾翻的手: str  # 女人倾翻的手
+"""💁‍♀️"""
+举起手的人: str  # 举起手的人
+"""🙋"""
+举起手来: str  # 举起手来
+"""🙋‍♂️"""
+女人举起手来: str  # 女人举起手来
+"""🙋‍♀️"""
+聋人: str  # 聋人
+"""🧏"""
+聋男人: str  # 聋男人
+"""🧏‍♂️"""
+聋女: str  # 聋女
+"""🧏‍♀️"""
+鞠躬: str  # 鞠躬
+"""🙇"""
+男人鞠躬: str  # 男人鞠躬
+"""🙇‍♂️"""
+女子鞠躬: str  # 女子鞠躬
+"""🙇‍♀️"""
+面部护理: str  # 面部护理
+"""🤦"""
+人脸识别: str  # 人脸识别
+"""🤦‍♂️"""
+女性面部按摩: str  # 女性面部按摩
+"""🤦‍♀️"""
+人耸肩: str  # 人耸肩
+"""🤷"""
+男人耸肩: str  # 男人耸肩
+"""🤷‍♂️"""
+女耸肩: str  # 女耸肩
+"""🤷‍♀️"""
+男子卫生工作者: str  # 男子卫生工作者
+"""👨‍⚕️"""
+女保健员: str  # 女保健员
+"""👩‍⚕️"""
+男学生: str  # 男学生
+"""👨‍🎓"""
+女学生: str  # 女学生
+"""👩‍🎓"""
+男教师: str  # 男教师
+"""👨‍🏫"""
+女教师: str  # 女教师
+"""👩‍🏫"""
+男子裁判员: str  # 男子裁判员
+"""👨‍⚖️"""
+女法官: str  # 女法官
+"""👩‍⚖️"""
+男子农民: str  # 男子农民
+"""👨‍🌾"""
+女农民: str  # 女农民
+"""👩‍🌾"""
+男子厨师: str  # 男子厨师
+"""👨‍🍳"""
+女厨师: str  # 女厨师
+"""👩‍🍳"""
+男子机械师: str  # 男子机械师
+"""👨‍🔧"""
+女机修工: str  # 女机修工
+"""👩‍🔧"""
+工厂工人: str  # 工厂工人
+"""👨‍🏭"""
+女工厂工人: str  # 女工厂工人
+"""👩‍🏭"""
+办公室文员: str  # 办公室文员
+"""👨‍💼"""
+女上班族: str  # 女上班族
+"""👩‍💼"""
+人类科学家: str  # 人类科学家
+"""👨‍🔬"""
+女科学家: str  # 女科学家
+"""👩‍🔬"""
+人工技术专家: str  # 人工技术专家
+"""👨‍💻"""
+女技师: str  # 女技师
+"""👩‍💻"""
+男歌手: str  # 男歌手
+"""👨‍🎤"""
+女歌手: str  # 女歌手
+"""👩‍🎤"""
+男性艺术家: str  # 男性艺术家
+"""👨‍🎨"""
+女艺术家: str  # 女艺术家
+"""👩‍🎨"""
+男飞行员: str  # 男飞行员
+"""👨‍✈️"""
+女飞行员: str  # 女飞行员
+"""👩‍✈️"""
+人航天员: str  # 人航天员
+"""👨‍🚀"""
+女宇航员: str  # 女宇航员
+"""👩‍🚀"""
+男子消防队员: str  # 男子消防队员
+"""👨‍🚒"""
+女消防员: str  # 女消防员
+"""👩‍🚒"""
+警官: str  # 警官
+"""👮"""
+男警官: str  # 男警官
+"""👮‍♂️"""
+女警官: str  # 女警官
+"""👮‍♀️"""
+侦探: str  # 侦探
+"""🕵"""
+男侦探: str  # 男侦探
+"""🕵️‍♂️"""
+女侦探: str  # 女侦探
+"""🕵️‍♀️"""
+警卫: str  # 警卫
+"""💂"""
+男子守卫: str  # 男子守卫
+"""💂‍♂️"""
+女警卫: str  # 女警卫
+"""💂‍♀️"""
+建筑工人: str  # 建筑工人
+"""👷"""
+施工员: str  # 施工员
+"""👷‍♂️"""
+女建筑工人: str  # 女建筑工人
+"""👷‍♀️"""
+王子: str  # 王子
+"""🤴"""
+公主: str  # 公主
+"""👸"""
+戴头巾的人: str  # 戴头巾的人
+"""👳"""
+戴头巾的男人: str  # 戴头巾的男人
+"""👳‍♂️"""
+女人戴着头巾: str  # 女人戴着头巾
+"""👳‍♀️"""
+戴中国帽子的男人: str  # 戴中国帽子的男人
+"""👲"""
+头巾的女人: str  # 头巾的女人
+"""🧕"""
+礼服男: str  # 礼服男
+"""🤵"""
+戴面纱的新娘: str  # 戴面纱的新娘
+"""👰"""
+孕妇: str  # 孕妇
+"""🤰"""
+母乳喂养: str  # 母乳喂养
+"""🤱"""
+宝贝天使: str  # 宝贝天使
+"""👼"""
+圣诞老人: str  # 圣诞老人
+"""🎅"""
+克劳斯夫人: str  # 克劳斯夫人
+"""🤶"""
+超级英雄: str  # 超级英雄
+"""🦸"""
+超人英雄: str  # 超人英雄
+"""🦸‍♂️"""
+女超级英雄: str  # 女超级英雄
+"""🦸‍♀️"""
+超级恶棍: str  # 超级恶棍
+"""🦹"""
+人类超级恶棍: str  # 人类超级恶棍
+"""🦹‍♂️"""
+女超人: str  # 女超人
+"""🦹‍♀️"""
+魔术师: str  # 魔术师
+"""🧙"""
+男子法师: str  # 男子法师
+"""🧙‍♂️"""
+女法师: str  # 女法师
+"""🧙‍♀️"""
+仙女: str  # 仙女
+"""🧚"""
+男人仙女: str  # 男人仙女
+"""🧚‍♂️"""
+女仙女: str  # 女仙女
+"""🧚‍♀️"""
+吸血鬼: str  # 吸血鬼
+"""🧛"""
+人吸血鬼: str  # 人吸血鬼
+"""🧛‍♂️"""
+女吸血鬼: str  # 女吸血鬼
+"""🧛‍♀️"""
+merperson: str  # merperson
+"""🧜"""
+人鱼: str  # 人鱼
+"""🧜‍♂️"""
+美人鱼: str  # 美人鱼
+"""🧜‍♀️"""
+精灵: str  # 精灵
+"""🧝"""
+人精灵: str  # 人精灵
+"""🧝‍♂️"""
+女妖: str  # 女妖
+"""🧝‍♀️"""
+妖怪: str  # 妖怪
+"""🧞"""
+人妖怪: str  # 人妖怪
+"""🧞‍♂️"""
+女妖怪: str  # 女妖怪
+"""🧞‍♀️"""
+僵尸: str  # 僵尸
+"""🧟"""
+男人僵尸: str  # 男人僵尸
+"""🧟‍♂️"""
+女人僵尸: str  # 女人僵尸
+"""🧟‍♀️"""
+按摩的人: str  # 按摩的人
+"""💆"""
+男人在按摩: str  # 男人在按摩
+"""💆‍♂️"""
+按摩的女人: str  # 按摩的女人
+"""💆‍♀️"""
+理发师: str  # 理发师
+"""💇"""
+男人理发: str  # 男人理发
+"""💇‍♂️"""
+理发的女人: str  # 理发的女人
+"""💇‍♀️"""
+走路的人: str  # 走路的人
+"""🚶"""
+男人走路: str  # 男人走路
+"""🚶‍♂️"""
+女人走路: str  # 女人走路
+"""🚶‍♀️"""
+站人: str  # 站人
+"""🧍"""
+男子站立: str  # 男子站立
+"""🧍‍♂️"""
+站着的女人: str  # 站着的女人
+"""🧍‍♀️"""
+跪人: str  # 跪人
+"""🧎"""
+跪跪: str  # 跪跪
+"""🧎‍♂️"""
+跪着的女人: str  # 跪着的女人
+"""🧎‍♀️"""
+有探测杖的人: str  # 有探测杖的人
+"""👨‍🦯"""
+有探测杖的女人: str  # 有探测杖的女人
+"""👩‍🦯"""
+坐机动轮椅的人: str  # 坐机动轮椅的人
+"""👨‍🦼"""
+坐机动轮椅的女人: str  # 坐机动轮椅的女人
+"""👩‍🦼"""
+坐手动轮椅的人: str  # 坐手动轮椅的人
+"""👨‍🦽"""
+坐手动轮椅的女人: str  # 坐手动轮椅的女人
+"""👩‍🦽"""
+人跑: str  # 人跑
+"""🏃"""
+男子跑步: str  # 男子跑步
+"""🏃‍♂️"""
+女子跑步: str  # 女子跑步
+"""🏃‍♀️"""
+女子舞蹈: str  # 女子舞蹈
+"""💃"""
+男人跳舞: str  # 男人跳舞
+"""🕺"""
+穿西装的人在空中飘浮: str  # 穿西装的人在空中飘浮
+"""🕴"""
+有兔子耳朵的人: str  # 有兔子耳朵的人
+"""👯"""
+有兔子耳朵的男人: str  # 有兔子耳朵的男人
+"""👯‍♂️"""
+有兔子耳朵的女人: str  # 有兔子耳朵的女人
+"""👯‍♀️"""
+在潮湿的房间里的人: str  # 在潮湿的房间里的人
+"""🧖"""
+在潮湿的房间里的男人: str  # 在潮湿的房间里的男人
+"""🧖‍♂️"""
+蒸汽房的女人: str  # 蒸汽房的女人
+"""🧖‍♀️"""
+攀登者: str  # 攀登者
+"""🧗"""
+爬人: str  # 爬人
+"""🧗‍♂️"""
+女子攀岩: str  # 女子攀岩
+"""🧗‍♀️"""
+击剑运动员: str  # 击剑运动员
+"""🤺"""
+赛马: str  # 赛马
+"""🏇"""
+滑雪者: str  # 滑雪者
+"""⛷"""
+滑雪板: str  # 滑雪板
+"""🏂"""
+个人打高尔夫球: str  # 个人打高尔夫球
+"""🏌"""
+男子高尔夫球: str  # 男子高尔夫球
+"""🏌️‍♂️"""
+女子高尔夫球: str  # 女子高尔夫球
+"""🏌️‍♀️"""
+人冲浪: str  # 人冲浪
+"""🏄"""
+男子冲浪: str  # 男子冲浪
+"""🏄‍♂️"""
+女人冲浪: str  # 女人冲浪
+"""🏄‍♀️"""
+划船人: str  # 划船人
+"""🚣"""
+人划艇: str  # 人划艇
+"""🚣‍♂️"""
+女子划艇: str  # 女子划艇
+"""🚣‍♀️"""
+人游泳: str  # 人游泳
+"""🏊"""
+男子游泳: str  # 男子游泳
+"""🏊‍♂️"""
+女子游泳: str  # 女子游泳
+"""🏊‍♀️"""
+弹跳球的人: str  # 弹跳球的人
+"""⛹"""
+男子跳球: str  # 男子跳球
+"""⛹️‍♂️"""
+女子跳球: str  # 女子跳球
+"""⛹️‍♀️"""
+举重人员: str  # 举重人员
+"""🏋"""
+人力举重: str  # 人力举重
+"""🏋️‍♂️"""
+女子举重: str  # 女子举重
+"""🏋️‍♀️"""
+骑自行车的人: str  # 骑自行车的人
+"""🚴"""
+骑自行车的男人: str  # 骑自行车的男人
+"""🚴‍♂️"""
+女子自行车: str  # 女子自行车
+"""🚴‍♀️"""
+山地自行车: str  # 山地自行车
+"""🚵"""
+曼山自行车: str  # 曼山自行车
+"""🚵‍♂️"""
+女子山地自行车: str  # 女子山地自行车
+"""🚵‍♀️"""
+人推车: str  # 人推车
+"""🤸"""
+手推车: str  # 手推车
+"""🤸‍♂️"""
+妇女手推车: str  # 妇女手推车
+"""🤸‍♀️"""
+人们摔跤: str  # 人们摔跤
+"""🤼"""
+男子摔跤: str  # 男子摔跤
+"""🤼‍♂️"""
+女子摔跤: str  # 女子摔跤
+"""🤼‍♀️"""
+水球运动员: str  # 水球运动员
+"""🤽"""
+男子水球: str  # 男子水球
+"""🤽‍♂️"""
+玩水球的女人: str  # 玩水球的女人
+"""🤽‍♀️"""
+打手球的人: str  # 打手球的人
+"""🤾"""
+男子玩手球: str  # 男子玩手球
+"""🤾‍♂️"""
+打手球的女人: str  # 打手球的女人
+"""🤾‍♀️"""
+人物杂耍: str  # 人物杂耍
+"""🤹"""
+男人杂耍: str  # 男人杂耍
+"""🤹‍♂️"""
+女人杂耍: str  # 女人杂耍
+"""🤹‍♀️"""
+莲花位: str  # 莲花位
+"""🧘"""
+莲花位男子: str  # 莲花位男子
+"""🧘‍♂️"""
+莲花位女子: str  # 莲花位女子
+"""🧘‍♀️"""
+洗澡的人: str  # 洗澡的人
+"""🛀"""
+躺在床上的人: str  # 躺在床上的人
+"""🛌"""
+女人牵着手: str  # 女人牵着手
+"""👭"""
+女人和男人牵着手: str  # 女人和男人牵着手
+"""👫"""
+手牵着手的男人: str  # 手牵着手的男人
+"""👬"""
+吻: str  # 吻
+"""💏"""
+有爱心的情侣: str  # 有爱心的情侣
+"""💑"""
+家庭: str  # 家庭
+"""👪"""
+说话的头: str  # 说话的头
+"""🗣"""
+半身像: str  # 半身像
+"""👤"""
+多个半身像: str  # 多个半身像
+"""👥"""
+足迹: str  # 足迹
+"""👣"""
+红发: str  # 红发
+"""🦰"""
+卷发: str  # 卷发
+"""🦱"""
+白发: str  # 白发
+"""🦳"""
+秃顶: str  # 秃顶
+"""🦲"""
+猴脸: str  # 猴脸
+"""🐵"""
+猴子: str  # 猴子
+"""🐒"""
+大猩猩: str  # 大猩猩
+"""🦍"""
+狗脸: str  # 狗脸
+"""🐶"""
+狗: str  # 狗
+"""🐕"""
+导盲犬: str  # 导盲犬
+"""🦮"""
+服务犬: str  # 服务犬
+"""🐕‍🦺"""
+贵宾犬: str  # 贵宾犬
+"""🐩"""
+狼: str  # 狼
+"""🐺"""
+狐狸: str  # 狐狸
+"""🦊"""
+浣熊: str  # 浣熊
+"""🦝"""
+猫脸: str  # 猫脸
+"""🐱"""
+猫: str  # 猫
+"""🐈"""
+狮子: str  # 狮子
+"""🦁"""
+虎面: str  # 虎面
+"""🐯"""
+老虎: str  # 老虎
+"""🐅"""
+豹: str  # 豹
+"""🐆"""
+马面: str  # 马面
+"""🐴"""
+马: str  # 马
+"""🐎"""
+独角兽: str  # 独角兽
+"""🦄"""
+斑马: str  # 斑马
+"""🦓"""
+鹿: str  # 鹿
+"""🦌"""
+牛脸: str  # 牛脸
+"""🐮"""
+公牛: str  # 公牛
+"""🐂"""
+水牛: str  # 水牛
+"""🐃"""
+奶牛: str  # 奶牛
+"""🐄"""
+猪脸: str  # 猪脸
+"""🐷"""
+猪: str  # 猪
+"""🐖"""
+野猪: str  # 野猪
+"""🐗"""
+猪鼻: str  # 猪鼻
+"""🐽"""
+猛撞: str  # 猛撞
+"""🐏"""
+母羊: str  # 母羊
+"""🐑"""
+山羊: str  # 山羊
+"""🐐"""
+骆驼: str  # 骆驼
+"""🐪"""
+双驼峰骆驼: str  # 双驼峰骆驼
+"""🐫"""
+美洲驼: str  # 美洲驼
+"""🦙"""
+长颈鹿: str  # 长颈鹿
+"""🦒"""
+大象: str  # 大象
+"""🐘"""
+犀牛: str  # 犀牛
+"""🦏"""
+河马: str  # 河马
+"""🦛"""
+鼠标面: str  # 鼠标面
+"""🐭"""
+鼠标: str  # 鼠标
+"""🐁"""
+老鼠: str  # 老鼠
+"""🐀"""
+仓鼠: str  # 仓鼠
+"""🐹"""
+兔脸: str  # 兔脸
+"""🐰"""
+兔子: str  # 兔子
+"""🐇"""
+花栗鼠: str  # 花栗鼠
+"""🐿"""
+刺猬: str  # 刺猬
+"""🦔"""
+蝙蝠: str  # 蝙蝠
+"""🦇"""
+熊: str  # 熊
+"""🐻"""
+考拉: str  # 考拉
+"""🐨"""
+熊猫: str  # 熊猫
+"""🐼"""
+树獭: str  # 树獭
+"""🦥"""
+水獭: str  # 水獭
+"""🦦"""
+猩猩: str  # 猩猩
+"""🦧"""
+臭鼬: str  # 臭鼬
+"""🦨"""
+袋鼠: str  # 袋鼠
+"""🦘"""
+獾: str  # 獾
+"""🦡"""
+爪印: str  # 爪印
+"""🐾"""
+火鸡: str  # 火鸡
+"""🦃"""
+鸡: str  # 鸡
+"""🐔"""
+公鸡: str  # 公鸡
+"""🐓"""
+孵蛋雏鸡: str  # 孵蛋雏鸡
+"""🐣"""
+小鸡: str  # 小鸡
+"""🐤"""
+正面小雏鸡: str  # 正面小雏鸡
+"""🐥"""
+鸟: str  # 鸟
+"""🐦"""
+企鹅: str  # 企鹅
+"""🐧"""
+鸽子: str  # 鸽子
+"""🕊"""
+鹰: str  # 鹰
+"""🦅"""
+鸭子: str  # 鸭子
+"""🦆"""
+天鹅: str  # 天鹅
+"""🦢"""
+猫头鹰: str  # 猫头鹰
+"""🦉"""
+火烈鸟: str  # 火烈鸟
+"""🦩"""
+孔雀: str  # 孔雀
+"""🦚"""
+鹦鹉: str  # 鹦鹉
+"""🦜"""
+青蛙: str  # 青蛙
+"""🐸"""
+鳄鱼: str  # 鳄鱼
+"""🐊"""
+乌龟: str  # 乌龟
+"""🐢"""
+蜥蜴: str  # 蜥蜴
+"""🦎"""
+蛇: str  # 蛇
+"""🐍"""
+龙脸: str  # 龙脸
+"""🐲"""
+龙: str  # 龙
+"""🐉"""
+蜥脚类: str  # 蜥脚类
+"""🦕"""
+喷鲸: str  # 喷鲸
+"""🐳"""
+鲸鱼: str  # 鲸鱼
+"""🐋"""
+海豚: str  # 海豚
+"""🐬"""
+鱼: str  # 鱼
+"""🐟"""
+热带鱼: str  # 热带鱼
+"""🐠"""
+河豚: str  # 河豚
+"""🐡"""
+鲨鱼: str  # 鲨鱼
+"""🦈"""
+章鱼: str  # 章鱼
+"""🐙"""
+螺旋壳: str  # 螺旋壳
+"""🐚"""
+蜗牛: str  # 蜗牛
+"""🐌"""
+蝴蝶: str  # 蝴蝶
+"""🦋"""
+缺陷: str  # 缺陷
+"""🐛"""
+蚂蚁: str  # 蚂蚁
+"""🐜"""
+蜜蜂: str  # 蜜蜂
+"""🐝"""
+瓢虫: str  # 瓢虫
+"""🐞"""
+板球: str  # 板球
+"""🦗"""
+蜘蛛: str  # 蜘蛛
+"""🕷"""
+蜘蛛网: str  # 蜘蛛网
+"""🕸"""
+蝎子: str  # 蝎子
+"""🦂"""
+蚊子: str  # 蚊子
+"""🦟"""
+微生物: str  # 微生物
+"""🦠"""
+花束: str  # 花束
+"""💐"""
+樱花: str  # 樱花
+"""🌸"""
+白花: str  # 白花
+"""💮"""
+玫瑰花结: str  # 玫瑰花结
+"""🏵"""
+玫瑰: str  # 玫瑰
+"""🌹"""
+枯萎花: str  # 枯萎花
+"""🥀"""
+木槿: str  # 木槿
+"""🌺"""
+向日葵: str  # 向日葵
+"""🌻"""
+开花: str  # 开花
+"""🌼"""
+郁金香: str  # 郁金香
+"""🌷"""
+秧苗: str  # 秧苗
+"""🌱"""
+常绿乔木: str  # 常绿乔木
+"""🌲"""
+落叶树: str  # 落叶树
+"""🌳"""
+棕榈树: str  # 棕榈树
+"""🌴"""
+仙人掌: str  # 仙人掌
+"""🌵"""
+水稻捆: str  # 水稻捆
+"""🌾"""
+草本植物: str  # 草本植物
+"""🌿"""
+三叶草: str  # 三叶草
+"""☘"""
+四叶草: str  # 四叶草
+"""🍀"""
+枫叶: str  # 枫叶
+"""🍁"""
+落叶: str  # 落叶
+"""🍂"""
+树叶在风中飘动: str  # 树叶在风中飘动
+"""🍃"""
+葡萄: str  # 葡萄
+"""🍇"""
+甜瓜: str  # 甜瓜
+"""🍈"""
+西瓜: str  # 西瓜
+"""🍉"""
+Tangerine夜店: str  # Tangerine夜店
+"""🍊"""
+柠檬: str  # 柠檬
+"""🍋"""
+香蕉: str  # 香蕉
+"""🍌"""
+菠萝: str  # 菠萝
+"""🍍"""
+芒果: str  # 芒果
+"""🥭"""
+红苹果: str  # 红苹果
+"""🍎"""
+青苹果: str  # 青苹果
+"""🍏"""
+梨: str  # 梨
+"""🍐"""
+桃: str  # 桃
+"""🍑"""
+樱桃: str  # 樱桃
+"""🍒"""
+草莓: str  # 草莓
+"""🍓"""
+猕猴桃: str  # 猕猴桃
+"""🥝"""
+番茄: str  # 番茄
+"""🍅"""
+椰子: str  # 椰子
+"""🥥"""
+鳄梨: str  # 鳄梨
+"""🥑"""
+茄子: str  # 茄子
+"""🍆"""
+马铃薯: str  # 马铃薯
+"""🥔"""
+胡萝卜: str  # 胡萝卜
+"""🥕"""
+玉米穗: str  # 玉米穗
+"""🌽"""
+辣椒: str  # 辣椒
+"""🌶"""
+黄瓜: str  # 黄瓜
+"""🥒"""
+叶绿: str  # 叶绿
+"""🥬"""
+西兰花: str  # 西兰花
+"""🥦"""
+大蒜: str  # 大蒜
+"""🧄"""
+洋葱: str  # 洋葱
+"""🧅"""
+蘑菇: str  # 蘑菇
+"""🍄"""
+花生: str  # 花生
+"""🥜"""
+板栗: str  # 板栗
+"""🌰"""
+面包: str  # 面包
+"""🍞"""
+羊角面包: str  # 羊角面包
+"""🥐"""
+面包面包: str  # 面包面包
+"""🥖"""
+椒盐脆饼: str  # 椒盐脆饼
+"""🥨"""
+百吉饼: str  # 百吉饼
+"""🥯"""
+烙饼: str  # 烙饼
+"""🥞"""
+华夫饼干: str  # 华夫饼干
+"""🧇"""
+奶酪楔: str  # 奶酪楔
+"""🧀"""
+骨上肉: str  # 骨上肉
+"""🍖"""
+鸡腿: str  # 鸡腿
+"""🍗"""
+肉切肉: str  # 肉切肉
+"""🥩"""
+熏肉: str  # 熏肉
+"""🥓"""
+汉堡包: str  # 汉堡包
+"""🍔"""
+炸薯条: str  # 炸薯条
+"""🍟"""
+披萨: str  # 披萨
+"""🍕"""
+热狗: str  # 热狗
+"""🌭"""
+三明治: str  # 三明治
+"""🥪"""
+墨西哥玉米薄饼卷: str  # 墨西哥玉米薄饼卷
+"""🌮"""
+墨西哥煎饼: str  # 墨西哥煎饼
+"""🌯"""
+夹心面包: str  # 夹心面包
+"""🥙"""
+法拉菲尔: str  # 法拉菲尔
+"""🧆"""
+鸡蛋: str  # 鸡蛋
+"""🥚"""
+烹饪: str  # 烹饪
+"""🍳"""
+浅盘食物: str  # 浅盘食物
+"""🥘"""
+一罐食物: str  # 一罐食物
+"""🍲"""
+汤匙碗: str  # 汤匙碗
+"""🥣"""
+绿色沙拉: str  # 绿色沙拉
+"""🥗"""
+爆米花: str  # 爆米花
+"""🍿"""
+黄油: str  # 黄油
+"""🧈"""
+盐: str  # 盐
+"""🧂"""
+罐头食品: str  # 罐头食品
+"""🥫"""
+便当盒: str  # 便当盒
+"""🍱"""
+碾米机: str  # 碾米机
+"""🍘"""
+米球: str  # 米球
+"""🍙"""
+米饭: str  # 米饭
+"""🍚"""
+咖喱饭: str  # 咖喱饭
+"""🍛"""
+蒸碗: str  # 蒸碗
+"""🍜"""
+意大利面条: str  # 意大利面条
+"""🍝"""
+烤红薯: str  # 烤红薯
+"""🍠"""
+奥登: str  # 奥登
+"""🍢"""
+寿司: str  # 寿司
+"""🍣"""
+炸虾仁: str  # 炸虾仁
+"""🍤"""
+漩涡鱼糕: str  # 漩涡鱼糕
+"""🍥"""
+月饼: str  # 月饼
+"""🥮"""
+丹戈: str  # 丹戈
+"""🍡"""
+饺子: str  # 饺子
+"""🥟"""
+幸运饼干: str  # 幸运饼干
+"""🥠"""
+取出盒: str  # 取出盒
+"""🥡"""
+蟹: str  # 蟹
+"""🦀"""
+龙虾: str  # 龙虾
+"""🦞"""
+虾: str  # 虾
+"""🦐"""
+鱿鱼: str  # 鱿鱼
+"""🦑"""
+牡蛎: str  # 牡蛎
+"""🦪"""
+软冰淇淋: str  # 软冰淇淋
+"""🍦"""
+刨冰: str  # 刨冰
+"""🍧"""
+冰淇淋: str  # 冰淇淋
+"""🍨"""
+油炸圈饼: str  # 油炸圈饼
+"""🍩"""
+曲奇饼干: str  # 曲奇饼干
+"""🍪"""
+生日蛋糕: str  # 生日蛋糕
+"""🎂"""
+酥饼: str  # 酥饼
+"""🍰"""
+纸杯蛋糕: str  # 纸杯蛋糕
+"""🧁"""
+馅饼: str  # 馅饼
+"""🥧"""
+巧克力棒: str  # 巧克力棒
+"""🍫"""
+糖果: str  # 糖果
+"""🍬"""
+棒棒糖: str  # 棒棒糖
+"""🍭"""
+奶油冻: str  # 奶油冻
+"""🍮"""
+蜜罐: str  # 蜜罐
+"""🍯"""
+奶瓶: str  # 奶瓶
+"""🍼"""
+一杯牛奶: str  # 一杯牛奶
+"""🥛"""
+热饮: str  # 热饮
+"""☕"""
+无柄茶杯: str  # 无柄茶杯
+"""🍵"""
+目的: str  # 目的
+"""🍶"""
+带弹出软木塞的瓶子: str  # 带弹出软木塞的瓶子
+"""🍾"""
+酒杯: str  # 酒杯
+"""🍷"""
+鸡尾酒杯: str  # 鸡尾酒杯
+"""🍸"""
+热带饮料: str  # 热带饮料
+"""🍹"""
+啤酒杯: str  # 啤酒杯
+"""🍺"""
+叮当作响的啤酒杯: str  # 叮当作响的啤酒杯
+"""🍻"""
+碰杯: str  # 碰杯
+"""🥂"""
+平底杯: str  # 平底杯
+"""🥃"""
+吸管杯: str  # 吸管杯
+"""🥤"""
+饮料盒: str  # 饮料盒
+"""🧃"""
+伙伴: str  # 伙伴
+"""🧉"""
+冰块: str  # 冰块
+"""🧊"""
+筷子: str  # 筷子
+"""🥢"""
+带盘叉刀: str  # 带盘叉刀
+"""🍽"""
+刀叉: str  # 刀叉
+"""🍴"""
+勺子: str  # 勺子
+"""🥄"""
+厨刀: str  # 厨刀
+"""🔪"""
+菊花: str  # 菊花
+"""🏺"""
+环球展示美洲: str  # 环球展示美洲
+"""🌎"""
+经络地球仪: str  # 经络地球仪
+"""🌐"""
+世界地图: str  # 世界地图
+"""🗺"""
+日本地图: str  # 日本地图
+"""🗾"""
+罗盘: str  # 罗盘
+"""🧭"""
+雪山: str  # 雪山
+"""🏔"""
+山: str  # 山
+"""⛰"""
+火山: str  # 火山
+"""🌋"""
+富士山: str  # 富士山
+"""🗻"""
+露营: str  # 露营
+"""🏕"""
+带伞的海滩: str  # 带伞的海滩
+"""🏖"""
+沙漠: str  # 沙漠
+"""🏜"""
+荒岛: str  # 荒岛
+"""🏝"""
+国家公园: str  # 国家公园
+"""🏞"""
+体育场: str  # 体育场
+"""🏟"""
+古典建筑: str  # 古典建筑
+"""🏛"""
+建筑施工: str  # 建筑施工
+"""🏗"""
+砖: str  # 砖
+"""🧱"""
+房屋: str  # 房屋
+"""🏘"""
+废弃房屋: str  # 废弃房屋
+"""🏚"""
+房子: str  # 房子
+"""🏠"""
+带花园的房子: str  # 带花园的房子
+"""🏡"""
+办公楼: str  # 办公楼
+"""🏢"""
+日本邮局: str  # 日本邮局
+"""🏣"""
+邮局: str  # 邮局
+"""🏤"""
+医院: str  # 医院
+"""🏥"""
+银行: str  # 银行
+"""🏦"""
+酒店: str  # 酒店
+"""🏨"""
+爱酒店: str  # 爱酒店
+"""🏩"""
+便利店: str  # 便利店
+"""🏪"""
+学校: str  # 学校
+"""🏫"""
+百货公司: str  # 百货公司
+"""🏬"""
+工厂: str  # 工厂
+"""🏭"""
+日本城堡: str  # 日本城堡
+"""🏯"""
+城堡: str  # 城堡
+"""🏰"""
+婚礼: str  # 婚礼
+"""💒"""
+东京塔: str  # 东京塔
+"""🗼"""
+自由女神像: str  # 自由女神像
+"""🗽"""
+教堂: str  # 教堂
+"""⛪"""
+清真寺: str  # 清真寺
+"""🕌"""
+印度教寺庙: str  # 印度教寺庙
+"""🛕"""
+犹太会堂: str  # 犹太会堂
+"""🕍"""
+神社: str  # 神社
+"""⛩"""
+卡巴: str  # 卡巴
+"""🕋"""
+喷泉: str  # 喷泉
+"""⛲"""
+帐篷: str  # 帐篷
+"""⛺"""
+多雾的: str  # 多雾的
+"""🌁"""
+星星之夜: str  # 星星之夜
+"""🌃"""
+城市风貌: str  # 城市风貌
+"""🏙"""
+山上日出: str  # 山上日出
+"""🌄"""
+日出: str  # 日出
+"""🌅"""
+黄昏时的城市景色: str  # 黄昏时的城市景色
+"""🌆"""
+日落: str  # 日落
+"""🌇"""
+夜桥: str  # 夜桥
+"""🌉"""
+温泉: str  # 温泉
+"""♨"""
+银河系: str  # 银河系
+"""🌌"""
+旋转木马: str  # 旋转木马
+"""🎠"""
+费里斯轮: str  # 费里斯轮
+"""🎡"""
+过山车: str  # 过山车
+"""🎢"""
+理发竿: str  # 理发竿
+"""💈"""
+马戏团帐篷: str  # 马戏团帐篷
+"""🎪"""
+机车: str  # 机车
+"""🚂"""
+铁道车辆: str  # 铁道车辆
+"""🚃"""
+高速列车: str  # 高速列车
+"""🚄"""
+子弹头列车: str  # 子弹头列车
+"""🚅"""
+火车: str  # 火车
+"""🚆"""
+地铁: str  # 地铁
+"""🚇"""
+轻轨: str  # 轻轨
+"""🚈"""
+站: str  # 站
+"""🚉"""
+电车: str  # 电车
+"""🚊"""
+单轨铁路: str  # 单轨铁路
+"""🚝"""
+山区铁路: str  # 山区铁路
+"""🚞"""
+电车车: str  # 电车车
+"""🚋"""
+公共汽车: str  # 公共汽车
+"""🚌"""
+迎面驶来的公共汽车: str  # 迎面驶来的公共汽车
+"""🚍"""
+无轨电车: str  # 无轨电车
+"""🚎"""
+微型客车: str  # 微型客车
+"""🚐"""
+救护车: str  # 救护车
+"""🚑"""
+消防车: str  # 消防车
+"""🚒"""
+警车: str  # 警车
+"""🚓"""
+迎面而来的警车: str  # 迎面而来的警车
+"""🚔"""
+出租车: str  # 出租车
+"""🚕"""
+迎面来的出租车: str  # 迎面来的出租车
+"""🚖"""
+汽车: str  # 汽车
+"""🚗"""
+迎面而来的汽车: str  # 迎面而来的汽车
+"""🚘"""
+运动型多用途车: str  # 运动型多用途车
+"""🚙"""
+送货车: str  # 送货车
+"""🚚"""
+铰接式货车: str  # 铰接式货车
+"""🚛"""
+拖拉机: str  # 拖拉机
+"""🚜"""
+赛车: str  # 赛车
+"""🏎"""
+摩托车: str  # 摩托车
+"""🏍"""
+电动滑板车: str  # 电动滑板车
+"""🛵"""
+手动轮椅: str  # 手动轮椅
+"""🦽"""
+机动轮椅: str  # 机动轮椅
+"""🦼"""
+自动人力车: str  # 自动人力车
+"""🛺"""
+自行车: str  # 自行车
+"""🚲"""
+踢踏板车: str  # 踢踏板车
+"""🛴"""
+滑板: str  # 滑板
+"""🛹"""
+公交站: str  # 公交站
+"""🚏"""
+高速公路: str  # 高速公路
+"""🛣"""
+铁路轨道: str  # 铁路轨道
+"""🛤"""
+油桶: str  # 油桶
+"""🛢"""
+燃油泵: str  # 燃油泵
+"""⛽"""
+警车灯: str  # 警车灯
+"""🚨"""
+水平交通灯: str  # 水平交通灯
+"""🚥"""
+垂直交通灯: str  # 垂直交通灯
+"""🚦"""
+停车标志: str  # 停车标志
+"""🛑"""
+建设: str  # 建设
+"""🚧"""
+锚: str  # 锚
+"""⚓"""
+帆船: str  # 帆船
+"""⛵"""
+独木舟: str  # 独木舟
+"""🛶"""
+快艇: str  # 快艇
+"""🚤"""
+客船: str  # 客船
+"""🛳"""
+渡船: str  # 渡船
+"""⛴"""
+摩托艇: str  # 摩托艇
+"""🛥"""
+船: str  # 船
+"""🚢"""
+飞机: str  # 飞机
+"""✈"""
+小型飞机: str  # 小型飞机
+"""🛩"""
+飞机起飞: str  # 飞机起飞
+"""🛫"""
+飞机抵达: str  # 飞机抵达
+"""🛬"""
+降落伞: str  # 降落伞
+"""🪂"""
+座位: str  # 座位
+"""💺"""
+直升机: str  # 直升机
+"""🚁"""
+悬空铁路: str  # 悬空铁路
+"""🚟"""
+山地索道: str  # 山地索道
+"""🚠"""
+架空索道: str  # 架空索道
+"""🚡"""
+卫星: str  # 卫星
+"""🛰"""
+火箭: str  # 火箭
+"""🚀"""
+飞碟: str  # 飞碟
+"""🛸"""
+贝尔钟: str  # 贝尔钟
+"""🛎"""
+行李: str  # 行李
+"""🧳"""
+沙漏完成: str  # 沙漏完成
+"""⌛"""
+沙漏未完成: str  # 沙漏未完成
+"""⏳"""
+看: str  # 看
+"""⌚"""
+闹钟: str  # 闹钟
+"""⏰"""
+秒表: str  # 秒表
+"""⏱"""
+定时器时钟: str  # 定时器时钟
+"""⏲"""
+壁炉架时钟: str  # 壁炉架时钟
+"""🕰"""
+十二点: str  # 十二点
+"""🕛"""
+十二点三十: str  # 十二点三十
+"""🕧"""
+一点: str  # 一点
+"""🕐"""
+一点三十: str  # 一点三十
+"""🕜"""
+二点: str  # 二点
+"""🕑"""
+二点三十: str  # 二点三十
+"""🕝"""
+三点: str  # 三点
+"""🕒"""
+三点三十: str  # 三点三十
+"""🕞"""
+四点: str  # 四点
+"""🕓"""
+四点三十: str  # 四点三十
+"""🕟"""
+五点: str  # 五点
+"""🕔"""
+五点三十: str  # 五点三十
+"""🕠"""
+六点: str  # 六点
+"""🕕"""
+六点三十: str  # 六点三十
+"""🕡"""
+七点: str  # 七点
+"""🕖"""
+七点三十: str  # 七点三十
+"""🕢"""
+八点: str  # 八点
+"""🕗"""
+八点三十: str  # 八点三十
+"""🕣"""
+九点: str  # 九点
+"""🕘"""
+九点三十: str  # 九点三十
+"""🕤"""
+十点: str  # 十点
+"""🕙"""
+十点三十: str  # 十点三十
+"""🕥"""
+十一点: str  # 十一点
+"""🕚"""
+十一点三十: str  # 十一点三十
+"""🕦"""
+新月: str  # 新月
+"""🌑"""
+娥眉月: str  # 娥眉月
+"""🌒"""
+第一季月球: str  # 第一季月球
+"""🌓"""
+上蜡的凸月: str  # 上蜡的凸月
+"""🌔"""
+满月: str  # 满月
+"""🌕"""
+月亮渐渐消失: str  # 月亮渐渐消失
+"""🌖"""
+最后四分之一的月亮: str  # 最后四分之一的月亮
+"""🌗"""
+月牙渐渐消失: str  # 月牙渐渐消失
+"""🌘"""
+新的月: str  # 新的月
+"""🌙"""
+新月面: str  # 新月面
+"""🌚"""
+第一季月面: str  # 第一季月面
+"""🌛"""
+最后四分之一的月面: str  # 最后四分之一的月面
+"""🌜"""
+温度计: str  # 温度计
+"""🌡"""
+太阳: str  # 太阳
+"""☀"""
+满月脸: str  # 满月脸
+"""🌝"""
+有脸的太阳: str  # 有脸的太阳
+"""🌞"""
+环状行星: str  # 环状行星
+"""🪐"""
+明星: str  # 明星
+"""⭐"""
+发光星: str  # 发光星
+"""🌟"""
+流星: str  # 流星
+"""🌠"""
+云: str  # 云
+"""☁"""
+云后太阳: str  # 云后太阳
+"""⛅"""
+闪电雨云: str  # 闪电雨云
+"""⛈"""
+小云后的太阳: str  # 小云后的太阳
+"""🌤"""
+大云后的太阳: str  # 大云后的太阳
+"""🌥"""
+雨云背后的太阳: str  # 雨云背后的太阳
+"""🌦"""
+雨云: str  # 雨云
+"""🌧"""
+雪与云: str  # 雪与云
+"""🌨"""
+闪电云: str  # 闪电云
+"""🌩"""
+龙卷风: str  # 龙卷风
+"""🌪"""
+雾: str  # 雾
+"""🌫"""
+风面: str  # 风面
+"""🌬"""
+旋风: str  # 旋风
+"""🌀"""
+彩虹: str  # 彩虹
+"""🌈"""
+闭伞: str  # 闭伞
+"""🌂"""
+雨伞: str  # 雨伞
+"""☂"""
+雨滴伞: str  # 雨滴伞
+"""☔"""
+地上的雨伞: str  # 地上的雨伞
+"""⛱"""
+高电压: str  # 高电压
+"""⚡"""
+雪花: str  # 雪花
+"""❄"""
+雪人: str  # 雪人
+"""☃"""
+没有雪的雪人: str  # 没有雪的雪人
+"""⛄"""
+彗星: str  # 彗星
+"""☄"""
+火: str  # 火
+"""🔥"""
+液滴: str  # 液滴
+"""💧"""
+水波: str  # 水波
+"""🌊"""
+南瓜灯: str  # 南瓜灯
+"""🎃"""
+圣诞树: str  # 圣诞树
+"""🎄"""
+烟花: str  # 烟花
+"""🎆"""
+火花机: str  # 火花机
+"""🎇"""
+爆竹: str  # 爆竹
+"""🧨"""
+火花: str  # 火花
+"""✨"""
+气球: str  # 气球
+"""🎈"""
+波普派对: str  # 波普派对
+"""🎉"""
+纸屑球: str  # 纸屑球
+"""🎊"""
+七夕树: str  # 七夕树
+"""🎋"""
+松木装饰: str  # 松木装饰
+"""🎍"""
+日本娃娃: str  # 日本娃娃
+"""🎎"""
+鲤鱼流光: str  # 鲤鱼流光
+"""🎏"""
+风铃: str  # 风铃
+"""🎐"""
+赏月仪式: str  # 赏月仪式
+"""🎑"""
+红包: str  # 红包
+"""🧧"""
+丝带: str  # 丝带
+"""🎀"""
+包装礼物: str  # 包装礼物
+"""🎁"""
+提醒带: str  # 提醒带
+"""🎗"""
+入场券: str  # 入场券
+"""🎟"""
+票: str  # 票
+"""🎫"""
+军事奖章: str  # 军事奖章
+"""🎖"""
+奖杯: str  # 奖杯
+"""🏆"""
+运动奖章: str  # 运动奖章
+"""🏅"""
+第一位奖章: str  # 第一位奖章
+"""🥇"""
+第二位奖章: str  # 第二位奖章
+"""🥈"""
+第三位奖章: str  # 第三位奖章
+"""🥉"""
+足球: str  # 足球
+"""⚽"""
+棒球运动: str  # 棒球运动
+"""⚾"""
+垒球: str  # 垒球
+"""🥎"""
+篮球: str  # 篮球
+"""🏀"""
+排球: str  # 排球
+"""🏐"""
+美式足球: str  # 美式足球
+"""🏈"""
+橄榄球: str  # 橄榄球
+"""🏉"""
+网球: str  # 网球
+"""🎾"""
+飞盘: str  # 飞盘
+"""🥏"""
+保龄球运动: str  # 保龄球运动
+"""🎳"""
+板球比赛: str  # 板球比赛
+"""🏏"""
+曲棍球: str  # 曲棍球
+"""🏑"""
+冰上曲棍球: str  # 冰上曲棍球
+"""🏒"""
+长曲棍球: str  # 长曲棍球
+"""🥍"""
+乒乓球: str  # 乒乓球
+"""🏓"""
+羽毛球: str  # 羽毛球
+"""🏸"""
+拳击手套: str  # 拳击手套
+"""🥊"""
+武术制服: str  # 武术制服
+"""🥋"""
+球门网: str  # 球门网
+"""🥅"""
+孔旗: str  # 孔旗
+"""⛳"""
+溜冰鞋: str  # 溜冰鞋
+"""⛸"""
+钓鱼竿: str  # 钓鱼竿
+"""🎣"""
+潜水面罩: str  # 潜水面罩
+"""🤿"""
+跑步衫: str  # 跑步衫
+"""🎽"""
+雪板: str  # 雪板
+"""🎿"""
+雪橇: str  # 雪橇
+"""🛷"""
+冰壶石: str  # 冰壶石
+"""🥌"""
+直接命中: str  # 直接命中
+"""🎯"""
+溜溜球: str  # 溜溜球
+"""🪀"""
+风筝: str  # 风筝
+"""🪁"""
+台球8号: str  # 台球8号
+"""🎱"""
+水晶球: str  # 水晶球
+"""🔮"""
+纳扎尔护身符: str  # 纳扎尔护身符
+"""🧿"""
+视频游戏: str  # 视频游戏
+"""🎮"""
+操纵杆: str  # 操纵杆
+"""🕹"""
+老虎机: str  # 老虎机
+"""🎰"""
+游戏骰子: str  # 游戏骰子
+"""🎲"""
+拼图片: str  # 拼图片
+"""🧩"""
+泰迪熊: str  # 泰迪熊
+"""🧸"""
+锹服: str  # 锹服
+"""♠"""
+心服: str  # 心服
+"""♥"""
+钻石套装: str  # 钻石套装
+"""♦"""
+俱乐部套装: str  # 俱乐部套装
+"""♣"""
+棋子: str  # 棋子
+"""♟"""
+小丑: str  # 小丑
+"""🃏"""
+麻将红龙: str  # 麻将红龙
+"""🀄"""
+花牌: str  # 花牌
+"""🎴"""
+表演艺术: str  # 表演艺术
+"""🎭"""
+框架图片: str  # 框架图片
+"""🖼"""
+艺术家调色板: str  # 艺术家调色板
+"""🎨"""
+线: str  # 线
+"""🧵"""
+纱线: str  # 纱线
+"""🧶"""
+玻璃杯: str  # 玻璃杯
+"""👓"""
+太阳镜: str  # 太阳镜
+"""🕶"""
+护目镜: str  # 护目镜
+"""🥽"""
+实验衣: str  # 实验衣
+"""🥼"""
+安全背心: str  # 安全背心
+"""🦺"""
+领带: str  # 领带
+"""👔"""
+T恤衫: str  # T恤衫
+"""👕"""
+牛仔裤: str  # 牛仔裤
+"""👖"""
+围巾: str  # 围巾
+"""🧣"""
+手套: str  # 手套
+"""🧤"""
+外套: str  # 外套
+"""🧥"""
+袜子: str  # 袜子
+"""🧦"""
+连衣裙: str  # 连衣裙
+"""👗"""
+和服: str  # 和服
+"""👘"""
+纱丽: str  # 纱丽
+"""🥻"""
+连体式泳衣: str  # 连体式泳衣
+"""🩱"""
+概要: str  # 概要
+"""🩲"""
+短裤: str  # 短裤
+"""🩳"""
+比基尼: str  # 比基尼
+"""👙"""
+女人的衣服: str  # 女人的衣服
+"""👚"""
+钱包: str  # 钱包
+"""👛"""
+手提包: str  # 手提包
+"""👜"""
+离合器袋: str  # 离合器袋
+"""👝"""
+购物袋: str  # 购物袋
+"""🛍"""
+背包: str  # 背包
+"""🎒"""
+男鞋: str  # 男鞋
+"""👞"""
+跑鞋: str  # 跑鞋
+"""👟"""
+徒步旅行靴: str  # 徒步旅行靴
+"""🥾"""
+扁形鞋: str  # 扁形鞋
+"""🥿"""
+高跟鞋: str  # 高跟鞋
+"""👠"""
+女式凉鞋: str  # 女式凉鞋
+"""👡"""
+芭蕾舞鞋: str  # 芭蕾舞鞋
+"""🩰"""
+女靴: str  # 女靴
+"""👢"""
+王冠: str  # 王冠
+"""👑"""
+女人的帽子: str  # 女人的帽子
+"""👒"""
+顶帽: str  # 顶帽
+"""🎩"""
+毕业帽: str  # 毕业帽
+"""🎓"""
+瓶盖: str  # 瓶盖
+"""🧢"""
+救援人员头盔: str  # 救援人员头盔
+"""⛑"""
+念珠: str  # 念珠
+"""📿"""
+唇膏: str  # 唇膏
+"""💄"""
+戒指: str  # 戒指
+"""💍"""
+宝石: str  # 宝石
+"""💎"""
+静音扬声器: str  # 静音扬声器
+"""🔇"""
+扬声器音量低: str  # 扬声器音量低
+"""🔈"""
+扬声器中等音量: str  # 扬声器中等音量
+"""🔉"""
+扬声器音量大: str  # 扬声器音量大
+"""🔊"""
+扬声器: str  # 扬声器
+"""📢"""
+扩音器: str  # 扩音器
+"""📣"""
+邮政号角: str  # 邮政号角
+"""📯"""
+钟: str  # 钟
+"""🔔"""
+带斜纹的钟: str  # 带斜纹的钟
+"""🔕"""
+乐谱: str  # 乐谱
+"""🎼"""
+音符: str  # 音符
+"""🎵"""
+多音符: str  # 多音符
+"""🎶"""
+录音室麦克风: str  # 录音室麦克风
+"""🎙"""
+水平滑块: str  # 水平滑块
+"""🎚"""
+控制旋钮: str  # 控制旋钮
+"""🎛"""
+麦克风: str  # 麦克风
+"""🎤"""
+头戴式耳机: str  # 头戴式耳机
+"""🎧"""
+收音机: str  # 收音机
+"""📻"""
+萨克斯: str  # 萨克斯
+"""🎷"""
+吉他: str  # 吉他
+"""🎸"""
+音乐键盘: str  # 音乐键盘
+"""🎹"""
+小号: str  # 小号
+"""🎺"""
+小提琴: str  # 小提琴
+"""🎻"""
+班卓琴: str  # 班卓琴
+"""🪕"""
+鼓: str  # 鼓
+"""🥁"""
+移动电话: str  # 移动电话
+"""📱"""
+带箭头的手机: str  # 带箭头的手机
+"""📲"""
+电话: str  # 电话
+"""☎"""
+电话接收机: str  # 电话接收机
+"""📞"""
+寻呼机: str  # 寻呼机
+"""📟"""
+传真机: str  # 传真机
+"""📠"""
+电池: str  # 电池
+"""🔋"""
+电插头: str  # 电插头
+"""🔌"""
+膝上型计算机: str  # 膝上型计算机
+"""💻"""
+台式计算机: str  # 台式计算机
+"""🖥"""
+打印机: str  # 打印机
+"""🖨"""
+键盘: str  # 键盘
+"""⌨"""
+电脑鼠标: str  # 电脑鼠标
+"""🖱"""
+轨迹球: str  # 轨迹球
+"""🖲"""
+计算机磁盘: str  # 计算机磁盘
+"""💽"""
+软盘: str  # 软盘
+"""💾"""
+光盘: str  # 光盘
+"""💿"""
+DVD: str  # DVD
+"""📀"""
+算盘: str  # 算盘
+"""🧮"""
+电影摄影机: str  # 电影摄影机
+"""🎥"""
+胶片架: str  # 胶片架
+"""🎞"""
+电影放映机: str  # 电影放映机
+"""📽"""
+拍板: str  # 拍板
+"""🎬"""
+电视: str  # 电视
+"""📺"""
+照相机: str  # 照相机
+"""📷"""
+带闪光灯的照相机: str  # 带闪光灯的照相机
+"""📸"""
+摄像机: str  # 摄像机
+"""📹"""
+盒式录像带: str  # 盒式录像带
+"""📼"""
+放大镜向左倾斜: str  # 放大镜向左倾斜
+"""🔍"""
+放大镜向右倾斜: str  # 放大镜向右倾斜
+"""🔎"""
+蜡烛: str  # 蜡烛
+"""🕯"""
+灯泡: str  # 灯泡
+"""💡"""
+手电筒: str  # 手电筒
+"""🔦"""
+红纸灯笼: str  # 红纸灯笼
+"""🏮"""
+迪亚灯: str  # 迪亚灯
+"""🪔"""
+带装饰盖的笔记本: str  # 带装饰盖的笔记本
+"""📔"""
+闭书: str  # 闭书
+"""📕"""
+开卷: str  # 开卷
+"""📖"""
+绿皮书: str  # 绿皮书
+"""📗"""
+蓝皮书: str  # 蓝皮书
+"""📘"""
+橙皮书: str  # 橙皮书
+"""📙"""
+书: str  # 书
+"""📚"""
+笔记本: str  # 笔记本
+"""📓"""
+分类帐: str  # 分类帐
+"""📒"""
+卷曲页: str  # 卷曲页
+"""📃"""
+纸卷: str  # 纸卷
+"""📜"""
+页面向上: str  # 页面向上
+"""📄"""
+报纸: str  # 报纸
+"""📰"""
+卷起来的报纸: str  # 卷起来的报纸
+"""🗞"""
+书签标签: str  # 书签标签
+"""📑"""
+书签: str  # 书签
+"""🔖"""
+标签: str  # 标签
+"""🏷"""
+钱袋: str  # 钱袋
+"""💰"""
+日元纸币: str  # 日元纸币
+"""💴"""
+美元纸币: str  # 美元纸币
+"""💵"""
+欧元纸币: str  # 欧元纸币
+"""💶"""
+英镑纸币: str  # 英镑纸币
+"""💷"""
+有翅膀的钱: str  # 有翅膀的钱
+"""💸"""
+信用卡: str  # 信用卡
+"""💳"""
+收据: str  # 收据
+"""🧾"""
+图表随日元增长: str  # 图表随日元增长
+"""💹"""
+货币兑换: str  # 货币兑换
+"""💱"""
+重美元符号: str  # 重美元符号
+"""💲"""
+信封: str  # 信封
+"""✉"""
+电子邮件: str  # 电子邮件
+"""📧"""
+传入信封: str  # 传入信封
+"""📨"""
+带箭头的信封: str  # 带箭头的信封
+"""📩"""
+发件箱托盘: str  # 发件箱托盘
+"""📤"""
+收件箱托盘: str  # 收件箱托盘
+"""📥"""
+包裹: str  # 包裹
+"""📦"""
+带升起标志的已关闭邮箱: str  # 带升起标志的已关闭邮箱
+"""📫"""
+标志降低的已关闭邮箱: str  # 标志降低的已关闭邮箱
+"""📪"""
+打开带有升起标志的邮箱: str  # 打开带有升起标志的邮箱
+"""📬"""
+打开标志降低的邮箱: str  # 打开标志降低的邮箱
+"""📭"""
+邮筒: str  # 邮筒
+"""📮"""
+带选票的投票箱: str  # 带选票的投票箱
+"""🗳"""
+铅笔: str  # 铅笔
+"""✏"""
+黑笔尖: str  # 黑笔尖
+"""✒"""
+钢笔: str  # 钢笔
+"""🖋"""
+笔: str  # 笔
+"""🖊"""
+画笔: str  # 画笔
+"""🖌"""
+蜡笔: str  # 蜡笔
+"""🖍"""
+备忘录: str  # 备忘录
+"""📝"""
+公文包: str  # 公文包
+"""💼"""
+文件文件夹: str  # 文件文件夹
+"""📁"""
+打开文件文件夹: str  # 打开文件文件夹
+"""📂"""
+卡片索引分隔符: str  # 卡片索引分隔符
+"""🗂"""
+日历: str  # 日历
+"""📅"""
+撕下日历: str  # 撕下日历
+"""📆"""
+螺旋记事本: str  # 螺旋记事本
+"""🗒"""
+螺旋历: str  # 螺旋历
+"""🗓"""
+卡片索引: str  # 卡片索引
+"""📇"""
+图表增加: str  # 图表增加
+"""📈"""
+图表递减: str  # 图表递减
+"""📉"""
+条形图: str  # 条形图
+"""📊"""
+剪贴板: str  # 剪贴板
+"""📋"""
+图钉: str  # 图钉
+"""📌"""
+圆推销: str  # 圆推销
+"""📍"""
+回形针: str  # 回形针
+"""📎"""
+链接回形针: str  # 链接回形针
+"""🖇"""
+直尺: str  # 直尺
+"""📏"""
+三角尺: str  # 三角尺
+"""📐"""
+剪刀: str  # 剪刀
+"""✂"""
+卡片盒: str  # 卡片盒
+"""🗃"""
+文件柜: str  # 文件柜
+"""🗄"""
+废纸篓: str  # 废纸篓
+"""🗑"""
+锁定的: str  # 锁定的
+"""🔒"""
+解锁: str  # 解锁
+"""🔓"""
+用钢笔锁着: str  # 用钢笔锁着
+"""🔏"""
+钥匙锁住: str  # 钥匙锁住
+"""🔐"""
+钥匙: str  # 钥匙
+"""🔑"""
+旧钥匙: str  # 旧钥匙
+"""🗝"""
+铁锤: str  # 铁锤
+"""🔨"""
+斧子: str  # 斧子
+"""🪓"""
+挑选: str  # 挑选
+"""⛏"""
+锤与挑: str  # 锤与挑
+"""⚒"""
+锤子和扳手: str  # 锤子和扳手
+"""🛠"""
+匕首: str  # 匕首
+"""🗡"""
+十字剑: str  # 十字剑
+"""⚔"""
+手枪: str  # 手枪
+"""🔫"""
+弓箭: str  # 弓箭
+"""🏹"""
+盾: str  # 盾
+"""🛡"""
+扳手: str  # 扳手
+"""🔧"""
+螺母螺栓: str  # 螺母螺栓
+"""🔩"""
+齿轮: str  # 齿轮
+"""⚙"""
+夹紧: str  # 夹紧
+"""🗜"""
+平衡秤: str  # 平衡秤
+"""⚖"""
+探杖: str  # 探杖
+"""🦯"""
+链接: str  # 链接
+"""🔗"""
+链: str  # 链
+"""⛓"""
+工具箱: str  # 工具箱
+"""🧰"""
+磁铁: str  # 磁铁
+"""🧲"""
+蒸馏器: str  # 蒸馏器
+"""⚗"""
+试管: str  # 试管
+"""🧪"""
+培养皿: str  # 培养皿
+"""🧫"""
+DNA: str  # DNA
+"""🧬"""
+显微镜: str  # 显微镜
+"""🔬"""
+望远镜: str  # 望远镜
+"""🔭"""
+卫星天线: str  # 卫星天线
+"""📡"""
+注射器: str  # 注射器
+"""💉"""
+血滴: str  # 血滴
+"""🩸"""
+药丸: str  # 药丸
+"""💊"""
+胶带: str  # 胶带
+"""🩹"""
+听诊器: str  # 听诊器
+"""🩺"""
+门: str  # 门
+"""🚪"""
+床: str  # 床
+"""🛏"""
+沙发灯: str  # 沙发灯
+"""🛋"""
+椅子: str  # 椅子
+"""🪑"""
+厕所: str  # 厕所
+"""🚽"""
+淋浴: str  # 淋浴
+"""🚿"""
+浴缸: str  # 浴缸
+"""🛁"""
+剃刀: str  # 剃刀
+"""🪒"""
+洗液瓶: str  # 洗液瓶
+"""🧴"""
+安全销: str  # 安全销
+"""🧷"""
+扫帚: str  # 扫帚
+"""🧹"""
+篮子: str  # 篮子
+"""🧺"""
+卷筒纸: str  # 卷筒纸
+"""🧻"""
+肥皂: str  # 肥皂
+"""🧼"""
+海绵: str  # 海绵
+"""🧽"""
+灭火器: str  # 灭火器
+"""🧯"""
+购物车: str  # 购物车
+"""🛒"""
+香烟: str  # 香烟
+"""🚬"""
+棺材: str  # 棺材
+"""⚰"""
+丧葬瓮: str  # 丧葬瓮
+"""⚱"""
+莫艾: str  # 莫艾
+"""🗿"""
+自动取款机标志: str  # 自动取款机标志
+"""🏧"""
+垃圾箱标志: str  # 垃圾箱标志
+"""🚮"""
+饮用水: str  # 饮用水
+"""🚰"""
+轮椅标志: str  # 轮椅标志
+"""♿"""
+男厕所: str  # 男厕所
+"""🚹"""
+女厕所: str  # 女厕所
+"""🚺"""
+卫生间: str  # 卫生间
+"""🚻"""
+婴儿符号: str  # 婴儿符号
+"""🚼"""
+抽水马桶: str  # 抽水马桶
+"""🚾"""
+护照管理: str  # 护照管理
+"""🛂"""
+海关: str  # 海关
+"""🛃"""
+行李认领: str  # 行李认领
+"""🛄"""
+行李寄存: str  # 行李寄存
+"""🛅"""
+警告: str  # 警告
+"""⚠"""
+儿童穿越: str  # 儿童穿越
+"""🚸"""
+禁止进入: str  # 禁止进入
+"""⛔"""
+禁止: str  # 禁止
+"""🚫"""
+禁止骑自行车: str  # 禁止骑自行车
+"""🚳"""
+禁止吸烟: str  # 禁止吸烟
+"""🚭"""
+禁止乱丢垃圾: str  # 禁止乱丢垃圾
+"""🚯"""
+非饮用水: str  # 非饮用水
+"""🚱"""
+没有行人: str  # 没有行人
+"""🚷"""
+没有手机: str  # 没有手机
+"""📵"""
+十八岁以下没有人: str  # 十八岁以下没有人
+"""🔞"""
+放射性的: str  # 放射性的
+"""☢"""
+生物危害: str  # 生物危害
+"""☣"""
+向上箭头: str  # 向上箭头
+"""⬆"""
+右上箭头: str  # 右上箭头
+"""↗"""
+右箭头: str  # 右箭头
+"""➡"""
+右下箭头: str  # 右下箭头
+"""↘"""
+向下箭头: str  # 向下箭头
+"""⬇"""
+左下箭头: str  # 左下箭头
+"""↙"""
+左箭头: str  # 左箭头
+"""⬅"""
+左上箭头: str  # 左上箭头
+"""↖"""
+上下箭头: str  # 上下箭头
+"""↕"""
+左右箭头: str  # 左右箭头
+"""↔"""
+右箭头向左弯曲: str  # 右箭头向左弯曲
+"""↩"""
+左箭头向右弯曲: str  # 左箭头向右弯曲
+"""↪"""
+右箭头向上弯曲: str  # 右箭头向上弯曲
+"""⤴"""
+右箭头向下弯曲: str  # 右箭头向下弯曲
+"""⤵"""
+顺时针垂直箭头: str  # 顺时针垂直箭头
+"""🔃"""
+逆时针箭头按钮: str  # 逆时针箭头按钮
+"""🔄"""
+后箭头: str  # 后箭头
+"""🔙"""
+结束箭头: str  # 结束箭头
+"""🔚"""
+快箭: str  # 快箭
+"""🔜"""
+上箭头: str  # 上箭头
+"""🔝"""
+礼拜场所: str  # 礼拜场所
+"""🛐"""
+原子符号: str  # 原子符号
+"""⚛"""
+奥姆: str  # 奥姆
+"""🕉"""
+戴维之星: str  # 戴维之星
+"""✡"""
+法轮: str  # 法轮
+"""☸"""
+阴阳: str  # 阴阳
+"""☯"""
+拉丁十字勋章: str  # 拉丁十字勋章
+"""✝"""
+正统十字架: str  # 正统十字架
+"""☦"""
+星与新月: str  # 星与新月
+"""☪"""
+和平象征: str  # 和平象征
+"""☮"""
+米诺拉: str  # 米诺拉
+"""🕎"""
+星点六角星: str  # 星点六角星
+"""🔯"""
+白羊座: str  # 白羊座
+"""♈"""
+金牛座: str  # 金牛座
+"""♉"""
+双子星座: str  # 双子星座
+"""♊"""
+癌症: str  # 癌症
+"""♋"""
+狮子座: str  # 狮子座
+"""♌"""
+处女座: str  # 处女座
+"""♍"""
+天秤座: str  # 天秤座
+"""♎"""
+天蝎座: str  # 天蝎座
+"""♏"""
+射手座: str  # 射手座
+"""♐"""
+摩羯座: str  # 摩羯座
+"""♑"""
+宝瓶座: str  # 宝瓶座
+"""♒"""
+双鱼座: str  # 双鱼座
+"""♓"""
+蛇夫座: str  # 蛇夫座
+"""⛎"""
+随机播放曲目按钮: str  # 随机播放曲目按钮
+"""🔀"""
+重复按钮: str  # 重复按钮
+"""🔁"""
+重复单个按钮: str  # 重复单个按钮
+"""🔂"""
+播放按钮: str  # 播放按钮
+"""▶"""
+快进按钮: str  # 快进按钮
+"""⏩"""
+下一曲目按钮: str  # 下一曲目按钮
+"""⏭"""
+播放或暂停按钮: str  # 播放或暂停按钮
+"""⏯"""
+反向按钮: str  # 反向按钮
+"""◀"""
+快速后退按钮: str  # 快速后退按钮
+"""⏪"""
+最后一个曲目按钮: str  # 最后一个曲目按钮
+"""⏮"""
+向上按钮: str  # 向上按钮
+"""🔼"""
+快速按钮: str  # 快速按钮
+"""⏫"""
+向下按钮: str  # 向下按钮
+"""🔽"""
+快速向下按钮: str  # 快速向下按钮
+"""⏬"""
+暂停按钮: str  # 暂停按钮
+"""⏸"""
+停止按钮: str  # 停止按钮
+"""⏹"""
+记录按钮: str  # 记录按钮
+"""⏺"""
+弹出按钮: str  # 弹出按钮
+"""⏏"""
+电影院: str  # 电影院
+"""🎦"""
+暗淡按钮: str  # 暗淡按钮
+"""🔅"""
+亮钮: str  # 亮钮
+"""🔆"""
+天线杆: str  # 天线杆
+"""📶"""
+振动模式: str  # 振动模式
+"""📳"""
+手机关闭: str  # 手机关闭
+"""📴"""
+女性征: str  # 女性征
+"""♀"""
+男性征: str  # 男性征
+"""♂"""
+医学符号: str  # 医学符号
+"""⚕"""
+无穷: str  # 无穷
+"""♾"""
+回收符号: str  # 回收符号
+"""♻"""
+鸢尾花: str  # 鸢尾花
+"""⚜"""
+三叉戟徽章: str  # 三叉戟徽章
+"""🔱"""
+姓名徽章: str  # 姓名徽章
+"""📛"""
+日语初学者符号: str  # 日语初学者符号
+"""🔰"""
+空心红色圆圈: str  # 空心红色圆圈
+"""⭕"""
+复选标记按钮: str  # 复选标记按钮
+"""✅"""
+带复选框的复选框: str  # 带复选框的复选框
+"""☑"""
+复选标记: str  # 复选标记
+"""✔"""
+乘号: str  # 乘号
+"""✖"""
+十字标记: str  # 十字标记
+"""❌"""
+十字标记按钮: str  # 十字标记按钮
+"""❎"""
+加号: str  # 加号
+"""➕"""
+负号: str  # 负号
+"""➖"""
+除法标志: str  # 除法标志
+"""➗"""
+卷曲环: str  # 卷曲环
+"""➰"""
+双卷曲环: str  # 双卷曲环
+"""➿"""
+零件替换标记: str  # 零件替换标记
+"""〽"""
+八辐星号: str  # 八辐星号
+"""✳"""
+八角星: str  # 八角星
+"""✴"""
+闪耀: str  # 闪耀
+"""❇"""
+双感叹号: str  # 双感叹号
+"""‼"""
+感叹号问号: str  # 感叹号问号
+"""⁉"""
+问号: str  # 问号
+"""❓"""
+白色问号: str  # 白色问号
+"""❔"""
+白色感叹号: str  # 白色感叹号
+"""❕"""
+感叹号: str  # 感叹号
+"""❗"""
+波浪冲刺: str  # 波浪冲刺
+"""〰"""
+版权: str  # 版权
+"""©"""
+注册的: str  # 注册的
+"""®"""
+商标: str  # 商标
+"""™"""
+输入拉丁文大写: str  # 输入拉丁文大写
+"""🔠"""
+输入拉丁文小写: str  # 输入拉丁文小写
+"""🔡"""
+输入数: str  # 输入数
+"""🔢"""
+输入符号: str  # 输入符号
+"""🔣"""
+输入拉丁字母: str  # 输入拉丁字母
+"""🔤"""
+CL按钮: str  # CL按钮
+"""🆑"""
+酷按钮: str  # 酷按钮
+"""🆒"""
+免费按钮: str  # 免费按钮
+"""🆓"""
+信息: str  # 信息
+"""ℹ"""
+标识按钮: str  # 标识按钮
+"""🆔"""
+圆圈M: str  # 圆圈M
+"""Ⓜ"""
+新按钮: str  # 新按钮
+"""🆕"""
+NG按钮: str  # NG按钮
+"""🆖"""
+确定按钮: str  # 确定按钮
+"""🆗"""
+P按钮: str  # P按钮
+"""🅿"""
+SOS按钮: str  # SOS按钮
+"""🆘"""
+VS按钮: str  # VS按钮
+"""🆚"""
+红圈: str  # 红圈
+"""🔴"""
+橙色圈: str  # 橙色圈
+"""🟠"""
+黄圈: str  # 黄圈
+"""🟡"""
+绿圈: str  # 绿圈
+"""🟢"""
+蓝圆: str  # 蓝圆
+"""🔵"""
+紫色圈: str  # 紫色圈
+"""🟣"""
+白圈: str  # 白圈
+"""⚪"""
+棕圆: str  # 棕圆
+"""🟤"""
+红场: str  # 红场
+"""🟥"""
+橙色广场: str  # 橙色广场
+"""🟧"""
+黄色广场: str  # 黄色广场
+"""🟨"""
+绿色广场: str  # 绿色广场
+"""🟩"""
+蓝方: str  # 蓝方
+"""🟦"""
+紫方: str  # 紫方
+"""🟪"""
+黑圈: str  # 黑圈
+"""⚫"""
+白色大方形: str  # 白色大方形
+"""⬜"""
+褐色广场: str  # 褐色广场
+"""🟫"""
+黑色大方形: str  # 黑色大方形
+"""⬛"""
+黑色中方形: str  # 黑色中方形
+"""◼"""
+白色中方形: str  # 白色中方形
+"""◻"""
+白色中小型方形: str  # 白色中小型方形
+"""◽"""
+黑色中小型方形: str  # 黑色中小型方形
+"""◾"""
+白色小正方形: str  # 白色小正方形
+"""▫"""
+黑色小正方形: str  # 黑色小正方形
+"""▪"""
+大橙色菱形: str  # 大橙色菱形
+"""🔶"""
+大蓝钻石: str  # 大蓝钻石
+"""🔷"""
+小橙色菱形: str  # 小橙色菱形
+"""🔸"""
+蓝色小钻石: str  # 蓝色小钻石
+"""🔹"""
+红色三角形尖朝上: str  # 红色三角形尖朝上
+"""🔺"""
+红色三角形向下: str  # 红色三角形向下
+"""🔻"""
+带点的菱形: str  # 带点的菱形
+"""💠"""
+单选按钮: str  # 单选按钮
+"""🔘"""
+黑色方形按钮: str  # 黑色方形按钮
+"""🔲"""
+白色方形按钮: str  # 白色方形按钮
+"""🔳"""
+黑白方格旗: str  # 黑白方格旗
+"""🏁"""
+三角旗: str  # 三角旗
+"""🚩"""
+十字旗: str  # 十字旗
+"""🎌"""
+黑旗: str  # 黑旗
+"""🏴"""
+白旗: str  # 白旗
+"""🏳"""
+彩虹旗: str  # 彩虹旗
+"""🏳️‍🌈"""
+海盗旗: str  # 海盗旗
+"""🏴‍☠️"""
+阿森松岛国旗: str  # 阿森松岛国旗
+"""🇦🇨"""
+安道尔国旗: str  # 安道尔国旗
+"""🇦🇩"""
+阿拉伯联合酋长国国旗: str  # 阿拉伯联合酋长国国旗
+"""🇦🇪"""
+阿富汗国旗: str  # 阿富汗国旗
+"""🇦🇫"""
+安提瓜和巴布达国旗: str  # 安提瓜和巴布达国旗
+"""🇦🇬"""
+安圭拉国旗: str  # 安圭拉国旗
+"""🇦🇮"""
+阿尔巴尼亚国旗: str  # 阿尔巴尼亚国旗
+"""🇦🇱"""
+亚美尼亚国旗: str  # 亚美尼亚国旗
+"""🇦🇲"""
+安哥拉国旗: str  # 安哥拉国旗
+"""🇦🇴"""
+南极洲国旗: str  # 南极洲国旗
+"""🇦🇶"""
+阿根廷国旗: str  # 阿根廷国旗
+"""🇦🇷"""
+美属萨摩亚国旗: str  # 美属萨摩亚国旗
+"""🇦🇸"""
+奥地利国旗: str  # 奥地利国旗
+"""🇦🇹"""
+澳大利亚国旗: str  # 澳大利亚国旗
+"""🇦🇺"""
+Aruba国旗: str  # Aruba国旗
+"""🇦🇼"""
+陆地岛屿国旗: str  # 陆地岛屿国旗
+"""🇦🇽"""
+阿塞拜疆国旗: str  # 阿塞拜疆国旗
+"""🇦🇿"""
+波斯尼亚和黑塞哥维那国旗: str  # 波斯尼亚和黑塞哥维那国旗
+"""🇧🇦"""
+巴巴多斯国旗: str  # 巴巴多斯国旗
+"""🇧🇧"""
+孟加拉国国旗: str  # 孟加拉国国旗
+"""🇧🇩"""
+比利时国旗: str  # 比利时国旗
+"""🇧🇪"""
+布基纳法索国旗: str  # 布基纳法索国旗
+"""🇧🇫"""
+保加利亚国旗: str  # 保加利亚国旗
+"""🇧🇬"""
+巴林国旗: str  # 巴林国旗
+"""🇧🇭"""
+布隆迪国旗: str  # 布隆迪国旗
+"""🇧🇮"""
+贝宁国旗: str  # 贝宁国旗
+"""🇧🇯"""
+圣巴特莱米国旗: str  # 圣巴特莱米国旗
+"""🇧🇱"""
+百慕大群岛国旗: str  # 百慕大群岛国旗
+"""🇧🇲"""
+文莱国旗: str  # 文莱国旗
+"""🇧🇳"""
+玻利维亚国旗: str  # 玻利维亚国旗
+"""🇧🇴"""
+加勒比海荷兰国旗: str  # 加勒比海荷兰国旗
+"""🇧🇶"""
+巴西国旗: str  # 巴西国旗
+"""🇧🇷"""
+巴哈马国旗: str  # 巴哈马国旗
+"""🇧🇸"""
+不丹国旗: str  # 不丹国旗
+"""🇧🇹"""
+布韦岛国旗: str  # 布韦岛国旗
+"""🇧🇻"""
+博茨瓦纳国旗: str  # 博茨瓦纳国旗
+"""🇧🇼"""
+白俄罗斯国旗: str  # 白俄罗斯国旗
+"""🇧🇾"""
+伯利兹国旗: str  # 伯利兹国旗
+"""🇧🇿"""
+加拿大国旗: str  # 加拿大国旗
+"""🇨🇦"""
+中非共和国国旗: str  # 中非共和国国旗
+"""🇨🇫"""
+瑞士国旗: str  # 瑞士国旗
+"""🇨🇭"""
+科特迪瓦国旗: str  # 科特迪瓦国旗
+"""🇨🇮"""
+库克群岛国旗: str  # 库克群岛国旗
+"""🇨🇰"""
+智利国旗: str  # 智利国旗
+"""🇨🇱"""
+喀麦隆国旗: str  # 喀麦隆国旗
+"""🇨🇲"""
+中国国旗: str  # 中国国旗
+"""🇨🇳"""
+哥伦比亚国旗: str  # 哥伦比亚国旗
+"""🇨🇴"""
+克利珀顿岛国旗: str  # 克利珀顿岛国旗
+"""🇨🇵"""
+哥斯达黎加国旗: str  # 哥斯达黎加国旗
+"""🇨🇷"""
+古巴国旗: str  # 古巴国旗
+"""🇨🇺"""
+佛得角国旗: str  # 佛得角国旗
+"""🇨🇻"""
+库劳国旗: str  # 库劳国旗
+"""🇨🇼"""
+圣诞岛国旗: str  # 圣诞岛国旗
+"""🇨🇽"""
+塞浦路斯国旗: str  # 塞浦路斯国旗
+"""🇨🇾"""
+捷克国旗: str  # 捷克国旗
+"""🇨🇿"""
+德国国旗: str  # 德国国旗
+"""🇩🇪"""
+吉布提国旗: str  # 吉布提国旗
+"""🇩🇯"""
+丹麦国旗: str  # 丹麦国旗
+"""🇩🇰"""
+多米尼加国旗: str  # 多米尼加国旗
+"""🇩🇲"""
+多米尼加共和国国旗: str  # 多米尼加共和国国旗
+"""🇩🇴"""
+阿尔及利亚国旗: str  # 阿尔及利亚国旗
+"""🇩🇿"""
+休达和梅利利亚国旗: str  # 休达和梅利利亚国旗
+"""🇪🇦"""
+厄瓜多尔国旗: str  # 厄瓜多尔国旗
+"""🇪🇨"""
+爱沙尼亚国旗: str  # 爱沙尼亚国旗
+"""🇪🇪"""
+埃及国旗: str  # 埃及国旗
+"""🇪🇬"""
+西撒哈拉国旗: str  # 西撒哈拉国旗
+"""🇪🇭"""
+Eritrea国旗: str  # Eritrea国旗
+"""🇪🇷"""
+西班牙国旗: str  # 西班牙国旗
+"""🇪🇸"""
+埃塞俄比亚国旗: str  # 埃塞俄比亚国旗
+"""🇪🇹"""
+欧盟国旗: str  # 欧盟国旗
+"""🇪🇺"""
+芬兰国旗: str  # 芬兰国旗
+"""🇫🇮"""
+斐济国旗: str  # 斐济国旗
+"""🇫🇯"""
+福克兰群岛国旗: str  # 福克兰群岛国旗
+"""🇫🇰"""
+密克罗尼西亚国旗: str  # 密克罗尼西亚国旗
+"""🇫🇲"""
+法罗群岛国旗: str  # 法罗群岛国旗
+"""🇫🇴"""
+法国国旗: str  # 法国国旗
+"""🇫🇷"""
+Gabon国旗: str  # Gabon国旗
+"""🇬🇦"""
+格林纳达国旗: str  # 格林纳达国旗
+"""🇬🇩"""
+格鲁吉亚国旗: str  # 格鲁吉亚国旗
+"""🇬🇪"""
+法属圭亚那国旗: str  # 法属圭亚那国旗
+"""🇬🇫"""
+英属格恩西国旗: str  # 英属格恩西国旗
+"""🇬🇬"""
+加纳国旗: str  # 加纳国旗
+"""🇬🇭"""
+直布罗陀国旗: str  # 直布罗陀国旗
+"""🇬🇮"""
+格陵兰岛国旗: str  # 格陵兰岛国旗
+"""🇬🇱"""
+冈比亚国旗: str  # 冈比亚国旗
+"""🇬🇲"""
+几内亚国旗: str  # 几内亚国旗
+"""🇬🇳"""
+瓜德罗普国旗: str  # 瓜德罗普国旗
+"""🇬🇵"""
+赤道几内亚国旗: str  # 赤道几内亚国旗
+"""🇬🇶"""
+希腊国旗: str  # 希腊国旗
+"""🇬🇷"""
+南乔治亚和南桑威奇群岛国旗: str  # 南乔治亚和南桑威奇群岛国旗
+"""🇬🇸"""
+瓜地马拉国旗: str  # 瓜地马拉国旗
+"""🇬🇹"""
+关岛国旗: str  # 关岛国旗
+"""🇬🇺"""
+几内亚比绍国旗: str  # 几内亚比绍国旗
+"""🇬🇼"""
+圭亚那国旗: str  # 圭亚那国旗
+"""🇬🇾"""
+香港特区: str  # 香港特区
+"""🇭🇰"""
+赫德和麦克唐纳群岛国旗: str  # 赫德和麦克唐纳群岛国旗
+"""🇭🇲"""
+洪都拉斯国旗: str  # 洪都拉斯国旗
+"""🇭🇳"""
+克罗地亚国旗: str  # 克罗地亚国旗
+"""🇭🇷"""
+海地国旗: str  # 海地国旗
+"""🇭🇹"""
+匈牙利国旗: str  # 匈牙利国旗
+"""🇭🇺"""
+加那利群岛国旗: str  # 加那利群岛国旗
+"""🇮🇨"""
+印度尼西亚国旗: str  # 印度尼西亚国旗
+"""🇮🇩"""
+爱尔兰国旗: str  # 爱尔兰国旗
+"""🇮🇪"""
+以色列国旗: str  # 以色列国旗
+"""🇮🇱"""
+马恩岛国旗: str  # 马恩岛国旗
+"""🇮🇲"""
+印度国旗: str  # 印度国旗
+"""🇮🇳"""
+英属印度洋领土国旗: str  # 英属印度洋领土国旗
+"""🇮🇴"""
+伊拉克国旗: str  # 伊拉克国旗
+"""🇮🇶"""
+伊朗国旗: str  # 伊朗国旗
+"""🇮🇷"""
+冰岛国旗: str  # 冰岛国旗
+"""🇮🇸"""
+意大利国旗: str  # 意大利国旗
+"""🇮🇹"""
+Jersey国旗: str  # Jersey国旗
+"""🇯🇪"""
+牙买加国旗: str  # 牙买加国旗
+"""🇯🇲"""
+约旦国旗: str  # 约旦国旗
+"""🇯🇴"""
+日本国旗: str  # 日本国旗
+"""🇯🇵"""
+肯尼亚国旗: str  # 肯尼亚国旗
+"""🇰🇪"""
+吉尔吉斯斯坦国旗: str  # 吉尔吉斯斯坦国旗
+"""🇰🇬"""
+柬埔寨国旗: str  # 柬埔寨国旗
+"""🇰🇭"""
+基里巴斯国旗: str  # 基里巴斯国旗
+"""🇰🇮"""
+科摩罗伊斯兰国旗: str  # 科摩罗伊斯兰国旗
+"""🇰🇲"""
+圣基茨和尼维斯国旗: str  # 圣基茨和尼维斯国旗
+"""🇰🇳"""
+朝鲜国旗: str  # 朝鲜国旗
+"""🇰🇵"""
+韩国国旗: str  # 韩国国旗
+"""🇰🇷"""
+科威特国旗: str  # 科威特国旗
+"""🇰🇼"""
+开曼群岛国旗: str  # 开曼群岛国旗
+"""🇰🇾"""
+哈萨克斯坦国旗: str  # 哈萨克斯坦国旗
+"""🇰🇿"""
+Laos国旗: str  # Laos国旗
+"""🇱🇦"""
+黎巴嫩国旗: str  # 黎巴嫩国旗
+"""🇱🇧"""
+圣卢西亚国旗: str  # 圣卢西亚国旗
+"""🇱🇨"""
+列支敦士登国旗: str  # 列支敦士登国旗
+"""🇱🇮"""
+斯里兰卡国旗: str  # 斯里兰卡国旗
+"""🇱🇰"""
+利比里亚国旗: str  # 利比里亚国旗
+"""🇱🇷"""
+莱索托国旗: str  # 莱索托国旗
+"""🇱🇸"""
+立陶宛国旗: str  # 立陶宛国旗
+"""🇱🇹"""
+卢森堡国旗: str  # 卢森堡国旗
+"""🇱🇺"""
+拉脱维亚国旗: str  # 拉脱维亚国旗
+"""🇱🇻"""
+利比亚国旗: str  # 利比亚国旗
+"""🇱🇾"""
+摩洛哥国旗: str  # 摩洛哥国旗
+"""🇲🇦"""
+摩纳哥国旗: str  # 摩纳哥国旗
+"""🇲🇨"""
+摩尔多瓦国旗: str  # 摩尔多瓦国旗
+"""🇲🇩"""
+黑山国旗: str  # 黑山国旗
+"""🇲🇪"""
+圣马丁国旗: str  # 圣马丁国旗
+"""🇲🇫"""
+马达加斯加国旗: str  # 马达加斯加国旗
+"""🇲🇬"""
+马绍尔群岛国旗: str  # 马绍尔群岛国旗
+"""🇲🇭"""
+马其顿国旗: str  # 马其顿国旗
+"""🇲🇰"""
+马里国旗: str  # 马里国旗
+"""🇲🇱"""
+蒙古国旗: str  # 蒙古国旗
+"""🇲🇳"""
+中国澳门特别行政区: str  # 中国澳门特别行政区
+"""🇲🇴"""
+北马里亚纳群岛国旗: str  # 北马里亚纳群岛国旗
+"""🇲🇵"""
+马提尼克国旗: str  # 马提尼克国旗
+"""🇲🇶"""
+毛里塔尼亚国旗: str  # 毛里塔尼亚国旗
+"""🇲🇷"""
+蒙特塞拉特国旗: str  # 蒙特塞拉特国旗
+"""🇲🇸"""
+马耳他国旗: str  # 马耳他国旗
+"""🇲🇹"""
+毛里求斯国旗: str  # 毛里求斯国旗
+"""🇲🇺"""
+马尔代夫国旗: str  # 马尔代夫国旗
+"""🇲🇻"""
+马拉维国旗: str  # 马拉维国旗
+"""🇲🇼"""
+墨西哥国旗: str  # 墨西哥国旗
+"""🇲🇽"""
+马来西亚国旗: str  # 马来西亚国旗
+"""🇲🇾"""
+莫桑比克国旗: str  # 莫桑比克国旗
+"""🇲🇿"""
+纳米比亚国旗: str  # 纳米比亚国旗
+"""🇳🇦"""
+新喀里多尼亚国旗: str  # 新喀里多尼亚国旗
+"""🇳🇨"""
+尼日尔国旗: str  # 尼日尔国旗
+"""🇳🇪"""
+诺福克岛国旗: str  # 诺福克岛国旗
+"""🇳🇫"""
+尼日利亚国旗: str  # 尼日利亚国旗
+"""🇳🇬"""
+尼加拉瓜国旗: str  # 尼加拉瓜国旗
+"""🇳🇮"""
+荷兰国旗: str  # 荷兰国旗
+"""🇳🇱"""
+挪威国旗: str  # 挪威国旗
+"""🇳🇴"""
+尼泊尔国旗: str  # 尼泊尔国旗
+"""🇳🇵"""
+瑙鲁国旗: str  # 瑙鲁国旗
+"""🇳🇷"""
+纽埃国旗: str  # 纽埃国旗
+"""🇳🇺"""
+新西兰国旗: str  # 新西兰国旗
+"""🇳🇿"""
+阿曼国旗: str  # 阿曼国旗
+"""🇴🇲"""
+巴拿马国旗: str  # 巴拿马国旗
+"""🇵🇦"""
+秘鲁国旗: str  # 秘鲁国旗
+"""🇵🇪"""
+法属波利尼西亚国旗: str  # 法属波利尼西亚国旗
+"""🇵🇫"""
+巴布亚新几内亚国旗: str  # 巴布亚新几内亚国旗
+"""🇵🇬"""
+菲律宾国旗: str  # 菲律宾国旗
+"""🇵🇭"""
+巴基斯坦国旗: str  # 巴基斯坦国旗
+"""🇵🇰"""
+波兰国旗: str  # 波兰国旗
+"""🇵🇱"""
+圣皮埃尔和密克隆国旗: str  # 圣皮埃尔和密克隆国旗
+"""🇵🇲"""
+皮特凯恩群岛国旗: str  # 皮特凯恩群岛国旗
+"""🇵🇳"""
+波多黎各国旗: str  # 波多黎各国旗
+"""🇵🇷"""
+巴勒斯坦领土国旗: str  # 巴勒斯坦领土国旗
+"""🇵🇸"""
+葡萄牙国旗: str  # 葡萄牙国旗
+"""🇵🇹"""
+帕劳国旗: str  # 帕劳国旗
+"""🇵🇼"""
+巴拉圭国旗: str  # 巴拉圭国旗
+"""🇵🇾"""
+卡塔尔国旗: str  # 卡塔尔国旗
+"""🇶🇦"""
+留尼旺岛国旗: str  # 留尼旺岛国旗
+"""🇷🇪"""
+罗马尼亚国旗: str  # 罗马尼亚国旗
+"""🇷🇴"""
+塞尔维亚国旗: str  # 塞尔维亚国旗
+"""🇷🇸"""
+俄罗斯国旗: str  # 俄罗斯国旗
+"""🇷🇺"""
+卢旺达国旗: str  # 卢旺达国旗
+"""🇷🇼"""
+沙特阿拉伯国旗: str  # 沙特阿拉伯国旗
+"""🇸🇦"""
+所罗门群岛国旗: str  # 所罗门群岛国旗
+"""🇸🇧"""
+塞舌尔国旗: str  # 塞舌尔国旗
+"""🇸🇨"""
+苏丹国旗: str  # 苏丹国旗
+"""🇸🇩"""
+瑞典国旗: str  # 瑞典国旗
+"""🇸🇪"""
+新加坡国旗: str  # 新加坡国旗
+"""🇸🇬"""
+圣赫勒拿国旗: str  # 圣赫勒拿国旗
+"""🇸🇭"""
+斯洛文尼亚国旗: str  # 斯洛文尼亚国旗
+"""🇸🇮"""
+斯瓦尔巴和扬马延国旗: str  # 斯瓦尔巴和扬马延国旗
+"""🇸🇯"""
+斯洛伐克国旗: str  # 斯洛伐克国旗
+"""🇸🇰"""
+塞拉利昂国旗: str  # 塞拉利昂国旗
+"""🇸🇱"""
+圣马力诺国旗: str  # 圣马力诺国旗
+"""🇸🇲"""
+塞内加尔国旗: str  # 塞内加尔国旗
+"""🇸🇳"""
+索马里国旗: str  # 索马里国旗
+"""🇸🇴"""
+苏里南国旗: str  # 苏里南国旗
+"""🇸🇷"""
+南苏丹国旗: str  # 南苏丹国旗
+"""🇸🇸"""
+圣多美和普林西比国旗: str  # 圣多美和普林西比国旗
+"""🇸🇹"""
+萨尔瓦多国旗: str  # 萨尔瓦多国旗
+"""🇸🇻"""
+荷属圣马丁国旗: str  # 荷属圣马丁国旗
+"""🇸🇽"""
+叙利亚国旗: str  # 叙利亚国旗
+"""🇸🇾"""
+埃斯瓦蒂尼国旗: str  # 埃斯瓦蒂尼国旗
+"""🇸🇿"""
+特里斯坦达库尼亚国旗: str  # 特里斯坦达库尼亚国旗
+"""🇹🇦"""
+特克斯和凯科斯群岛国旗: str  # 特克斯和凯科斯群岛国旗
+"""🇹🇨"""
+乍得国旗: str  # 乍得国旗
+"""🇹🇩"""
+法国南部领土国旗: str  # 法国南部领土国旗
+"""🇹🇫"""
+多哥国旗: str  # 多哥国旗
+"""🇹🇬"""
+泰国国旗: str  # 泰国国旗
+"""🇹🇭"""
+塔吉克斯坦国旗: str  # 塔吉克斯坦国旗
+"""🇹🇯"""
+托克劳国旗: str  # 托克劳国旗
+"""🇹🇰"""
+东帝汶国旗: str  # 东帝汶国旗
+"""🇹🇱"""
+土库曼斯坦国旗: str  # 土库曼斯坦国旗
+"""🇹🇲"""
+突尼斯国旗: str  # 突尼斯国旗
+"""🇹🇳"""
+汤加国旗: str  # 汤加国旗
+"""🇹🇴"""
+土耳其国旗: str  # 土耳其国旗
+"""🇹🇷"""
+特立尼达和多巴哥国旗: str  # 特立尼达和多巴哥国旗
+"""🇹🇹"""
+图瓦卢国旗: str  # 图瓦卢国旗
+"""🇹🇻"""
+台湾: str  # 台湾
+"""🇹🇼"""
+坦桑尼亚国旗: str  # 坦桑尼亚国旗
+"""🇹🇿"""
+乌克兰国旗: str  # 乌克兰国旗
+"""🇺🇦"""
+乌干达国旗: str  # 乌干达国旗
+"""🇺🇬"""
+美国边远岛屿国旗: str  # 美国边远岛屿国旗
+"""🇺🇲"""
+联合国国旗: str  # 联合国国旗
+"""🇺🇳"""
+美国国旗: str  # 美国国旗
+"""🇺🇸"""
+乌拉圭国旗: str  # 乌拉圭国旗
+"""🇺🇾"""
+乌兹别克斯坦国旗: str  # 乌兹别克斯坦国旗
+"""🇺🇿"""
+梵蒂冈城国旗: str  # 梵蒂冈城国旗
+"""🇻🇦"""
+圣文森特格林纳丁斯国旗: str  # 圣文森特格林纳丁斯国旗
+"""🇻🇨"""
+委内瑞拉国旗: str  # 委内瑞拉国旗
+"""🇻🇪"""
+英属维尔京群岛国旗: str  # 英属维尔京群岛国旗
+"""🇻🇬"""
+美属维尔京群岛国旗: str  # 美属维尔京群岛国旗
+"""🇻🇮"""
+越南国旗: str  # 越南国旗
+"""🇻🇳"""
+瓦努阿图国旗: str  # 瓦努阿图国旗
+"""🇻🇺"""
+瓦利斯和富图纳国旗: str  # 瓦利斯和富图纳国旗
+"""🇼🇫"""
+萨摩亚国旗: str  # 萨摩亚国旗
+"""🇼🇸"""
+科索沃国旗: str  # 科索沃国旗
+"""🇽🇰"""
+也门国旗: str  # 也门国旗
+"""🇾🇪"""
+马约特国旗: str  # 马约特国旗
+"""🇾🇹"""
+南非国旗: str  # 南非国旗
+"""🇿🇦"""
+赞比亚国旗: str  # 赞比亚国旗
+"""🇿🇲"""
+津巴布韦国旗: str  # 津巴布韦国旗
+"""🇿🇼"""
+英国国旗: str  # 英国国旗
+"""🏴󠁧󠁢󠁥󠁮󠁧󠁿"""
+苏格兰国旗: str  # 苏格兰国旗
+"""🏴󠁧󠁢󠁳󠁣󠁴󠁿"""
+威尔士国旗: str  # 威尔士国旗
+"""🏴󠁧󠁢󠁷󠁬󠁳󠁿"""
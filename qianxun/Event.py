@@ -0,0 +1,99 @@
+import re
+
+# 回调事件代码
+EVENT_ACCOUNT_CHANGE = 10014    # 账号变动事件
+EVENT_GROUP_MESSAGE = 10008     # 收到群聊消息
+EVENT_PRIVATE_MESSAGE = 10009   # 收到私聊消息
+EVENT_SELF_MESSAGE = 10010      # 自己发出消息
+EVENT_TRANSFER = 10006          # 收到转账事件
+EVENT_REVOKE = 10013            # 撤回事件
+EVENT_FRIEND_REQUEST = 10011    # 好友请求
+EVENT_PAYMENT = 10007           # 支付事件
+
+# 系统消息类型
+MSG_TYPE_SYSTEM = 10000
+
+# 系统消息通知
+NOTICE_PATTERNS = (
+    ('rename', re.compile(r'修改群名为[“"](.*)[”"]$')),
+    ('kicked', re.compile(r'^你被[“"].*[”"]移出群聊')),
+    ('join', re.compile(r'加入了?群聊')),
+    ('leave', re.compile(r'移出了?群聊|退出了群聊')),
+    ('friend', re.compile(r'^你已添加了(.*)，现在可以开始聊天了')),
+)
+
+
+# 事件内容
+def payload(event: dict) -> dict:
+    """取出回调事件的内容, 即 event['data']['data']
+
+    Args:
+        event (dict): 原始回调事件
+
+    Returns:
+        dict: 事件内容, 不存在时为 {}
+    """
+
+    data = event.get('data')
+    if not isinstance(data, dict):
+        return {}
+    inner = data.get('data')
+    return inner if isinstance(inner, dict) else {}
+
+
+# 事件所属会话
+def conversation(event: dict) -> str:
+    """事件所属会话, 群聊消息为群聊 WXID, 私聊消息为对方 WXID
+
+    Args:
+        event (dict): 原始回调事件
+
+    Returns:
+        str: 会话 WXID
+    """
+
+    return payload(event).get('fromWxid', '')
+
+
+# 事件发送者
+def sender(event: dict) -> str:
+    """事件发送者, 群聊消息为实际发言的群成员 WXID
+
+    Args:
+        event (dict): 原始回调事件
+
+    Returns:
+        str: 发送者 WXID
+    """
+
+    data = payload(event)
+    return data.get('finalFromWxid') or data.get('fromWxid', '')
+
+
+# 系统消息通知
+def notice(event: dict) -> tuple:
+    """解析群聊与私聊中的系统消息通知
+
+    1.('rename', 新群名): 群聊改名 \r\n
+    2.('kicked', ''): 机器人被移出群聊 \r\n
+    3.('join', ''): 有人加入群聊 \r\n
+    4.('leave', ''): 有人被移出或退出群聊 \r\n
+    5.('friend', 昵称): 新添加了好友
+
+    Args:
+        event (dict): 原始回调事件
+
+    Returns:
+        tuple: (通知类型, 内容), 不是系统消息通知时为 None
+    """
+
+    data = payload(event)
+    if data.get('msgType') not in (MSG_TYPE_SYSTEM, str(MSG_TYPE_SYSTEM)):
+        return None
+
+    msg = data.get('msg', '')
+    for kind, pattern in NOTICE_PATTERNS:
+        match = pattern.search(msg)
+        if match:
+            return kind, match.group(1) if match.groups() else ''
+    return None
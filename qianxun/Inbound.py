@@ -0,0 +1,181 @@
+import random
+import logging
+import threading
+from collections import deque
+from .Event import EVENT_SELF_MESSAGE, EVENT_TRANSFER, EVENT_FRIEND_REQUEST, conversation
+
+
+# 事件优先级
+PRIORITY_CRITICAL = 0   # 永不丢弃
+PRIORITY_NORMAL = 1     # 队列满时丢弃
+PRIORITY_LOW = 2        # 优先丢弃, 积压时按比例采样
+
+
+class ShedPolicy:
+    def __init__(self, critical_events: list = (EVENT_TRANSFER, EVENT_FRIEND_REQUEST), low_events: list = (EVENT_SELF_MESSAGE,),
+                 low_groups: list = (), sample_rate: float = 0.0, watermark: float = 0.5):
+        """削峰策略, 决定队列积压时优先丢弃哪些事件
+
+        1.critical_events 中的事件永不丢弃 \r\n
+        2.low_events 中的事件, 以及来自 low_groups 群聊的事件为低优先级, 队列长度超过 watermark 后按 sample_rate 采样, 队列满时最先被丢弃 \r\n
+        3.其余事件为普通优先级, 队列满时丢弃
+
+        Args:
+            critical_events (list, optional): 永不丢弃的事件代码. 默认 [10006 转账, 10011 好友请求] \r\n
+            low_events (list, optional): 低优先级事件代码. 默认 [10010 自己发出消息] \r\n
+            low_groups (list, optional): 低优先级群聊 WXID \r\n
+            sample_rate (float, optional): 积压时低优先级事件的保留比例, 0 = 全部丢弃, 1 = 全部保留. 默认 0 \r\n
+            watermark (float, optional): 开始采样低优先级事件的队列占用比例. 默认 0.5
+        """
+
+        self.critical_events = set(critical_events)
+        self.low_events = set(low_events)
+        self.low_groups = set(low_groups)
+        self.sample_rate = sample_rate
+        self.watermark = watermark
+
+    # 事件优先级
+    def priority(self, event: dict) -> int:
+        code = event.get('event')
+        if code in self.critical_events:
+            return PRIORITY_CRITICAL
+        if code in self.low_events:
+            return PRIORITY_LOW
+        if self.low_groups and conversation(event) in self.low_groups:
+            return PRIORITY_LOW
+        return PRIORITY_NORMAL
+
+    # 是否保留积压时的低优先级事件
+    def sample(self) -> bool:
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+
+class InboundQueue:
+    def __init__(self, handler, maxsize: int = 10000, workers: int = 4, policy: ShedPolicy = None, metrics=None, logger: logging.Logger = None):
+        """有界入站队列, 回调服务收到事件后立即入队并响应, 由工作线程按优先级取出交给回调方法
+
+        Args:
+            handler (callable): 回调方法 \r\n
+            maxsize (int, optional): 队列最大长度, 永不丢弃的事件可以超出. 默认 10000 \r\n
+            workers (int, optional): 工作线程数. 默认 4 \r\n
+            policy (ShedPolicy, optional): 削峰策略. 默认 ShedPolicy() \r\n
+            metrics (Metrics, optional): 运行指标, 统计队列深度与丢弃事件数 \r\n
+            logger (logging.Logger, optional): 日志记录器. 默认 logging.getLogger('qianxun')
+        """
+
+        self.handler = handler
+        self.maxsize = maxsize
+        self.policy = policy or ShedPolicy()
+        self.metrics = metrics
+        self.logger = logger or logging.getLogger('qianxun')
+        self.lanes = (deque(), deque(), deque())
+        self.size = 0
+        self.closed = False
+        self.cond = threading.Condition()
+        self.threads = [
+            threading.Thread(target=self.work, name=f'qianxun-inbound-{i}', daemon=True) for i in range(workers)
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    def __len__(self) -> int:
+        return self.size
+
+    # 事件入队
+    def put(self, event: dict) -> bool:
+        """事件入队
+
+        Args:
+            event (dict): 回调事件
+
+        Returns:
+            bool: 是否入队, 被丢弃时为 False
+        """
+
+        priority = self.policy.priority(event)
+        with self.cond:
+            if self.closed:
+                self.drop(event, 'closed')
+                return False
+            if priority == PRIORITY_LOW and self.size >= self.maxsize * self.policy.watermark and not self.policy.sample():
+                self.drop(event, 'shed')
+                return False
+
+            if self.size >= self.maxsize:
+                if priority == PRIORITY_LOW or not self.evict(priority):
+                    if priority != PRIORITY_CRITICAL:
+                        self.drop(event, 'full')
+                        return False
+
+            self.lanes[priority].append(event)
+            self.size += 1
+            self.cond.notify()
+
+        if self.metrics:
+            self.metrics.add('queue_depth', 1)
+        return True
+
+    # 队列满时按优先级从低到高丢弃最早的事件, 为更高优先级的事件腾出位置
+    def evict(self, priority: int) -> bool:
+        for lane in range(PRIORITY_LOW, priority, -1):
+            if self.lanes[lane]:
+                self.drop(self.lanes[lane].popleft(), 'evicted')
+                self.size -= 1
+                if self.metrics:
+                    self.metrics.add('queue_depth', -1)
+                return True
+        return False
+
+    def drop(self, event: dict, reason: str):
+        if self.metrics:
+            self.metrics.inc('events_dropped_total', (('event', str(event.get('event', ''))), ('reason', reason)))
+        else:
+            self.logger.debug('丢弃事件: event=%s reason=%s', event.get('event'), reason)
+
+    # 按优先级取出事件, 关闭且队列已空时为 None
+    def get(self) -> dict:
+        with self.cond:
+            while not self.size:
+                if self.closed:
+                    return None
+                self.cond.wait()
+            for lane in self.lanes:
+                if lane:
+                    self.size -= 1
+                    return lane.popleft()
+
+    # 关闭队列
+    def close(self, drain: bool = True, timeout: float = None):
+        """关闭队列, 不再接收新事件, 工作线程处理完队列中的事件后退出
+
+        Args:
+            drain (bool, optional): 是否处理完队列中剩余的事件, False 时直接丢弃. 默认 True \r\n
+            timeout (float, optional): 等待每个工作线程退出的超时时间(秒), None 为一直等待. 默认 None
+        """
+
+        with self.cond:
+            self.closed = True
+            if not drain:
+                for lane in self.lanes:
+                    while lane:
+                        self.drop(lane.popleft(), 'closed')
+                        self.size -= 1
+                        if self.metrics:
+                            self.metrics.add('queue_depth', -1)
+            self.cond.notify_all()
+        for thread in self.threads:
+            if thread is not threading.current_thread():
+                thread.join(timeout)
+
+    # 工作线程
+    def work(self):
+        while True:
+            event = self.get()
+            if event is None:
+                return
+            if self.metrics:
+                self.metrics.add('queue_depth', -1)
+            try:
+                self.handler(event)
+            except Exception:
+                self.logger.exception('回调处理失败: event=%s', event.get('event'))
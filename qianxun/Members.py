@@ -0,0 +1,281 @@
+import os
+import json
+import time
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from .Compact import MemberSet, StringTable
+from .Diff import diff
+from .Event import conversation, notice
+from .Middleware import Middleware
+from .RateLimiter import RateLimiter
+from .Shared import MISSING, ProcessLocal, SingleFlight
+
+
+class GroupMemberCache(ProcessLocal):
+    persistent = ('robot', 'max_members', 'logger')
+
+    def __init__(self, robot, max_members: int = 500000, logger: logging.Logger = None):
+        """群成员缓存, 首次访问某个群时才拉取成员列表, 按最近最少使用淘汰以控制内存
+
+        群成员以 MemberSet 紧凑保存, 所有群共享同一个字符串表; \r\n
+        同时维护 群成员 -> 所在群 的倒排索引, 随缓存增量更新
+
+        Args:
+            robot (Robot): 机器人实例 \r\n
+            max_members (int, optional): 缓存的群成员总数上限, 超出后淘汰最久未访问的群. 默认 500000 \r\n
+            logger (logging.Logger, optional): 日志记录器. 默认 logging.getLogger('qianxun')
+        """
+
+        self.robot = robot
+        self.max_members = max_members
+        self.logger = logger or logging.getLogger('qianxun')
+        self.setup()
+
+    def setup(self):
+        self.groups = OrderedDict()
+        self.table = StringTable()
+        self.memberships = {}
+        self.size = 0
+        self.lock = threading.RLock()
+        self.flight = SingleFlight(self.lock)
+
+    def __len__(self) -> int:
+        return len(self.groups)
+
+    def __contains__(self, group_wxid: str) -> bool:
+        return group_wxid in self.groups
+
+    # 获取群成员
+    def get(self, group_wxid: str) -> dict:
+        """获取群成员, 不在缓存中时拉取, 同一个群同时只会拉取一次
+
+        Args:
+            group_wxid (str): 群聊 WXID
+
+        Returns:
+            MemberSet: {群成员 WXID: 群昵称}, 只读, 用法同 dict, 拉取失败时为 None
+        """
+
+        return self.flight.get(group_wxid, self.lookup, self.load)
+
+    # 查找缓存, 在锁内调用
+    def lookup(self, group_wxid: str):
+        members = self.groups.get(group_wxid)
+        if members is None:
+            return MISSING
+        self.groups.move_to_end(group_wxid)
+        return members
+
+    # 获取群成员的群昵称
+    def getGroupNick(self, group_wxid: str, wxid: str, default: str = '') -> str:
+        members = self.get(group_wxid)
+        return members.get(wxid, default) if members else default
+
+    # 拉取群成员
+    def load(self, group_wxid: str) -> MemberSet:
+        try:
+            result = self.robot.iterGroupMemberList(wxid=group_wxid)
+            members = MemberSet(self.table, ((member['wxid'], member.get('groupNick', '')) for member in result))
+        except Exception as e:
+            self.logger.warning('群成员拉取失败: group=%s error=%s', group_wxid, e)
+            return None
+
+        self.put(group_wxid, members)
+        return members
+
+    # 重新拉取并比较
+    def reload(self, group_wxid: str) -> dict:
+        """重新拉取群成员, 并与缓存中的旧成员比较, 用于定期对账
+
+        Args:
+            group_wxid (str): 群聊 WXID
+
+        Returns:
+            dict: 格式同 Diff.diff, 旧成员不在缓存中时全部视为新增, 拉取失败时为 None
+        """
+
+        with self.lock:
+            old = self.groups.get(group_wxid)
+        new = self.load(group_wxid)
+        if new is None:
+            return None
+        return diff(old if old is not None else MemberSet(self.table), new)
+
+    # 写入群成员
+    def put(self, group_wxid: str, members: dict):
+        """写入群成员, 超出上限时淘汰最久未访问的群
+
+        Args:
+            group_wxid (str): 群聊 WXID \r\n
+            members (dict): {群成员 WXID: 群昵称}
+        """
+
+        with self.lock:
+            if not isinstance(members, MemberSet) or members.table is not self.table:
+                members = MemberSet(self.table, members)
+            self.discard(group_wxid)
+            self.groups[group_wxid] = members
+            self.size += len(members)
+            for index in members.wxids:
+                self.memberships.setdefault(index, set()).add(group_wxid)
+            while self.size > self.max_members and len(self.groups) > 1:
+                self.discard(next(iter(self.groups)))
+            # 淘汰的群留下的字符串只增不减, 占多数时重建字符串表
+            if len(self.table) > 4 * self.size + 1024:
+                self.compact()
+
+    # 重建字符串表
+    def compact(self):
+        """重建字符串表, 只保留缓存中的群仍在使用的字符串, 已返回给调用方的 MemberSet 继续引用旧表, 不受影响"""
+
+        with self.lock:
+            table = StringTable()
+            groups = OrderedDict((group_wxid, MemberSet(table, members.items())) for group_wxid, members in self.groups.items())
+            memberships = {}
+            for group_wxid, members in groups.items():
+                for index in members.wxids:
+                    memberships.setdefault(index, set()).add(group_wxid)
+            self.table, self.groups, self.memberships = table, groups, memberships
+
+    # 使群成员失效
+    def invalidate(self, group_wxid: str = ''):
+        """使群成员失效, 下次访问时重新拉取
+
+        Args:
+            group_wxid (str, optional): 群聊 WXID, 不填则全部失效
+        """
+
+        with self.lock:
+            if group_wxid:
+                self.discard(group_wxid)
+            else:
+                self.groups.clear()
+                self.table = StringTable()
+                self.memberships = {}
+                self.size = 0
+
+    def discard(self, group_wxid: str):
+        members = self.groups.pop(group_wxid, None)
+        if members is None:
+            return
+        self.size -= len(members)
+        for index in members.wxids:
+            groups = self.memberships.get(index)
+            if groups is not None:
+                groups.discard(group_wxid)
+                if not groups:
+                    del self.memberships[index]
+
+    # 查询群成员所在的群
+    def getGroups(self, wxid: str) -> dict:
+        """查询某人所在的群, 只查找已缓存的群, 需要完整结果时先调用 prefetch
+
+        Args:
+            wxid (str): 群成员 WXID
+
+        Returns:
+            dict: {群聊 WXID: 群昵称}
+        """
+
+        with self.lock:
+            index = self.table.find(wxid)
+            groups = self.memberships.get(index, ()) if index is not None else ()
+            return {group_wxid: self.groups[group_wxid][wxid] for group_wxid in groups}
+
+    # 按回调事件使群成员失效
+    def apply(self, event: dict):
+        """按回调事件使群成员失效: 有人加入, 退出或被移出群聊, 以及机器人被移出群聊
+
+        Args:
+            event (dict): 原始回调事件
+        """
+
+        result = notice(event)
+        if result and result[0] in ('join', 'leave', 'kicked'):
+            self.invalidate(conversation(event))
+
+    # 批量预拉取
+    def prefetch(self, groups: list = None, workers: int = 8, rate: float = 10, checkpoint: str = '') -> dict:
+        """并发批量预拉取群成员, 用于启动时预热
+
+        1.多个线程并发拉取, 由令牌桶限制每秒请求数, 避免压垮千寻 \r\n
+        2.填写 checkpoint 后每拉取完一个群就追加写入该文件, 中断后再次调用会先从文件恢复已拉取的群, 只拉取剩余的群
+
+        Args:
+            groups (list, optional): 群聊 WXID 列表, 不填则为联系人目录中的全部群聊 \r\n
+            workers (int, optional): 并发线程数. 默认 8 \r\n
+            rate (float, optional): 每秒最多请求数. 默认 10 \r\n
+            checkpoint (str, optional): 断点文件路径. 默认不记录
+
+        Returns:
+            dict: {"total": 3000, "restored": 1200, "loaded": 1795, "failed": 5, "elapsed": 182.4}
+        """
+
+        if groups is None:
+            groups = [record['wxid'] for record in self.robot.contacts.list('chatroom')]
+
+        begin = time.perf_counter()
+        pending = set(groups)
+        restored = 0
+        if checkpoint and os.path.exists(checkpoint):
+            with open(checkpoint, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    item = json.loads(line)
+                    if item['group'] in pending:
+                        pending.discard(item['group'])
+                        self.put(item['group'], item['members'])
+                        restored += 1
+
+        limiter = RateLimiter(rate, max(1, workers))
+        writer = open(checkpoint, 'a', encoding='utf-8') if checkpoint else None
+        write_lock = threading.Lock()
+        stats = {'loaded': 0, 'failed': 0}
+
+        def fetch(group_wxid):
+            limiter.acquire()
+            members = self.load(group_wxid)
+            with write_lock:
+                if members is None:
+                    stats['failed'] += 1
+                    return
+                stats['loaded'] += 1
+                if writer:
+                    writer.write(json.dumps({'group': group_wxid, 'members': dict(members.items())}, ensure_ascii=False) + '\n')
+                    writer.flush()
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='qianxun-prefetch') as executor:
+                list(executor.map(fetch, [group for group in groups if group in pending]))
+        finally:
+            if writer:
+                writer.close()
+
+        return {
+            'total': len(groups),
+            'restored': restored,
+            'loaded': stats['loaded'],
+            'failed': stats['failed'],
+            'elapsed': time.perf_counter() - begin,
+        }
+
+
+class MemberSync(Middleware):
+    def __init__(self, cache: GroupMemberCache):
+        """群成员同步中间件, 按回调事件使受影响的群成员缓存失效
+
+        Args:
+            cache (GroupMemberCache): 群成员缓存
+        """
+
+        self.cache = cache
+        self.warned = False
+
+    def before(self, event: dict):
+        if self.cache.detached and not self.warned:
+            self.warned = True
+            self.cache.logger.warning("MemberSync 在回调进程中不会更新主进程的群成员缓存, 请使用 callbackEvents(..., mode='thread')")
+        self.cache.apply(event)
@@ -0,0 +1,175 @@
+import bisect
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from .Shared import LockState
+
+
+# 耗时直方图默认分桶(秒)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        """耗时直方图, 只记录各分桶计数与总和, 观测一次为 O(log n)
+
+        Args:
+            buckets (tuple, optional): 分桶上限(秒), 需从小到大排列. 默认 DEFAULT_BUCKETS
+        """
+
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    # 记录一次观测值
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Metrics(LockState):
+    def __init__(self, namespace: str = 'qianxun'):
+        """运行指标, 以低开销计数器统计回调与接口调用情况, 可导出为 Prometheus 文本格式
+
+        Args:
+            namespace (str, optional): 指标名前缀. 默认 qianxun
+        """
+
+        self.namespace = namespace
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.gauges = {}
+        self.histograms = {}
+
+    # 计数器加一
+    def inc(self, name: str, labels: tuple = (), value: float = 1):
+        """计数器加一
+
+        Args:
+            name (str): 指标名 \r\n
+            labels (tuple, optional): 标签 例: (('event', '10008'),) \r\n
+            value (float, optional): 增加值. 默认 1
+        """
+
+        key = (name, labels)
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    # 设置仪表值
+    def set(self, name: str, value: float, labels: tuple = ()):
+        self.gauges[(name, labels)] = value
+
+    # 仪表值增减
+    def add(self, name: str, value: float, labels: tuple = ()):
+        key = (name, labels)
+        with self.lock:
+            self.gauges[key] = self.gauges.get(key, 0) + value
+
+    # 记录耗时
+    def observe(self, name: str, value: float, labels: tuple = ()):
+        """记录耗时
+
+        Args:
+            name (str): 指标名 \r\n
+            value (float): 耗时(秒) \r\n
+            labels (tuple, optional): 标签
+        """
+
+        key = (name, labels)
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(value)
+
+    # 导出为 Prometheus 文本格式
+    def render(self) -> str:
+        """导出为 Prometheus 文本格式
+
+        Returns:
+            str: Prometheus text exposition format
+        """
+
+        lines = []
+        with self.lock:
+            counters = sorted(self.counters.items())
+            gauges = sorted(self.gauges.items())
+            histograms = sorted(
+                (key, (h.buckets, list(h.counts), h.sum, h.count)) for key, h in self.histograms.items()
+            )
+
+        self._render_simple(lines, counters, 'counter')
+        self._render_simple(lines, gauges, 'gauge')
+
+        declared = set()
+        for (name, labels), (buckets, counts, total, count) in histograms:
+            full_name = f'{self.namespace}_{name}'
+            if name not in declared:
+                declared.add(name)
+                lines.append(f'# TYPE {full_name} histogram')
+            cumulative = 0
+            for bound, bucket_count in zip(buckets, counts):
+                cumulative += bucket_count
+                lines.append(f'{full_name}_bucket{self._labels(labels + (("le", repr(bound)),))} {cumulative}')
+            lines.append(f'{full_name}_bucket{self._labels(labels + (("le", "+Inf"),))} {count}')
+            lines.append(f'{full_name}_sum{self._labels(labels)} {total}')
+            lines.append(f'{full_name}_count{self._labels(labels)} {count}')
+
+        return '\n'.join(lines) + '\n'
+
+    # 独立的指标接口
+    def serve(self, port: int, host: str = '0.0.0.0', path: str = '/metrics') -> ThreadingHTTPServer:
+        """在当前进程的后台线程中提供 Prometheus 指标接口
+
+        回调服务默认运行在子进程中, 其 metrics_path 接口只包含子进程中的回调指标; \r\n
+        主程序发起的接口调用(如 sendTextMessage)记录在主进程的 robot.metrics 中, 需由主进程自行提供
+
+        例: robot.metrics.serve(9100)
+
+        Args:
+            port (int): 端口 \r\n
+            host (str, optional): 监听地址. 默认 0.0.0.0 \r\n
+            path (str, optional): 接口路径. 默认 '/metrics'
+
+        Returns:
+            ThreadingHTTPServer: 指标服务, 调用 shutdown() 停止
+        """
+
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] != path:
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name='qianxun-metrics', daemon=True).start()
+        return server
+
+    def _render_simple(self, lines: list, items: list, kind: str):
+        declared = set()
+        for (name, labels), value in items:
+            full_name = f'{self.namespace}_{name}'
+            if name not in declared:
+                declared.add(name)
+                lines.append(f'# TYPE {full_name} {kind}')
+            lines.append(f'{full_name}{self._labels(labels)} {value}')
+
+    @staticmethod
+    def _labels(labels: tuple) -> str:
+        if not labels:
+            return ''
+        pairs = ','.join('{}="{}"'.format(k, str(v).replace('\\', '\\\\').replace('"', '\\"')) for k, v in labels)
+        return '{' + pairs + '}'
@@ -0,0 +1,145 @@
+import json
+import time
+import threading
+from collections import OrderedDict
+from .Shared import LockState
+
+
+class Middleware:
+    """回调中间件基类, 按注册顺序执行 before, 按相反顺序执行 after / error
+
+    1.before(event) 返回 False 时丢弃该事件, 后续中间件与回调方法均不执行; 返回 dict 时用其替换事件 \r\n
+    2.after(event, result) 在回调方法成功执行后调用 \r\n
+    3.error(event, exc) 在回调方法或中间件抛出异常时调用, 返回 True 表示异常已处理不再抛出
+    """
+
+    def before(self, event: dict):
+        return None
+
+    def after(self, event: dict, result):
+        return None
+
+    def error(self, event: dict, exc: Exception):
+        return None
+
+
+class FunctionMiddleware(Middleware):
+    def __init__(self, fun):
+        """将普通方法包装为只有 before 阶段的中间件
+
+        Args:
+            fun (callable): fun(event) 返回值同 Middleware.before
+        """
+
+        self.fun = fun
+        self.name = getattr(fun, '__qualname__', repr(fun))
+
+    def before(self, event: dict):
+        return self.fun(event)
+
+
+class Pipeline:
+    def __init__(self, handler, middlewares: list, metrics=None):
+        """中间件管道, 事件依次经过各中间件后交给回调方法, 并统计每个中间件各阶段的耗时
+
+        Args:
+            handler (callable): 回调方法 \r\n
+            middlewares (list): 中间件列表 \r\n
+            metrics (Metrics, optional): 运行指标, 耗时记录在 middleware_latency_seconds
+        """
+
+        self.handler = handler
+        self.middlewares = [m if isinstance(m, Middleware) else FunctionMiddleware(m) for m in middlewares]
+        self.names = [getattr(m, 'name', type(m).__name__) for m in self.middlewares]
+        self.metrics = metrics
+
+    def __call__(self, event: dict):
+        passed = []
+        try:
+            for index, middleware in enumerate(self.middlewares):
+                begin = time.perf_counter()
+                result = middleware.before(event)
+                self.observe(index, 'before', begin)
+                passed.append(index)
+                if result is False:
+                    return None
+                if isinstance(result, dict):
+                    event = result
+
+            result = self.handler(event)
+        except Exception as e:
+            handled = False
+            for index in reversed(passed):
+                begin = time.perf_counter()
+                handled = self.middlewares[index].error(event, e) is True or handled
+                self.observe(index, 'error', begin)
+            if not handled:
+                raise
+            return None
+
+        for index in reversed(passed):
+            begin = time.perf_counter()
+            self.middlewares[index].after(event, result)
+            self.observe(index, 'after', begin)
+        return result
+
+    def observe(self, index: int, stage: str, begin: float):
+        if self.metrics:
+            labels = (('middleware', self.names[index]), ('stage', stage))
+            self.metrics.observe('middleware_latency_seconds', time.perf_counter() - begin, labels)
+
+
+class EventFilter(Middleware):
+    def __init__(self, events: list = None, wxids: list = None):
+        """事件过滤中间件, 只放行指定的事件代码与机器人 WXID
+
+        Args:
+            events (list, optional): 放行的事件代码 例: [10008, 10009], 不填则不限制 \r\n
+            wxids (list, optional): 放行的机器人 WXID, 不填则不限制
+        """
+
+        self.events = set(events) if events else None
+        self.wxids = set(wxids) if wxids else None
+
+    def before(self, event: dict):
+        if self.events is not None and event.get('event') not in self.events:
+            return False
+        if self.wxids is not None and event.get('wxid') not in self.wxids:
+            return False
+
+
+# 默认去重键, 为事件内容本身
+def event_key(event: dict) -> str:
+    return json.dumps(event, sort_keys=True)
+
+
+class Dedup(LockState, Middleware):
+    def __init__(self, key=None, ttl: float = 60, maxsize: int = 10000):
+        """去重中间件, 在 ttl 时间内丢弃重复的事件
+
+        Args:
+            key (callable, optional): 计算事件去重键的方法, 默认为事件内容本身 \r\n
+            ttl (float, optional): 去重时间窗口(秒). 默认 60 \r\n
+            maxsize (int, optional): 最多记录的去重键数量. 默认 10000
+        """
+
+        self.key = key or event_key
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.seen = OrderedDict()
+        self.lock = threading.Lock()
+
+    def before(self, event: dict):
+        key = self.key(event)
+        now = time.monotonic()
+        with self.lock:
+            seen = self.seen
+            while seen:
+                expire = next(iter(seen.values()))
+                if expire > now and len(seen) < self.maxsize:
+                    break
+                seen.popitem(last=False)
+
+            if key in seen:
+                return False
+            seen[key] = now + self.ttl
@@ -0,0 +1,143 @@
+import time
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from .RateLimiter import RateLimiter
+from .Shared import MISSING, ProcessLocal, SingleFlight
+
+
+class ProfileCache(ProcessLocal):
+    persistent = ('robot', 'ttl', 'negative_ttl', 'maxsize', 'logger')
+
+    def __init__(self, robot, ttl: float = 600, negative_ttl: float = 60, maxsize: int = 100000, logger: logging.Logger = None):
+        """对象信息缓存, 缓存 queryObjectInformation(Q0004) 的结果
+
+        1.查询成功的结果缓存 ttl 秒, 查询成功但对象不存在的结果缓存 negative_ttl 秒, 接口请求失败不缓存 \r\n
+        2.同一个 wxid 同时只会查询一次, 超过 maxsize 后淘汰最久未访问的对象
+
+        Args:
+            robot (Robot): 机器人实例 \r\n
+            ttl (float, optional): 缓存有效期(秒). 默认 600 \r\n
+            negative_ttl (float, optional): 对象不存在时的缓存有效期(秒). 默认 60 \r\n
+            maxsize (int, optional): 最多缓存的对象数. 默认 100000 \r\n
+            logger (logging.Logger, optional): 日志记录器. 默认 logging.getLogger('qianxun')
+        """
+
+        self.robot = robot
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.maxsize = maxsize
+        self.logger = logger or logging.getLogger('qianxun')
+        self.setup()
+
+    def setup(self):
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.flight = SingleFlight(self.lock)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    # 获取对象信息
+    def get(self, wxid: str) -> dict:
+        """获取对象信息, 优先使用缓存
+
+        Args:
+            wxid (str): 查询对象的 WXID
+
+        Returns:
+            dict: 对象信息, 格式同 queryObjectInformation 的 result, 不存在或查询失败时为 None
+        """
+
+        return self.flight.get(wxid, self.lookup, self.load)
+
+    # 查找未过期的缓存, 在锁内调用
+    def lookup(self, wxid: str):
+        entry = self.entries.get(wxid)
+        if entry is None:
+            return MISSING
+        if entry[0] > time.monotonic():
+            self.entries.move_to_end(wxid)
+            return entry[1]
+        del self.entries[wxid]
+        return MISSING
+
+    def load(self, wxid: str) -> dict:
+        response = self.robot.queryObjectInformation(wxid=wxid)
+        if not isinstance(response, dict) or response.get('code') != 200:
+            self.logger.warning('对象信息查询失败: wxid=%s response=%s', wxid, response)
+            return None
+
+        result = response.get('result')
+        profile = result if isinstance(result, dict) and result.get('wxid') else None
+        self.put(wxid, profile)
+        return profile
+
+    # 写入缓存
+    def put(self, wxid: str, profile: dict):
+        """写入缓存
+
+        Args:
+            wxid (str): 对象 WXID \r\n
+            profile (dict): 对象信息, None 表示对象不存在
+        """
+
+        expire = time.monotonic() + (self.ttl if profile is not None else self.negative_ttl)
+        with self.lock:
+            self.entries[wxid] = (expire, profile)
+            self.entries.move_to_end(wxid)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    # 使缓存失效
+    def invalidate(self, wxid: str = ''):
+        """使缓存失效
+
+        Args:
+            wxid (str, optional): 对象 WXID, 不填则全部失效
+        """
+
+        with self.lock:
+            if wxid:
+                self.entries.pop(wxid, None)
+            else:
+                self.entries.clear()
+
+    # 批量获取对象信息
+    def getMany(self, wxids: list, workers: int = 8, rate: float = 20) -> dict:
+        """批量获取对象信息, 未缓存的对象并发查询并写入缓存
+
+        例: robot.profiles.getMany(list(robot.members.get('xxx@chatroom')))
+
+        Args:
+            wxids (list): 对象 WXID 列表 \r\n
+            workers (int, optional): 并发线程数. 默认 8 \r\n
+            rate (float, optional): 每秒最多请求数. 默认 20
+
+        Returns:
+            dict: {wxid: 对象信息或 None}
+        """
+
+        result = {}
+        missing = []
+        now = time.monotonic()
+        with self.lock:
+            for wxid in dict.fromkeys(wxids):
+                entry = self.entries.get(wxid)
+                if entry is not None and entry[0] > now:
+                    result[wxid] = entry[1]
+                else:
+                    missing.append(wxid)
+
+        if missing:
+            limiter = RateLimiter(rate, max(1, workers))
+
+            def fetch(wxid):
+                limiter.acquire()
+                return self.get(wxid)
+
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='qianxun-profiles') as executor:
+                result.update(zip(missing, executor.map(fetch, missing)))
+
+        return result
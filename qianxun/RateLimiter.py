@@ -0,0 +1,39 @@
+import time
+from .Shared import LockState
+
+
+class RateLimiter(LockState):
+    transient = ('lock', 'tokens', 'refilled')
+
+    def __init__(self, rate: float = 5, burst: int = 5):
+        """令牌桶限速器, 多线程共享
+
+        Args:
+            rate (float, optional): 每秒生成的令牌数, 0 为不限速. 默认 5 \r\n
+            burst (int, optional): 令牌桶容量, 即允许的突发数. 默认 5
+        """
+
+        self.rate = rate
+        self.burst = burst
+        self.restore()
+
+    # 令牌桶在每个进程中重新装满
+    def restore(self):
+        super().restore()
+        self.tokens = float(self.burst)
+        self.refilled = time.monotonic()
+
+    # 获取一个令牌, 没有令牌时等待
+    def acquire(self):
+        while True:
+            if self.rate <= 0:
+                return
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.refilled) * self.rate)
+                self.refilled = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
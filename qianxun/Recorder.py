@@ -0,0 +1,178 @@
+import sys
+import time
+import json
+import argparse
+import threading
+import requests
+
+
+class Recorder:
+    def __init__(self, path: str, flush_every: int = 100, flush_interval: float = 1.0):
+        """回调事件录制器, 将原始回调事件按 JSONL 格式追加写入文件
+
+        每行格式: {"t": 1657518149.909, "e": {...原始回调事件...}}
+
+        每写入 flush_every 条刷新一次磁盘, 后台线程另外每隔 flush_interval 秒刷新一次, 事件稀少时末尾的事件也能及时落盘; \r\n
+        回调服务停止时应调用 close, 线程模式的 CallbackServer.shutdown 与进程模式收到 SIGTERM 时会自动关闭
+
+        Args:
+            path (str): 录制文件路径 \r\n
+            flush_every (int, optional): 每写入多少条刷新一次磁盘. 默认 100 \r\n
+            flush_interval (float, optional): 定时刷新间隔(秒), 0 为不定时刷新. 默认 1.0
+        """
+
+        self.path = path
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.count = 0
+        self.flushed = 0
+        self.lock = threading.Lock()
+        self.closed = threading.Event()
+        self.file = open(path, 'a', encoding='utf-8')
+        if flush_interval > 0:
+            threading.Thread(target=self.flush_loop, name='qianxun-recorder', daemon=True).start()
+
+    # 录制事件
+    def record(self, event: dict):
+        """录制事件
+
+        Args:
+            event (dict): 原始回调事件
+        """
+
+        line = json.dumps({'t': time.time(), 'e': event}, ensure_ascii=False, separators=(',', ':'))
+        with self.lock:
+            if self.file.closed:
+                return
+            self.file.write(line + '\n')
+            self.count += 1
+            if self.count % self.flush_every == 0:
+                self.file.flush()
+                self.flushed = self.count
+
+    # 定时刷新
+    def flush_loop(self):
+        while not self.closed.wait(self.flush_interval):
+            self.flush()
+
+    # 刷新磁盘
+    def flush(self):
+        with self.lock:
+            if self.flushed != self.count and not self.file.closed:
+                self.file.flush()
+                self.flushed = self.count
+
+    # 关闭录制
+    def close(self):
+        self.closed.set()
+        with self.lock:
+            if not self.file.closed:
+                self.file.flush()
+                self.file.close()
+
+
+# 读取录制文件
+def load(path: str) -> list:
+    """读取录制文件
+
+    Args:
+        path (str): 录制文件路径
+
+    Returns:
+        list: [(时间戳, 原始回调事件), ...]
+    """
+
+    records = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                item = json.loads(line)
+                records.append((item['t'], item['e']))
+    return records
+
+
+# 回放录制文件
+def replay(path: str, target, speed: float = 1.0) -> dict:
+    """回放录制文件, 按原始时间间隔将事件重新投递给回调服务, 回调方法或回调地址
+
+    target 为 robot.callbackApp(...) 创建的回调服务时, 事件在当前进程中经过与线上相同的中间件, 看门狗与入站队列; \r\n
+    带入站队列时统计的是入队耗时, 回放结束后调用 app.close() 等待队列处理完毕
+
+    例: replay('events.jsonl', robot.callbackApp(callback, slow_threshold=1), speed=0)
+
+    Args:
+        path (str): 录制文件路径 \r\n
+        target (Flask | callable | str): 回调服务应用, 回调方法, 或回调服务地址 例: "http://127.0.0.1:5000/" \r\n
+        speed (float, optional): 回放倍速, 1 = 原速, 10 = 十倍速, 0 = 不等待以最快速度回放. 默认 1.0
+
+    Returns:
+        dict: {
+            "count": 1000, # 回放事件数 \r\n
+            "failed": 0, # 投递失败数 \r\n
+            "elapsed": 1.52, # 总耗时(秒) \r\n
+            "throughput": 657.9, # 吞吐量(条/秒) \r\n
+            "latency": {"avg": 0.0011, "p50": 0.0009, "p99": 0.0043, "max": 0.0121} # 处理耗时(秒) \r\n
+        }
+    """
+
+    records = load(path)
+
+    if isinstance(target, str):
+        session = requests.Session()
+
+        def deliver(event):
+            session.post(url=target, data=json.dumps(event)).raise_for_status()
+    elif hasattr(target, 'test_client'):
+        client = target.test_client()
+
+        def deliver(event):
+            response = client.post('/', data=json.dumps(event))
+            if response.status_code >= 400:
+                raise RuntimeError(f'回调服务返回 {response.status_code}')
+    else:
+        deliver = target
+
+    latencies = []
+    failed = 0
+    first_ts = records[0][0] if records else 0
+    start = time.perf_counter()
+
+    for ts, event in records:
+        if speed > 0:
+            delay = (ts - first_ts) / speed - (time.perf_counter() - start)
+            if delay > 0:
+                time.sleep(delay)
+
+        begin = time.perf_counter()
+        try:
+            deliver(event)
+        except Exception:
+            failed += 1
+        latencies.append(time.perf_counter() - begin)
+
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    count = len(latencies)
+
+    return {
+        'count': count,
+        'failed': failed,
+        'elapsed': elapsed,
+        'throughput': count / elapsed if elapsed > 0 else 0.0,
+        'latency': {
+            'avg': sum(latencies) / count if count else 0.0,
+            'p50': latencies[int(count * 0.50)] if count else 0.0,
+            'p99': latencies[min(int(count * 0.99), count - 1)] if count else 0.0,
+            'max': latencies[-1] if count else 0.0,
+        },
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='回放千寻回调事件录制文件')
+    parser.add_argument('path', help='录制文件路径')
+    parser.add_argument('url', help='回调服务地址 例: http://127.0.0.1:5000/')
+    parser.add_argument('--speed', type=float, default=1.0, help='回放倍速, 0 为最快速度')
+    args = parser.parse_args()
+
+    json.dump(replay(args.path, args.url, args.speed), sys.stdout, indent=4)
@@ -2,11 +2,84 @@ import os
 import sys
 import time
 import json
+import signal
 import logging
+import threading
 import requests
 import xml.etree.ElementTree as ET
+from queue import Empty
 from multiprocessing import Process, Queue
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
+from werkzeug.serving import make_server
+from .Contacts import ContactDirectory
+from .Inbound import InboundQueue, ShedPolicy
+from .Members import GroupMemberCache
+from .Metrics import Metrics
+from .Middleware import Pipeline
+from .Profiles import ProfileCache
+from .Recorder import Recorder
+from .Scheduler import Scheduler
+from .Stream import iter_array
+from .TextCode import MAX_LENGTH, fits
+from .Watchdog import Watchdog
+
+
+class EventForwarder:
+    def __init__(self, queue):
+        """回调转发器, 在回调进程中将收到的事件放入跨进程队列, 供主进程消费
+
+        Args:
+            queue (multiprocessing.Queue): 跨进程队列
+        """
+
+        self.queue = queue
+
+    def __call__(self, event: dict):
+        self.queue.put(event)
+
+
+class CallbackServer(threading.Thread):
+    def __init__(self, app: Flask, port: int, host: str = '0.0.0.0'):
+        """线程模式的回调服务, 在当前进程的后台线程中运行, 回调方法与主程序共享内存
+
+        Args:
+            app (Flask): 回调服务应用
+            port (int): 回调端口
+            host (str, optional): 监听地址. 默认 0.0.0.0
+        """
+
+        super().__init__(daemon=True)
+        self.app = app
+        self.port = port
+        self.host = host
+        self.server = None
+        self.error = None
+        self.ready = threading.Event()
+
+    def run(self):
+        try:
+            self.server = make_server(self.host, self.port, self.app, threaded=True)
+        except SystemExit:
+            # werkzeug 在端口被占用时会直接退出
+            self.error = OSError(f'回调端口 {self.port} 启动失败')
+            self.ready.set()
+            return
+        except Exception as e:
+            self.error = e
+            self.ready.set()
+            return
+
+        self.ready.set()
+        self.server.serve_forever()
+
+    # 停止回调服务
+    def shutdown(self):
+        if self.server:
+            self.server.shutdown()
+        # 处理完入站队列中的事件, 停止工作线程并关闭录制文件
+        close = getattr(self.app, 'close', None)
+        if close:
+            close()
 
 
 class Robot:
@@ -23,6 +96,12 @@ class Robot:
         self.port = port
         self.bot_wxid = bot_wxid
         self.url = f"http://{self.host}:{self.port}/DaenWxHook/httpapi/"
+        self.metrics = Metrics()
+        self.middlewares = []
+        self.scheduler = Scheduler(self)
+        self.contacts = ContactDirectory(self)
+        self.members = GroupMemberCache(self)
+        self.profiles = ProfileCache(self)
 
     # 获取微信列表(X0000)
     def getWeChatList(self) -> dict:
@@ -87,7 +166,7 @@ class Robot:
         """发送文本消息(Q0001)
 
         1.消息内支持文本代码，详情见文本代码章节 \r\n
-        2.微信最多支持4096个字符,相当于2048个汉字,请勿超出否则崩溃
+        2.微信最多支持4096个字符,相当于2048个汉字,请勿超出否则崩溃; 超出时不会发送, 直接返回失败, 可先用 TextCode.truncate 截断
 
         Args:
             wxid (str): 要发给谁，支持好友、群聊、公众号等 \r\n \r\n
@@ -105,6 +184,9 @@ class Robot:
                 "timestamp": "1657121302946"
             }
         """
+        # 自动填充的昵称长度未知, 按 0 计算, 只拒绝一定超长的消息
+        if not fits(msg, auto_nick=0):
+            return {'code': 500, 'msg': f'消息超过 {MAX_LENGTH} 个字符'}
         data = {"type": "Q0001", "data": {"wxid": wxid, "msg": msg}}
         return self.post_(bot_wxid=bot_wxid, data=data)
 
@@ -368,6 +450,68 @@ class Robot:
         data = {"type": "Q0008", "data": {"wxid": wxid}}
         return self.post_(bot_wxid=bot_wxid, data=data)
 
+    # 逐条获取好友列表(Q0005)
+    def iterFriendList(self, type: str = '1', bot_wxid: str = ''):
+        """逐条获取好友列表(Q0005), 边下载边解析, 适用于好友很多的账号
+
+        例: for friend in robot.iterFriendList(): ...
+
+        Args:
+            bot_wxid (str, optional):  机器人 WXID, 不填则默认为初始化时的 WXID \r\n
+            type (str, optional): 1 = 从缓存中获取, 2 = 重新遍历二叉树并刷新缓存
+
+        Yields:
+            dict: 好友, 格式同 getFriendList 的 result 元素
+        """
+
+        data = {"type": "Q0005", "data": {"type": type}}
+        return self.stream_(bot_wxid=bot_wxid, data=data)
+
+    # 逐条获取群聊列表(Q0006)
+    def iterChatroomList(self, type: str = '1', bot_wxid: str = ''):
+        """逐条获取群聊列表(Q0006), 边下载边解析
+
+        Args:
+            bot_wxid (str, optional):  机器人 WXID, 不填则默认为初始化时的 WXID \r\n
+            type (str, optional): 1 = 从缓存中获取, 2 = 重新遍历二叉树并刷新缓存
+
+        Yields:
+            dict: 群聊, 格式同 getChatroomList 的 result 元素
+        """
+
+        data = {"type": "Q0006", "data": {"type": type}}
+        return self.stream_(bot_wxid=bot_wxid, data=data)
+
+    # 逐条获取公众号列表(Q0007)
+    def iterSubscriptionList(self, type: str = '1', bot_wxid: str = ''):
+        """逐条获取公众号列表(Q0007), 边下载边解析
+
+        Args:
+            bot_wxid (str, optional):  机器人 WXID, 不填则默认为初始化时的 WXID \r\n
+            type (str, optional): 1 = 从缓存中获取, 2 = 重新遍历二叉树并刷新缓存
+
+        Yields:
+            dict: 公众号, 格式同 getSubscriptionList 的 result 元素
+        """
+
+        data = {"type": "Q0007", "data": {"type": type}}
+        return self.stream_(bot_wxid=bot_wxid, data=data)
+
+    # 逐条获取群成员列表(Q0008)
+    def iterGroupMemberList(self, wxid: str, bot_wxid: str = ''):
+        """逐条获取群成员列表(Q0008), 边下载边解析, 适用于大群
+
+        Args:
+            bot_wxid (str, optional): 机器人 WXID, 不填则默认为初始化时的 WXID \r\n
+            wxid (str, optional): 群聊 WXID
+
+        Yields:
+            dict: {"wxid": "wxid_3sq4tklb6c3121", "groupNick": ""}
+        """
+
+        data = {"type": "Q0008", "data": {"wxid": wxid}}
+        return self.stream_(bot_wxid=bot_wxid, data=data)
+
     # 发送聊天记录(Q0009)
     def sendChatroomMsg(self, wxid: str, title: str, data_list: list, bot_wxid: str = '') -> dict:
         """发送聊天记录(Q0009)
@@ -622,7 +766,10 @@ class Robot:
         """
 
         data = {"type": "Q0017", "data": {"scene": scene, "v3": v3, "v4": v4}}
-        return self.post_(bot_wxid=bot_wxid, data=data)
+        response = self.post_(bot_wxid=bot_wxid, data=data)
+        if self.isSuccess(response, bot_wxid):
+            self.contacts.accept(v3)
+        return response
 
     # 添加好友_通过v3(Q0018)
     def addFriendByV3(self, v3: str, content: str, scene: str, type: int, bot_wxid: str = '') -> dict:
@@ -760,8 +907,10 @@ class Robot:
         """
 
         data = {"type": "Q0022", "data": {"wxid": wxid}}
-        response = requests.post(url=f'{self.url}?wxid={bot_wxid}', json=data)
-        return self.post_(bot_wxid=bot_wxid, data=data)
+        response = self.post_(bot_wxid=bot_wxid, data=data)
+        if self.isSuccess(response, bot_wxid):
+            self.contacts.remove(wxid)
+        return response
 
     # 修改对象备注(Q0023)
     def setFriendRemark(self, wxid: str, remark: str, bot_wxid: str = '') -> dict:
@@ -786,7 +935,10 @@ class Robot:
         """
 
         data = {"type": "Q0023", "data": {"wxid": wxid, "remark": remark}}
-        return self.post_(bot_wxid=bot_wxid, data=data)
+        response = self.post_(bot_wxid=bot_wxid, data=data)
+        if self.isSuccess(response, bot_wxid):
+            self.contacts.patch(wxid, remark=remark, remarkBrief='', remarkWhole='')
+        return response
 
     # 修改群聊名称(Q0024)
     def setGroupName(self, wxid: str, nick: str, bot_wxid: str = '') -> dict:
@@ -811,7 +963,10 @@ class Robot:
         """
 
         data = {"type": "Q0024", "data": {"wxid": wxid, "nick": nick}}
-        return self.post_(bot_wxid=bot_wxid, data=data)
+        response = self.post_(bot_wxid=bot_wxid, data=data)
+        if self.isSuccess(response, bot_wxid):
+            self.contacts.patch(wxid, nick=nick)
+        return response
 
     # 发送名片(Q0025)
     def sendCard(self, wxid: str, card_wxid: str, bot_wxid: str = '') -> dict:
@@ -835,40 +990,112 @@ class Robot:
             }
         """
 
-        object_info = self.queryObjectInformation(query_wxid=card_wxid)
+        object_info = self.profiles.get(card_wxid)
+        if object_info is None:
+            return {'code': 500, 'msg': '名片对象查询失败'}
 
         root = ET.Element("msg")
-        root.attrib["username"] = object_info['result']['wxid']
-        root.attrib["nickname"] = object_info['result']['nick']
-        root.attrib["alias"] = object_info['result']['wxNum']
-        root.attrib["province"] = object_info['result']['province']
-        root.attrib["city"] = object_info['result']['city']
-        root.attrib["sex"] = object_info['result']['sex']
+        root.attrib["username"] = object_info['wxid']
+        root.attrib["nickname"] = object_info['nick']
+        root.attrib["alias"] = object_info['wxNum']
+        root.attrib["province"] = object_info['province']
+        root.attrib["city"] = object_info['city']
+        root.attrib["sex"] = object_info.get('sex', '')
         card_xml = '<?xml version="1.0"?>' + ET.tostring(root).decode()
 
         data = {"type": "Q0025", "data": {"wxid": wxid, "xml": card_xml}}
         return self.post_(bot_wxid=bot_wxid, data=data)
 
+    # 注册中间件
+    def use(self, middleware) -> 'Robot':
+        """注册回调中间件, 按注册顺序在回调方法之前执行, 每个事件只执行一次
+
+        例: robot.use(EventFilter(events=[10008, 10009])).use(Dedup())
+
+        Args:
+            middleware (Middleware | callable): 中间件, 普通方法视为只有 before 阶段的中间件, 返回 False 时丢弃事件
+
+        Returns:
+            Robot: 当前实例, 便于链式调用
+        """
+
+        self.middlewares.append(middleware)
+        return self
+
     # 回调事件
-    def callbackEvents(self, callback_fun, port: int = 5000, log_level: int = logging.INFO):
+    def callbackEvents(self, callback_fun, port: int = 5000, log_level: int = logging.INFO, mode: str = 'process', ready_timeout: float = 10, **options):
         """回调事件
 
         Args:
             callback_fun (_type_): 回调方法
             port (int, optional): 回调端口. 默认 5000
             log_level (int, optional): 是否打印日志. 默认 logging.INFO
+            mode (str, optional): 运行模式, 'process' = 在子进程中运行, 'thread' = 在当前进程的后台线程中运行, \r\n
+                                  线程模式无需启动进程和序列化 Robot 与回调方法, 回调方法可以是闭包并与主程序共享内存. 默认 'process'
+            ready_timeout (float, optional): 线程模式下等待回调服务就绪的超时时间(秒). 默认 10
+            **options: 回调服务选项, 见 callbackApp
+
+        Returns:
+            Process | CallbackServer: 子进程, 或线程模式下已就绪的回调服务
+        """
+
+        if mode == 'thread':
+            if log_level:
+                logging.getLogger('werkzeug').setLevel(log_level)
+
+            server = CallbackServer(self.callbackApp(callback_fun, **options), port)
+            server.start()
+            if not server.ready.wait(ready_timeout):
+                raise TimeoutError('回调服务启动超时')
+            if server.error:
+                raise server.error
+            return server
+
+        process = Process(target=self.callbackMessage, args=(port, callback_fun, log_level), kwargs=options)
+        process.start()
+        return process
+
+    # 回调事件流
+    def events(self, port: int = 5000, log_level: int = logging.INFO, maxsize: int = 0, timeout: float = None, **kwargs):
+        """回调事件流, 回调服务仍运行在子进程中, 收到的事件经跨进程队列送回主进程, \r\n
+        由主进程迭代消费, 处理逻辑可直接使用主进程中的缓存与状态
+
+        例: for event in robot.events(port=5000): ...
+
+        Args:
+            port (int, optional): 回调端口. 默认 5000
+            log_level (int, optional): 是否打印日志. 默认 logging.INFO
+            maxsize (int, optional): 队列最大长度, 0 为不限制. 默认 0
+            timeout (float, optional): 等待事件的超时时间(秒), 超时后结束迭代, None 为一直等待. 默认 None
+            **kwargs: 其余参数同 callbackEvents, 如 record_path, metrics_path, mode
+
+        Yields:
+            dict: 原始回调事件
         """
 
-        Process(target=self.callbackMessage, args=(port, callback_fun, log_level)).start()
+        queue = Queue(maxsize)
+        process = self.callbackEvents(callback_fun=EventForwarder(queue), port=port, log_level=log_level, **kwargs)
+        try:
+            while True:
+                try:
+                    yield queue.get(timeout=timeout)
+                except Empty:
+                    return
+        finally:
+            if isinstance(process, CallbackServer):
+                process.shutdown()
+            else:
+                process.terminate()
 
     # 回调消息
-    def callbackMessage(self, port, callback_fun, log_level):
+    def callbackMessage(self, port, callback_fun, log_level, **options):
         """回调消息
 
         Args:
             port (_type_): 回调端口
             callback_fun (_type_): 回调方法
             log_level (_type_): 日志等级
+            **options: 回调服务选项, 见 callbackApp
 
         """
 
@@ -876,17 +1103,97 @@ class Robot:
             log = logging.getLogger('werkzeug')
             log.setLevel(log_level)
 
+        app = self.callbackApp(callback_fun, **options)
+        if threading.current_thread() is threading.main_thread():
+            # Process.terminate 发送 SIGTERM, 转为 SystemExit 以便处理完队列并关闭录制文件
+            signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        try:
+            app.run(host='0.0.0.0', port=port)
+        finally:
+            app.close()
+
+    # 回调服务
+    def callbackApp(self, callback_fun, record_path: str = '', metrics_path: str = '', slow_threshold: float = 0, handler_timeout: float = 0,
+                    queue_size: int = 0, workers: int = 4, shed_policy: ShedPolicy = None) -> Flask:
+        """创建回调服务的 Flask 应用
+
+        Args:
+            callback_fun (_type_): 回调方法
+            record_path (str, optional): 录制文件路径, 填写后会将收到的原始回调事件追加写入该文件, 可用 qianxun.Recorder.replay 回放. 默认不录制
+            metrics_path (str, optional): 指标接口路径 例: '/metrics', 填写后以 Prometheus 文本格式提供运行指标, \r\n
+                                          进程模式下只包含回调进程中的指标, 主程序的接口调用指标需用 robot.metrics.serve 提供. 默认不开启
+            slow_threshold (float, optional): 慢回调阈值(秒), 超过后记录事件代码, 回调方法名, 耗时与调用栈. 默认 0 不检测
+            handler_timeout (float, optional): 回调超时时间(秒), 超时后立即响应千寻, 回调方法隔离到后台线程继续执行. 默认 0 不限制
+            queue_size (int, optional): 入站队列长度, 大于 0 时收到事件后立即入队并响应, 由工作线程处理, 积压时按 shed_policy 丢弃事件. 默认 0 同步处理
+            workers (int, optional): 入站队列工作线程数. 默认 4
+            shed_policy (ShedPolicy, optional): 削峰策略, 见 qianxun.Inbound.ShedPolicy. 默认不丢弃 10006 转账与 10011 好友请求, 优先丢弃 10010 自己发出消息
+
+        Returns:
+            Flask: 回调服务应用, 停止服务后调用 app.close() 处理完入站队列中的事件并释放工作线程
+        """
+
+        watchdog = None
+        if slow_threshold or handler_timeout:
+            watchdog = Watchdog(slow_threshold, handler_timeout, metrics=self.metrics, policy=shed_policy)
+            callback_fun = watchdog.wrap(callback_fun)
+        if self.middlewares:
+            callback_fun = Pipeline(callback_fun, self.middlewares, self.metrics)
+
+        recorder = Recorder(record_path) if record_path else None
+        metrics = self.metrics
+
+        def dispatch(event):
+            labels = (('event', str(event.get('event', ''))),)
+            metrics.add('handlers_in_flight', 1)
+            begin = time.perf_counter()
+            try:
+                callback_fun(event)
+            except Exception:
+                metrics.inc('events_failed_total', labels)
+                raise
+            finally:
+                metrics.observe('handler_latency_seconds', time.perf_counter() - begin, labels)
+                metrics.add('handlers_in_flight', -1)
+
+        inbound = InboundQueue(dispatch, queue_size, workers, shed_policy, metrics) if queue_size else None
+
         app = Flask(__name__)
 
+        # 停止回调服务后调用: 处理完入站队列中的事件, 关闭隔离线程池与录制文件
+        def close():
+            if inbound is not None:
+                inbound.close()
+            if watchdog is not None:
+                watchdog.close()
+            if recorder:
+                recorder.close()
+
+        app.close = close
+
         @app.route('/', methods=['GET', 'POST'])
         def callback():
             if request.method == 'GET':
                 return jsonify({'code': 404, 'msg': '需要POST请求'})
             elif request.method == 'POST':
-                callback_fun(request.json)
+                event = request.get_json(force=True, silent=True)
+                if not isinstance(event, dict):
+                    return jsonify({'code': 400, 'msg': '回调事件必须是 JSON 对象'}), 400
+                metrics.inc('events_received_total', (('event', str(event.get('event', ''))),))
+                if recorder:
+                    recorder.record(event)
+
+                if inbound is not None:
+                    inbound.put(event)
+                else:
+                    dispatch(event)
                 return jsonify({'code': 200, 'msg': '回调成功'})
 
-        app.run(host='0.0.0.0', port=port)
+        if metrics_path:
+            @app.route(metrics_path, methods=['GET'])
+            def metrics_endpoint():
+                return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+        return app
 
     # 艾特群员
     def at(wxid: str = '', nick: str = '', is_auto: bool = True, at_list: list = []) -> str:
@@ -914,14 +1221,59 @@ class Robot:
                     at_str += f'[@,wxid={at},nick=' ',isAuto=true]'
             return at_str
 
+    # 请求是否成功
+    def isSuccess(self, response: dict, bot_wxid: str = '') -> bool:
+        """请求是否成功, 且操作的是初始化时的机器人, 用于同步本地缓存
+
+        Args:
+            response (dict): 接口返回值
+            bot_wxid (str, optional): 请求使用的机器人 WXID
+
+        Returns:
+            bool: 是否成功
+        """
+
+        if bot_wxid and bot_wxid != self.bot_wxid:
+            return False
+        return isinstance(response, dict) and response.get('code') == 200
+
     # 发送消息
     def post_(self, bot_wxid: str = '', data: dict = {}) -> dict:
         if not bot_wxid and not self.bot_wxid and data['type'] != 'X0000':
             print('请传入机器人WXID')
             return
 
+        labels = (('type', data['type']),)
+        begin = time.perf_counter()
         try:
             bot_wxid = bot_wxid if bot_wxid else self.bot_wxid
             return requests.post(url=f'{self.url}?wxid={bot_wxid}', data=json.dumps(data)).json()
         except Exception as e:
+            self.metrics.inc('outbound_failed_total', labels)
             return {'code': 500, 'msg': '千寻接口请求失败'}
+        finally:
+            self.metrics.observe('outbound_latency_seconds', time.perf_counter() - begin, labels)
+
+    # 流式请求列表
+    def stream_(self, bot_wxid: str = '', data: dict = {}, chunk_size: int = 65536):
+        """流式请求列表类接口, 逐条返回 result 数组的元素, 不在内存中保留完整响应
+
+        Raises:
+            requests.RequestException: 千寻接口请求失败 \r\n
+            ValueError: 响应中没有 result 数组
+        """
+
+        bot_wxid = bot_wxid if bot_wxid else self.bot_wxid
+        if not bot_wxid:
+            raise ValueError('请传入机器人WXID')
+
+        labels = (('type', data['type']),)
+        begin = time.perf_counter()
+        try:
+            with requests.post(url=f'{self.url}?wxid={bot_wxid}', data=json.dumps(data), stream=True) as response:
+                yield from iter_array(response.iter_content(chunk_size))
+        except Exception:
+            self.metrics.inc('outbound_failed_total', labels)
+            raise
+        finally:
+            self.metrics.observe('outbound_latency_seconds', time.perf_counter() - begin, labels)
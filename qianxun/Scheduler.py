@@ -0,0 +1,287 @@
+import time
+import heapq
+import logging
+import itertools
+import threading
+from datetime import datetime, timedelta
+from .RateLimiter import RateLimiter
+from .Shared import ProcessLocal
+
+
+class Cron:
+    # 各字段的取值范围: 分 时 日 月 周
+    RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+    def __init__(self, expr: str):
+        """cron 表达式, 格式为 "分 时 日 月 周", 支持 *, */n, a-b, a-b/n 与逗号分隔的列表
+
+        例: "0 9 * * 1-5" 为工作日 9 点, "*/15 * * * *" 为每 15 分钟
+
+        Args:
+            expr (str): cron 表达式
+        """
+
+        fields = expr.split()
+        if len(fields) != 5:
+            raise ValueError(f'cron 表达式需要 5 个字段: {expr}')
+
+        self.expr = expr
+        self.minutes, self.hours, self.days, self.months, weekdays = (
+            self.parse(field, low, high) for field, (low, high) in zip(fields, self.RANGES)
+        )
+        self.weekdays = {day % 7 for day in weekdays}
+        self.any_day = fields[2] == '*'
+        self.any_weekday = fields[4] == '*'
+
+    @staticmethod
+    def parse(field: str, low: int, high: int) -> frozenset:
+        values = set()
+        for part in field.split(','):
+            step = 1
+            if '/' in part:
+                part, step = part.split('/')
+                step = int(step)
+            if part == '*':
+                start, end = low, high
+            elif '-' in part:
+                start, end = (int(x) for x in part.split('-'))
+            else:
+                start = end = int(part)
+                if step > 1:
+                    end = high
+            if start < low or end > high or start > end or step < 1:
+                raise ValueError(f'cron 字段超出范围: {field}')
+            values.update(range(start, end + 1, step))
+        return frozenset(values)
+
+    def match_day(self, t: datetime) -> bool:
+        day = t.day in self.days
+        weekday = (t.weekday() + 1) % 7 in self.weekdays
+        if self.any_day:
+            return weekday
+        if self.any_weekday:
+            return day
+        return day or weekday
+
+    # 下一次触发时间
+    def next(self, after: float) -> float:
+        """下一次触发时间
+
+        Args:
+            after (float): 起始时间戳
+
+        Returns:
+            float: 晚于 after 的下一次触发时间戳
+        """
+
+        t = datetime.fromtimestamp(after).replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = t.year + 5
+        while t.year <= limit:
+            if t.month not in self.months:
+                t = (t.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self.match_day(t):
+                t = t.replace(hour=0, minute=0) + timedelta(days=1)
+            elif t.hour not in self.hours:
+                t = t.replace(minute=0) + timedelta(hours=1)
+            elif t.minute not in self.minutes:
+                t += timedelta(minutes=1)
+            else:
+                return t.timestamp()
+        raise ValueError(f'cron 表达式没有可触发的时间: {self.expr}')
+
+
+class Job:
+    __slots__ = ('id', 'due', 'method', 'args', 'kwargs', 'repeat', 'cancelled')
+
+    def __init__(self, id: int, due: float, method, args: tuple, kwargs: tuple, repeat):
+        self.id = id
+        self.due = due
+        self.method = method
+        self.args = args
+        self.kwargs = kwargs
+        self.repeat = repeat
+        self.cancelled = False
+
+    def __lt__(self, other: 'Job') -> bool:
+        return (self.due, self.id) < (other.due, other.id)
+
+
+class Scheduler(ProcessLocal):
+    persistent = ('robot', 'limiter', 'logger')
+
+    def __init__(self, robot, rate: float = 5, burst: int = 5, logger: logging.Logger = None):
+        """定时任务调度器, 支持延时, 定点, 间隔与 cron 方式调用 Robot 的任意接口
+
+        任务存放在按触发时间排列的最小堆中, 由一个后台线程等待最早的任务, 添加与取出均为 O(log n), \r\n
+        几十万个待执行任务只占用少量内存; 到期任务经令牌桶限速后依次调用, 避免瞬间压垮千寻接口
+
+        Args:
+            robot (Robot): 机器人实例 \r\n
+            rate (float, optional): 每秒最多执行的任务数. 默认 5 \r\n
+            burst (int, optional): 允许的突发任务数. 默认 5 \r\n
+            logger (logging.Logger, optional): 日志记录器. 默认 logging.getLogger('qianxun')
+        """
+
+        self.robot = robot
+        self.limiter = RateLimiter(rate, burst)
+        self.logger = logger or logging.getLogger('qianxun')
+        self.setup()
+
+    def setup(self):
+        self.heap = []
+        self.jobs = {}
+        self.ids = itertools.count(1)
+        self.cond = threading.Condition()
+        self.thread = None
+        self.running = False
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    # 延时执行
+    def later(self, delay: float, method, *args, **kwargs) -> int:
+        """延时执行
+
+        例: robot.scheduler.later(60, 'sendTextMessage', wxid='filehelper', msg='一分钟后')
+
+        Args:
+            delay (float): 延时(秒) \r\n
+            method (str | callable): Robot 的接口名, 或任意可调用对象 \r\n
+            *args, **kwargs: 调用参数
+
+        Returns:
+            int: 任务 ID
+        """
+
+        return self.add(time.time() + delay, method, args, kwargs, None)
+
+    # 定点执行
+    def at(self, timestamp: float, method, *args, **kwargs) -> int:
+        """定点执行
+
+        Args:
+            timestamp (float): 执行时间戳 \r\n
+            method (str | callable): Robot 的接口名, 或任意可调用对象 \r\n
+            *args, **kwargs: 调用参数
+
+        Returns:
+            int: 任务 ID
+        """
+
+        return self.add(timestamp, method, args, kwargs, None)
+
+    # 间隔执行
+    def every(self, interval: float, method, *args, **kwargs) -> int:
+        """间隔执行, 首次在 interval 秒后执行
+
+        Args:
+            interval (float): 间隔(秒) \r\n
+            method (str | callable): Robot 的接口名, 或任意可调用对象 \r\n
+            *args, **kwargs: 调用参数
+
+        Returns:
+            int: 任务 ID
+        """
+
+        return self.add(time.time() + interval, method, args, kwargs, float(interval))
+
+    # cron 方式执行
+    def cron(self, expr: str, method, *args, **kwargs) -> int:
+        """cron 方式执行
+
+        例: robot.scheduler.cron('0 9 * * *', 'sendTextMessage', wxid='filehelper', msg='早上好')
+
+        Args:
+            expr (str): cron 表达式 "分 时 日 月 周" \r\n
+            method (str | callable): Robot 的接口名, 或任意可调用对象 \r\n
+            *args, **kwargs: 调用参数
+
+        Returns:
+            int: 任务 ID
+        """
+
+        cron = Cron(expr)
+        return self.add(cron.next(time.time()), method, args, kwargs, cron)
+
+    # 取消任务
+    def cancel(self, job_id: int) -> bool:
+        """取消任务
+
+        Args:
+            job_id (int): 任务 ID
+
+        Returns:
+            bool: 任务存在并已取消时为 True
+        """
+
+        with self.cond:
+            job = self.jobs.pop(job_id, None)
+            if job is None:
+                return False
+            job.cancelled = True
+            return True
+
+    def add(self, due: float, method, args: tuple, kwargs: dict, repeat) -> int:
+        if isinstance(method, str) and not callable(getattr(self.robot, method, None)):
+            raise AttributeError(f'Robot 没有接口 {method}')
+
+        with self.cond:
+            job = Job(next(self.ids), due, method, args, tuple(kwargs.items()) if kwargs else None, repeat)
+            self.jobs[job.id] = job
+            heapq.heappush(self.heap, job)
+            if self.heap[0] is job:
+                self.cond.notify()
+            if self.thread is None:
+                self.start()
+            return job.id
+
+    # 启动调度线程
+    def start(self):
+        with self.cond:
+            if self.thread is None:
+                self.running = True
+                self.thread = threading.Thread(target=self.loop, name='qianxun-scheduler', daemon=True)
+                self.thread.start()
+
+    # 停止调度线程
+    def stop(self):
+        with self.cond:
+            self.running = False
+            self.cond.notify()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+
+    # 调度循环
+    def loop(self):
+        while True:
+            with self.cond:
+                while self.running:
+                    while self.heap and self.heap[0].cancelled:
+                        heapq.heappop(self.heap)
+                    if self.heap:
+                        wait = self.heap[0].due - time.time()
+                        if wait <= 0:
+                            break
+                        self.cond.wait(wait)
+                    else:
+                        self.cond.wait()
+                if not self.running:
+                    return
+
+                job = heapq.heappop(self.heap)
+                if job.repeat is None:
+                    del self.jobs[job.id]
+                else:
+                    job.due = job.repeat.next(job.due) if isinstance(job.repeat, Cron) else max(job.due + job.repeat, time.time())
+                    heapq.heappush(self.heap, job)
+
+            self.limiter.acquire()
+            self.run(job)
+
+    def run(self, job: Job):
+        method = getattr(self.robot, job.method) if isinstance(job.method, str) else job.method
+        try:
+            method(*job.args, **dict(job.kwargs or ()))
+        except Exception:
+            self.logger.exception('定时任务执行失败: id=%s method=%s', job.id, job.method)
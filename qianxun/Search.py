@@ -0,0 +1,198 @@
+import re
+import math
+import heapq
+import bisect
+import threading
+from .Shared import LockState
+
+
+# 参与检索的字段: 昵称, 备注, 以及千寻返回的简拼与全拼
+FIELDS = ('nick', 'remark', 'nickBrief', 'nickWhole', 'remarkBrief', 'remarkWhole')
+
+# 文本代码, 如 [emoji=D83D] [捂脸], 不参与检索
+TEXT_CODE = re.compile(r'\[[^\[\]]*\]')
+
+
+# 规范化检索词
+def normalize(text: str) -> str:
+    return TEXT_CODE.sub('', text or '').replace('?', '').strip().lower()
+
+
+# 拆分 n-gram
+def grams(text: str) -> set:
+    """拆分 n-gram: 全部相邻两字, 以及单个非 ASCII 字符(中文单字区分度高, 单独建索引)
+
+    Args:
+        text (str): 已规范化的文本
+
+    Returns:
+        set: n-gram 集合
+    """
+
+    result = {text[i:i + 2] for i in range(len(text) - 1)}
+    result.update(char for char in text if ord(char) > 127)
+    if len(text) == 1:
+        result.add(text)
+    return result
+
+
+class SearchIndex(LockState):
+    def __init__(self, fields: tuple = FIELDS):
+        """联系人检索索引, 支持昵称, 备注与拼音的前缀匹配和模糊匹配
+
+        1.前缀匹配: 全部检索词排序存放, 二分查找前缀区间, O(log n) \r\n
+        2.模糊匹配: n-gram 倒排索引, 按与查询词共有的 n-gram 比例打分
+
+        Args:
+            fields (tuple, optional): 参与检索的字段. 默认 FIELDS
+        """
+
+        self.fields = fields
+        self.terms = []
+        self.postings = {}
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    # 加入索引
+    def add(self, wxid: str, record: dict):
+        """加入索引, 已存在时先删除旧索引
+
+        Args:
+            wxid (str): 联系人 WXID \r\n
+            record (dict): 联系人, 格式同 getFriendList 的 result 元素
+        """
+
+        words = {normalize(record.get(field)) for field in self.fields}
+        words.discard('')
+        with self.lock:
+            self.discard(wxid)
+            self.entries[wxid] = words
+            for word in words:
+                bisect.insort(self.terms, (word, wxid))
+                for gram in grams(word):
+                    self.postings.setdefault(gram, set()).add(wxid)
+
+    # 批量重建索引
+    def rebuild(self, records: dict):
+        """批量重建索引, 比逐条 add 快得多
+
+        Args:
+            records (dict): {wxid: 联系人}
+        """
+
+        terms = []
+        postings = {}
+        entries = {}
+        for wxid, record in records.items():
+            words = {normalize(record.get(field)) for field in self.fields}
+            words.discard('')
+            entries[wxid] = words
+            for word in words:
+                terms.append((word, wxid))
+                for gram in grams(word):
+                    postings.setdefault(gram, set()).add(wxid)
+        terms.sort()
+
+        with self.lock:
+            self.terms, self.postings, self.entries = terms, postings, entries
+
+    # 移出索引
+    def remove(self, wxid: str):
+        with self.lock:
+            self.discard(wxid)
+
+    def discard(self, wxid: str):
+        words = self.entries.pop(wxid, None)
+        if not words:
+            return
+        for word in words:
+            index = bisect.bisect_left(self.terms, (word, wxid))
+            if index < len(self.terms) and self.terms[index] == (word, wxid):
+                del self.terms[index]
+            for gram in grams(word):
+                posting = self.postings.get(gram)
+                if posting is not None:
+                    posting.discard(wxid)
+                    if not posting:
+                        del self.postings[gram]
+
+    # 前缀匹配
+    def prefix(self, query: str, limit: int = 20) -> list:
+        """前缀匹配
+
+        例: index.prefix('zhang') 可匹配全拼 zhangsan, index.prefix('zs') 可匹配简拼 ZS
+
+        Args:
+            query (str): 查询词 \r\n
+            limit (int, optional): 最多返回数量. 默认 20
+
+        Returns:
+            list: 匹配的 WXID 列表
+        """
+
+        query = normalize(query)
+        if not query:
+            return []
+
+        result = []
+        seen = set()
+        terms = self.terms
+        index = bisect.bisect_left(terms, (query,))
+        while index < len(terms) and len(result) < limit:
+            word, wxid = terms[index]
+            if not word.startswith(query):
+                break
+            if wxid not in seen:
+                seen.add(wxid)
+                result.append(wxid)
+            index += 1
+        return result
+
+    # 模糊匹配
+    def fuzzy(self, query: str, limit: int = 20, threshold: float = 0.5) -> list:
+        """模糊匹配, 按与查询词共有的 n-gram 比例打分
+
+        Args:
+            query (str): 查询词 \r\n
+            limit (int, optional): 最多返回数量. 默认 20 \r\n
+            threshold (float, optional): 最低得分, 0 到 1. 默认 0.5
+
+        Returns:
+            list: [(wxid, 得分), ...] 按得分从高到低排列
+        """
+
+        query_grams = grams(normalize(query))
+        if not query_grams:
+            return []
+
+        # 得分达到阈值至少要命中 need 个 n-gram, 因此候选只需从最短的 total - need + 1 个倒排表中取
+        total = len(query_grams)
+        need = max(1, math.ceil(threshold * total))
+        postings = sorted((self.postings.get(gram, ()) for gram in query_grams), key=len)
+        candidates = set()
+        for posting in postings[:total - need + 1]:
+            candidates.update(posting)
+
+        matched = []
+        for wxid in candidates:
+            hits = sum(1 for posting in postings if wxid in posting)
+            if hits >= need:
+                matched.append((wxid, hits / total))
+        return heapq.nlargest(limit, matched, key=lambda item: item[1])
+
+    # 检索
+    def search(self, query: str, limit: int = 20) -> list:
+        """检索, 优先使用前缀匹配, 没有结果时再使用模糊匹配
+
+        Args:
+            query (str): 查询词 \r\n
+            limit (int, optional): 最多返回数量. 默认 20
+
+        Returns:
+            list: 匹配的 WXID 列表
+        """
+
+        return self.prefix(query, limit) or [wxid for wxid, _ in self.fuzzy(query, limit)]
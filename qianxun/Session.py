@@ -0,0 +1,172 @@
+import math
+import time
+import pickle
+import threading
+from .Event import conversation, sender
+from .Middleware import Middleware
+from .Shared import LockState
+
+
+class SessionStore(LockState):
+    def __init__(self, ttl: float = 1800, resolution: float = 1.0, clock=time.monotonic):
+        """会话存储, 按 (机器人 WXID, 会话 WXID, 用户 WXID) 保存多轮对话的状态
+
+        过期由时间轮管理: 每次访问会把会话移动到新的过期槽位, 时间轮随访问推进并清理到期槽位, \r\n
+        读写与过期均为 O(1), 无需后台线程, 内存只随活跃会话数增长
+
+        Args:
+            ttl (float, optional): 会话空闲多久后过期(秒). 默认 1800 \r\n
+            resolution (float, optional): 时间轮精度(秒), 过期时间误差不超过该值. 默认 1.0 \r\n
+            clock (callable, optional): 时钟. 默认 time.monotonic
+        """
+
+        self.ttl = ttl
+        self.resolution = resolution
+        self.clock = clock
+        self.size = int(math.ceil(ttl / resolution)) + 1
+        self.slots = [set() for _ in range(self.size)]
+        self.data = {}
+        self.tick = self.now_tick()
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self.lock:
+            self.advance()
+            return len(self.data)
+
+    def __contains__(self, key: tuple) -> bool:
+        with self.lock:
+            self.advance()
+            return key in self.data
+
+    def now_tick(self) -> int:
+        return int(self.clock() / self.resolution)
+
+    # 获取会话
+    def get(self, key: tuple, create: bool = True) -> dict:
+        """获取会话, 并刷新其过期时间
+
+        Args:
+            key (tuple): (机器人 WXID, 会话 WXID, 用户 WXID) \r\n
+            create (bool, optional): 不存在时是否创建空会话. 默认 True
+
+        Returns:
+            dict: 会话状态, 不存在且不创建时为 None
+        """
+
+        with self.lock:
+            self.advance()
+            entry = self.data.get(key)
+            if entry is None:
+                if not create:
+                    return None
+                entry = self.data[key] = [{}, None]
+            self.touch(key, entry)
+            return entry[0]
+
+    # 写入会话
+    def set(self, key: tuple, value: dict):
+        with self.lock:
+            self.advance()
+            entry = self.data.get(key)
+            if entry is None:
+                entry = self.data[key] = [value, None]
+            else:
+                entry[0] = value
+            self.touch(key, entry)
+
+    # 删除会话
+    def pop(self, key: tuple, default=None):
+        with self.lock:
+            entry = self.data.pop(key, None)
+            if entry is None:
+                return default
+            self.slots[entry[1]].discard(key)
+            return entry[0]
+
+    # 获取事件对应的会话
+    def of(self, event: dict) -> dict:
+        """获取事件对应的会话
+
+        Args:
+            event (dict): 原始回调事件
+
+        Returns:
+            dict: 会话状态
+        """
+
+        return self.get((event.get('wxid', ''), conversation(event), sender(event)))
+
+    # 将会话移动到新的过期槽位
+    def touch(self, key: tuple, entry: list):
+        slot = (self.tick + self.size - 1) % self.size
+        if entry[1] is not None and entry[1] != slot:
+            self.slots[entry[1]].discard(key)
+        entry[1] = slot
+        self.slots[slot].add(key)
+
+    # 推进时间轮, 清理到期槽位
+    def advance(self):
+        now = self.now_tick()
+        steps = min(now - self.tick, self.size)
+        for step in range(1, steps + 1):
+            slot = self.slots[(self.tick + step) % self.size]
+            for key in slot:
+                del self.data[key]
+            slot.clear()
+        if now > self.tick:
+            self.tick = now
+
+    # 保存到文件
+    def save(self, path: str):
+        """保存到文件, 记录各会话剩余的存活时间
+
+        Args:
+            path (str): 文件路径
+        """
+
+        with self.lock:
+            self.advance()
+            items = [
+                (key, value, ((slot - self.tick) % self.size) * self.resolution)
+                for key, (value, slot) in self.data.items()
+            ]
+        with open(path, 'wb') as f:
+            pickle.dump(items, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    # 从文件加载
+    def load(self, path: str):
+        """从文件加载, 会话按保存时剩余的存活时间继续计时
+
+        Args:
+            path (str): 文件路径
+        """
+
+        with open(path, 'rb') as f:
+            items = pickle.load(f)
+
+        with self.lock:
+            self.advance()
+            for key, value, remaining in items:
+                slot = (self.tick + max(1, min(int(remaining / self.resolution), self.size - 1))) % self.size
+                old = self.data.get(key)
+                if old is not None:
+                    self.slots[old[1]].discard(key)
+                self.data[key] = [value, slot]
+                self.slots[slot].add(key)
+
+
+class SessionMiddleware(Middleware):
+    def __init__(self, store: SessionStore, field: str = 'session'):
+        """会话中间件, 将事件对应的会话放入 event[field], 回调方法可直接读写
+
+        Args:
+            store (SessionStore): 会话存储 \r\n
+            field (str, optional): 会话放入事件的字段名. 默认 'session'
+        """
+
+        self.store = store
+        self.field = field
+
+    def before(self, event: dict):
+        event[self.field] = self.store.of(event)
@@ -0,0 +1,92 @@
+import threading
+
+# 缓存中没有该键
+MISSING = object()
+
+
+class LockState:
+    """带锁的可序列化对象, 锁等 transient 中的字段不随实例复制到回调进程, 恢复后由 restore 重新创建"""
+
+    # 不随实例复制的字段
+    transient = ('lock',)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in self.transient:
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.restore()
+
+    # 重建不随实例复制的字段
+    def restore(self):
+        self.lock = threading.Lock()
+
+
+class ProcessLocal:
+    """属于创建它的进程的缓存, 随 Robot 复制到回调进程时只保留 persistent 中的配置, 恢复后由 setup 重建空缓存
+
+    复制出的实例与主进程互不相通, detached 为 True
+    """
+
+    # 随实例复制的配置字段
+    persistent = ()
+    detached = False
+
+    def __getstate__(self):
+        return {name: self.__dict__[name] for name in self.persistent}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.detached = True
+        self.setup()
+
+
+class SingleFlight:
+    def __init__(self, lock):
+        """同一个键同时只加载一次, 其余调用等待加载完成后读取缓存
+
+        Args:
+            lock (threading.Lock | threading.RLock): 保护缓存的锁, 查找缓存与登记加载在同一把锁内完成
+        """
+
+        self.lock = lock
+        self.loading = {}
+
+    # 读取缓存, 没有时加载
+    def get(self, key, lookup, load):
+        """读取缓存, 没有时加载
+
+        Args:
+            key (str): 键 \r\n
+            lookup (callable): lookup(key), 在锁内查找缓存, 没有时返回 MISSING \r\n
+            load (callable): load(key), 在锁外加载并写入缓存, 返回加载结果
+
+        Returns:
+            any: 缓存或加载结果, 等待的调用在加载失败时为 None
+        """
+
+        with self.lock:
+            value = lookup(key)
+            if value is not MISSING:
+                return value
+
+            event = self.loading.get(key)
+            owner = event is None
+            if owner:
+                event = self.loading[key] = threading.Event()
+
+        if not owner:
+            event.wait()
+            with self.lock:
+                value = lookup(key)
+            return None if value is MISSING else value
+
+        try:
+            return load(key)
+        finally:
+            with self.lock:
+                del self.loading[key]
+            event.set()
@@ -0,0 +1,154 @@
+import time
+import json
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from .RateLimiter import RateLimiter
+
+
+class ContactSnapshot:
+    def __init__(self, path: str, logger: logging.Logger = None):
+        """联系人快照, 将联系人目录与群成员缓存保存到 SQLite 文件, 重启时直接恢复, 不再等待千寻拉取
+
+        1.save 保存当前缓存并记录保存时间 \r\n
+        2.restore 从文件恢复缓存, 联系人目录按保存时间计算是否过期, 过期后的访问照常在后台刷新 \r\n
+        3.reconcile 在后台线程中重新拉取联系人与已恢复的群成员, 完成后再次保存
+
+        Args:
+            path (str): 快照文件路径 \r\n
+            logger (logging.Logger, optional): 日志记录器. 默认 logging.getLogger('qianxun')
+        """
+
+        self.path = path
+        self.logger = logger or logging.getLogger('qianxun')
+        self.lock = threading.Lock()
+        with self.connect() as db:
+            db.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+            db.execute('CREATE TABLE IF NOT EXISTS contacts (wxid TEXT PRIMARY KEY, kind TEXT, data TEXT)')
+            db.execute('CREATE TABLE IF NOT EXISTS members (seq INTEGER PRIMARY KEY, group_wxid TEXT, data TEXT)')
+
+    @contextmanager
+    def connect(self):
+        db = sqlite3.connect(self.path, timeout=30)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    # 保存时间
+    def saved_at(self) -> float:
+        """快照保存时间
+
+        Returns:
+            float: 保存时的 time.time(), 没有快照时为 0
+        """
+
+        with self.connect() as db:
+            row = db.execute("SELECT value FROM meta WHERE key = 'saved_at'").fetchone()
+        return float(row[0]) if row else 0
+
+    # 保存快照
+    def save(self, robot) -> dict:
+        """保存联系人目录与群成员缓存, 覆盖原有快照
+
+        Args:
+            robot (Robot): 机器人实例
+
+        Returns:
+            dict: {"contacts": 5000, "groups": 300}
+        """
+
+        directory = robot.contacts
+        with directory.lock:
+            contacts = [
+                (wxid, directory.kinds.get(wxid, 'friend'), json.dumps(dict(record), ensure_ascii=False))
+                for wxid, record in directory.records.items()
+            ]
+
+        cache = robot.members
+        with cache.lock:
+            # 按最近访问顺序保存, 恢复时优先恢复最近访问的群
+            groups = list(cache.groups.items())
+        members = [
+            (group_wxid, json.dumps(list(group.items()), ensure_ascii=False))
+            for group_wxid, group in groups
+        ]
+
+        with self.lock, self.connect() as db:
+            db.execute('DELETE FROM contacts')
+            db.execute('DELETE FROM members')
+            db.executemany('INSERT INTO contacts (wxid, kind, data) VALUES (?, ?, ?)', contacts)
+            db.executemany('INSERT INTO members (group_wxid, data) VALUES (?, ?)', members)
+            db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('saved_at', ?)", (str(time.time()),))
+
+        return {'contacts': len(contacts), 'groups': len(members)}
+
+    # 恢复快照
+    def restore(self, robot, reconcile: bool = True, rate: float = 2) -> dict:
+        """从快照恢复联系人目录与群成员缓存
+
+        群成员从最近访问的群开始恢复, 达到 robot.members.max_members 后停止
+
+        Args:
+            robot (Robot): 机器人实例 \r\n
+            reconcile (bool, optional): 恢复后是否在后台与千寻对账. 默认 True \r\n
+            rate (float, optional): 后台对账时每秒最多拉取的群数. 默认 2
+
+        Returns:
+            dict: {"contacts": 5000, "groups": 300, "age": 3600.5}, 没有快照时为 None
+        """
+
+        saved_at = self.saved_at()
+        if not saved_at:
+            return None
+        age = max(0, time.time() - saved_at)
+
+        with self.connect() as db:
+            contacts = db.execute('SELECT kind, data FROM contacts').fetchall()
+            rows = db.execute('SELECT group_wxid, data FROM members ORDER BY seq DESC')
+            cache = robot.members
+            groups = []
+            total = 0
+            for group_wxid, data in rows:
+                members = json.loads(data)
+                if groups and total + len(members) > cache.max_members:
+                    break
+                groups.append((group_wxid, members))
+                total += len(members)
+
+        robot.contacts.restore(((kind, json.loads(data)) for kind, data in contacts), age)
+        for group_wxid, members in reversed(groups):
+            cache.put(group_wxid, members)
+
+        if reconcile:
+            threading.Thread(
+                target=self.reconcile, args=(robot, [group for group, _ in groups], rate),
+                name='qianxun-snapshot', daemon=True,
+            ).start()
+
+        return {'contacts': len(contacts), 'groups': len(groups), 'age': age}
+
+    # 后台对账
+    def reconcile(self, robot, groups: list = None, rate: float = 2):
+        """重新拉取联系人与群成员, 完成后保存快照
+
+        Args:
+            robot (Robot): 机器人实例 \r\n
+            groups (list, optional): 要重新拉取的群聊 WXID 列表, 不填则为当前缓存中的全部群 \r\n
+            rate (float, optional): 每秒最多拉取的群数. 默认 2
+        """
+
+        try:
+            robot.contacts.refresh()
+            if groups is None:
+                groups = list(robot.members.groups)
+            limiter = RateLimiter(rate, 1)
+            for group_wxid in groups:
+                limiter.acquire()
+                if robot.members.load(group_wxid) is None:
+                    robot.members.invalidate(group_wxid)
+            self.save(robot)
+        except Exception:
+            self.logger.exception('联系人快照对账失败')
@@ -0,0 +1,65 @@
+import re
+import json
+import codecs
+
+# 数组开始位置, 如 "result": [
+ARRAY_START = '"{}"\\s*:\\s*\\['
+
+# 数组元素之间的空白与逗号
+SEPARATOR = re.compile(r'[\s,]*')
+
+# 完整元素之后的字符
+DELIMITERS = frozenset(' \t\r\n,]')
+
+
+# 流式解析 JSON 数组
+def iter_array(chunks, key: str = 'result'):
+    """从分块到达的 JSON 响应中逐条解析顶层字段 key 对应的数组元素, 每解析出一个元素就立即返回
+
+    只保留尚未解析完的部分文本, 内存占用与单个元素大小相当, 不随数组长度增长
+
+    Args:
+        chunks (iterable): bytes 分块, 如 response.iter_content(65536) \r\n
+        key (str, optional): 数组所在的字段名. 默认 'result'
+
+    Yields:
+        dict: 数组元素
+
+    Raises:
+        ValueError: 响应中没有该数组, 或数组不完整
+    """
+
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    start = re.compile(ARRAY_START.format(re.escape(key)))
+    buffer = ''
+    started = False
+    for chunk in chunks:
+        buffer += text_decoder.decode(chunk)
+        if not started:
+            match = start.search(buffer)
+            if match is None:
+                continue
+            buffer = buffer[match.end():]
+            started = True
+
+        position = 0
+        while True:
+            position = SEPARATOR.match(buffer, position).end()
+            if position >= len(buffer):
+                break
+            if buffer[position] == ']':
+                return
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # 元素尚未完整到达, 等待下一块
+                break
+            if end >= len(buffer) or buffer[end] not in DELIMITERS:
+                # 后面还没有分隔符的值可能不完整, 如 23 或 1. 的后半部分还在下一块中
+                break
+            position = end
+            yield item
+        buffer = buffer[position:]
+
+    raise ValueError(f'响应中没有完整的 {key} 数组: {buffer[:200]}')
@@ -0,0 +1,99 @@
+from string import Formatter
+from . import Emoji
+from .TextCode import encode
+
+# 占位符中的 !r !s !a 转换
+CONVERSIONS = {'r': 'repr', 's': 'str', 'a': 'ascii'}
+
+
+class Template:
+    def __init__(self, source: str):
+        """消息模板, 创建时解析一次并编译为渲染函数, 之后每次渲染只做字符串拼接
+
+        1.{字段}: 替换为对应的值, 值中的 Emoji 自动转为文本代码, 支持格式说明, 如 {price:.2f} \r\n
+        2.{@字段}: 艾特该字段中的 WXID, 格式同 Robot.at, {@all} 为艾特所有人 \r\n
+        3.{:常量名}: Emoji 模块中的表情, 如 {:小丑脸}, {:表情_捂脸} \r\n
+        4.{{ 与 }}: 花括号本身; 模板中直接书写的 Emoji 同样会转为文本代码 \r\n
+        5.与 str.format 不同, 不支持 {a.b}, {a[0]} 等属性与下标占位符
+
+        例: Template('{@wxid} 你好 {nick} {:表情_愉快}').render(wxid='wxid_xxx', nick='小明')
+
+        Args:
+            source (str): 模板
+
+        Raises:
+            ValueError: 模板格式错误, 表情不存在, 或使用了 {a.b}, {a[0]} 等属性与下标占位符
+        """
+
+        self.source = source
+        self.fields = []
+        parts = []
+        for literal, field, spec, conversion in Formatter().parse(source):
+            if literal:
+                parts.append(repr(encode(literal)))
+            if field is None:
+                continue
+            if '.' in field or '[' in field:
+                raise ValueError(f'模板不支持属性或下标占位符: {{{field}}}')
+            if field == '':
+                if not spec:
+                    raise ValueError(f'模板中不能有空的占位符: {source}')
+                code = Emoji.lookup(spec)
+                if code is None:
+                    raise ValueError(f'表情不存在: {spec}')
+                parts.append(repr(code))
+            elif field == '@all':
+                parts.append(repr('[@,wxid=all,nick=,isAuto=true]'))
+            elif field.startswith('@'):
+                self.fields.append(field[1:])
+                parts.append(f"'[@,wxid=' + str(c[{field[1:]!r}]) + ',nick=,isAuto=true]'")
+            else:
+                self.fields.append(field)
+                value = f'c[{field!r}]'
+                if conversion:
+                    value = f"{CONVERSIONS[conversion]}({value})"
+                value = f'format({value}, {spec!r})' if spec else f'str({value})'
+                parts.append(f'encode({value})')
+
+        # 生成的表达式只包含字面量与字段名的 repr, 不含模板中的任意代码
+        expression = ' + '.join(parts) or "''"
+        self.function = eval(f'lambda c: {expression}', {'encode': encode, 'format': format, 'repr': repr, 'str': str, 'ascii': ascii})
+
+    def __repr__(self) -> str:
+        return f'Template({self.source!r})'
+
+    # 渲染
+    def render(self, context: dict = None, **fields) -> str:
+        """渲染模板
+
+        Args:
+            context (dict, optional): 字段值, 如联系人记录 \r\n
+            **fields: 字段值, 与 context 同名时优先使用
+
+        Returns:
+            str: 可直接发送的消息
+
+        Raises:
+            KeyError: 缺少模板中的字段
+        """
+
+        if fields:
+            context = {**context, **fields} if context else fields
+        return self.function(context or {})
+
+    __call__ = render
+
+    # 批量渲染
+    def renderMany(self, contexts: list) -> list:
+        """批量渲染, 用于群发
+
+        例: Template('{nick} 新年快乐').renderMany(robot.contacts.list('friend'))
+
+        Args:
+            contexts (list): 字段值列表
+
+        Returns:
+            list: 消息列表
+        """
+
+        return list(map(self.function, contexts))
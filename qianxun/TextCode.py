@@ -0,0 +1,276 @@
+import re
+from collections.abc import Mapping
+
+# 需要编码的基本平面字符, 即 Emoji 表中出现过的全部非代理码元, 以及组合用的 U+20E3
+EMOJI_BMP = (
+    '\u00A9\u00AE\u200D\u203C\u2049\u20E3\u2122\u2139\u2194-\u2199\u21A9\u21AA'
+    '\u231A\u231B\u2328\u23CF\u23E9-\u23F3\u23F8-\u23FA\u24C2\u25AA\u25AB\u25B6\u25C0'
+    '\u25FB-\u25FE\u2600-\u2604\u260E\u2611\u2614\u2615\u2618\u261D\u2620\u2622\u2623'
+    '\u2626\u262A\u262E\u262F\u2638-\u263A\u2640\u2642\u2648-\u2653\u265F\u2660\u2663'
+    '\u2665\u2666\u2668\u267B\u267E\u267F\u2692-\u2697\u2699\u269B\u269C\u26A0\u26A1'
+    '\u26AA\u26AB\u26B0\u26B1\u26BD\u26BE\u26C4\u26C5\u26C8\u26CE\u26CF\u26D1\u26D3\u26D4'
+    '\u26E9\u26EA\u26F0-\u26F5\u26F7-\u26FA\u26FD\u2702\u2705\u2708-\u270D\u270F\u2712'
+    '\u2714\u2716\u271D\u2721\u2728\u2733\u2734\u2744\u2747\u274C\u274E\u2753-\u2755'
+    '\u2757\u2763\u2764\u2795-\u2797\u27A1\u27B0\u27BF\u2934\u2935\u2B05-\u2B07'
+    '\u2B1B\u2B1C\u2B50\u2B55\u3030\u303D\uFE0F'
+)
+
+# 需要编码的字符: 基本平面以外的全部字符, 私用区(旧版 Emoji, 如 [emoji=E057]), 以及上面的基本平面字符
+ENCODE_PATTERN = re.compile('[\U00010000-\U0010FFFF\uE000-\uF8FF' + EMOJI_BMP + ']+')
+
+# 连续的 Emoji 文本代码
+DECODE_PATTERN = re.compile(r'(?:\[emoji=[0-9A-Fa-f]{4}\])+')
+
+# 单个文本代码的长度, 即 len('[emoji=D83D]')
+CODE_LENGTH = 12
+
+# 编解码缓存上限, 超出后清空
+CACHE_SIZE = 10000
+
+# 批量解码的字段: 昵称, 备注, 群昵称
+FIELDS = ('nick', 'remark', 'groupNick')
+
+# 单条文本消息的长度上限, 按 UTF-16 码元计, ASCII 记 1, 其余记 2, 即最多 2048 个汉字
+MAX_LENGTH = 4096
+
+# 自动填充昵称的艾特无法预知昵称长度, 按微信昵称上限 16 个汉字估算
+AUTO_NICK_LENGTH = 32
+
+# 展开后长度与原文不同的文本代码: Emoji 与艾特; 代理对的两个代码作为一个整体匹配, 截断时不会被拆开
+LENGTH_PATTERN = re.compile(
+    r'\[emoji=[dD][89abAB][0-9A-Fa-f]{2}\]\[emoji=[dD][c-fC-F][0-9A-Fa-f]{2}\]'
+    r'|\[emoji=[0-9A-Fa-f]{4}\]'
+    r'|\[@,wxid=([^,\]]*),nick=([^\]]*?),isAuto=(true|false)\]'
+)
+
+# 结尾处的高位代理代码
+HIGH_SURROGATE_TAIL = re.compile(r'\[emoji=[dD][89abAB][0-9A-Fa-f]{2}\]$')
+
+encoded = {}
+decoded = {}
+names = {}
+
+
+def encode_run(match) -> str:
+    run = match.group()
+    value = encoded.get(run)
+    if value is None:
+        data = run.encode('utf-16-be')
+        value = ''.join('[emoji=%02X%02X]' % (data[i], data[i + 1]) for i in range(0, len(data), 2))
+        if len(encoded) >= CACHE_SIZE:
+            encoded.clear()
+        encoded[run] = value
+    return value
+
+
+def decode_run(match) -> str:
+    run = match.group()
+    value = decoded.get(run)
+    if value is None:
+        units = [int(run[i + 7:i + 11], 16) for i in range(0, len(run), CODE_LENGTH)]
+        chars = []
+        i = 0
+        while i < len(units):
+            unit = units[i]
+            if 0xD800 <= unit < 0xDC00 and i + 1 < len(units) and 0xDC00 <= units[i + 1] < 0xE000:
+                chars.append(chr(0x10000 + ((unit - 0xD800) << 10) + (units[i + 1] - 0xDC00)))
+                i += 2
+                continue
+            # 落单的代理码元无法表示为字符, 保留原文本代码
+            chars.append(run[i * CODE_LENGTH:(i + 1) * CODE_LENGTH] if 0xD800 <= unit < 0xE000 else chr(unit))
+            i += 1
+        value = ''.join(chars)
+        if len(decoded) >= CACHE_SIZE:
+            decoded.clear()
+        decoded[run] = value
+    return value
+
+
+# 编码
+def encode(text: str) -> str:
+    """将 Unicode 文本中的 Emoji 转为千寻的文本代码, 每个 UTF-16 码元一个 [emoji=XXXX]
+
+    例: encode('你好😁') == '你好[emoji=D83D][emoji=DE01]'
+
+    Args:
+        text (str): 文本
+
+    Returns:
+        str: 可直接发送的文本
+    """
+
+    if not text or text.isascii():
+        return text
+    return ENCODE_PATTERN.sub(encode_run, text)
+
+
+# 解码
+def decode(text: str) -> str:
+    """将千寻的 Emoji 文本代码还原为 Unicode 字符, 微信表情代码如 [捂脸] 保持不变
+
+    例: decode('Daen[emoji=D83D][emoji=DE01]') == 'Daen😁'
+
+    Args:
+        text (str): 千寻返回的文本, 如昵称, 备注, 消息内容
+
+    Returns:
+        str: Unicode 文本
+    """
+
+    if not text or '[emoji=' not in text:
+        return text
+    return DECODE_PATTERN.sub(decode_run, text)
+
+
+# 批量解码
+def decode_records(records, fields: tuple = FIELDS) -> list:
+    """批量解码联系人或群成员列表中的昵称, 备注与群昵称
+
+    1.相同的名称只解码一次, 结果缓存复用 \r\n
+    2.不含文本代码的记录原样返回, 不复制, 含文本代码的记录返回修改后的副本, 不改动原记录
+
+    例: friends = decode_records(robot.getFriendList()['result'])
+
+    Args:
+        records (list | dict): 联系人列表, 格式同 getFriendList / getGroupMemberList 的 result, 也可以是单个联系人 \r\n
+        fields (tuple, optional): 需要解码的字段. 默认 ('nick', 'remark', 'groupNick')
+
+    Returns:
+        list: 解码后的列表, 传入单个联系人时为 dict
+    """
+
+    if isinstance(records, Mapping):
+        return decode_records([records], fields)[0]
+
+    result = []
+    for record in records:
+        changed = None
+        for field in fields:
+            value = record.get(field)
+            if not value or '[emoji=' not in value:
+                continue
+            text = names.get(value)
+            if text is None:
+                text = decode(value)
+                if len(names) >= CACHE_SIZE:
+                    names.clear()
+                names[value] = text
+            if changed is None:
+                changed = dict(record)
+            changed[field] = text
+        result.append(record if changed is None else changed)
+    return result
+
+
+# 文本长度, 不处理文本代码
+def weight(text: str) -> int:
+    # UTF-16 码元数的两倍减去 ASCII 字符数, 即 ASCII 记 1, 其余码元记 2
+    return len(text.encode('utf-16-le')) - len(text.encode('ascii', 'ignore'))
+
+
+# 单个文本代码展开后的长度
+def token_weight(match, auto_nick: int) -> int:
+    wxid, nick, auto = match.groups()
+    if wxid is None:
+        # 每个 [emoji=XXXX] 为一个非 ASCII 码元
+        return 2 * (len(match.group()) // CODE_LENGTH)
+    if wxid == 'all':
+        nick_weight = weight('所有人')
+    elif auto == 'true':
+        nick_weight = auto_nick
+    else:
+        nick_weight = weight(nick)
+    # @ + 昵称 + 分隔用的空格
+    return nick_weight + 2
+
+
+# 消息长度
+def length(text: str, auto_nick: int = AUTO_NICK_LENGTH) -> int:
+    """计算消息发出后的长度, 文本代码按展开后的内容计算, 一次扫描
+
+    1.ASCII 字符记 1, 其余字符按 UTF-16 码元每个记 2 \r\n
+    2.[emoji=XXXX] 记 2, [捂脸] 等微信表情按原文计算 \r\n
+    3.艾特记为 @ + 昵称 + 空格, 自动填充昵称时按 auto_nick 估算
+
+    例: length('你好[emoji=D83D][emoji=DE01]') == 8
+
+    Args:
+        text (str): 消息 \r\n
+        auto_nick (int, optional): 自动填充的昵称长度估算值. 默认 32
+
+    Returns:
+        int: 长度
+    """
+
+    total = weight(text)
+    if '[' in text:
+        for match in LENGTH_PATTERN.finditer(text):
+            total += token_weight(match, auto_nick) - weight(match.group())
+    return total
+
+
+# 批量计算消息长度
+def lengths(texts: list, auto_nick: int = AUTO_NICK_LENGTH) -> list:
+    return [length(text, auto_nick) for text in texts]
+
+
+# 检查消息长度
+def fits(text: str, limit: int = MAX_LENGTH, auto_nick: int = AUTO_NICK_LENGTH) -> bool:
+    """检查消息长度是否在上限以内
+
+    Args:
+        text (str): 消息 \r\n
+        limit (int, optional): 长度上限. 默认 4096 \r\n
+        auto_nick (int, optional): 自动填充的昵称长度估算值. 默认 32
+
+    Returns:
+        bool: 未超出上限时为 True
+    """
+
+    # 只有艾特展开后会变长, 没有艾特且按原文计算未超出上限时无需扫描文本代码
+    if '[@' not in text and weight(text) <= limit:
+        return True
+    return length(text, auto_nick) <= limit
+
+
+# 截断消息
+def truncate(text: str, limit: int = MAX_LENGTH, auto_nick: int = AUTO_NICK_LENGTH) -> str:
+    """按展开后的长度截断消息, 不会截断文本代码或拆开代理对
+
+    Args:
+        text (str): 消息 \r\n
+        limit (int, optional): 长度上限. 默认 4096 \r\n
+        auto_nick (int, optional): 自动填充的昵称长度估算值. 默认 32
+
+    Returns:
+        str: 截断后的消息, 未超出上限时原样返回
+    """
+
+    if fits(text, limit, auto_nick):
+        return text
+    result = cut(text, limit, auto_nick)
+    # 保证截断处不会留下落单的高位代理代码
+    return HIGH_SURROGATE_TAIL.sub('', result)
+
+
+def cut(text: str, limit: int, auto_nick: int) -> str:
+    total = 0
+    position = 0
+    for match in LENGTH_PATTERN.finditer(text):
+        plain = text[position:match.start()]
+        size = weight(plain)
+        if total + size > limit:
+            break
+        total += size
+        size = token_weight(match, auto_nick)
+        if total + size > limit:
+            return text[:match.start()]
+        total += size
+        position = match.end()
+
+    for index in range(position, len(text)):
+        char = text[index]
+        total += 1 if char < '\x80' else 2 if char < '\U00010000' else 4
+        if total > limit:
+            return text[:index]
+    return text
@@ -0,0 +1,182 @@
+import sys
+import time
+import logging
+import itertools
+import threading
+import traceback
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from .Inbound import PRIORITY_CRITICAL, ShedPolicy
+
+
+class Watchdog:
+    def __init__(self, slow_threshold: float = 1.0, timeout: float = 0, max_workers: int = 8, metrics=None,
+                 policy: ShedPolicy = None, logger: logging.Logger = None):
+        """回调处理看门狗, 为回调方法设置耗时预算, 记录慢调用并可隔离超时的回调方法
+
+        1.耗时超过 slow_threshold 的调用会记录日志: 事件代码, 回调方法名, 耗时, 以及执行中采样到的调用栈 \r\n
+        2.timeout 大于 0 时, 回调方法在独立线程池中执行, 超时后立即返回, 不再阻塞回调服务, 回调方法继续在后台执行完毕 \r\n
+        3.执行中(含超时后仍在后台执行)的回调达到 max_workers 时, 新事件直接丢弃并记录日志, 不在线程池中排队; \r\n
+          policy 中永不丢弃的事件(默认 10006 转账与 10011 好友请求)改为在当前线程中直接执行 \r\n
+        4.超时后在后台抛出的异常同样记录日志并计入 events_failed_total
+
+        Args:
+            slow_threshold (float, optional): 慢调用阈值(秒), 0 为不检测. 默认 1.0 \r\n
+            timeout (float, optional): 超时时间(秒), 0 为不隔离. 默认 0 \r\n
+            max_workers (int, optional): 隔离线程池大小. 默认 8 \r\n
+            metrics (Metrics, optional): 运行指标, 填写后统计慢调用与超时次数 \r\n
+            policy (ShedPolicy, optional): 削峰策略, 用于判断永不丢弃的事件. 默认 ShedPolicy() \r\n
+            logger (logging.Logger, optional): 日志记录器. 默认 logging.getLogger('qianxun')
+        """
+
+        self.slow_threshold = slow_threshold
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.metrics = metrics
+        self.policy = policy or ShedPolicy()
+        self.logger = logger or logging.getLogger('qianxun')
+        self.active = {}
+        self.counter = itertools.count()
+        self.lock = threading.Lock()
+        self.executor = None
+        self.slots = threading.BoundedSemaphore(max_workers)
+        self.monitor = None
+        self.closed = threading.Event()
+
+    # 包装回调方法
+    def wrap(self, handler):
+        """包装回调方法
+
+        Args:
+            handler (callable): 回调方法
+
+        Returns:
+            callable: 带耗时预算的回调方法
+        """
+
+        def wrapper(event):
+            return self.call(handler, event)
+
+        wrapper.__name__ = getattr(handler, '__name__', 'handler')
+        wrapper.__qualname__ = getattr(handler, '__qualname__', wrapper.__name__)
+        return wrapper
+
+    # 执行回调方法
+    def call(self, handler, event: dict):
+        """执行回调方法, 超时时返回 None
+
+        Args:
+            handler (callable): 回调方法 \r\n
+            event (dict): 回调事件
+        """
+
+        if self.timeout <= 0:
+            return self.run(handler, event)
+
+        if self.executor is None:
+            with self.lock:
+                if self.executor is None:
+                    self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='qianxun-handler')
+
+        if not self.slots.acquire(blocking=False):
+            if self.policy.priority(event) == PRIORITY_CRITICAL:
+                # 永不丢弃的事件不隔离, 在当前线程中执行完毕
+                return self.run(handler, event)
+            self.logger.warning(
+                '回调隔离线程已满: event=%s handler=%s, %d 个回调仍在执行, 丢弃事件',
+                event.get('event'), self.name(handler), self.max_workers,
+            )
+            if self.metrics:
+                self.metrics.inc('handler_shed_total', (('handler', self.name(handler)),))
+                self.metrics.inc('events_dropped_total', (('event', str(event.get('event', ''))), ('reason', 'isolation')))
+            return None
+
+        future = self.executor.submit(self.isolate, handler, event)
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            self.logger.warning(
+                '回调超时: event=%s handler=%s timeout=%.3fs, 已隔离到后台继续执行',
+                event.get('event'), self.name(handler), self.timeout,
+            )
+            if self.metrics:
+                self.metrics.inc('handler_timeouts_total', (('handler', self.name(handler)),))
+            future.add_done_callback(partial(self.finished, handler, event))
+            return None
+
+    # 超时后在后台结束的回调, 记录其中抛出的异常
+    def finished(self, handler, event: dict, future):
+        error = future.exception()
+        if error is None:
+            return
+        self.logger.error(
+            '回调超时后执行失败: event=%s handler=%s', event.get('event'), self.name(handler),
+            exc_info=(type(error), error, error.__traceback__),
+        )
+        if self.metrics:
+            self.metrics.inc('events_failed_total', (('event', str(event.get('event', ''))),))
+
+    # 在隔离线程中执行, 结束后释放名额
+    def isolate(self, handler, event: dict):
+        try:
+            return self.run(handler, event)
+        finally:
+            self.slots.release()
+
+    # 执行并记录耗时
+    def run(self, handler, event: dict):
+        if self.slow_threshold <= 0:
+            return handler(event)
+
+        self.ensure_monitor()
+        token = next(self.counter)
+        begin = time.perf_counter()
+        self.active[token] = [threading.get_ident(), handler, event.get('event'), begin, False]
+        try:
+            return handler(event)
+        finally:
+            call = self.active.pop(token)
+            elapsed = time.perf_counter() - begin
+            if elapsed >= self.slow_threshold:
+                if self.metrics:
+                    self.metrics.inc('handler_slow_total', (('handler', self.name(handler)),))
+                self.logger.warning('慢回调: event=%s handler=%s 耗时 %.3fs', call[2], self.name(handler), elapsed)
+
+    # 启动监视线程
+    def ensure_monitor(self):
+        if self.monitor is None:
+            with self.lock:
+                if self.monitor is None:
+                    self.monitor = threading.Thread(target=self.watch, name='qianxun-watchdog', daemon=True)
+                    self.monitor.start()
+
+    # 监视执行中的回调, 对超过阈值的调用采样调用栈
+    def watch(self):
+        interval = max(self.slow_threshold / 2, 0.01)
+        while not self.closed.wait(interval):
+            now = time.perf_counter()
+            frames = None
+            for call in list(self.active.values()):
+                thread_id, handler, code, begin, logged = call
+                if logged or now - begin < self.slow_threshold:
+                    continue
+                if frames is None:
+                    frames = sys._current_frames()
+                frame = frames.get(thread_id)
+                stack = ''.join(traceback.format_stack(frame)) if frame else ''
+                call[4] = True
+                self.logger.warning(
+                    '慢回调: event=%s handler=%s 已执行 %.3fs, 调用栈:\n%s',
+                    code, self.name(handler), now - begin, stack,
+                )
+
+    # 关闭隔离线程池与监视线程, 执行中的回调继续在后台执行完毕
+    def close(self):
+        self.closed.set()
+        with self.lock:
+            if self.executor is not None:
+                self.executor.shutdown(wait=False)
+
+    @staticmethod
+    def name(handler) -> str:
+        return getattr(handler, '__qualname__', None) or repr(handler)
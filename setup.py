@@ -13,10 +13,11 @@ setuptools.setup(
     long_description_content_type="text/markdown",  # 包的详细介绍格式为markdown
     url="https://github.com/MaiXiaoMeng/qianxun-wechat-sdk",  # 自己项目地址，比如 github 的项目地址
     packages=setuptools.find_packages(),
+    package_data={"qianxun": ["*.pyi"]},  # Emoji 常量的类型存根, 供编辑器补全
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: Apache Software License",
         "Operating System :: OS Independent",
     ],
-    python_requires='>=3.6',  # 对python的最低版本要求
+    python_requires='>=3.7',  # 对python的最低版本要求
 )